@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+#####################
+#
+# Replays search algorithms against recorded checkpoints (without a GPU),
+# in parallel across checkpoints x searches x seeds, and reports how close
+# each search gets to the best measurement in the checkpoint (percentile)
+# and how many measurements it needs to get there
+#
+# Example usage:
+#
+#   cd experiments
+#   PYTHONPATH=.. python3 benchmark.py \
+#       --checkpoints ../tests/common/single-model-ckpt/0.ckpt data/*/0.ckpt \
+#       --search "--run-config-search-mode quick" \
+#       --search "--run-config-search-mode quick --quick-search-surrogate quadratic" \
+#       --search "--run-config-search-mode optuna" \
+#       --seeds 0 1 2
+#
+# Each --search is a set of model analyzer (or experiment) options that are
+# replayed against every model of every checkpoint, once per seed. Searches
+# that do not sample randomly are only replayed with the first seed, as every
+# seed would repeat the same replay. All seeds of a checkpoint's model and
+# search are replayed by the same worker, which only loads the checkpoint once
+#
+#####################
+
+import argparse
+import csv
+import io
+import json
+import logging
+import math
+import multiprocessing
+import random
+import re
+import sys
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from statistics import mean, median
+from typing import List, Optional, Tuple
+
+from evaluate_config_generator import EvaluateConfigGenerator
+
+from model_analyzer.constants import LOGGER_NAME
+
+DEFAULT_SEARCHES = [
+    "--run-config-search-mode quick",
+    "--run-config-search-mode quick --quick-search-surrogate quadratic",
+    "--run-config-search-mode optuna",
+]
+
+# Search modes whose replay depends on the seed
+STOCHASTIC_SEARCH_MODES = ["optuna"]
+
+
+@dataclass
+class BenchmarkTask:
+    """The replays of a search against one model of a checkpoint"""
+
+    checkpoint: str
+    model_name: str
+    search: str
+    seeds: Tuple[int, ...]
+    checkpoint_args: Tuple[str, ...]
+
+
+@dataclass
+class BenchmarkResult:
+    """Holds the result of a single replay (one seed) of a BenchmarkTask"""
+
+    checkpoint: str
+    model_name: str
+    search: str
+    seed: int
+    percentile: Optional[float] = None
+    measurements: Optional[int] = None
+    measurements_to_best: Optional[int] = None
+    error: Optional[str] = None
+
+
+def run_task(task: BenchmarkTask) -> List[BenchmarkResult]:
+    """
+    Replays the task's search against its checkpoint, once per seed. This
+    runs in its own worker process, as the experiment patches model
+    analyzer globally
+    """
+    logging.getLogger(LOGGER_NAME).setLevel(logging.ERROR)
+
+    results = [
+        BenchmarkResult(
+            checkpoint=task.checkpoint,
+            model_name=task.model_name,
+            search=task.search,
+            seed=seed,
+        )
+        for seed in task.seeds
+    ]
+
+    other_args = task.search.split() + list(task.checkpoint_args)
+    try:
+        with redirect_stdout(io.StringIO()):
+            ecg = EvaluateConfigGenerator(
+                task.model_name, task.checkpoint, "./output", other_args
+            )
+    except (Exception, SystemExit) as e:
+        for result in results:
+            result.error = f"{type(e).__name__}: {e}"
+        return results
+
+    for result in results:
+        _replay(ecg, result)
+
+    return results
+
+
+def _replay(ecg: EvaluateConfigGenerator, result: BenchmarkResult) -> None:
+    random.seed(result.seed)
+
+    try:
+        with redirect_stdout(io.StringIO()):
+            ecg.execute_generator()
+    except (Exception, SystemExit) as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return
+
+    evaluator = ecg.get_result_evaluator()
+    result.percentile = evaluator.get_percentile()
+    result.measurements = evaluator.get_measurement_count()
+    result.measurements_to_best = evaluator.get_measurements_to_best()
+
+    if result.percentile is None:
+        result.error = "No passing measurement found"
+
+
+class Benchmark:
+    """
+    Creates the benchmark tasks, runs them in a process pool
+    and reports the results of each search
+    """
+
+    def __init__(
+        self, checkpoints: List[str], searches: List[str], seeds: List[int]
+    ) -> None:
+        self._checkpoints = checkpoints
+        self._searches = searches
+        self._seeds = seeds
+
+        self._results: List[BenchmarkResult] = []
+
+    def run(self, processes: Optional[int]) -> None:
+        tasks = self._create_tasks()
+
+        with multiprocessing.Pool(processes=processes, maxtasksperchild=1) as pool:
+            for i, results in enumerate(pool.imap_unordered(run_task, tasks)):
+                for result in results:
+                    status = (
+                        result.error
+                        if result.error
+                        else f"percentile = {result.percentile}, "
+                        f"measurements = {result.measurements}, "
+                        f"measurements to best = {result.measurements_to_best}"
+                    )
+                    print(
+                        f"[{i + 1}/{len(tasks)}] {result.checkpoint} "
+                        f"{result.model_name} ({result.search}, seed {result.seed}): "
+                        f"{status}"
+                    )
+                self._results.extend(results)
+
+        self._results.sort(key=lambda r: (r.search, r.checkpoint, r.model_name, r.seed))
+
+    def print_summary(self) -> None:
+        for search in self._searches:
+            results = [r for r in self._results if r.search == search]
+            passed = [r for r in results if not r.error]
+
+            print()
+            print("====================================")
+            print(f"Search: {search}")
+            print(f"Tasks: {len(passed)} of {len(results)} passed")
+
+            if not passed:
+                continue
+
+            percentiles = [r.percentile for r in passed]
+            measurements = [r.measurements for r in passed]
+            measurements_to_best = [r.measurements_to_best for r in passed]
+
+            print(
+                f"Average/Median/Min percentile = {mean(percentiles):0.2f} / "
+                f"{median(percentiles):0.2f} / {min(percentiles):0.2f}"
+            )
+            print(
+                f"Average/Median/Max measurements = {mean(measurements):0.2f} / "
+                f"{median(measurements):0.2f} / {max(measurements)}"
+            )
+            print(
+                f"Average/Median/Max measurements to best = "
+                f"{mean(measurements_to_best):0.2f} / "
+                f"{median(measurements_to_best):0.2f} / {max(measurements_to_best)}"
+            )
+
+            for r in results:
+                if r.error:
+                    print(
+                        f"  FAILED {r.checkpoint} {r.model_name} seed {r.seed}: {r.error}"
+                    )
+
+    def write_csv(self, path: str) -> None:
+        fields = list(BenchmarkResult.__dataclass_fields__.keys())
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for result in self._results:
+                writer.writerow(asdict(result))
+
+    def failed_count(self) -> int:
+        return len([r for r in self._results if r.error])
+
+    def min_average_percentile(self) -> Optional[float]:
+        """
+        Returns the lowest average percentile of any search
+        """
+        averages = []
+        for search in self._searches:
+            percentiles = [
+                r.percentile
+                for r in self._results
+                if r.search == search and not r.error
+            ]
+            if percentiles:
+                averages.append(mean(percentiles))
+
+        return min(averages) if averages else None
+
+    def _create_tasks(self) -> List[BenchmarkTask]:
+        tasks = []
+        for checkpoint in self._checkpoints:
+            with open(checkpoint, "r") as f:
+                contents = f.read()
+
+            checkpoint_args = tuple(self._get_checkpoint_args(contents))
+            for model_name in json.loads(contents)["ResultManager.results"]["_results"]:
+                for search in self._searches:
+                    tasks.append(
+                        BenchmarkTask(
+                            checkpoint=checkpoint,
+                            model_name=model_name,
+                            search=search,
+                            seeds=tuple(self._get_seeds(search)),
+                            checkpoint_args=checkpoint_args,
+                        )
+                    )
+
+        return tasks
+
+    def _get_seeds(self, search: str) -> List[int]:
+        search_mode = re.search(r"--run-config-search-mode[ =](\S+)", search)
+        if search_mode and search_mode.group(1) in STOCHASTIC_SEARCH_MODES:
+            return self._seeds
+
+        return self._seeds[:1]
+
+    def _get_checkpoint_args(self, contents: str) -> List[str]:
+        """
+        Returns the experiment options that match the search
+        dimensions to the configs that were profiled
+        """
+        args = ["--min-mbs-index", str(self._get_min_mbs_index(contents))]
+
+        # If instance count of 3 was not profiled, it is exponential (1,2,4,8)
+        if not re.search(r'instanceGroup": \[{"count": 3,', contents):
+            args.append("--exponential-inst-count")
+
+        return args
+
+    def _get_min_mbs_index(self, contents: str) -> int:
+        # If max batch size of 2 is not in the checkpoint, then find the index
+        # where max batch sizes start (other than 1, which is part of default)
+        max_batch_sizes = [
+            int(value)
+            for value in re.findall(r'maxBatchSize": (\d+),', contents)
+            if int(value) > 1
+        ]
+        if not max_batch_sizes or 2 in max_batch_sizes:
+            return 0
+
+        return int(math.log2(min(max_batch_sizes)))
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--checkpoints",
+    type=str,
+    nargs="+",
+    required=True,
+    help="The checkpoint files to replay the searches against",
+)
+parser.add_argument(
+    "--search",
+    type=str,
+    action="append",
+    dest="searches",
+    help="The options of a search to benchmark (can be repeated). "
+    f"Defaults to {DEFAULT_SEARCHES}",
+)
+parser.add_argument(
+    "--seeds",
+    type=int,
+    nargs="+",
+    default=[0],
+    help="The seeds each search is replayed with. Searches that do not sample "
+    "randomly only use the first seed",
+)
+parser.add_argument(
+    "--processes",
+    type=int,
+    default=None,
+    help="The number of worker processes (defaults to the number of CPUs)",
+)
+parser.add_argument(
+    "--output-csv",
+    type=str,
+    default=None,
+    help="Write the result of every replay to this csv file",
+)
+parser.add_argument(
+    "--min-percentile",
+    type=float,
+    default=None,
+    help="Fail if the average percentile of any search is below this value",
+)
+parser.add_argument(
+    "--allow-failures",
+    action="store_true",
+    help="Do not fail if a replay fails",
+)
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    benchmark = Benchmark(
+        checkpoints=args.checkpoints,
+        searches=args.searches or DEFAULT_SEARCHES,
+        seeds=args.seeds,
+    )
+    benchmark.run(args.processes)
+    benchmark.print_summary()
+
+    if args.output_csv:
+        benchmark.write_csv(args.output_csv)
+
+    exit_code = 0
+    if benchmark.failed_count() and not args.allow_failures:
+        print(f"\n{benchmark.failed_count()} replay(s) failed")
+        exit_code = 1
+
+    min_average_percentile = benchmark.min_average_percentile()
+    if (
+        args.min_percentile is not None
+        and min_average_percentile is not None
+        and min_average_percentile < args.min_percentile
+    ):
+        print(
+            f"\nAn average percentile of {min_average_percentile:0.2f} "
+            f"is below {args.min_percentile}"
+        )
+        exit_code = 1
+
+    sys.exit(exit_code)
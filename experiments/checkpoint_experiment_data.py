@@ -14,11 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
 from copy import deepcopy
 from unittest.mock import MagicMock
 
 from experiments.experiment_data import ExperimentData
+from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 
 
@@ -35,9 +35,11 @@ def __init__(self, config):
         self._load_checkpoint(config)
 
     def get_default_config_dict(self):
-        ret = self._default_run_config.model_run_configs()[0].model_config().to_dict()
+        ret = (
+            self._default_run_config.model_run_configs()[0].model_config().get_config()
+        )
         ret = deepcopy(ret)
-        del ret["cpu_only"]
+        ret.pop("cpu_only", None)
         return ret
 
     def _load_checkpoint(self, config):
@@ -45,11 +47,15 @@ def _load_checkpoint(self, config):
         state_manager.load_checkpoint(checkpoint_required=True)
 
         results = state_manager.get_state_variable("ResultManager.results")
+        constraint_manager = ConstraintManager(config)
 
         model_name = ",".join([x.model_name() for x in config.profile_models])
+        default_variants_name = ",".join(
+            [f"{x.model_name()}_config_default" for x in config.profile_models]
+        )
         model_measurements = results.get_model_measurements_dict(model_name)
         for run_config, run_config_measurements in model_measurements.values():
-            if run_config.model_variants_name() == model_name + "_config_default":
+            if run_config.model_variants_name() == default_variants_name:
                 self._default_run_config = run_config
 
             # Due to the way that data is stored in the AnalyzerStateManager, the
@@ -63,15 +69,23 @@ def _load_checkpoint(self, config):
                 perf_analyzer_string,
                 run_config_measurement,
             ) in run_config_measurements.items():
-                run_config_measurement.set_model_config_constraints(
-                    model_config_constraints=[config.constraints]
-                )
+                run_config_measurement.set_constraint_manager(constraint_manager)
                 run_config_measurement.set_metric_weightings(
-                    metric_objectives=[config.objectives]
+                    metric_objectives=[
+                        model.objectives() for model in config.profile_models
+                    ]
+                )
+                run_config_measurement.set_model_config_weighting(
+                    model_config_weights=[1] * len(config.profile_models)
                 )
                 pa_key = self._make_pa_key_from_cli_string(perf_analyzer_string)
 
-                if CheckpointExperimentData.LOAD_ONLY_VISABLE:
+                # Other search modes also search the concurrency, and can see
+                # every measurement
+                if (
+                    CheckpointExperimentData.LOAD_ONLY_VISABLE
+                    and config.run_config_search_mode == "quick"
+                ):
                     if not self._are_keys_visable_to_algorithm(ma_key, pa_key):
                         continue
 
@@ -107,16 +121,11 @@ def _print_map(self):
                 instance_count = 2**j if has_exponential_inst_count else j + 1
                 max_batch_size = 2**i
 
-                ma_key = (
-                    f"instance_count={instance_count},max_batch_size={max_batch_size}"
-                )
-
-                clamped_int = self._clamp_to_power_of_two(
-                    2 * instance_count * max_batch_size
+                ma_key = (instance_count, max_batch_size)
+                pa_key = (
+                    self._clamp_to_power_of_two(2 * instance_count * max_batch_size),
                 )
 
-                pa_key = str(clamped_int)
-
                 measurement = self._get_run_config_measurement_from_keys(
                     ma_key, pa_key, skip_warn=True
                 )
@@ -138,8 +147,8 @@ def _print_map(self):
     def _has_exponential_inst_count(self) -> bool:
         # See if instance count of 3 is in the database. If not, it is exponential (1,2,4,8)
         ret = False
-        ma_key = f"instance_count=3,max_batch_size=1"
-        pa_key = "8"
+        ma_key = (3, 1)
+        pa_key = (8,)
         measurement = self._get_run_config_measurement_from_keys(
             ma_key, pa_key, skip_warn=True
         )
@@ -149,9 +158,14 @@ def _has_exponential_inst_count(self) -> bool:
 
     def _are_keys_visable_to_algorithm(self, ma_key, pa_key) -> bool:
         # The quick algorithm can only see measurements where the
-        # concurrency is 2 * inst_count * max_batch_size.
-        results = re.search("instance_count=(\d+),max_batch_size=(\d+)", ma_key)
-        inst_count = int(results.group(1))
-        max_batch_size = int(results.group(2))
-        expected_pa_key = self._clamp_to_power_of_two(2 * inst_count * max_batch_size)
-        return expected_pa_key == int(pa_key)
+        # concurrency is 2 * inst_count * max_batch_size (for every model)
+        for inst_count, max_batch_size, model_pa_key in zip(
+            ma_key[0::2], ma_key[1::2], pa_key
+        ):
+            expected_pa_key = self._clamp_to_power_of_two(
+                2 * inst_count * max_batch_size
+            )
+            if expected_pa_key != model_pa_key:
+                return False
+
+        return True
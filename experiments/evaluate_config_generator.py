@@ -26,6 +26,7 @@
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
 )
+from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.state.analyzer_state import AnalyzerState
 
 
@@ -45,25 +46,33 @@ def __init__(self, model_name, data_path, output_path, other_args):
         )
 
         self._checkpoint_data = CheckpointExperimentData(self._config_command)
+        self._constraint_manager = ConstraintManager(self._config_command)
         self._profile_data = ExperimentData()
 
         self._default_config_dict = self._checkpoint_data.get_default_config_dict()
         p = patch(
-            "model_analyzer.config.generate.base_model_config_generator.BaseModelConfigGenerator.get_base_model_config_dict",
+            "model_analyzer.triton.model.model_config.ModelConfig.create_model_config_dict",
             MagicMock(return_value=self._default_config_dict),
         )
         p.start()
 
     def execute_generator(self):
+        # The checkpoint is only loaded once, so that it
+        # can be replayed repeatedly (e.g. with different seeds)
+        self._profile_data = ExperimentData()
+        self._checkpoint_data.reset_missing_measurement_count()
+
         generator = GeneratorExperimentFactory.create_generator(self._config_command)
 
         self._run_generator(generator)
 
     def print_results(self):
-        result_evaluator = ExperimentEvaluator(
+        self.get_result_evaluator().print_results()
+
+    def get_result_evaluator(self):
+        return ExperimentEvaluator(
             self._checkpoint_data, self._profile_data, self._config_command
         )
-        result_evaluator.print_results()
 
     def store_results(self):
         configs = self._config_command.get_all_config()
@@ -85,11 +94,15 @@ def _run_generator(self, cg):
 
             if run_config_measurement:
                 run_config_measurement.set_metric_weightings(
-                    metric_objectives=[self._config_command.objectives]
+                    metric_objectives=[
+                        model.objectives()
+                        for model in self._config_command.profile_models
+                    ]
                 )
-                run_config_measurement.set_model_config_constraints(
-                    model_config_constraints=[self._config_command.constraints]
+                run_config_measurement.set_model_config_weighting(
+                    model_config_weights=[1] * len(self._config_command.profile_models)
                 )
+                run_config_measurement.set_constraint_manager(self._constraint_manager)
 
             self._profile_data.add_run_config_measurement(
                 run_config, run_config_measurement
@@ -105,6 +118,7 @@ def patched_analyzer_state_from_dict(state_dict):
                 state_dict[
                     "ModelManager.model_variant_name_manager"
                 ] = ModelVariantNameManager()
+            self._upgrade_model_run_configs(state_dict)
             return old_fn(state_dict)
 
         p = patch(
@@ -112,3 +126,20 @@ def patched_analyzer_state_from_dict(state_dict):
             patched_analyzer_state_from_dict,
         )
         p.start()
+
+    def _upgrade_model_run_configs(self, state_dict):
+        """
+        Older checkpoints store a model run config's ModelConfig (along with
+        its cpu_only flag) directly, rather than as a ModelConfigVariant
+        """
+        results = state_dict["ResultManager.results"]["_results"]
+        for model_measurements in results.values():
+            for run_config_dict, _ in model_measurements.values():
+                for model_run_config_dict in run_config_dict["_model_run_configs"]:
+                    if "_model_config" in model_run_config_dict:
+                        model_config_dict = model_run_config_dict.pop("_model_config")
+                        model_config_dict.pop("cpu_only", None)
+                        model_run_config_dict["_model_config_variant"] = {
+                            "model_config": model_config_dict,
+                            "variant_name": model_config_dict["name"],
+                        }
@@ -15,10 +15,13 @@
 # limitations under the License.
 
 import re
+from unittest.mock import patch
 
 from config_command_experiment import ConfigCommandExperiment
 
 from model_analyzer.cli.cli import CLI
+from model_analyzer.config.input.config_status import ConfigStatus
+from model_analyzer.constants import CONFIG_PARSER_SUCCESS
 from tests.common.test_utils import convert_to_bytes
 from tests.mocks.mock_config import MockConfig
 from tests.mocks.mock_model_config import MockModelConfig
@@ -65,15 +68,21 @@ def make_config(data_path, model_name, other_args):
 
         mock_config = MockConfig(args, yaml_content)
         mock_config.start()
-        config = ConfigCommandExperiment()
-        cli = CLI()
-        cli.add_subcommand(
-            cmd="profile",
-            help="Run model inference profiling based on specified CLI or "
-            "config options.",
-            config=config,
-        )
-        cli.parse()
+
+        # Nothing is profiled, so perf analyzer does not need to be installed
+        with patch(
+            "model_analyzer.config.input.config_command_profile.binary_path_validator",
+            lambda _: ConfigStatus(status=CONFIG_PARSER_SUCCESS),
+        ):
+            config = ConfigCommandExperiment()
+            cli = CLI()
+            cli.add_subcommand(
+                cmd="profile",
+                help="Run model inference profiling based on specified CLI or "
+                "config options.",
+                config=config,
+            )
+            cli.parse()
         mock_config.stop()
 
         mock_model_config.stop()
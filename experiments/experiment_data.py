@@ -29,14 +29,21 @@ def __init__(self):
         self._best_run_config_measurement = None
         self._missing_measurement_count = 0
 
+        # Every (unique) run config a measurement was requested for, in order,
+        # including the ones missing from the data
+        self._requested_keys = {}
+        self._measurements_to_best = 0
+
     def add_run_config_measurement(self, run_config, run_config_measurement):
         """
         Add a run_config_measurement for the given run_config
         """
+        ma_key, pa_key = self._extract_run_config_keys(run_config)
+        self._requested_keys.setdefault((ma_key, pa_key), len(self._requested_keys))
+
         if not run_config_measurement:
             return
 
-        ma_key, pa_key = self._extract_run_config_keys(run_config)
         self._add_run_config_measurement_from_keys(
             ma_key, pa_key, run_config, run_config_measurement
         )
@@ -66,6 +73,23 @@ def get_run_config_measurement_count(self):
     def get_missing_measurement_count(self):
         return self._missing_measurement_count
 
+    def reset_missing_measurement_count(self):
+        self._missing_measurement_count = 0
+
+    def get_requested_measurement_count(self):
+        """
+        Get the number of unique run configs a measurement was
+        requested for, including the ones missing from the data
+        """
+        return len(self._requested_keys)
+
+    def get_measurements_to_best(self):
+        """
+        Get the number of unique run configs a measurement was requested
+        for, up to and including the best measurement in the data
+        """
+        return self._measurements_to_best
+
     def get_best_run_config_measurement(self):
         """
         Get the best overall measurement in the data
@@ -82,7 +106,7 @@ def get_best_run_config(self):
     def _add_run_config_measurement_from_keys(
         self, ma_key, pa_key, run_config, run_config_measurement
     ):
-        self._update_best_trackers(run_config, run_config_measurement)
+        self._update_best_trackers(ma_key, pa_key, run_config, run_config_measurement)
 
         curr_dict = self._data
 
@@ -90,7 +114,7 @@ def _add_run_config_measurement_from_keys(
             curr_dict[ma_key] = {}
         curr_dict[ma_key][pa_key] = run_config_measurement
 
-    def _update_best_trackers(self, run_config, run_config_measurement):
+    def _update_best_trackers(self, ma_key, pa_key, run_config, run_config_measurement):
         if run_config_measurement.is_passing_constraints() and (
             not self._best_run_config_measurement
             or (run_config_measurement > self._best_run_config_measurement)
@@ -98,6 +122,9 @@ def _update_best_trackers(self, run_config, run_config_measurement):
             self._best_run_config_measurement = run_config_measurement
             self._best_run_config = run_config
 
+            if (ma_key, pa_key) in self._requested_keys:
+                self._measurements_to_best = self._requested_keys[(ma_key, pa_key)] + 1
+
     def _get_run_config_measurement_from_keys(self, ma_key, pa_key, skip_warn=False):
         if ma_key not in self._data:
             if not skip_warn:
@@ -115,30 +142,42 @@ def _get_run_config_measurement_from_keys(self, ma_key, pa_key, skip_warn=False)
         return self._data[ma_key][pa_key]
 
     def _extract_run_config_keys(self, run_config):
-        model_config_key = ";".join(
-            [
-                self._extract_model_config_key(x.model_config())
-                for x in run_config.model_run_configs()
-            ]
-        )
-        perf_analyzer_key = ";".join(
-            [
-                self._extract_perf_config_key(x.perf_config())
-                for x in run_config.model_run_configs()
-            ]
-        )
+        """
+        Returns the keys of the run config: a tuple of (instance count,
+        max batch size) for every model, and a tuple of the (clamped)
+        concurrency * batch size of every model
+        """
+        model_config_key = ()
+        perf_analyzer_key = ()
+        for model_run_config in run_config.model_run_configs():
+            model_config_key += self._extract_model_config_key(
+                model_run_config.model_config()
+            )
+            perf_analyzer_key += self._extract_perf_config_key(
+                model_run_config.perf_config()
+            )
 
         return (model_config_key, perf_analyzer_key)
 
     def _extract_model_config_key(self, model_config):
         model_config_dict = model_config.get_config()
-        max_batch_size = model_config_dict.get("max_batch_size", 0)
+        max_batch_size = int(model_config_dict.get("max_batch_size", 0))
         instance_group = model_config_dict.get("instance_group", [{}])
-        instance_count = instance_group[0].get("count", 0)
-        key = f"instance_count={instance_count},max_batch_size={max_batch_size}"
-        return key
+        instance_count = int(instance_group[0].get("count", 0))
+        return (instance_count, max_batch_size)
 
     def _extract_perf_config_key(self, perf_config):
+        concurrency = perf_config["concurrency-range"]
+        batch_size = perf_config["batch-size"]
+
+        # Without a concurrency, perf_analyzer runs at a concurrency of 1
+        if concurrency is None:
+            concurrency = 1
+
+        if isinstance(concurrency, int) and isinstance(batch_size, int):
+            return (self._clamp_to_power_of_two(concurrency * batch_size),)
+
+        # Ranges (e.g. 1:16) are only found in the CLI string
         pa_string = perf_config.to_cli_string()
         return self._make_pa_key_from_cli_string(pa_string)
 
@@ -146,21 +185,20 @@ def _make_pa_key_from_cli_string(self, pa_cli_string):
         concurrencies = re.findall("--concurrency-range=(\d+)", pa_cli_string)
         batch_sizes = re.findall(" -b (\d+)", pa_cli_string)
 
+        # Without a concurrency, perf_analyzer runs at a concurrency of 1
+        if not concurrencies and len(batch_sizes) == 1:
+            concurrencies = ["1"]
+
         if len(concurrencies) != len(batch_sizes):
             raise Exception(f"concurrencies don't match batch sizes")
 
-        for i in range(len(concurrencies)):
-            tmp_int = int(concurrencies[i]) * int(batch_sizes[i])
-            clamped_int = self._clamp_to_power_of_two(tmp_int)
-            concurrencies[i] = str(clamped_int)
-
-        return ";".join(concurrencies)
+        return tuple(
+            self._clamp_to_power_of_two(int(concurrency) * int(batch_size))
+            for concurrency, batch_size in zip(concurrencies, batch_sizes)
+        )
 
     def _clamp_to_power_of_two(self, num):
         """
         Return the smallest power of two that is >= the input
         """
-        v = 1
-        while v < num:
-            v *= 2
-        return v
+        return 1 << max(num - 1, 0).bit_length()
@@ -38,6 +38,48 @@ def __init__(
         if config_command.min_throughput is not None:
             self._maximize_throughput = False
 
+    def get_percentile(self):
+        """
+        Returns how close the best measurement found by the generator is to
+        the best measurement in the checkpoint (1.0 is the optimum), or None
+        if the generator found no passing measurement
+        """
+        overall_best_measurement = self._raw_data.get_best_run_config_measurement()
+        generator_best_measurement = (
+            self._profile_data.get_best_run_config_measurement()
+        )
+        if not overall_best_measurement or not generator_best_measurement:
+            return None
+
+        if self._maximize_throughput:
+            return round(
+                generator_best_measurement.get_non_gpu_metric_value("perf_throughput")
+                / overall_best_measurement.get_non_gpu_metric_value("perf_throughput"),
+                2,
+            )
+        else:
+            return round(
+                overall_best_measurement.get_non_gpu_metric_value("perf_latency_p99")
+                / generator_best_measurement.get_non_gpu_metric_value(
+                    "perf_latency_p99"
+                ),
+                2,
+            )
+
+    def get_measurement_count(self):
+        """
+        Returns the number of measurements the generator needed,
+        including the ones missing from the checkpoint
+        """
+        return self._profile_data.get_requested_measurement_count()
+
+    def get_measurements_to_best(self):
+        """
+        Returns the number of measurements the generator
+        needed before it found its best measurement
+        """
+        return self._profile_data.get_measurements_to_best()
+
     def print_results(self):
         overall_best_measurement = self._raw_data.get_best_run_config_measurement()
         overall_best_run_config = self._raw_data.get_best_run_config()
@@ -80,25 +122,14 @@ def print_results(self):
             best_latency = generator_best_measurement.get_non_gpu_metric_value(
                 "perf_latency_p99"
             )
-            overall_best_throughput = overall_best_measurement.get_non_gpu_metric_value(
-                "perf_throughput"
-            )
-            overall_best_latency = overall_best_measurement.get_non_gpu_metric_value(
-                "perf_latency_p99"
-            )
-
-            if self._maximize_throughput:
-                percentile = round(best_throughput / overall_best_throughput, 2)
-            else:
-                percentile = round(overall_best_latency / best_latency, 2)
         else:
             best_throughput = None
             best_latency = None
-            percentile = None
 
         print(f"Generator best throughput: {best_throughput}")
         print(f"Generator best latency: {best_latency}")
-        print(f"Percentile: {percentile}")
+        print(f"Generator measurements to best: {self.get_measurements_to_best()}")
+        print(f"Percentile: {self.get_percentile()}")
         print()
 
     def _run_config_to_string(self, run_config):
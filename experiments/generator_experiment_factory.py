@@ -16,6 +16,7 @@
 
 from unittest.mock import MagicMock, patch
 
+from model_analyzer.config.generate.model_profile_spec import ModelProfileSpec
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
 )
@@ -23,6 +24,7 @@
     RunConfigGeneratorFactory,
 )
 from model_analyzer.config.generate.search_dimension import SearchDimension
+from model_analyzer.config.generate.search_parameters import SearchParameters
 
 
 class GeneratorExperimentFactory:
@@ -46,27 +48,51 @@ def create_generator(config_command):
 
         GeneratorExperimentFactory.config_command = config_command
 
-        p1 = patch(
-            "model_analyzer.config.generate.run_config_generator_factory.RunConfigGeneratorFactory._get_batching_supported_dimensions",
-            GeneratorExperimentFactory.get_batching_supported_dimensions,
+        p = patch(
+            "model_analyzer.config.generate.run_config_generator_factory.RunConfigGeneratorFactory._get_dimensions_for_model",
+            GeneratorExperimentFactory.get_dimensions_for_model,
         )
-        p2 = patch(
-            "model_analyzer.config.generate.run_config_generator_factory.RunConfigGeneratorFactory._get_batching_not_supported_dimensions",
-            GeneratorExperimentFactory.get_batching_not_supported_dimensions,
-        )
-        p1.start()
-        p2.start()
+        p.start()
         mvn = ModelVariantNameManager()
         generator = RunConfigGeneratorFactory.create_run_config_generator(
-            config_command,
-            MagicMock(),
-            config_command.profile_models,
-            MagicMock(),
-            MagicMock(),
-            mvn,
+            command_config=config_command,
+            state_manager=MagicMock(),
+            gpus=MagicMock(),
+            models=config_command.profile_models,
+            client=MagicMock(),
+            result_manager=MagicMock(),
+            model_variant_name_manager=mvn,
+            search_parameters=GeneratorExperimentFactory.get_search_parameters(
+                config_command
+            ),
+            composing_search_parameters={},
         )
         return generator
 
+    @staticmethod
+    def get_search_parameters(config_command):
+        """
+        Returns the search parameters of each profiled model,
+        which the optuna search mode searches over
+        """
+        search_parameters = {}
+        for model in config_command.profile_models:
+            model_profile_spec = ModelProfileSpec(
+                model, config_command, MagicMock(), MagicMock()
+            )
+            search_parameters[model.model_name()] = SearchParameters(
+                config=config_command, model=model_profile_spec
+            )
+
+        return search_parameters
+
+    @staticmethod
+    def get_dimensions_for_model(model):
+        if model.supports_batching():
+            return GeneratorExperimentFactory.get_batching_supported_dimensions()
+        else:
+            return GeneratorExperimentFactory.get_batching_not_supported_dimensions()
+
     @staticmethod
     def get_batching_supported_dimensions():
         mbs_min = GeneratorExperimentFactory.config_command.min_mbs_index
@@ -136,6 +136,11 @@ def profile(
 
             logger.info(self._get_profile_complete_string())
             logger.info("")
+
+            if self._config.optuna_multi_objective:
+                for model_name in self._result_manager.get_model_names():
+                    logger.info(self._get_pareto_frontier_string(model_name))
+                logger.info("")
         elif self._state_manager.starting_fresh_run():
             raise TritonModelAnalyzerException(
                 "No model repository specified and no checkpoint found. Please either specify a model repository (-m) or load a checkpoint (--checkpoint-directory)."
@@ -300,6 +305,17 @@ def _get_profile_complete_string(self):
             f"configurations for models: {profiled_model_list}"
         )
 
+    def _get_pareto_frontier_string(self, model_name: str) -> str:
+        frontier = self._result_manager.get_pareto_frontier(model_name)
+        frontier_config_names = sorted(
+            set([measurement.model_variants_name() for measurement in frontier])
+        )
+
+        return (
+            f"{len(frontier)} measurements of {model_name} are on the Pareto frontier, "
+            f"from configurations: {frontier_config_names}"
+        )
+
     def _get_num_profiled_configs(self):
         return sum(
             [
@@ -31,6 +31,7 @@
 from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
 
 from .config_generator_interface import ConfigGeneratorInterface
+from .dominance_pruner import DominancePruner
 from .model_profile_spec import ModelProfileSpec
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -83,6 +84,13 @@ def __init__(
         #
         self._curr_max_batch_size_throughputs: List[float] = []
 
+        self._dominance_pruner = (
+            DominancePruner(self._base_model_name)
+            if config.brute_search_dominance_pruning_enable
+            else None
+        )
+        self._dominated_config_count = 0
+
     def _is_done(self) -> bool:
         """Returns true if this generator is done generating configs"""
         return self._generator_started and (self._default_only or self._done_walking())
@@ -100,9 +108,22 @@ def get_configs(self) -> Generator[ModelConfigVariant, None, None]:
 
             self._generator_started = True
             config = self._get_next_model_config_variant()
-            yield (config)
+
+            if self._is_dominated(config):
+                # A skipped config ends a max batch size walk like a failed one
+                self._last_results = []
+            else:
+                yield (config)
+                self._add_results_to_dominance_pruner(config)
+
             self._step()
 
+        if self._dominated_config_count:
+            logger.info(
+                f"Dominance pruning skipped {self._dominated_config_count} "
+                f"model config(s) of {self._base_model_name}"
+            )
+
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
     ) -> None:
@@ -116,6 +137,30 @@ def set_last_results(
         """
         self._last_results = measurements
 
+    def _is_dominated(self, config: ModelConfigVariant) -> bool:
+        if not self._dominance_pruner:
+            return False
+
+        parameter = self._dominance_pruner.find_dominating_parameter(
+            config.model_config.get_config()
+        )
+        if parameter is None:
+            return False
+
+        logger.info(
+            f"Skipping {config.variant_name}: a smaller {parameter} already "
+            "had higher throughput at every measured load"
+        )
+        self._dominated_config_count += 1
+
+        return True
+
+    def _add_results_to_dominance_pruner(self, config: ModelConfigVariant) -> None:
+        if self._dominance_pruner:
+            self._dominance_pruner.add_results(
+                config.model_config.get_config(), self._last_results
+            )
+
     @abc.abstractmethod
     def _done_walking(self) -> bool:
         raise NotImplementedError
@@ -17,7 +17,9 @@
 from model_analyzer.config.run.run_config import RunConfig
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.device.gpu_device import GPUDevice
+from model_analyzer.perf_analyzer.request_trace import RequestTrace
 from model_analyzer.result.parameter_search import ParameterSearch
+from model_analyzer.result.request_rate_predictor import RequestRatePredictor
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 from model_analyzer.triton.client.client import TritonClient
@@ -62,6 +64,7 @@ def __init__(
         self._client = client
         self._result_manager = result_manager
         self._model_variant_name_manager = model_variant_name_manager
+        self._request_trace: Optional[RequestTrace] = None
 
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
@@ -126,6 +129,10 @@ def _binary_search_over_top_results(self) -> Generator[RunConfig, None, None]:
                     model_parameters=model_parameters,
                     perf_analyzer_flags=perf_analyzer_flags,
                     skip_parameter_sweep=True,
+                    request_rate_predictor=self._create_request_rate_predictor(
+                        run_config
+                    ),
+                    batch_size=self._get_batch_size(run_config),
                 )
                 for parameter in parameter_search.search_parameters():
                     run_config = self._set_parameter(
@@ -134,6 +141,41 @@ def _binary_search_over_top_results(self) -> Generator[RunConfig, None, None]:
                     yield run_config
                     parameter_search.add_run_config_measurement(self._last_measurement)
 
+    def _create_request_rate_predictor(
+        self, run_config: RunConfig
+    ) -> Optional[RequestRatePredictor]:
+        # The predictor models a single model on the server, and is
+        # only used to skip request rates that violate the latency budget
+        if (
+            not self._config.request_rate_prediction_enable
+            or len(run_config.model_run_configs()) != 1
+        ):
+            return None
+
+        model_run_config = run_config.model_run_configs()[0]
+        model = self._get_model(model_run_config.model_name())
+        model_config = model_run_config.model_config()
+        if not model or not model_config:
+            return None
+
+        request_rate_predictor = RequestRatePredictor.create(
+            model_config, len(self._gpus), model
+        )
+        if not request_rate_predictor.has_latency_budget():
+            return None
+
+        return request_rate_predictor
+
+    def _get_batch_size(self, run_config: RunConfig) -> int:
+        return run_config.model_run_configs()[0].perf_config()["batch-size"]
+
+    def _get_model(self, model_name: str) -> Optional[ModelProfileSpec]:
+        for model in self._models:
+            if model_name == model.model_name():
+                return model
+
+        return None
+
     def _get_model_parameters(self, model_name: str) -> Dict:
         for model in self._models:
             if model_name == model.model_name():
@@ -148,13 +190,29 @@ def _get_model_perf_analyzer_flags(self, model_name: str) -> Dict:
         return {}
 
     def _set_parameter(
-        self, run_config: RunConfig, model_parameters: Dict, parameter: int
+        self, run_config: RunConfig, model_parameters: Dict, parameter: float
     ) -> RunConfig:
         for model_run_config in run_config.model_run_configs():
             perf_config = model_run_config.perf_config()
             if self._config.is_request_rate_specified(model_parameters):
                 perf_config.update_config({"request-rate-range": parameter})
+            elif self._config.is_request_trace_specified():
+                # The trace cannot be replayed at a scale of 0, which the
+                # binary search returns after a failed measurement
+                request_intervals = self._get_request_trace().get_intervals_file(
+                    max(
+                        parameter,
+                        self._config.run_config_search_min_request_trace_scale,
+                    )
+                )
+                perf_config.update_config({"request-intervals": request_intervals})
             else:
                 perf_config.update_config({"concurrency-range": parameter})
 
         return run_config
+
+    def _get_request_trace(self) -> RequestTrace:
+        if self._request_trace is None:
+            self._request_trace = RequestTrace(self._config)
+
+        return self._request_trace
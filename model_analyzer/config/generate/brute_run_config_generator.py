@@ -30,6 +30,7 @@
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 from model_analyzer.triton.client.client import TritonClient
+from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
 
 from .config_generator_interface import ConfigGeneratorInterface
 
@@ -37,6 +38,11 @@
 class BruteRunConfigGenerator(ConfigGeneratorInterface):
     """
     Generates all RunConfigs to execute via brute force given a list of models
+
+    By default every ModelRunConfig (model config variant and perf analyzer config)
+    of one model is combined with every ModelRunConfig of the next. When minimizing
+    restarts, the variants of all models are fixed first and every perf analyzer
+    config is swept for that combination, so each combination is only loaded once
     """
 
     def __init__(
@@ -77,10 +83,12 @@ def __init__(
         self._curr_model_run_configs: List[Optional[ModelRunConfig]] = [
             None for n in range(self._num_models)
         ]
+        self._curr_model_config_variants: Dict[int, ModelConfigVariant] = {}
         self._curr_results: List = [[] for n in range(self._num_models)]
-        self._curr_generators: Dict[int, ConfigGeneratorInterface] = {}
+        self._curr_generators: Dict[int, ModelRunConfigGenerator] = {}
 
         self._skip_default_config = skip_default_config
+        self._minimize_restarts = config.brute_search_minimize_restarts
 
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
@@ -99,10 +107,16 @@ def get_configs(self) -> Generator[RunConfig, None, None]:
         yield from self._get_next_config()
 
     def _get_next_config(self) -> Generator[RunConfig, None, None]:
+        generate_subset = (
+            self._generate_variant_subset
+            if self._minimize_restarts
+            else self._generate_subset
+        )
+
         if not self._skip_default_config:
-            yield from self._generate_subset(0, default_only=True)
+            yield from generate_subset(0, default_only=True)
 
-        yield from self._generate_subset(0, default_only=False)
+        yield from generate_subset(0, default_only=False)
 
     def _generate_subset(
         self, index: int, default_only: bool
@@ -128,6 +142,45 @@ def _generate_subset(
 
             self._send_results_to_generator(index)
 
+    def _generate_variant_subset(
+        self, index: int, default_only: bool
+    ) -> Generator[RunConfig, None, None]:
+        mrcg = ModelRunConfigGenerator(
+            self._config,
+            self._gpus,
+            self._models[index],
+            self._client,
+            self._model_variant_name_manager,
+            default_only,
+        )
+
+        self._curr_generators[index] = mrcg
+
+        for model_config_variant in mrcg.get_model_config_variants():
+            self._curr_model_config_variants[index] = model_config_variant
+
+            if index == (len(self._models) - 1):
+                yield from self._generate_perf_subset(0)
+            else:
+                yield from self._generate_variant_subset(index + 1, default_only)
+
+            mrcg.finish_model_config_variant()
+
+    def _generate_perf_subset(self, index: int) -> Generator[RunConfig, None, None]:
+        mrcg = self._curr_generators[index]
+
+        for model_run_config in mrcg.get_model_run_configs(
+            self._curr_model_config_variants[index]
+        ):
+            self._curr_model_run_configs[index] = model_run_config
+
+            if index == (len(self._models) - 1):
+                yield (self._make_run_config())
+            else:
+                yield from self._generate_perf_subset(index + 1)
+
+            self._send_results_to_generator(index)
+
     def _make_run_config(self) -> RunConfig:
         run_config = RunConfig(self._triton_env, self._models[0].genai_perf_flags())
         for index in range(len(self._models)):
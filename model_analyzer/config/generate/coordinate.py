@@ -14,9 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
 from functools import total_ordering
-from typing import Any, Iterator, List, Union
+from typing import Any, Iterator, List, Optional, Union
+
+import numpy as np
 
 
 @total_ordering
@@ -25,7 +26,7 @@ class Coordinate:
     Class to define a coordinate in n-dimension space
     """
 
-    def __init__(self, val: Union["Coordinate", List[int]]):
+    def __init__(self, val: Union["Coordinate", List[int], np.ndarray]):
         """
         val: list
             List of floats or integers corresponding to the location in space
@@ -33,111 +34,71 @@ def __init__(self, val: Union["Coordinate", List[int]]):
         if isinstance(val, Coordinate):
             val = val._values
 
-        self._values: List[int] = deepcopy(val)
+        self._values: np.ndarray = np.array(val)
 
     def __getitem__(self, idx: int) -> int:
-        return self._values[idx]
+        return self._values[idx].item()
 
     def __setitem__(self, idx: int, item: int) -> None:
+        if isinstance(item, float) and self._values.dtype.kind != "f":
+            self._values = self._values.astype(float)
         self._values[idx] = item
 
     def __len__(self) -> int:
         return len(self._values)
 
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None):
+        return np.array(self._values, dtype=dtype)
+
     def __add__(self, other: Any) -> "Coordinate":
         if type(other) == Coordinate:
-            return self._add_coordinate(other)
+            return Coordinate(self._values + other._values)
         elif type(other) == int or type(other) == float:
-            return self._add_number(other)
+            return Coordinate(self._values + other)
         else:
             raise Exception("Unhandled addition type")
 
     def __sub__(self, other: Any) -> "Coordinate":
         if type(other) == Coordinate:
-            return self._sub_coordinate(other)
+            return Coordinate(self._values - other._values)
         elif type(other) == int or type(other) == float:
-            return self._sub_number(other)
+            return Coordinate(self._values - other)
         else:
             raise Exception("Unhandled subtraction type")
 
     def __truediv__(self, other: Any) -> "Coordinate":
         if type(other) == int or type(other) == float:
-            return self._div_number(other)
+            return Coordinate(self._values / other)
         else:
             raise Exception("Unhandled division type")
 
     def __mul__(self, other: Any) -> "Coordinate":
         if type(other) == int or type(other) == float:
-            return self._mul_number(other)
+            return Coordinate(self._values * other)
         else:
             raise Exception("Unhandled mul type")
 
     def __eq__(self, other: Any) -> bool:
-        for i, v in enumerate(self._values):
-            if v != other[i]:
-                return False
-        return True
+        return np.array_equal(self._values, np.asarray(other))
 
     def __lt__(self, other: Any) -> bool:
-        for i, v in enumerate(self._values):
-            if v != other[i]:
-                return v < other[i]
-        return False
+        other_values = np.asarray(other)
+        differences = np.flatnonzero(self._values != other_values)
+        if len(differences) == 0:
+            return False
+
+        first_difference = differences[0]
+        return bool(self._values[first_difference] < other_values[first_difference])
 
     def round(self) -> None:
         """Rounds the coordinate in-place"""
-        for i, _ in enumerate(self._values):
-            self._values[i] = round(self._values[i])
-
-    def _add_coordinate(self, other: Any) -> "Coordinate":
-        ret = Coordinate(self._values)
-        for i, v in enumerate(self._values):
-            ret[i] = v + other[i]
-        return ret
-
-    def _add_number(self, other: Any) -> "Coordinate":
-        ret = Coordinate(self._values)
-        for i, v in enumerate(self._values):
-            ret[i] = v + other
-        return ret
-
-    def _sub_coordinate(self, other: Any) -> "Coordinate":
-        ret = Coordinate(self._values)
-        for i, v in enumerate(self._values):
-            ret[i] = v - other[i]
-        return ret
-
-    def _sub_number(self, other: Any) -> "Coordinate":
-        ret = Coordinate(self._values)
-        for i, v in enumerate(self._values):
-            ret[i] = v - other
-        return ret
-
-    def _mul_number(self, other: Any) -> "Coordinate":
-        ret = Coordinate(self._values)
-        for i, v in enumerate(self._values):
-            ret[i] = v * other
-        return ret
-
-    def _div_number(self, other: Any) -> "Coordinate":
-        ret = Coordinate(self._values)
-        for i, v in enumerate(self._values):
-            ret[i] = v / other
-        return ret
+        self._values = np.rint(self._values).astype(int)
 
     def __iter__(self) -> Iterator:
-        self._idx = 0
-        return self
-
-    def __next__(self) -> int:
-        if self._idx < len(self._values):
-            val = self._values[self._idx]
-            self._idx += 1
-            return val
-        raise StopIteration
+        return iter(self._values.tolist())
 
     def __str__(self) -> str:
-        return str(self._values)
+        return str(self._values.tolist())
 
     def __repr__(self) -> str:
-        return repr(f"Coordinate({self._values})")
+        return repr(f"Coordinate({self._values.tolist()})")
@@ -14,12 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from model_analyzer.config.generate.coordinate import Coordinate
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
 CoordinateKey = Tuple[Coordinate, ...]
+CoordinateLike = Union[Coordinate, List[int]]
 
 
 class CoordinateData:
@@ -33,7 +34,9 @@ def __init__(self) -> None:
         self._visit_counts: Dict[CoordinateKey, int] = {}
         self._is_measured: Dict[CoordinateKey, bool] = {}
 
-    def get_measurement(self, coordinate: Coordinate) -> Optional[RunConfigMeasurement]:
+    def get_measurement(
+        self, coordinate: CoordinateLike
+    ) -> Optional[RunConfigMeasurement]:
         """
         Return the measurement data of the given coordinate.
         """
@@ -50,14 +53,14 @@ def set_measurement(
         self._measurements[key] = measurement
         self._is_measured[key] = True
 
-    def is_measured(self, coordinate: Coordinate) -> bool:
+    def is_measured(self, coordinate: CoordinateLike) -> bool:
         """
         Returns true if a measurement has been set for the given Coordinate
         """
         key: CoordinateKey = tuple(coordinate)
         return self._is_measured.get(key, False)
 
-    def has_valid_measurement(self, coordinate: Coordinate) -> bool:
+    def has_valid_measurement(self, coordinate: CoordinateLike) -> bool:
         """
         Returns true if there is a valid measurement for the given Coordinate
         """
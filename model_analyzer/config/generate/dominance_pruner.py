@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+
+
+class DominancePruner:
+    """
+    Records the throughput of each model config measured by a brute search,
+    and finds the model configs that cannot win: those that increase a
+    numeric model config parameter (e.g. instance count or max batch size)
+    beyond a value whose increase already lowered the throughput at every
+    measured load, with every other parameter unchanged
+    """
+
+    def __init__(self, model_name: str) -> None:
+        """
+        Parameters
+        ----------
+        model_name: str
+            The model whose configs are being pruned. The variants of
+            any other model in a measurement are part of its load
+        """
+        self._model_name = model_name
+
+        # Every measured model config, flattened, with its
+        # throughput at each load it was measured at
+        self._records: List[Tuple[Dict[str, Any], Dict[str, float]]] = []
+
+        # Keyed by (parameter, every other parameter's value), values above
+        # the bound are dominated by a smaller value of the parameter
+        self._bounds: Dict[Tuple[str, str], Any] = {}
+
+    def add_results(
+        self,
+        model_config: Dict,
+        measurements: List[Optional[RunConfigMeasurement]],
+    ) -> None:
+        """
+        Records the measurements of a model config, and updates
+        the bounds it proves against the model configs already recorded
+
+        Parameters
+        ----------
+        model_config: dict
+            The model config, as returned by ModelConfig.get_config()
+        measurements: List of RunConfigMeasurements
+            Every measurement taken with the model config
+        """
+        throughputs = self._get_throughputs(measurements)
+        if not throughputs:
+            return
+
+        parameters = self._flatten(model_config)
+        for recorded_parameters, recorded_throughputs in self._records:
+            parameter = self._get_single_numeric_difference(
+                parameters, recorded_parameters
+            )
+            if parameter is None:
+                continue
+
+            if parameters[parameter] > recorded_parameters[parameter]:
+                self._update_bound(
+                    parameter,
+                    parameters,
+                    larger_throughputs=throughputs,
+                    smaller_throughputs=recorded_throughputs,
+                )
+            else:
+                self._update_bound(
+                    parameter,
+                    recorded_parameters,
+                    larger_throughputs=recorded_throughputs,
+                    smaller_throughputs=throughputs,
+                )
+
+        self._records.append((parameters, throughputs))
+
+    def find_dominating_parameter(self, model_config: Dict) -> Optional[str]:
+        """
+        Returns the parameter whose value makes the model config
+        dominated, or None if the model config is not dominated
+
+        Parameters
+        ----------
+        model_config: dict
+            The model config, as returned by ModelConfig.get_config()
+        """
+        parameters = self._flatten(model_config)
+        for parameter, value in parameters.items():
+            if not self._is_numeric(value):
+                continue
+
+            bound = self._bounds.get(
+                (parameter, self._other_values(parameters, parameter))
+            )
+            if bound is not None and value > bound:
+                return parameter
+
+        return None
+
+    def _update_bound(
+        self,
+        parameter: str,
+        larger_parameters: Dict[str, Any],
+        larger_throughputs: Dict[str, float],
+        smaller_throughputs: Dict[str, float],
+    ) -> None:
+        common_loads = larger_throughputs.keys() & smaller_throughputs.keys()
+        if not common_loads:
+            return
+
+        if all(
+            larger_throughputs[load] < smaller_throughputs[load]
+            for load in common_loads
+        ):
+            key = (parameter, self._other_values(larger_parameters, parameter))
+            value = larger_parameters[parameter]
+            if key not in self._bounds or value < self._bounds[key]:
+                self._bounds[key] = value
+
+    def _get_single_numeric_difference(
+        self, parameters: Dict[str, Any], other_parameters: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Returns the parameter, if it is the only one the two model configs
+        differ in and it is numeric in both, otherwise None
+        """
+        differences = [
+            parameter
+            for parameter in parameters.keys() | other_parameters.keys()
+            if parameters.get(parameter) != other_parameters.get(parameter)
+        ]
+        if len(differences) != 1:
+            return None
+
+        parameter = differences[0]
+        if self._is_numeric(parameters.get(parameter)) and self._is_numeric(
+            other_parameters.get(parameter)
+        ):
+            return parameter
+
+        return None
+
+    def _get_throughputs(
+        self, measurements: List[Optional[RunConfigMeasurement]]
+    ) -> Dict[str, float]:
+        """
+        Returns the throughput of each measurement, keyed by its load
+        (the perf analyzer parameters and the other models' variants)
+        """
+        throughputs = {}
+        for measurement in measurements:
+            if measurement is None:
+                continue
+
+            other_variants = [
+                variant
+                for variant in (measurement.model_variants_name() or "").split(",")
+                if not variant.startswith(f"{self._model_name}_config_")
+            ]
+            load = json.dumps(
+                [other_variants, measurement.model_specific_pa_params()],
+                sort_keys=True,
+            )
+            throughputs[load] = measurement.get_non_gpu_metric_value("perf_throughput")
+
+        return throughputs
+
+    def _flatten(self, value: Any, prefix: str = "") -> Dict[str, Any]:
+        """
+        Flattens the model config into a dict keyed by the path of each
+        field. The name is left out, as it differs between every variant
+        """
+        if isinstance(value, dict):
+            items = [(key, field) for key, field in value.items() if key != "name"]
+        elif isinstance(value, list):
+            items = [(str(index), field) for index, field in enumerate(value)]
+        else:
+            # uint64 fields of the model config protobuf are strings in its dict
+            if isinstance(value, str) and value.isdigit():
+                value = int(value)
+            return {prefix: value}
+
+        flattened = {}
+        for key, field in items:
+            flattened.update(self._flatten(field, f"{prefix}.{key}" if prefix else key))
+
+        return flattened
+
+    def _other_values(self, parameters: Dict[str, Any], parameter: str) -> str:
+        return json.dumps(
+            {key: value for key, value in parameters.items() if key != parameter},
+            sort_keys=True,
+        )
+
+    def _is_numeric(self, value: Any) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from itertools import product
-from typing import Dict, List
+from itertools import chain, product
+from typing import Any, Dict, Iterator, List, Optional
+
+from model_analyzer.constants import BATCHING_SEARCH_PARAMETER_PATHS
 
 
 class GeneratorUtils:
@@ -38,44 +40,82 @@ def generate_combinations(value: object) -> List:
             A list of all the alternatives for the parameters.
         """
 
+        return list(GeneratorUtils.iterate_combinations(value))
+
+    @staticmethod
+    def iterate_combinations(value: object) -> Iterator:
+        """
+        Lazily yields all the alternative fields for
+        a given value, in the same order as generate_combinations()
+
+        Only the alternatives of each individual field are held in memory,
+        never the full cartesian product
+
+        Parameters
+        ----------
+        value : object
+            The value to be used for sweeping.
+        """
+
         if type(value) is dict:
             sweeped_dict = {}
             for key, sweep_choices in value.items():
-                sweep_parameter_list = []
-
                 # This is the list of sweep parameters. When parsing a
                 # config every sweepable parameter will be converted
                 # to a list of values to make the parameter sweeping easier in
                 # here.
-                for sweep_choice in sweep_choices:
-                    sweep_parameter_list += GeneratorUtils.generate_combinations(
-                        sweep_choice
+                sweeped_dict[key] = list(
+                    chain.from_iterable(
+                        GeneratorUtils.iterate_combinations(sweep_choice)
+                        for sweep_choice in sweep_choices
                     )
-
-                sweeped_dict[key] = sweep_parameter_list
+                )
 
             # Generate parameter combinations for this field.
-            return GeneratorUtils.generate_parameter_combinations(sweeped_dict)
+            yield from GeneratorUtils.iterate_parameter_combinations(sweeped_dict)
 
         # When this line of code is executed the value for this field is
         # a list. This list does NOT represent possible sweep values.
         # Because of this we need to ensure that in every sweep configuration,
         # one item from every list item exists.
         elif type(value) is list:
-            # This list contains a set of lists. The return value from this
-            # branch of the code is a list of lists where in each inner list
-            # there is one item from every list item.
-            sweep_parameter_list = []
-            for item in value:
-                sweep_parameter_list_item = GeneratorUtils.generate_combinations(item)
-                sweep_parameter_list.append(sweep_parameter_list_item)
+            # This list contains a set of lists. The yielded values from this
+            # branch of the code are lists where there is one item from every
+            # list item.
+            sweep_parameter_list = [
+                list(GeneratorUtils.iterate_combinations(item)) for item in value
+            ]
 
             # Cartesian product of all the elements in the sweep_parameter_list
-            return [list(x) for x in list(product(*sweep_parameter_list))]
+            for x in product(*sweep_parameter_list):
+                yield list(x)
 
-        # In the default case return a list of the value. This function should
-        # always return a list.
-        return [value]
+        # In the default case yield the value
+        else:
+            yield value
+
+    @staticmethod
+    def count_combinations(value: object) -> int:
+        """
+        Returns the number of alternatives generate_combinations()
+        produces for the value, without generating them
+        """
+
+        if type(value) is dict:
+            count = 1
+            for sweep_choices in value.values():
+                count *= sum(
+                    GeneratorUtils.count_combinations(sweep_choice)
+                    for sweep_choice in sweep_choices
+                )
+            return count
+        elif type(value) is list:
+            count = 1
+            for item in value:
+                count *= GeneratorUtils.count_combinations(item)
+            return count
+
+        return 1
 
     @staticmethod
     def generate_parameter_combinations(params: Dict) -> List[Dict]:
@@ -91,8 +131,143 @@ def generate_parameter_combinations(params: Dict) -> List[Dict]:
             keys are strings and the values must be lists
         """
 
-        param_combinations = list(product(*tuple(params.values())))
-        return [dict(zip(params.keys(), vals)) for vals in param_combinations]
+        return list(GeneratorUtils.iterate_parameter_combinations(params))
+
+    @staticmethod
+    def iterate_parameter_combinations(params: Dict) -> Iterator[Dict]:
+        """
+        Lazily yields the subdictionaries of
+        generate_parameter_combinations()
+
+        Parameters
+        ----------
+        params : dict
+            keys are strings and the values must be lists
+        """
+
+        for vals in product(*tuple(params.values())):
+            yield dict(zip(params.keys(), vals))
+
+    @staticmethod
+    def get_model_config_parameter(
+        model_config_parameters: Optional[Dict], path: List[str]
+    ) -> Optional[List]:
+        """
+        Returns the sweep choices of the model config parameter
+        at the path, or None if it is not specified
+
+        Parameters
+        ----------
+        model_config_parameters : dict
+            The model config parameters, as parsed from the config
+        path : list
+            The keys leading to the parameter, e.g.
+            ["dynamic_batching", "max_queue_delay_microseconds"]
+        """
+
+        value: Any = model_config_parameters
+        for depth, key in enumerate(path):
+            if not isinstance(value, dict) or key not in value:
+                return None
+
+            value = value[key]
+
+            # Every nested field is parsed as a list with one sweep choice
+            if depth < len(path) - 1:
+                if not isinstance(value, list) or len(value) != 1:
+                    return None
+                value = value[0]
+
+        return value if isinstance(value, list) else [value]
+
+    @staticmethod
+    def remove_model_config_parameter(
+        model_config_parameters: Optional[Dict], path: List[str]
+    ) -> None:
+        """
+        Removes the model config parameter at the path, if it is specified
+        """
+
+        value: Any = model_config_parameters
+        for key in path[:-1]:
+            if not isinstance(value, dict) or key not in value:
+                return
+
+            value = value[key]
+            if not isinstance(value, list) or len(value) != 1:
+                return
+            value = value[0]
+
+        if isinstance(value, dict):
+            value.pop(path[-1], None)
+
+    @staticmethod
+    def apply_batching_parameters(param_combo: Dict, values: Dict[str, Any]) -> None:
+        """
+        Sets the searched batching parameters in the param combo
+
+        Parameters
+        ----------
+        param_combo : dict
+            The parameters to apply on top of the default model config
+        values : dict
+            Keys are batching search parameter names (see
+            BATCHING_SEARCH_PARAMETER_PATHS), values are their chosen values
+        """
+
+        for name, path in BATCHING_SEARCH_PARAMETER_PATHS.items():
+            if name not in values:
+                continue
+
+            value = values[name]
+            if name == "preferred_batch_size":
+                value = [value]
+
+            GeneratorUtils._set_nested_value(param_combo, path, value)
+
+            # Requests sent without a priority get the lowest priority
+            if name == "priority_levels":
+                GeneratorUtils._set_nested_value(
+                    param_combo, ["dynamic_batching", "default_priority_level"], value
+                )
+
+    @staticmethod
+    def get_batching_parameters(model_config: Dict) -> Dict[str, Any]:
+        """
+        Returns the values of the batching search parameters set in a
+        model config (the reverse of apply_batching_parameters)
+
+        Parameters
+        ----------
+        model_config : dict
+            The model config, as returned by ModelConfig.get_config()
+        """
+
+        values = {}
+        for name, path in BATCHING_SEARCH_PARAMETER_PATHS.items():
+            value: Any = model_config
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+
+            if name == "preferred_batch_size":
+                value = value[0] if value else None
+
+            if value is None:
+                continue
+
+            # uint64 fields of the model config protobuf are strings in its dict
+            values[name] = value if isinstance(value, bool) else int(value)
+
+        return values
+
+    @staticmethod
+    def _set_nested_value(dict_in: Dict, path: List[str], value: Any) -> None:
+        for key in path[:-1]:
+            if not isinstance(dict_in.get(key), dict):
+                dict_in[key] = {}
+            dict_in = dict_in[key]
+
+        dict_in[path[-1]] = value
 
     @staticmethod
     def generate_doubled_list(min_value: int, max_value: int) -> List[int]:
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 import logging
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
@@ -81,21 +81,20 @@ def __init__(
             ManualModelConfigGenerator._log_first_run = True
 
         self._search_disabled = config.run_config_search_disable
-        self._curr_config_index = 0
         self._curr_max_batch_size_index = 0
 
         self._max_batch_sizes = None
-        self._non_max_batch_size_param_combos: List[Dict] = []
+        self._non_max_batch_size_param_combos: Iterator[Dict] = iter([])
         self._determine_max_batch_sizes_and_param_combos()
 
-        # All configs are pregenerated in _configs[][]
-        # Indexed as follows:
-        #    _configs[_curr_config_index][_curr_max_batch_size_index]
+        # Configs are generated one parameter combination at a time, so that
+        # huge search spaces are never held in memory. Indexed as follows:
+        #    _curr_configs[_curr_max_batch_size_index]
         #
-        self._configs = self._generate_model_config_variants()
+        self._curr_configs = self._generate_next_model_config_variants()
 
     def _done_walking(self) -> bool:
-        return len(self._configs) == self._curr_config_index
+        return self._curr_configs is None
 
     def _done_walking_max_batch_size(self) -> bool:
         if (
@@ -124,7 +123,7 @@ def _reset_max_batch_size(self) -> None:
         self._curr_max_batch_size_index = 0
 
     def _step_config(self) -> None:
-        self._curr_config_index += 1
+        self._curr_configs = self._generate_next_model_config_variants()
 
     def _step_max_batch_size(self) -> None:
         self._curr_max_batch_size_index += 1
@@ -134,47 +133,54 @@ def _step_max_batch_size(self) -> None:
             self._curr_max_batch_size_throughputs.append(last_max_throughput)
 
     def _get_next_model_config_variant(self) -> ModelConfigVariant:
-        return self._configs[self._curr_config_index][self._curr_max_batch_size_index]
-
-    def _generate_model_config_variants(self) -> List[List[ModelConfigVariant]]:
-        """Generate all model config combinations"""
-
-        model_config_variants = []
-        for param_combo in self._non_max_batch_size_param_combos:
-            configs_with_max_batch_size = []
-            if self._max_batch_sizes:
-                for mbs in self._max_batch_sizes:
-                    param_combo["max_batch_size"] = mbs
-                    model_config_variant = self._make_direct_mode_model_config_variant(
-                        param_combo
-                    )
-                    configs_with_max_batch_size.append(model_config_variant)
-            else:
+        assert self._curr_configs is not None
+        return self._curr_configs[self._curr_max_batch_size_index]
+
+    def _generate_next_model_config_variants(
+        self,
+    ) -> Optional[List[ModelConfigVariant]]:
+        """
+        Generate the model configs of the next parameter combination, one
+        per max batch size, or None if all combinations have been generated
+        """
+
+        param_combo = next(self._non_max_batch_size_param_combos, None)
+        if param_combo is None:
+            return None
+
+        configs_with_max_batch_size = []
+        if self._max_batch_sizes:
+            for mbs in self._max_batch_sizes:
+                param_combo["max_batch_size"] = mbs
                 model_config_variant = self._make_direct_mode_model_config_variant(
                     param_combo
                 )
                 configs_with_max_batch_size.append(model_config_variant)
+        else:
+            model_config_variant = self._make_direct_mode_model_config_variant(
+                param_combo
+            )
+            configs_with_max_batch_size.append(model_config_variant)
 
-            model_config_variants.append(configs_with_max_batch_size)
-
-        return model_config_variants
+        return configs_with_max_batch_size
 
     def _determine_max_batch_sizes_and_param_combos(self) -> None:
         """
         Determine self._max_batch_sizes and self._non_max_batch_size_param_combos
         """
         if self._default_only:
-            self._non_max_batch_size_param_combos = [DEFAULT_CONFIG_PARAMS]
+            self._non_max_batch_size_param_combos = iter([DEFAULT_CONFIG_PARAMS])
         else:
             model_config_params = deepcopy(self._base_model.model_config_parameters())
             if model_config_params:
                 self._max_batch_sizes = model_config_params.pop("max_batch_size", None)
+                self._log_number_of_combinations(model_config_params)
                 self._non_max_batch_size_param_combos = (
-                    GeneratorUtils.generate_combinations(model_config_params)
+                    GeneratorUtils.iterate_combinations(model_config_params)
                 )
             else:
                 if self._search_disabled:
-                    self._non_max_batch_size_param_combos = (
+                    self._non_max_batch_size_param_combos = iter(
                         self._generate_search_disabled_param_combos()
                     )
                 else:
@@ -182,6 +188,16 @@ def _determine_max_batch_sizes_and_param_combos(self) -> None:
                         f"Automatic search not supported in ManualModelConfigGenerator"
                     )
 
+    def _log_number_of_combinations(self, model_config_params: Dict) -> None:
+        number_of_combinations = GeneratorUtils.count_combinations(
+            model_config_params
+        ) * len(self._max_batch_sizes or [None])
+
+        logger.info(
+            f"Manual search space of {self._base_model_name} "
+            f"has {number_of_combinations} model config(s)"
+        )
+
     def _generate_search_disabled_param_combos(self) -> List[Dict]:
         """Return the configs when we want to search but searching is disabled"""
         return [DEFAULT_CONFIG_PARAMS]
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from copy import deepcopy
+from typing import Generator, List, Optional, Set, Tuple
+
+from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.result.result_manager import ResultManager
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class MeasurementRepeater:
+    """
+    Measures the top candidate run configs of a model again, until the
+    confidence interval on the objective of every candidate is below the
+    threshold, or the budget of repeated measurements is spent
+
+    The candidates are re-ranked after every repetition, and the candidate
+    with the fewest repetitions is always measured next
+    """
+
+    def __init__(
+        self,
+        config: ConfigCommandProfile,
+        result_manager: ResultManager,
+        models_name: str,
+    ):
+        """
+        Parameters
+        ----------
+        config: ConfigCommandProfile
+            Profile configuration information
+        result_manager: ResultManager
+            The object that handles storing and sorting the results
+        models_name: str
+            The name of the model(s) whose candidates are measured again
+        """
+        self._config = config
+        self._result_manager = result_manager
+        self._models_name = models_name
+
+        self._repetition_count = 0
+        self._last_candidate: Optional[str] = None
+        self._failed_candidates: Set[str] = set()
+
+    def set_last_results(
+        self, measurements: List[Optional[RunConfigMeasurement]]
+    ) -> None:
+        """
+        Candidates whose repetition failed are not measured again
+        """
+        if measurements[-1] is None and self._last_candidate is not None:
+            self._failed_candidates.add(self._last_candidate)
+
+    def get_configs(self) -> Generator[RunConfig, None, None]:
+        """
+        A generator which yields the RunConfig of
+        the candidate to measure again next
+        """
+        while self._repetition_count < self._config.statistical_measurement_budget:
+            candidate = self._get_next_candidate()
+            if candidate is None:
+                break
+
+            run_config, measurement = candidate
+            logger.info(
+                f"Repeating the measurement of {run_config.model_variants_name()} "
+                f"({measurement.repetition_count()} so far)"
+            )
+
+            self._last_candidate = run_config.representation()
+            self._repetition_count += 1
+            yield run_config
+
+        logger.info(
+            f"Statistical measurement of {self._models_name} took "
+            f"{self._repetition_count} repeated measurements"
+        )
+        self._log_candidates()
+
+    def _get_next_candidate(
+        self,
+    ) -> Optional[Tuple[RunConfig, RunConfigMeasurement]]:
+        """
+        Returns the candidate with the fewest repetitions (the best ranked
+        first) whose confidence interval is still above the threshold
+        """
+        remaining_candidates = []
+        for rank, (run_config, measurement) in enumerate(self._get_candidates()):
+            if run_config.representation() in self._failed_candidates:
+                continue
+
+            if self._get_confidence_interval(measurement) <= (
+                self._config.statistical_measurement_ci_threshold
+            ):
+                continue
+
+            remaining_candidates.append(
+                (measurement.repetition_count(), rank, run_config, measurement)
+            )
+
+        if not remaining_candidates:
+            return None
+
+        _, _, run_config, measurement = min(
+            remaining_candidates, key=lambda candidate: candidate[:2]
+        )
+
+        return run_config, measurement
+
+    def _get_candidates(self) -> List[Tuple[RunConfig, RunConfigMeasurement]]:
+        """
+        Returns the RunConfig and best measurement of each of the
+        top results (the passing ones, if any result is passing)
+        """
+        if self._models_name not in self._result_manager.get_model_names():
+            return []
+
+        results = self._result_manager.get_model_sorted_results(
+            self._models_name
+        ).results()
+        top_results = [result for result in results if not result.failing()]
+        if not top_results:
+            top_results = results
+
+        candidates = []
+        for result in top_results[: self._config.statistical_measurement_candidates]:
+            measurements = (
+                result.passing_measurements() or result.run_config_measurements()
+            )
+            candidates.append(
+                (
+                    self._create_run_config(result.run_config(), measurements[0]),
+                    measurements[0],
+                )
+            )
+
+        return candidates
+
+    def _create_run_config(
+        self, run_config: RunConfig, measurement: RunConfigMeasurement
+    ) -> RunConfig:
+        """
+        Returns a copy of the result's RunConfig with the perf analyzer
+        parameters (concurrency, batch size...) of the measurement
+        """
+        run_config = deepcopy(run_config)
+        for model_run_config, pa_params in zip(
+            run_config.model_run_configs(), measurement.model_specific_pa_params()
+        ):
+            model_run_config.perf_config().update_config(pa_params)
+
+        return run_config
+
+    def _get_confidence_interval(self, measurement: RunConfigMeasurement) -> float:
+        return measurement.get_objective_confidence_interval(
+            self._config.statistical_measurement_confidence_level
+        )
+
+    def _log_candidates(self) -> None:
+        for run_config, measurement in self._get_candidates():
+            confidence_interval = self._get_confidence_interval(measurement)
+            interval = (
+                f"+/- {confidence_interval * 100:.1f}%"
+                if measurement.repetition_count() > 1
+                else "not repeated"
+            )
+            logger.info(
+                f"{run_config.model_variants_name()}: "
+                f"{measurement.repetition_count()} repetitions, {interval}"
+            )
@@ -23,6 +23,7 @@
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.device.gpu_device import GPUDevice
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.result.request_rate_predictor import RequestRatePredictor
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 from model_analyzer.triton.client.client import TritonClient
 from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
@@ -98,22 +99,49 @@ def get_configs(self) -> Generator[ModelRunConfig, None, None]:
             The next ModelRunConfig generated by this class
         """
         for model_config_variant in self._mcg.get_configs():
-            self._pacg = PerfAnalyzerConfigGenerator(
-                self._config,
-                model_config_variant.model_config.get_field("name"),
-                self._model_pa_flags,
-                self._model_parameters,
-                self._pacg_early_exit_enable,
-            )
-
-            for perf_analyzer_config in self._pacg.get_configs():
-                run_config = self._generate_model_run_config(
-                    model_config_variant, perf_analyzer_config
-                )
-                yield run_config
+            yield from self.get_model_run_configs(model_config_variant)
 
             self._set_last_results_model_config_generator()
 
+    def get_model_config_variants(self) -> Generator[ModelConfigVariant, None, None]:
+        """
+        Returns the ModelConfigVariants without sweeping their perf analyzer
+        configs. The caller sweeps them with get_model_run_configs(), and must
+        call finish_model_config_variant() before asking for the next variant
+        """
+        yield from self._mcg.get_configs()
+
+    def get_model_run_configs(
+        self, model_config_variant: ModelConfigVariant
+    ) -> Generator[ModelRunConfig, None, None]:
+        """
+        Returns the ModelRunConfigs that sweep the perf analyzer configs
+        of a single ModelConfigVariant
+        """
+        self._pacg = PerfAnalyzerConfigGenerator(
+            self._config,
+            model_config_variant.model_config.get_field("name"),
+            self._model_pa_flags,
+            self._model_parameters,
+            self._pacg_early_exit_enable,
+            request_rate_predictor=self._create_request_rate_predictor(
+                model_config_variant
+            ),
+        )
+
+        for perf_analyzer_config in self._pacg.get_configs():
+            run_config = self._generate_model_run_config(
+                model_config_variant, perf_analyzer_config
+            )
+            yield run_config
+
+    def finish_model_config_variant(self) -> None:
+        """
+        Passes every measurement taken with the current ModelConfigVariant
+        to the model config generator
+        """
+        self._set_last_results_model_config_generator()
+
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
     ) -> None:
@@ -143,6 +171,18 @@ def _generate_model_run_config(
 
         return run_config
 
+    def _create_request_rate_predictor(
+        self, model_config_variant: ModelConfigVariant
+    ) -> Optional[RequestRatePredictor]:
+        # Counting the instances requires checking for CUDA, so only
+        # create the predictor when it is used
+        if not self._config.request_rate_prediction_enable:
+            return None
+
+        return RequestRatePredictor.create(
+            model_config_variant.model_config, len(self._gpus), self._model
+        )
+
     def _determine_early_exit_enables(
         self, config: ConfigCommandProfile, model: ModelProfileSpec
     ) -> None:
@@ -18,6 +18,8 @@
 from copy import deepcopy
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from model_analyzer.config.generate.coordinate import Coordinate
 from model_analyzer.config.generate.coordinate_data import CoordinateData
 from model_analyzer.config.generate.search_config import NeighborhoodConfig
@@ -41,6 +43,16 @@ class Neighborhood:
     #
     TRANSLATION_LIST = [0.09, 0.3, 1.0]
 
+    # Step vectors within a radius, keyed by (number of dimensions, radius).
+    # These only depend on the shape of the search, so are shared by every
+    # neighborhood instead of being enumerated on each step
+    _offset_tables: Dict[Tuple[int, int], np.ndarray] = {}
+
+    # Ridge penalty applied to the linear and quadratic terms of the
+    # surrogate fit. This keeps the fit well-posed when there are fewer
+    # measurements than terms, and shrinks it towards a flat (no step) model
+    SURROGATE_RIDGE_PENALTY = 0.1
+
     def __init__(
         self,
         neighborhood_config: NeighborhoodConfig,
@@ -141,6 +153,9 @@ def _get_best_coordinate_found(self) -> Coordinate:
         return best_coordinate
 
     def _calculate_new_home(self) -> Coordinate:
+        if self._config.get_surrogate() == "quadratic":
+            return self._calculate_new_home_from_surrogate()
+
         step_vector = self._get_step_vector()
         step_vector_coordinate = self._translate_step_vector(
             step_vector, Neighborhood.TRANSLATION_LIST
@@ -149,6 +164,112 @@ def _calculate_new_home(self) -> Coordinate:
         new_coordinate = self._clamp_coordinate_to_bounds(tmp_new_coordinate)
         return new_coordinate
 
+    def _calculate_new_home_from_surrogate(self) -> Coordinate:
+        """
+        Fits a quadratic surrogate to the scores of the measured vectors and
+        returns the coordinate in the neighborhood with the best score:
+        measured if known, otherwise predicted by the surrogate.
+
+        The surrogate is only trusted inside the bounding box of the measured
+        vectors, and stays at home unless a coordinate is expected to beat it
+        by more than the smallest step of the translation list
+        """
+        vectors, scores = self._get_vectors_and_scores()
+        coefficients = self._fit_quadratic_surrogate(vectors, scores)
+
+        best_score = Neighborhood.TRANSLATION_LIST[0]
+        best_coordinate = self._home_coordinate
+        for coordinate in self._get_neighborhood_coordinates():
+            vector = coordinate - self._home_coordinate
+            if not self._is_inside_bounding_box(vector, vectors):
+                continue
+
+            score = self._predict_quadratic_surrogate(coefficients, vector)
+            for measured_vector, measured_score in zip(vectors, scores):
+                if measured_vector == vector:
+                    score = measured_score
+
+            if score > best_score:
+                best_score = score
+                best_coordinate = coordinate
+
+        return best_coordinate
+
+    def _is_inside_bounding_box(
+        self, vector: Coordinate, vectors: List[Coordinate]
+    ) -> bool:
+        for dim, v in enumerate(vector):
+            dim_values = [other[dim] for other in vectors]
+            if v < min(dim_values) or v > max(dim_values):
+                return False
+        return True
+
+    def _get_vectors_and_scores(self) -> Tuple[List[Coordinate], List[float]]:
+        """
+        Returns the measured vectors (including home) and their scores
+        relative to home: the objective comparison if home is passing
+        constraints, else the constraint comparison
+        """
+        home_measurement = self._get_home_measurement()
+        if not home_measurement:
+            raise Exception("Can't step from home if it has no measurement")
+
+        compare_constraints = not home_measurement.is_passing_constraints()
+        vectors, measurements = self._get_all_measurements()
+
+        scores = []
+        for m in measurements:
+            if compare_constraints:
+                score = home_measurement.compare_constraints(m)
+            else:
+                score = home_measurement.compare_measurements(m)
+            scores.append(score if score else 0.0)
+
+        vectors.append(Coordinate([0] * self._config.get_num_dimensions()))
+        scores.append(0.0)
+
+        return vectors, scores
+
+    def _fit_quadratic_surrogate(
+        self, vectors: List[Coordinate], scores: List[float]
+    ) -> np.ndarray:
+        """
+        Ridge regression of score = c + sum(b_i * x_i) + sum(a_i * x_i^2)
+
+        The ridge penalty is applied by appending sqrt(penalty) * I rows
+        (without the unpenalized intercept) to the least squares system
+
+        Returns
+        -------
+        coefficients
+            [c, b_0, ..., b_n-1, a_0, ..., a_n-1]
+        """
+        features = np.array(
+            [self._get_quadratic_features(vector) for vector in vectors]
+        )
+        num_features = features.shape[1]
+
+        penalty = (
+            math.sqrt(Neighborhood.SURROGATE_RIDGE_PENALTY) * np.eye(num_features)[1:]
+        )
+
+        coefficients, *_ = np.linalg.lstsq(
+            np.vstack([features, penalty]),
+            np.concatenate([np.array(scores, dtype=float), np.zeros(num_features - 1)]),
+            rcond=None,
+        )
+
+        return coefficients
+
+    def _predict_quadratic_surrogate(
+        self, coefficients: np.ndarray, vector: Coordinate
+    ) -> float:
+        return float(self._get_quadratic_features(vector) @ coefficients)
+
+    def _get_quadratic_features(self, vector: Coordinate) -> np.ndarray:
+        values = np.array(list(vector), dtype=float)
+        return np.concatenate([[1.0], values, values * values])
+
     def _translate_step_vector(
         self, step_vector: List[float], translate_list: List[float]
     ) -> Coordinate:
@@ -192,8 +313,8 @@ def _pick_fast_mode_coordinate_to_initialize(self) -> Optional[Coordinate]:
 
         max_num_uncovered = -1
         best_coordinate = None
-        for coordinate in self._neighborhood:
-            if not self._is_coordinate_measured(coordinate):
+        for coordinate in self._neighborhood.tolist():
+            if not self._coordinate_data.is_measured(coordinate):
                 num_uncovered = self._get_num_uncovered_values(
                     coordinate, covered_values_per_dimension
                 )
@@ -202,52 +323,81 @@ def _pick_fast_mode_coordinate_to_initialize(self) -> Optional[Coordinate]:
                     max_num_uncovered = num_uncovered
                     best_coordinate = coordinate
 
-        return best_coordinate
+        return Coordinate(best_coordinate) if best_coordinate is not None else None
 
     def get_nearest_neighbor(self, coordinate_in: Coordinate) -> Coordinate:
         """
         Find the nearest coordinate to the `coordinate_in` among the
         coordinates within the current neighborhood.
         """
-        min_distance = float("inf")
-        nearest_neighbor = self._home_coordinate
+        if len(self._neighborhood) == 0:
+            return self._home_coordinate
 
-        for coordinate in self._neighborhood:
-            distance = Neighborhood.calc_distance(coordinate, coordinate_in)
-            if distance < min_distance:
-                nearest_neighbor = coordinate
-                min_distance = distance
+        differences = self._neighborhood - np.asarray(coordinate_in)
+        distances = np.sqrt(np.sum(differences**2, axis=1))
 
-        return nearest_neighbor
+        return Coordinate(self._neighborhood[np.argmin(distances)])
 
-    def _create_neighborhood(self) -> List[Coordinate]:
+    def _get_neighborhood_coordinates(self) -> List[Coordinate]:
+        return [Coordinate(c) for c in self._neighborhood]
+
+    def _create_neighborhood(self) -> np.ndarray:
         """
-        Create and return a neighborhood of all Coordinates within
-        range <_radius> that are also within all bounds
+        Create and return a neighborhood of all coordinates within
+        range <_radius> that are also within all bounds, as the rows
+        of an array
+
+        Only the active dimensions are stepped in, every
+        other dimension keeps the home coordinate's value
         """
+        active_dimensions = self._config.get_active_dimensions()
+        active_offsets = Neighborhood._get_offset_table(
+            len(active_dimensions), self._radius
+        )
 
-        neighborhood = []
-        potential_steps = self._get_potential_steps(
-            self._config.get_num_dimensions(), self._radius
+        offsets = np.zeros(
+            (len(active_offsets), self._config.get_num_dimensions()), dtype=int
         )
+        offsets[:, active_dimensions] = active_offsets
 
-        for potential_step in potential_steps:
-            for i, v in enumerate(self._home_coordinate):
-                potential_step[i] += v
-            if self._is_in_bounds(potential_step):
-                neighborhood.append(Coordinate(potential_step))
-        return neighborhood
-
-    def _is_in_bounds(self, potential_coordinate: List[int]) -> bool:
-        for i, v in enumerate(potential_coordinate):
-            dim = self._config.get_dimension(i)
-            if v > dim.get_max_idx() or v < dim.get_min_idx():
-                return False
-        return True
+        potential_coordinates = offsets + np.asarray(self._home_coordinate)
+
+        min_indexes, max_indexes = self._get_bounds()
+        in_bounds = np.all(
+            (potential_coordinates >= min_indexes)
+            & (potential_coordinates <= max_indexes),
+            axis=1,
+        )
+
+        return potential_coordinates[in_bounds]
+
+    def _get_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        min_indexes = []
+        max_indexes = []
+        for dimension in self._config.get_dimensions():
+            min_indexes.append(dimension.get_min_idx())
+            max_indexes.append(dimension.get_max_idx())
 
-    def _get_potential_steps(
-        self, num_coordinates: int, radius: int
-    ) -> List[List[int]]:
+        return np.array(min_indexes), np.array(max_indexes)
+
+    @classmethod
+    def _get_offset_table(cls, num_dimensions: int, radius: int) -> np.ndarray:
+        """
+        Returns a (read-only) array of all step vectors that are within
+        <radius> distance, computed once per number of dimensions and radius
+        """
+        key = (num_dimensions, radius)
+        if key not in cls._offset_tables:
+            offsets = np.array(
+                cls._get_potential_steps(num_dimensions, radius), dtype=int
+            ).reshape(-1, num_dimensions)
+            offsets.flags.writeable = False
+            cls._offset_tables[key] = offsets
+
+        return cls._offset_tables[key]
+
+    @classmethod
+    def _get_potential_steps(cls, num_coordinates: int, radius: int) -> List[List[int]]:
         """
         Create and return a list of all possible step vectors that are
         within <_radius> distance
@@ -255,11 +405,12 @@ def _get_potential_steps(
 
         result_list: List[List[int]] = []
         v = [0] * num_coordinates
-        self._permute_steps_in_range(v, radius, 0, result_list)
+        cls._permute_steps_in_range(v, radius, 0, result_list)
         return result_list
 
+    @classmethod
     def _append_combinations_to_results(
-        self, curr_val: List[int], index: int, result_list: List[List[int]]
+        cls, curr_val: List[int], index: int, result_list: List[List[int]]
     ) -> None:
         """
         Given a List of integers (a potential step vector) with all positive
@@ -270,18 +421,19 @@ def _append_combinations_to_results(
         [1,0,2], [1,0,-2], [-1,0,2], [-1,0,-2]
         """
         if index + 1 == len(curr_val):
-            result_list.append(deepcopy(curr_val))
+            result_list.append(list(curr_val))
             if curr_val[index]:
                 curr_val[index] = -curr_val[index]
-                result_list.append(deepcopy(curr_val))
+                result_list.append(list(curr_val))
         else:
-            self._append_combinations_to_results(curr_val, index + 1, result_list)
+            cls._append_combinations_to_results(curr_val, index + 1, result_list)
             if curr_val[index]:
                 curr_val[index] = -curr_val[index]
-                self._append_combinations_to_results(curr_val, index + 1, result_list)
+                cls._append_combinations_to_results(curr_val, index + 1, result_list)
 
+    @classmethod
     def _permute_steps_in_range(
-        self,
+        cls,
         curr_step: List[int],
         radius: int,
         index: int,
@@ -299,21 +451,23 @@ def _permute_steps_in_range(
             if index == len(curr_step) - 1:
                 d = Neighborhood.calc_distance(base, curr_step)
                 if d <= radius:
-                    self._append_combinations_to_results(curr_step, 0, result_list)
+                    cls._append_combinations_to_results(curr_step, 0, result_list)
                 else:
                     return
             # Non-leaf coordinate index: Recurse
             else:
-                self._permute_steps_in_range(curr_step, radius, index + 1, result_list)
+                cls._permute_steps_in_range(curr_step, radius, index + 1, result_list)
 
     def _get_coordinates_with_valid_measurements(self) -> List[Coordinate]:
+        home_coordinate = list(self._home_coordinate)
+
         initialized_coordinates = []
-        for coordinate in self._neighborhood:
+        for coordinate in self._neighborhood.tolist():
             if (
-                coordinate != self._home_coordinate
+                coordinate != home_coordinate
                 and self._coordinate_data.has_valid_measurement(coordinate)
             ):
-                initialized_coordinates.append(deepcopy(coordinate))
+                initialized_coordinates.append(Coordinate(coordinate))
         return initialized_coordinates
 
     def _get_step_vector(self) -> List[float]:
@@ -467,7 +621,7 @@ def _get_covered_values_per_dimension(self) -> List[Dict[Coordinate, bool]]:
 
     def _get_num_uncovered_values(
         self,
-        coordinate: Coordinate,
+        coordinate: List[int],
         covered_values_per_dimension: List[Dict[Coordinate, bool]],
     ) -> int:
         """
@@ -507,7 +661,7 @@ def _are_all_adjacent_neighbors_measured(self) -> bool:
     def _get_all_adjacent_neighbors(self) -> List[Coordinate]:
         adjacent_neighbors = []
 
-        for dim in range(self._config.get_num_dimensions()):
+        for dim in self._config.get_active_dimensions():
             dimension = self._config.get_dimension(dim)
 
             down_neighbor = Coordinate(self._home_coordinate)
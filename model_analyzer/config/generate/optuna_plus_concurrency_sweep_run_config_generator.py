@@ -33,6 +33,7 @@
 from model_analyzer.result.parameter_search import ParameterSearch
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.result.warm_start import WarmStart
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 
 from .config_generator_interface import ConfigGeneratorInterface
@@ -58,6 +59,7 @@ def __init__(
         model_variant_name_manager: ModelVariantNameManager,
         search_parameters: Dict[str, SearchParameters],
         composing_search_parameters: Dict[str, SearchParameters],
+        warm_start: Optional[WarmStart] = None,
     ):
         """
         Parameters
@@ -79,6 +81,9 @@ def __init__(
             The object that handles the users configuration search parameters
         composing_search_parameters: SearchParameters
             The object that handles the users configuration search parameters for composing models
+        warm_start: WarmStart
+            If provided, the best configurations of a previously profiled,
+            similar model are the first trials of the search
         """
         self._config = config
         self._state_manager = state_manager
@@ -89,6 +94,7 @@ def __init__(
         self._model_variant_name_manager = model_variant_name_manager
         self._search_parameters = search_parameters
         self._composing_search_parameters = composing_search_parameters
+        self._warm_start = warm_start
 
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
@@ -138,4 +144,5 @@ def _create_optuna_run_config_generator(self) -> OptunaRunConfigGenerator:
             model_variant_name_manager=self._model_variant_name_manager,
             search_parameters=self._search_parameters,
             composing_search_parameters=self._composing_search_parameters,
+            warm_start=self._warm_start,
         )
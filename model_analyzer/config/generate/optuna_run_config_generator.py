@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import logging
+from math import isfinite, log2
 from random import randint
 from sys import maxsize
 from typing import Any, Dict, Generator, List, Optional, TypeAlias, Union
@@ -27,6 +28,7 @@
 from model_analyzer.config.generate.brute_run_config_generator import (
     BruteRunConfigGenerator,
 )
+from model_analyzer.config.generate.generator_utils import GeneratorUtils
 from model_analyzer.config.generate.model_profile_spec import ModelProfileSpec
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
@@ -47,6 +49,7 @@
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.result.warm_start import WarmStart
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 from model_analyzer.triton.model.model_config import ModelConfig
 from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
@@ -79,6 +82,11 @@ class OptunaRunConfigGenerator(ConfigGeneratorInterface):
         "instance_group",
         "concurrency",
         "max_queue_delay_microseconds",
+        "preferred_batch_size",
+        "priority_levels",
+        "max_queue_size",
+        "max_candidate_sequences",
+        "response_cache",
         "request_rate",
     ]
 
@@ -96,6 +104,7 @@ def __init__(
         search_parameters: Dict[str, SearchParameters],
         composing_search_parameters: Dict[str, SearchParameters],
         user_seed: Optional[int] = None,
+        warm_start: Optional[WarmStart] = None,
     ):
         """
         Parameters
@@ -116,6 +125,9 @@ def __init__(
             The object that handles the users configuration search parameters for composing models
         user_seed: int
             The seed to use. If not provided, one will be generated (fresh run) or read from checkpoint
+        warm_start: WarmStart
+            If provided, the best configurations of a previously profiled,
+            similar model are the first trials of the search
         """
         self._config = config
         self._state_manager = state_manager
@@ -144,18 +156,43 @@ def __init__(
 
         self._done = False
 
+        if config.optuna_multi_objective and config.optuna_fidelity_levels > 1:
+            raise TritonModelAnalyzerException(
+                "optuna_multi_objective cannot be combined with more than one fidelity level"
+            )
+
+        if (
+            config.optuna_fidelity_levels > 1
+            and config.optuna_fidelity_reduction_factor < 2
+        ):
+            raise TritonModelAnalyzerException(
+                "optuna_fidelity_reduction_factor must be at least 2 "
+                "when using more than one fidelity level"
+            )
+
         self._seed = self._create_seed(user_seed)
 
         self._sampler = optuna.samplers.TPESampler(seed=self._seed)
 
         self._study_name = ",".join([model.model_name() for model in self._models])
 
+        # In multi-objective mode every objective is maximized (objectives
+        # where lower is better are negated), and the TPE sampler runs as MOTPE
         self._study = optuna.create_study(
             study_name=self._study_name,
-            direction="maximize",
+            directions=["maximize"] * self._get_objective_count(),
             sampler=self._sampler,
         )
 
+        self._trial_log = self._get_trial_log()
+        self._resumed_trial_count = self._add_logged_trials_to_study(self._study_name)
+
+        if config.optuna_warm_start_study:
+            self._add_logged_trials_to_study(config.optuna_warm_start_study)
+
+        if warm_start and warm_start.source_models_name():
+            self._enqueue_warm_start_trials(warm_start)
+
         self._init_state()
 
     def _get_seed(self) -> int:
@@ -169,10 +206,256 @@ def _create_seed(self, user_seed: Optional[int]) -> int:
 
         return seed
 
+    def _get_objective_count(self) -> int:
+        if not self._config.optuna_multi_objective:
+            return 1
+
+        # A model without objectives is ranked on throughput alone
+        return sum(
+            [
+                len(model.objectives()) if model.objectives() else 1
+                for model in self._models
+            ]
+        )
+
+    def _get_trial_log(self) -> Dict[str, List[Dict[str, Any]]]:
+        trial_log = self._state_manager.get_state_variable(
+            "OptunaRunConfigGenerator.trials"
+        )
+
+        return trial_log if isinstance(trial_log, dict) else {}
+
     def _init_state(self) -> None:
         self._state_manager.set_state_variable(
             "OptunaRunConfigGenerator.seed", self._seed
         )
+        self._state_manager.set_state_variable(
+            "OptunaRunConfigGenerator.trials", self._trial_log
+        )
+
+    def _add_logged_trials_to_study(self, study_name: str) -> int:
+        """
+        Adds the completed trials of a (checkpointed) study to this study,
+        so that the sampler starts out with their history
+
+        Parameters are matched to this study's models by position, and only
+        the values that still fall inside this study's search space are kept
+
+        Returns
+        -------
+        int
+            The number of trials added
+        """
+        logged_trials = self._trial_log.get(study_name, [])
+        if not logged_trials:
+            return 0
+
+        model_name_map = dict(
+            zip(study_name.split(","), [model.model_name() for model in self._models])
+        )
+        distributions = self._get_trial_distributions()
+
+        added_trials = 0
+        for logged_trial in logged_trials:
+            params = {}
+            for logged_name, value in logged_trial["params"].items():
+                model_name, _, parameter_name = logged_name.partition("::")
+                name = self._create_trial_objective_name(
+                    model_name=model_name_map.get(model_name, model_name),
+                    parameter_name=parameter_name,
+                )
+
+                if name in distributions and self._distribution_contains(
+                    distributions[name], value
+                ):
+                    params[name] = value
+
+            values = self._get_logged_trial_values(logged_trial)
+            if not params or not values:
+                continue
+
+            self._study.add_trial(
+                optuna.trial.create_trial(
+                    params=params,
+                    distributions={name: distributions[name] for name in params},
+                    values=values,
+                )
+            )
+            added_trials += 1
+
+        logger.info(
+            f"Added {added_trials} trial(s) from Optuna study {study_name} to the search"
+        )
+
+        return added_trials
+
+    def _enqueue_warm_start_trials(self, warm_start: WarmStart) -> None:
+        """
+        Enqueues the best configurations of a previously profiled, similar
+        model, so that they are the first trials Optuna measures
+
+        Parameters are matched to this study's models by position, and only
+        the values that fall inside this study's search space are kept
+        (the rest are sampled as usual)
+        """
+        distributions = self._get_trial_distributions()
+
+        enqueued_trials = 0
+        for config_parameters in warm_start.get_best_configs(
+            self._config.num_configs_per_model
+        ):
+            params = {}
+            for model, model_parameters in zip(self._models, config_parameters):
+                for parameter_name, value in model_parameters.items():
+                    parameter = self._search_parameters[
+                        model.model_name()
+                    ].get_parameter(parameter_name)
+                    if not parameter:
+                        continue
+
+                    if parameter.category is ParameterCategory.EXPONENTIAL:
+                        if value <= 0:
+                            continue
+                        value = round(log2(value))
+
+                    name = self._create_trial_objective_name(
+                        model_name=model.model_name(), parameter_name=parameter_name
+                    )
+                    if name in distributions and self._distribution_contains(
+                        distributions[name], value
+                    ):
+                        params[name] = value
+
+            if not params:
+                continue
+
+            self._study.enqueue_trial(params, skip_if_exists=True)
+            enqueued_trials += 1
+
+        logger.info(
+            f"Enqueued {enqueued_trials} trial(s) from the best configurations of "
+            f"{warm_start.source_models_name()} to warm start the search"
+        )
+
+    def _get_logged_trial_values(
+        self, logged_trial: Dict[str, Any]
+    ) -> Optional[List[float]]:
+        if not self._config.optuna_multi_objective:
+            return [logged_trial["value"]]
+
+        values = logged_trial.get("values")
+        if not values or len(values) != self._get_objective_count():
+            return None
+
+        return values
+
+    def _get_trial_distributions(
+        self,
+    ) -> Dict[ObjectiveName, optuna.distributions.BaseDistribution]:
+        distributions = {}
+
+        all_search_parameters = {
+            **self._search_parameters,
+            **self._composing_search_parameters,
+        }
+        for model in self._models + self._composing_models:
+            for parameter_name in OptunaRunConfigGenerator.optuna_parameter_list:
+                parameter = all_search_parameters[model.model_name()].get_parameter(
+                    parameter_name
+                )
+                if not parameter:
+                    continue
+
+                name = self._create_trial_objective_name(
+                    model_name=model.model_name(), parameter_name=parameter_name
+                )
+                if (
+                    parameter.category is ParameterCategory.INTEGER
+                    or parameter.category is ParameterCategory.EXPONENTIAL
+                ):
+                    distributions[name] = optuna.distributions.IntDistribution(
+                        parameter.min_range, parameter.max_range
+                    )
+                else:
+                    distributions[name] = optuna.distributions.CategoricalDistribution(
+                        parameter.enumerated_list
+                    )
+
+        return distributions
+
+    def _distribution_contains(
+        self, distribution: optuna.distributions.BaseDistribution, value: Any
+    ) -> bool:
+        try:
+            return distribution._contains(distribution.to_internal_repr(value))
+        except ValueError:
+            return False
+
+    def _tell(
+        self,
+        trial: optuna.Trial,
+        score: float,
+        run_config: RunConfig,
+        fidelity: float = 1.0,
+    ) -> None:
+        """
+        Tells Optuna the score (or in multi-objective mode, the objective
+        values) of a trial, and records the trial in the checkpoint so
+        the study can be rebuilt on resume
+        """
+        objective_values = None
+        if not self._config.optuna_multi_objective:
+            self._study.tell(trial, score)
+        else:
+            objective_values = self._get_objective_values()
+            if objective_values:
+                self._study.tell(trial, objective_values)
+            else:
+                self._study.tell(trial, state=optuna.trial.TrialState.FAIL)
+
+        self._trial_log.setdefault(self._study_name, []).append(
+            {
+                "params": trial.params,
+                "value": score,
+                "values": objective_values,
+                "fidelity": fidelity,
+                "config_name": run_config.combined_model_variants_name(),
+            }
+        )
+        self._state_manager.set_state_variable(
+            "OptunaRunConfigGenerator.trials", self._trial_log
+        )
+
+    def _get_objective_values(self) -> Optional[List[float]]:
+        if not self._last_measurement:
+            return None
+
+        objective_values = self._last_measurement.get_objective_values()
+        if len(objective_values) != self._get_objective_count() or not all(
+            isfinite(value) for value in objective_values
+        ):
+            return None
+
+        return objective_values
+
+    def _is_on_pareto_frontier(self, trial: optuna.Trial) -> bool:
+        return trial.number in [
+            best_trial.number for best_trial in self._study.best_trials
+        ]
+
+    def _set_best_measurement_from_trial_log(self) -> None:
+        logged_trials = self._trial_log.get(self._study_name, [])
+        for trial_number, logged_trial in enumerate(logged_trials, start=1):
+            if logged_trial["fidelity"] < 1:
+                continue
+
+            if (
+                self._best_config_score is None
+                or logged_trial["value"] > self._best_config_score
+            ):
+                self._best_config_name = logged_trial["config_name"]
+                self._best_config_score = logged_trial["value"]
+                self._best_trial_number = trial_number
 
     def _is_done(self) -> bool:
         return self._done
@@ -201,6 +484,7 @@ def get_configs(self) -> Generator[RunConfig, None, None]:
 
         self._capture_default_measurement(default_run_config)
         self._set_best_measurement(default_run_config)
+        self._set_best_measurement_from_trial_log()
 
         if logging.DEBUG:
             self._print_debug_search_space_info()
@@ -208,7 +492,16 @@ def get_configs(self) -> Generator[RunConfig, None, None]:
         min_configs_to_search = self._determine_minimum_number_of_configs_to_search()
         max_configs_to_search = self._determine_maximum_number_of_configs_to_search()
 
-        for trial_number in range(1, max_configs_to_search + 1):
+        if self._config.optuna_fidelity_levels > 1:
+            yield from self._get_successive_halving_configs(
+                min_configs_to_search, max_configs_to_search
+            )
+            return
+
+        # Trials restored from a checkpoint count towards the search budget
+        for trial_number in range(
+            self._resumed_trial_count + 1, max_configs_to_search + 1
+        ):
             trial = self._study.ask()
             trial_objectives = self._create_trial_objectives(trial)
             composing_trial_objectives = self._create_composing_trial_objectives(trial)
@@ -224,10 +517,105 @@ def get_configs(self) -> Generator[RunConfig, None, None]:
             if logging.DEBUG:
                 self._print_debug_score_info(run_config, score)
 
+            self._tell(trial, score, run_config)
+
+            # In multi-objective mode, extending the Pareto frontier
+            # also counts as an improvement for early exit
+            if self._config.optuna_multi_objective and self._is_on_pareto_frontier(
+                trial
+            ):
+                self._best_trial_number = trial_number
+
             if self._should_terminate_early(min_configs_to_search, trial_number):
                 logger.debug("Early termination threshold reached")
                 break
-            self._study.tell(trial, score)
+
+    def _get_successive_halving_configs(
+        self, min_configs_to_search: int, max_configs_to_search: int
+    ) -> Generator[RunConfig, None, None]:
+        """
+        Trials are asked for in brackets. Every trial in a bracket is measured
+        at the lowest fidelity, then only the best 1/reduction_factor of them
+        are promoted to the next (longer) fidelity, until the survivors are
+        measured at full fidelity. Each trial is told to Optuna with the score
+        from the highest fidelity it reached
+        """
+        fidelities = self._get_fidelities()
+        reduction_factor = self._config.optuna_fidelity_reduction_factor
+
+        trial_number = self._resumed_trial_count
+        while trial_number < max_configs_to_search:
+            bracket_size = min(
+                reduction_factor ** (len(fidelities) - 1),
+                max_configs_to_search - trial_number,
+            )
+
+            bracket = []
+            for _ in range(bracket_size):
+                trial_number += 1
+                trial = self._study.ask()
+                bracket.append(
+                    (
+                        trial,
+                        trial_number,
+                        self._create_trial_objectives(trial),
+                        self._create_composing_trial_objectives(trial),
+                    )
+                )
+
+            for fidelity in fidelities:
+                scores = []
+                run_configs = []
+                for trial, number, objectives, composing_objectives in bracket:
+                    logger.debug(
+                        f"Trial {number} of {max_configs_to_search} (fidelity {fidelity:.3g}):"
+                    )
+                    run_config = self._create_objective_based_run_config(
+                        objectives, composing_objectives
+                    )
+                    run_config.set_fidelity(fidelity)
+                    yield run_config
+
+                    score = self._calculate_score()
+                    scores.append(score)
+                    run_configs.append(run_config)
+
+                    # Only full fidelity measurements can become the best
+                    if fidelity >= 1:
+                        self._set_best_measurement(run_config, score, number)
+
+                    if logging.DEBUG:
+                        self._print_debug_score_info(run_config, score)
+
+                ranked_bracket = sorted(
+                    zip(bracket, scores, run_configs),
+                    key=lambda entry: entry[1],
+                    reverse=True,
+                )
+                promotion_count = (
+                    max(1, len(bracket) // reduction_factor) if fidelity < 1 else 0
+                )
+
+                for (trial, *_), score, run_config in ranked_bracket[promotion_count:]:
+                    self._tell(trial, score, run_config, fidelity)
+
+                bracket = [entry for entry, *_ in ranked_bracket[:promotion_count]]
+                if not bracket:
+                    break
+
+            if self._should_terminate_early(min_configs_to_search, trial_number):
+                logger.debug("Early termination threshold reached")
+                break
+
+    def _get_fidelities(self) -> List[float]:
+        """
+        Returns the fidelity of each level, lowest first. For example
+        3 levels with a reduction factor of 3 gives [1/9, 1/3, 1]
+        """
+        reduction_factor = self._config.optuna_fidelity_reduction_factor
+        levels = self._config.optuna_fidelity_levels
+
+        return [1 / reduction_factor**level for level in reversed(range(levels))]
 
     def _capture_default_measurement(self, default_run_config: RunConfig) -> None:
         if not self._last_measurement:
@@ -446,6 +834,8 @@ def _create_trial_objective(
             objective = int(trial.suggest_categorical(name, parameter.enumerated_list))
         elif parameter.category is ParameterCategory.STR_LIST:
             objective = trial.suggest_categorical(name, parameter.enumerated_list)
+        elif parameter.category is ParameterCategory.BOOL_LIST:
+            objective = bool(trial.suggest_categorical(name, parameter.enumerated_list))
 
         return objective
 
@@ -559,12 +949,7 @@ def _create_non_ensemble_parameter_combo(
         if "max_batch_size" in trial_objectives:
             param_combo["max_batch_size"] = trial_objectives["max_batch_size"]
 
-        if "max_queue_delay_microseconds" in trial_objectives:
-            param_combo["dynamic_batching"] = {
-                "max_queue_delay_microseconds": trial_objectives[
-                    "max_queue_delay_microseconds"
-                ]
-            }
+        GeneratorUtils.apply_batching_parameters(param_combo, trial_objectives)
 
         return param_combo
 
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Generator, List, Optional
+from typing import Dict, Generator, List, Optional
 
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 from model_analyzer.constants import (
@@ -13,6 +13,8 @@
     THROUGHPUT_MINIMUM_GAIN,
 )
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.perf_analyzer.request_trace import RequestTrace
+from model_analyzer.result.request_rate_predictor import RequestRatePredictor
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
 from .config_generator_interface import ConfigGeneratorInterface
@@ -36,6 +38,7 @@ def __init__(
         model_perf_analyzer_flags: dict,
         model_parameters: dict,
         early_exit_enable: bool,
+        request_rate_predictor: Optional[RequestRatePredictor] = None,
     ) -> None:
         """
         Parameters
@@ -54,6 +57,10 @@ def __init__(
 
         early_exit_enable: Bool
             If true, this class can early exit during search of concurrency/request rate
+
+        request_rate_predictor: RequestRatePredictor
+            Predicts the request rate the model config can sustain, if
+            request rate prediction is enabled
         """
 
         self._early_exit_enable = early_exit_enable
@@ -85,6 +92,16 @@ def __init__(
         self._parameters = self._create_parameter_list()
         self._generate_perf_configs()
 
+        self._request_rate_predictor = request_rate_predictor
+        self._request_rate_prediction_enable = (
+            early_exit_enable
+            and request_rate_predictor is not None
+            and cli_config.request_rate_prediction_enable
+            and self._is_request_rate_searched()
+        )
+        self._max_predicted_request_rate: Optional[float] = None
+        self._prediction_warning_printed = False
+
     @staticmethod
     def throughput_gain_valid_helper(
         throughputs: List[Optional[RunConfigMeasurement]],
@@ -157,13 +174,15 @@ def set_last_results(
             self._parameter_results.extend(measurement)
 
     def _create_parameter_list(self) -> List[int]:
-        # Determines the inference load (concurrency or request-rate or request-intervals)
-        # and creates the list of values to use. If nothing is specified by the user, then
-        # concurrency will be used.
+        # Determines the inference load (concurrency or request-rate or request-intervals
+        # or request trace scale) and creates the list of values to use. If nothing is
+        # specified by the user, then concurrency will be used.
         if "request-intervals" in self._perf_analyzer_flags:
             return [self._perf_analyzer_flags["request-intervals"]]
         elif self._cli_config.is_request_rate_specified(self._model_parameters):
             return self._create_request_rate_list()
+        elif self._cli_config.is_request_trace_specified():
+            return self._create_request_trace_scale_list()
         else:
             return self._create_concurrency_list()
 
@@ -178,6 +197,23 @@ def _create_request_rate_list(self) -> List[int]:
                 self._cli_config.run_config_search_max_request_rate,
             )
 
+    def _create_request_trace_scale_list(self) -> List[float]:
+        if self._cli_config.run_config_search_disable:
+            return [1]
+        else:
+            return utils.generate_doubled_list(
+                self._cli_config.run_config_search_min_request_trace_scale,
+                self._cli_config.run_config_search_max_request_trace_scale,
+            )
+
+    def _is_request_rate_searched(self) -> bool:
+        return (
+            "request-intervals" not in self._perf_analyzer_flags
+            and self._cli_config.is_request_rate_specified(self._model_parameters)
+            and not self._model_parameters["request_rate"]
+            and not self._cli_config.run_config_search_disable
+        )
+
     def _create_concurrency_list(self) -> List[int]:
         if self._model_parameters["concurrency"]:
             return sorted(self._model_parameters["concurrency"])
@@ -193,8 +229,9 @@ def _generate_perf_configs(self) -> None:
         perf_config_non_parameter_values = (
             self._create_non_parameter_perf_config_values()
         )
+        request_intervals_files = self._create_request_intervals_files()
 
-        for params in utils.generate_parameter_combinations(
+        for params in utils.iterate_parameter_combinations(
             perf_config_non_parameter_values
         ):
             configs_with_inference_load = []
@@ -211,6 +248,10 @@ def _generate_perf_configs(self) -> None:
                     pass
                 elif self._cli_config.is_request_rate_specified(self._model_parameters):
                     new_perf_config.update_config({"request-rate-range": parameter})
+                elif request_intervals_files:
+                    new_perf_config.update_config(
+                        {"request-intervals": request_intervals_files[parameter]}
+                    )
                 else:
                     new_perf_config.update_config({"concurrency-range": parameter})
 
@@ -220,6 +261,16 @@ def _generate_perf_configs(self) -> None:
                 configs_with_inference_load.append(new_perf_config)
             self._configs.append(configs_with_inference_load)
 
+    def _create_request_intervals_files(self) -> Dict[float, str]:
+        if (
+            "request-intervals" in self._perf_analyzer_flags
+            or self._cli_config.is_request_rate_specified(self._model_parameters)
+            or not self._cli_config.is_request_trace_specified()
+        ):
+            return {}
+
+        return RequestTrace(self._cli_config).create_intervals_files(self._parameters)
+
     def _create_non_parameter_perf_config_values(self) -> dict:
         perf_config_values = {
             "batch-size": self._batch_sizes,
@@ -245,10 +296,56 @@ def _reset_parameters(self) -> None:
         self._curr_parameter_index = 0
         self._parameter_warning_printed = False
         self._parameter_results = []
+        self._max_predicted_request_rate = None
 
     def _step_parameter(self) -> None:
         self._curr_parameter_index += 1
 
+        if self._request_rate_prediction_enable and self._last_results:
+            self._update_request_rate_prediction(self._last_results[-1])
+
+    def _update_request_rate_prediction(
+        self, measurement: RunConfigMeasurement
+    ) -> None:
+        assert self._request_rate_predictor is not None
+
+        batch_size = self._batch_sizes[self._curr_batch_size_index]
+        if not self._request_rate_predictor.update(measurement, batch_size):
+            self._max_predicted_request_rate = None
+            if not self._prediction_warning_printed:
+                logger.info(
+                    "Not predicting the request rate as the server compute time "
+                    "(perf_server_compute_infer) was not measured"
+                )
+                self._prediction_warning_printed = True
+            return
+
+        self._max_predicted_request_rate = (
+            self._request_rate_predictor.max_request_rate()
+        )
+
+        # After the first measurement, jump to one doubling below the rate
+        # the model config is guaranteed to reach, so the sweep still
+        # measures the rise to the knee
+        knee_request_rate = self._request_rate_predictor.knee_request_rate()
+        if len(self._parameter_results) == 1 and knee_request_rate:
+            knee_index = max(
+                [
+                    i
+                    for i, parameter in enumerate(self._parameters)
+                    if parameter <= knee_request_rate / 2
+                ],
+                default=0,
+            )
+            self._curr_parameter_index = max(self._curr_parameter_index, knee_index)
+
+    def _is_request_rate_predicted_to_fail(self) -> bool:
+        return (
+            self._max_predicted_request_rate is not None
+            and self._parameters[self._curr_parameter_index]
+            > self._max_predicted_request_rate
+        )
+
     def _step_batch_size(self) -> None:
         self._curr_batch_size_index += 1
 
@@ -258,12 +355,24 @@ def _done_walking(self) -> bool:
     def _done_walking_parameters(self) -> bool:
         if len(self._parameters) == self._curr_parameter_index:
             return True
+        if self._is_request_rate_predicted_to_fail():
+            if not self._parameter_warning_printed:
+                logger.info(
+                    "No longer increasing request rate as the queueing model predicts "
+                    "it will saturate the model or violate the latency budget"
+                )
+                self._parameter_warning_printed = True
+            return True
         if self._early_exit_enable and not self._parameter_throughput_gain_valid():
             if not self._parameter_warning_printed:
                 if self._cli_config.is_request_rate_specified(self._model_parameters):
                     logger.info(
                         "No longer increasing request rate as throughput has plateaued"
                     )
+                elif self._cli_config.is_request_trace_specified():
+                    logger.info(
+                        "No longer increasing request trace scale as throughput has plateaued"
+                    )
                 else:
                     logger.info(
                         "No longer increasing concurrency as throughput has plateaued"
@@ -19,6 +19,7 @@
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.result.warm_start import WarmStart
 
 from .config_generator_interface import ConfigGeneratorInterface
 
@@ -41,6 +42,7 @@ def __init__(
         composing_models: List[ModelProfileSpec],
         result_manager: ResultManager,
         model_variant_name_manager: ModelVariantNameManager,
+        warm_start: Optional[WarmStart] = None,
     ):
         """
         Parameters
@@ -58,6 +60,9 @@ def __init__(
             The object that handles storing and sorting the results from the perf analyzer
         model_variant_name_manager: ModelVariantNameManager
             Maps model variants to config names
+        warm_start: WarmStart
+            If provided, the search starts from the best configuration
+            of a previously profiled, similar model
         """
         self._search_config = search_config
         self._config = config
@@ -66,6 +71,7 @@ def __init__(
         self._composing_models = composing_models
         self._result_manager = result_manager
         self._model_variant_name_manager = model_variant_name_manager
+        self._warm_start = warm_start
 
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
@@ -113,4 +119,5 @@ def _create_quick_run_config_generator(self) -> QuickRunConfigGenerator:
             models=self._models,
             composing_models=self._composing_models,
             model_variant_name_manager=self._model_variant_name_manager,
+            warm_start=self._warm_start,
         )
@@ -24,10 +24,11 @@
 from model_analyzer.config.input.config_defaults import DEFAULT_BATCH_SIZES
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.config.run.run_config import RunConfig
-from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.constants import BATCHING_SEARCH_PARAMETER_PATHS, LOGGER_NAME
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.result.warm_start import WarmStart
 from model_analyzer.triton.model.model_config import ModelConfig
 from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
 
@@ -51,6 +52,7 @@ def __init__(
         models: List[ModelProfileSpec],
         composing_models: List[ModelProfileSpec],
         model_variant_name_manager: ModelVariantNameManager,
+        warm_start: Optional[WarmStart] = None,
     ):
         """
         Parameters
@@ -65,6 +67,9 @@ def __init__(
         composing_models: List of ModelProfileSpec
             List of composing model profiles
         model_variant_name_manager: ModelVariantNameManager
+        warm_start: WarmStart
+            If provided, the search starts from the best configuration
+            of a previously profiled, similar model
         """
         self._search_config = search_config
         self._config = config
@@ -73,6 +78,7 @@ def __init__(
         self._composing_models = composing_models
 
         self._model_variant_name_manager = model_variant_name_manager
+        self._warm_start = warm_start
 
         self._triton_env = BruteRunConfigGenerator.determine_triton_server_env(models)
 
@@ -81,6 +87,11 @@ def __init__(
         # This tracks measured results for all coordinates
         self._coordinate_data = CoordinateData()
 
+        # The blocks of dimensions that are searched in turn (block coordinate
+        # descent). The last block (None) searches every dimension jointly
+        self._blocks = self._create_blocks()
+        self._block_index = 0
+
         # This is an initial center that the neighborhood is built around.
         # It is updated every new creation of the neighborhood.
         self._home_coordinate = self._get_starting_coordinate()
@@ -95,7 +106,9 @@ def __init__(
         self._best_measurement: Optional[RunConfigMeasurement] = None
 
         self._neighborhood = Neighborhood(
-            self._search_config.get_neighborhood_config(),
+            self._search_config.get_neighborhood_config(
+                active_dimensions=self._blocks[self._block_index]
+            ),
             self._home_coordinate,
             self._coordinate_data,
         )
@@ -205,6 +218,9 @@ def _get_last_results(self) -> Optional[RunConfigMeasurement]:
     def _take_step(self) -> None:
         new_coordinate = self._neighborhood.determine_new_home()
         self._determine_if_done(new_coordinate)
+        if self._done:
+            self._start_next_block()
+            return
 
         logger.debug(f"Stepping {self._home_coordinate}->{new_coordinate}")
         self._home_coordinate = new_coordinate
@@ -219,6 +235,8 @@ def _take_step_back(self) -> None:
         # TODO: TMA-871: handle back-off (and its termination) better.
         if new_coordinate == self._home_coordinate:
             self._done = True
+            self._start_next_block()
+            return
 
         logger.debug(f"Stepping back: {self._home_coordinate}->{new_coordinate}")
         self._home_coordinate = new_coordinate
@@ -253,8 +271,59 @@ def _determine_if_done(self, new_coordinate: Coordinate) -> None:
         if self._coordinate_data.get_visit_count(new_coordinate) >= 2:
             self._done = True
 
+    def _create_blocks(self) -> List[Optional[List[int]]]:
+        """
+        Returns the blocks of dimension indexes to search in turn: with
+        coordinate descent enabled, one block per model, followed by a
+        final joint refinement over every dimension (None)
+        """
+        dims = self._search_config.get_dimensions()
+        blocks: Dict[int, List[int]] = {}
+        for i in range(len(dims)):
+            blocks.setdefault(dims.get_dimension_key(i), []).append(i)
+
+        if not self._config.quick_search_coordinate_descent_enable or len(blocks) < 2:
+            return [None]
+
+        return [*blocks.values(), None]
+
+    def _is_last_block(self) -> bool:
+        return self._block_index == len(self._blocks) - 1
+
+    def _start_next_block(self) -> None:
+        """
+        Called when the search of the current block has converged. Unless
+        it was the last block, moves home to the best coordinate found so
+        far and continues the search in the next block's dimensions, with
+        every other dimension held at its best value
+        """
+        # Nothing has been measured to descend from
+        if self._is_last_block() or self._best_measurement is None:
+            return
+
+        self._done = False
+        self._block_index += 1
+
+        block = self._blocks[self._block_index]
+        block_name = f"dimensions {block}" if block else "all dimensions"
+        logger.info(
+            f"Quick search continuing from {self._best_coordinate} in {block_name}"
+        )
+
+        self._home_coordinate = self._best_coordinate
+        self._coordinate_to_measure = self._best_coordinate
+        self._recreate_neighborhood(force_slow_mode=False)
+
+        # The home is already measured, so a new coordinate is picked immediately
+        if self._neighborhood.enough_coordinates_initialized():
+            self._take_step()
+        else:
+            self._pick_coordinate_to_initialize()
+
     def _recreate_neighborhood(self, force_slow_mode: bool) -> None:
-        neighborhood_config = self._search_config.get_neighborhood_config()
+        neighborhood_config = self._search_config.get_neighborhood_config(
+            active_dimensions=self._blocks[self._block_index]
+        )
 
         self._neighborhood = Neighborhood(
             neighborhood_config, self._home_coordinate, self._coordinate_data
@@ -271,13 +340,53 @@ def _pick_coordinate_to_initialize(self) -> None:
         if next_coordinate:
             self._coordinate_to_measure = next_coordinate
             logger.debug(f"Need more data. Measuring {self._coordinate_to_measure}")
-        else:
+        elif self._is_last_block():
             logger.info("No coordinate to measure. Exiting")
             self._done = True
+        else:
+            self._done = True
+            self._start_next_block()
 
     def _get_starting_coordinate(self) -> Coordinate:
         min_indexes = self._search_config.get_min_indexes()
-        return Coordinate(min_indexes)
+        starting_coordinate = Coordinate(min_indexes)
+
+        # Composing models are not warm started, as their dimensions
+        # cannot be matched to the source model's configs
+        if self._warm_start and not self._composing_models:
+            best_configs = self._warm_start.get_best_configs(count=1)
+            if best_configs:
+                starting_coordinate = self._get_warm_start_coordinate(
+                    best_configs[0], starting_coordinate
+                )
+                logger.info(f"Warm starting quick search at {starting_coordinate}")
+
+        return starting_coordinate
+
+    def _get_warm_start_coordinate(
+        self, config_parameters: List[Dict], min_coordinate: Coordinate
+    ) -> Coordinate:
+        """
+        Returns the coordinate closest to a warm start configuration,
+        keeping the minimum index of any dimension it does not set
+        """
+        coordinate = Coordinate(min_coordinate)
+
+        dims = self._search_config.get_dimensions()
+        for i, dim in enumerate(dims):
+            name = dim.get_name()
+            if name == "instance_count":
+                name = "instance_group"
+
+            value = config_parameters[dims.get_dimension_key(i)].get(name)
+            if value is None:
+                continue
+
+            idx = dim.get_idx_for_value(value)
+            if idx is not None:
+                coordinate[i] = idx
+
+        return coordinate
 
     def _get_coordinate_values(
         self, coordinate: Coordinate, key: int
@@ -437,6 +546,11 @@ def _get_next_model_config_variant(
             # Remove parameters that are controlled by search dimensions
             model_config_params.pop("max_batch_size", None)
             model_config_params.pop("instance_group", None)
+            for name, path in BATCHING_SEARCH_PARAMETER_PATHS.items():
+                if name in dimension_values:
+                    GeneratorUtils.remove_model_config_parameter(
+                        model_config_params, path
+                    )
 
             # Generate combinations from remaining parameters
             # For composing models, this may include dynamic_batching settings, etc.
@@ -475,6 +589,8 @@ def _get_next_model_config_variant(
         if model.supports_dynamic_batching() and "dynamic_batching" not in param_combo:
             param_combo["dynamic_batching"] = {}
 
+        GeneratorUtils.apply_batching_parameters(param_combo, dimension_values)
+
         model_config_variant = BaseModelConfigGenerator.make_model_config_variant(
             param_combo=param_combo,
             model=model,
@@ -4,7 +4,7 @@
 
 import logging
 import math
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from model_analyzer.config.generate.model_profile_spec import ModelProfileSpec
 from model_analyzer.config.generate.model_variant_name_manager import (
@@ -12,13 +12,20 @@
 )
 from model_analyzer.config.generate.search_parameters import SearchParameters
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
+from model_analyzer.config.input.config_defaults import DEFAULT_QUICK_SEARCH_SURROGATE
 from model_analyzer.config.input.objects.config_model_profile_spec import (
     ConfigModelProfileSpec,
 )
-from model_analyzer.constants import LOGGER_NAME, MIN_INITIALIZED, RADIUS
+from model_analyzer.constants import (
+    BATCHING_SEARCH_PARAMETER_PATHS,
+    LOGGER_NAME,
+    MIN_INITIALIZED,
+    RADIUS,
+)
 from model_analyzer.device.gpu_device import GPUDevice
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.result.result_manager import ResultManager
+from model_analyzer.result.warm_start import WarmStart
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 from model_analyzer.triton.client.client import TritonClient
 from model_analyzer.triton.model.model_config import ModelConfig
@@ -56,6 +63,7 @@ def create_run_config_generator(
         model_variant_name_manager: ModelVariantNameManager,
         search_parameters: Dict[str, SearchParameters],
         composing_search_parameters: Dict[str, SearchParameters],
+        warm_start: Optional[WarmStart] = None,
     ) -> ConfigGeneratorInterface:
         """
         Parameters
@@ -77,6 +85,9 @@ def create_run_config_generator(
             The object that handles the users configuration search parameters
         composing_search_parameters: SearchParameters
             The object that handles the users configuration search parameters for composing models
+        warm_start: WarmStart
+            If provided, quick and optuna searches start from the best
+            configurations of a previously profiled, similar model
 
         Returns
         -------
@@ -111,6 +122,7 @@ def create_run_config_generator(
                 search_parameters=search_parameters,
                 composing_search_parameters=composing_search_parameters,
                 model_variant_name_manager=model_variant_name_manager,
+                warm_start=warm_start,
             )
         elif command_config.run_config_search_mode == "quick" or composing_models:
             return RunConfigGeneratorFactory._create_quick_plus_concurrency_sweep_run_config_generator(
@@ -120,6 +132,7 @@ def create_run_config_generator(
                 composing_models=composing_models,
                 result_manager=result_manager,
                 model_variant_name_manager=model_variant_name_manager,
+                warm_start=warm_start,
             )
         elif command_config.run_config_search_mode == "brute":
             return RunConfigGeneratorFactory._create_brute_plus_binary_parameter_search_run_config_generator(
@@ -164,6 +177,7 @@ def _create_optuna_plus_concurrency_sweep_run_config_generator(
         model_variant_name_manager: ModelVariantNameManager,
         search_parameters: Dict[str, SearchParameters],
         composing_search_parameters: Dict[str, SearchParameters],
+        warm_start: Optional[WarmStart] = None,
     ) -> ConfigGeneratorInterface:
         return OptunaPlusConcurrencySweepRunConfigGenerator(
             config=command_config,
@@ -175,6 +189,7 @@ def _create_optuna_plus_concurrency_sweep_run_config_generator(
             model_variant_name_manager=model_variant_name_manager,
             search_parameters=search_parameters,
             composing_search_parameters=composing_search_parameters,
+            warm_start=warm_start,
         )
 
     @staticmethod
@@ -185,9 +200,10 @@ def _create_quick_plus_concurrency_sweep_run_config_generator(
         composing_models: List[ModelProfileSpec],
         result_manager: ResultManager,
         model_variant_name_manager: ModelVariantNameManager,
+        warm_start: Optional[WarmStart] = None,
     ) -> ConfigGeneratorInterface:
         search_config = RunConfigGeneratorFactory._create_search_config(
-            models, composing_models
+            models, composing_models, command_config.quick_search_surrogate
         )
         return QuickPlusConcurrencySweepRunConfigGenerator(
             search_config=search_config,
@@ -197,11 +213,14 @@ def _create_quick_plus_concurrency_sweep_run_config_generator(
             composing_models=composing_models,
             result_manager=result_manager,
             model_variant_name_manager=model_variant_name_manager,
+            warm_start=warm_start,
         )
 
     @staticmethod
     def _create_search_config(
-        models: List[ModelProfileSpec], composing_models: List[ModelProfileSpec]
+        models: List[ModelProfileSpec],
+        composing_models: List[ModelProfileSpec],
+        surrogate: str = DEFAULT_QUICK_SEARCH_SURROGATE,
     ) -> SearchConfig:
         dimensions = SearchDimensions()
 
@@ -218,7 +237,10 @@ def _create_search_config(
             index += 1
 
         search_config = SearchConfig(
-            dimensions=dimensions, radius=RADIUS, min_initialized=MIN_INITIALIZED
+            dimensions=dimensions,
+            radius=RADIUS,
+            min_initialized=MIN_INITIALIZED,
+            surrogate=surrogate,
         )
 
         return search_config
@@ -257,6 +279,29 @@ def _get_dimensions_for_model(model: ModelProfileSpec) -> List[SearchDimension]:
                 ),
             )
 
+        dims.extend(RunConfigGeneratorFactory._get_batching_dimensions(model))
+
+        return dims
+
+    @staticmethod
+    def _get_batching_dimensions(model: ModelProfileSpec) -> List[SearchDimension]:
+        """
+        Create a list dimension for every batching parameter the user
+        specified more than one value for. A single value is not searched,
+        and is applied to every config like any other model config parameter
+        """
+        dims = []
+        for name in BATCHING_SEARCH_PARAMETER_PATHS:
+            values = SearchParameters.get_batching_parameter_list(
+                model.model_config_parameters(), name
+            )
+            if values and len(values) > 1:
+                dims.append(
+                    SearchDimension(
+                        name, SearchDimension.DIMENSION_TYPE_LIST, values=values
+                    )
+                )
+
         return dims
 
     @staticmethod
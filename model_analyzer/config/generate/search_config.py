@@ -26,7 +26,14 @@ class NeighborhoodConfig:
     Defines the configuration for a Neighborhood object
     """
 
-    def __init__(self, dimensions: SearchDimensions, radius: int, min_initialized: int):
+    def __init__(
+        self,
+        dimensions: SearchDimensions,
+        radius: int,
+        min_initialized: int,
+        surrogate: str = "none",
+        active_dimensions: Optional[List[int]] = None,
+    ):
         """
         Parameters
         ----------
@@ -37,10 +44,19 @@ def __init__(self, dimensions: SearchDimensions, radius: int, min_initialized: i
         min_initialized: int
             Minimum number of initialized values in a neighborhood
             before a step can be taken
+        surrogate: str
+            The surrogate model used to pick the next home
+            ('none' uses the weighted step vector)
+        active_dimensions: list of ints
+            The indexes of the dimensions the neighborhood can step in.
+            All other dimensions are held at the home's values.
+            If None, every dimension is active
         """
         self._dimensions = dimensions
         self._radius = radius
         self._min_initialized = min_initialized
+        self._surrogate = surrogate
+        self._active_dimensions = active_dimensions
 
     def get_num_dimensions(self) -> int:
         """Returns the number of dimensions in this search"""
@@ -74,13 +90,32 @@ def get_radius(self) -> int:
         """Returns the base radius of a neighborhood"""
         return self._radius
 
+    def get_surrogate(self) -> str:
+        """Returns the surrogate model used to pick the next home"""
+        return self._surrogate
+
+    def get_active_dimensions(self) -> List[int]:
+        """
+        Returns the indexes of the dimensions the neighborhood can step in
+        """
+        if self._active_dimensions is None:
+            return list(range(len(self._dimensions)))
+
+        return self._active_dimensions
+
 
 class SearchConfig(NeighborhoodConfig):
     """
     Defines all dimensions to search
     """
 
-    def __init__(self, dimensions: SearchDimensions, radius: int, min_initialized: int):
+    def __init__(
+        self,
+        dimensions: SearchDimensions,
+        radius: int,
+        min_initialized: int,
+        surrogate: str = "none",
+    ):
         """
         Parameters
         ----------
@@ -91,17 +126,26 @@ def __init__(self, dimensions: SearchDimensions, radius: int, min_initialized: i
         min_initialized: int
             Minimum number of initialized values in a neighborhood
             before a step can be taken
+        surrogate: str
+            The surrogate model used to pick the next home
+            ('none' uses the weighted step vector)
 
         """
         super().__init__(
-            dimensions=dimensions, radius=radius, min_initialized=min_initialized
+            dimensions=dimensions,
+            radius=radius,
+            min_initialized=min_initialized,
+            surrogate=surrogate,
         )
 
     def get_neighborhood_config(
-        self, radius: Optional[int] = None
+        self,
+        radius: Optional[int] = None,
+        active_dimensions: Optional[List[int]] = None,
     ) -> NeighborhoodConfig:
         """
-        Return a NeighborhoodConfig with an optional override to the radius
+        Return a NeighborhoodConfig with an optional override to the radius,
+        and optionally restricted to stepping in the active dimensions
         """
         radius_to_use = radius if radius is not None else self.get_radius()
 
@@ -109,4 +153,6 @@ def get_neighborhood_config(
             dimensions=self._dimensions,
             radius=radius_to_use,
             min_initialized=self._min_initialized,
+            surrogate=self._surrogate,
+            active_dimensions=active_dimensions,
         )
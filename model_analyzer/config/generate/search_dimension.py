@@ -16,6 +16,7 @@
 
 import math
 import sys
+from typing import Any, List, Optional
 
 
 class SearchDimension:
@@ -26,9 +27,17 @@ class SearchDimension:
 
     DIMENSION_TYPE_LINEAR = 0
     DIMENSION_TYPE_EXPONENTIAL = 1
+    DIMENSION_TYPE_LIST = 2
     DIMENSION_NO_MAX = sys.maxsize
 
-    def __init__(self, name: str, type: int, min: int = 0, max: int = DIMENSION_NO_MAX):
+    def __init__(
+        self,
+        name: str,
+        type: int,
+        min: int = 0,
+        max: int = DIMENSION_NO_MAX,
+        values: Optional[List[Any]] = None,
+    ):
         """
         Parameters
         ----------
@@ -39,12 +48,19 @@ def __init__(self, name: str, type: int, min: int = 0, max: int = DIMENSION_NO_M
             The minimum index for this search dimension. If unspecified, min is 0
         max: int
             The maximum index for this search dimension. If unspecified, then there is no max
+            (or, for a list dimension, the max is the last index of the values)
+        values: list
+            The values of a list dimension, in the order they are searched
 
         """
         self._name = name
         self._type = type
         self._min = min
         self._max = max
+        self._values = values if values is not None else []
+
+        if type == SearchDimension.DIMENSION_TYPE_LIST and max == self.DIMENSION_NO_MAX:
+            self._max = len(self._values) - 1
 
     def get_min_idx(self) -> int:
         """Return the minimum index for this dimension"""
@@ -58,7 +74,7 @@ def get_name(self) -> str:
         """Return the name for this dimension"""
         return self._name
 
-    def get_value_at_idx(self, idx: int) -> int:
+    def get_value_at_idx(self, idx: int) -> Any:
         """Return the value of the dimension at the given index"""
         if idx < self._min or idx > self._max:
             raise IndexError(
@@ -69,5 +85,27 @@ def get_value_at_idx(self, idx: int) -> int:
             return idx + 1
         elif self._type == SearchDimension.DIMENSION_TYPE_EXPONENTIAL:
             return int(math.pow(2, idx))
+        elif self._type == SearchDimension.DIMENSION_TYPE_LIST:
+            return self._values[int(idx)]
         else:
             raise Exception(f"Unknown type {self._type}")
+
+    def get_idx_for_value(self, value: Any) -> Optional[int]:
+        """
+        Return the index whose value is closest to the given value, clamped
+        to this dimension's range, or None if there is no such index
+        """
+        if self._type == SearchDimension.DIMENSION_TYPE_LINEAR:
+            idx = round(value) - 1
+        elif self._type == SearchDimension.DIMENSION_TYPE_EXPONENTIAL:
+            if value <= 0:
+                return None
+            idx = round(math.log2(value))
+        elif self._type == SearchDimension.DIMENSION_TYPE_LIST:
+            if value not in self._values:
+                return None
+            idx = self._values.index(value)
+        else:
+            raise Exception(f"Unknown type {self._type}")
+
+        return max(self._min, min(self._max, idx))
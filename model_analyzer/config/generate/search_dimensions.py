@@ -75,6 +75,10 @@ def get_values_for_coordinate(
 
         return vals
 
+    def get_dimension_key(self, index: int) -> Any:
+        """Return the key associated with the dimension at the given index"""
+        return self._dimension_keys[index]
+
     def __iter__(self) -> Iterator:
         return iter(self._dimensions)
 
@@ -30,6 +30,7 @@ class ParameterCategory(Enum):
     EXPONENTIAL = auto()
     STR_LIST = auto()
     INT_LIST = auto()
+    BOOL_LIST = auto()
 
 
 @dataclass
@@ -17,8 +17,10 @@
 from math import log2
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from model_analyzer.config.generate.generator_utils import GeneratorUtils
 from model_analyzer.config.generate.model_profile_spec import ModelProfileSpec
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
+from model_analyzer.constants import BATCHING_SEARCH_PARAMETER_PATHS
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
 from .search_parameter import ParameterCategory, ParameterUsage, SearchParameter
@@ -43,6 +45,11 @@ class SearchParameters:
         "max_batch_size",
         "instance_group",
         "max_queue_delay_microseconds",
+        "preferred_batch_size",
+        "priority_levels",
+        "max_queue_size",
+        "max_candidate_sequences",
+        "response_cache",
     ]
     runtime_parameters = ["batch_sizes", "concurrency", "request_rate"]
 
@@ -86,6 +93,30 @@ def get_range(self, name: str) -> Tuple[Optional[int], Optional[int]]:
     def get_list(self, name: str) -> Optional[List[Any]]:
         return self._search_parameters[name].enumerated_list
 
+    @staticmethod
+    def get_batching_parameter_list(
+        model_config_parameters: Optional[Dict], name: str
+    ) -> Optional[List[Any]]:
+        """
+        Returns the values of the batching parameter
+        specified in the model config parameters, if any
+        """
+        parameter_list = GeneratorUtils.get_model_config_parameter(
+            model_config_parameters, BATCHING_SEARCH_PARAMETER_PATHS[name]
+        )
+
+        # Each preferred batch size is searched on its own
+        if parameter_list and name == "preferred_batch_size":
+            parameter_list = sorted(
+                {
+                    batch_size
+                    for choice in parameter_list
+                    for batch_size in (choice if isinstance(choice, list) else [choice])
+                }
+            )
+
+        return parameter_list
+
     def number_of_total_possible_configurations(self) -> int:
         total_number_of_configs = 1
         for parameter in self._search_parameters.values():
@@ -106,6 +137,7 @@ def print_info(self, name: str) -> str:
         elif (
             parameter.category is ParameterCategory.INT_LIST
             or parameter.category is ParameterCategory.STR_LIST
+            or parameter.category is ParameterCategory.BOOL_LIST
         ):
             info_string += f"{parameter.enumerated_list}"
 
@@ -142,7 +174,7 @@ def _populate_parameters(self) -> None:
     def _populate_model_config_parameters(self) -> None:
         self._populate_max_batch_size()
         self._populate_instance_group()
-        self._populate_max_queue_delay_microseconds()
+        self._populate_batching_parameters()
 
     def _populate_batch_sizes(self) -> None:
         if self._parameters and self._parameters["batch_sizes"]:
@@ -235,36 +267,34 @@ def _is_key_in_model_config_parameters(self, key: str) -> bool:
 
         return key_found
 
-    def _populate_max_queue_delay_microseconds(self) -> None:
+    def _populate_batching_parameters(self) -> None:
         # Example format
         #
         # model_config_parameters:
         #  dynamic_batching:
         #    max_queue_delay_microseconds: [100, 200, 300]
-
-        # There is no RCS field for max_queue_delay_microseconds
-        if self._is_max_queue_delay_in_model_config_parameters():
-            self._populate_list_parameter(
-                parameter_name="max_queue_delay_microseconds",
-                parameter_list=self._model_config_parameters["dynamic_batching"][0][
-                    "max_queue_delay_microseconds"
-                ],
-                parameter_category=ParameterCategory.INT_LIST,
+        #    preferred_batch_size: [4, 8, 16]
+        #  response_cache:
+        #    enable: [true, false]
+
+        # There are no RCS fields for the batching parameters
+        for parameter_name in BATCHING_SEARCH_PARAMETER_PATHS:
+            parameter_list = SearchParameters.get_batching_parameter_list(
+                self._model_config_parameters, parameter_name
             )
+            if not parameter_list:
+                continue
 
-    def _is_max_queue_delay_in_model_config_parameters(self) -> bool:
-        if self._model_config_parameters:
-            max_queue_delay_present = (
-                "dynamic_batching" in self._model_config_parameters.keys()
-                and (
-                    "max_queue_delay_microseconds"
-                    in self._model_config_parameters["dynamic_batching"][0]
-                )
-            )
-        else:
-            max_queue_delay_present = False
+            if parameter_name == "response_cache":
+                parameter_category = ParameterCategory.BOOL_LIST
+            else:
+                parameter_category = ParameterCategory.INT_LIST
 
-        return max_queue_delay_present
+            self._populate_list_parameter(
+                parameter_name=parameter_name,
+                parameter_list=parameter_list,
+                parameter_category=parameter_category,
+            )
 
     def _populate_list_parameter(
         self,
@@ -354,6 +384,7 @@ def _check_for_illegal_input(
         if (
             category is ParameterCategory.INT_LIST
             or category is ParameterCategory.STR_LIST
+            or category is ParameterCategory.BOOL_LIST
         ):
             self._check_for_illegal_list_input(min_range, max_range, enumerated_list)
         else:
@@ -9,6 +9,7 @@
 import yaml
 
 from model_analyzer.config.generate.generator_utils import GeneratorUtils
+from model_analyzer.constants import BATCHING_SEARCH_PARAMETER_PATHS
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
 from .yaml_config_validator import YamlConfigValidator
@@ -117,6 +118,7 @@ def _check_for_illegal_config_settings(
         self._check_for_bls_incompatibility(args, yaml_config)
         self._check_for_concurrency_rate_request_conflicts(args, yaml_config)
         self._check_for_config_search_rate_request_conflicts(args, yaml_config)
+        self._check_for_request_trace_conflicts(args, yaml_config)
         self._check_for_dcgm_disable_launch_mode_conflict(args, yaml_config)
 
     def _set_field_values(
@@ -174,13 +176,15 @@ def _check_for_multi_model_incompatibility(
     def _check_multi_model_search_mode_incompatibility(
         self, args: Namespace, yaml_config: Optional[Dict[str, List]]
     ) -> None:
-        if (
-            self._get_config_value("run_config_search_mode", args, yaml_config)
-            == "brute"
+        if self._get_config_value(
+            "run_config_search_mode", args, yaml_config
+        ) == "brute" and not self._get_config_value(
+            "brute_search_minimize_restarts", args, yaml_config
         ):
             raise TritonModelAnalyzerException(
-                f"\nConcurrent profiling of models not supported in brute search mode."
-                "\nPlease use quick search mode (`--run-config-search-mode quick`) or disable concurrent model profiling."
+                f"\nConcurrent profiling of models is only supported in brute search mode when restarts are minimized."
+                "\nPlease use quick search mode (`--run-config-search-mode quick`), add `--brute-search-minimize-restarts`, "
+                "or disable concurrent model profiling."
             )
 
     def _check_for_quick_search_incompatibility(
@@ -357,7 +361,13 @@ def _check_quick_search_model_config_parameters_combinations(self) -> None:
 
             model_config_params = deepcopy(model.model_config_parameters())
             if model_config_params:
-                if len(GeneratorUtils.generate_combinations(model_config_params)) > 1:
+                # Batching parameters are searched as their own dimensions
+                for path in BATCHING_SEARCH_PARAMETER_PATHS.values():
+                    GeneratorUtils.remove_model_config_parameter(
+                        model_config_params, path
+                    )
+
+                if GeneratorUtils.count_combinations(model_config_params) > 1:
                     raise TritonModelAnalyzerException(
                         f"\nProfiling of top-level models in quick search mode is not supported for the specified model config parameters, "
                         f"as more than one combination of parameters can be generated."
@@ -460,6 +470,35 @@ def _check_for_config_search_rate_request_conflicts(
                     f"\nCannot have both `run-config-search-max-request-rate` and `run-config-search-min/max-concurrency` specified in the config/CLI."
                 )
 
+    def _check_for_request_trace_conflicts(
+        self, args: Namespace, yaml_config: Optional[Dict[str, List]]
+    ) -> None:
+        if not self._get_config_value("request_trace", args, yaml_config):
+            return
+
+        for key in [
+            "concurrency",
+            "request_rate",
+            "request_rate_search_enable",
+            "run_config_search_min_concurrency",
+            "run_config_search_max_concurrency",
+            "run_config_search_min_request_rate",
+            "run_config_search_max_request_rate",
+        ]:
+            if self._get_config_value(key, args, yaml_config):
+                raise TritonModelAnalyzerException(
+                    f"\nCannot have both `request-trace` and `{key.replace('_', '-')}` specified in the config/CLI."
+                )
+
+        search_mode = self._get_config_value(
+            "run_config_search_mode", args, yaml_config
+        )
+        if search_mode and search_mode != "brute":
+            raise TritonModelAnalyzerException(
+                f"\nA request trace is only supported in brute search mode."
+                "\nPlease remove `--request-trace` or use `--run-config-search-mode brute`."
+            )
+
     def _check_for_dcgm_disable_launch_mode_conflict(
         self, args: Namespace, yaml_config: Optional[Dict[str, List]]
     ) -> None:
@@ -29,16 +29,21 @@
 from .config_defaults import (
     DEFAULT_ALWAYS_REPORT_GPU_METRICS,
     DEFAULT_BATCH_SIZES,
+    DEFAULT_BRUTE_SEARCH_DOMINANCE_PRUNING_ENABLE,
+    DEFAULT_BRUTE_SEARCH_MINIMIZE_RESTARTS,
     DEFAULT_CHECKPOINT_DIRECTORY,
     DEFAULT_CLIENT_PROTOCOL,
     DEFAULT_COLLECT_CPU_METRICS,
+    DEFAULT_COLLECT_LATENCY_HISTOGRAM,
     DEFAULT_CONCURRENCY_SWEEP_DISABLE,
     DEFAULT_DCGM_DISABLE,
     DEFAULT_DURATION_SECONDS,
     DEFAULT_EXPORT_PATH,
+    DEFAULT_FAILURE_PRUNING_ENABLE,
     DEFAULT_FILENAME_MODEL_GPU,
     DEFAULT_FILENAME_MODEL_INFERENCE,
     DEFAULT_FILENAME_SERVER_ONLY,
+    DEFAULT_GPU_MEMORY_PREDICTION_ENABLE,
     DEFAULT_GPU_OUTPUT_FIELDS,
     DEFAULT_GPUS,
     DEFAULT_INFERENCE_OUTPUT_FIELDS,
@@ -54,35 +59,52 @@
     DEFAULT_ONLINE_OBJECTIVES,
     DEFAULT_ONLINE_PLOTS,
     DEFAULT_OPTUNA_EARLY_EXIT_THRESHOLD,
+    DEFAULT_OPTUNA_FIDELITY_LEVELS,
+    DEFAULT_OPTUNA_FIDELITY_REDUCTION_FACTOR,
     DEFAULT_OPTUNA_MAX_PERCENTAGE_OF_SEARCH_SPACE,
     DEFAULT_OPTUNA_MAX_TRIALS,
     DEFAULT_OPTUNA_MIN_PERCENTAGE_OF_SEARCH_SPACE,
     DEFAULT_OPTUNA_MIN_TRIALS,
+    DEFAULT_OPTUNA_MULTI_OBJECTIVE,
     DEFAULT_OUTPUT_MODEL_REPOSITORY,
     DEFAULT_OVERRIDE_OUTPUT_REPOSITORY_FLAG,
+    DEFAULT_PARAMETER_SEARCH_MODE,
+    DEFAULT_PERF_ANALYZER_ARTIFACT_RETENTION,
     DEFAULT_PERF_ANALYZER_CPU_UTIL,
     DEFAULT_PERF_ANALYZER_PATH,
     DEFAULT_PERF_ANALYZER_TIMEOUT,
     DEFAULT_PERF_MAX_AUTO_ADJUSTS,
     DEFAULT_PERF_OUTPUT_FLAG,
+    DEFAULT_QUICK_SEARCH_COORDINATE_DESCENT_ENABLE,
+    DEFAULT_QUICK_SEARCH_SURROGATE,
     DEFAULT_REQUEST_RATE_GPU_OUTPUT_FIELDS,
     DEFAULT_REQUEST_RATE_INFERENCE_OUTPUT_FIELDS,
+    DEFAULT_REQUEST_RATE_PREDICTION_ENABLE,
     DEFAULT_REQUEST_RATE_SEARCH_ENABLE,
+    DEFAULT_REQUEST_TRACE_TIMESTAMP_FIELD,
+    DEFAULT_REQUEST_TRACE_TIMESTAMP_UNIT,
     DEFAULT_RUN_CONFIG_MAX_BINARY_SEARCH_STEPS,
     DEFAULT_RUN_CONFIG_MAX_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MAX_INSTANCE_COUNT,
     DEFAULT_RUN_CONFIG_MAX_MODEL_BATCH_SIZE,
     DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE,
+    DEFAULT_RUN_CONFIG_MAX_REQUEST_TRACE_SCALE,
     DEFAULT_RUN_CONFIG_MIN_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MIN_INSTANCE_COUNT,
     DEFAULT_RUN_CONFIG_MIN_MODEL_BATCH_SIZE,
     DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE,
+    DEFAULT_RUN_CONFIG_MIN_REQUEST_TRACE_SCALE,
     DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE,
     DEFAULT_RUN_CONFIG_SEARCH_DISABLE,
     DEFAULT_RUN_CONFIG_SEARCH_MODE,
     DEFAULT_SERVER_OUTPUT_FIELDS,
     DEFAULT_SKIP_DETAILED_REPORTS,
     DEFAULT_SKIP_SUMMARY_REPORTS,
+    DEFAULT_STATISTICAL_MEASUREMENT_BUDGET,
+    DEFAULT_STATISTICAL_MEASUREMENT_CANDIDATES,
+    DEFAULT_STATISTICAL_MEASUREMENT_CI_THRESHOLD,
+    DEFAULT_STATISTICAL_MEASUREMENT_CONFIDENCE_LEVEL,
+    DEFAULT_STATISTICAL_MEASUREMENT_ENABLE,
     DEFAULT_TRITON_DOCKER_IMAGE,
     DEFAULT_TRITON_GRPC_ENDPOINT,
     DEFAULT_TRITON_HTTP_ENDPOINT,
@@ -257,6 +279,16 @@ def _fill_config(self):
                 description="Specify whether CPU metrics are collected or not",
             )
         )
+        self._add_config(
+            ConfigField(
+                "collect_latency_histogram",
+                field_type=ConfigPrimitive(bool),
+                flags=["--collect-latency-histogram"],
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_COLLECT_LATENCY_HISTOGRAM,
+                description="Enables capturing the full latency distribution of each measurement from perf_analyzer's per-request profile export",
+            )
+        )
         self._add_config(
             ConfigField(
                 "gpus",
@@ -277,6 +309,77 @@ def _fill_config(self):
                 description="Report GPU metrics, even when the model is `cpu_only`.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "gpu_memory_prediction_enable",
+                flags=["--gpu-memory-prediction-enable"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_GPU_MEMORY_PREDICTION_ENABLE,
+                description="Skips run configs whose GPU memory usage, predicted from the instance counts and "
+                "max batch sizes of earlier measurements, exceeds the memory of the GPU.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "failure_pruning_enable",
+                flags=["--failure-pruning-enable"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_FAILURE_PRUNING_ENABLE,
+                description="Skips run configs at least as large as one that failed to load, ran out of memory, "
+                "or whose perf_analyzer run timed out or exceeded the CPU limit.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "statistical_measurement_enable",
+                flags=["--statistical-measurement-enable"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_STATISTICAL_MEASUREMENT_ENABLE,
+                description="After the search, measures the top candidate run configs of each model again "
+                "until the confidence interval on their objective is below the threshold, or the budget is spent. "
+                "Results are ranked by the mean of the repetitions.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "statistical_measurement_candidates",
+                flags=["--statistical-measurement-candidates"],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_STATISTICAL_MEASUREMENT_CANDIDATES,
+                description="The number of top run configs that are measured again in statistical measurement.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "statistical_measurement_budget",
+                flags=["--statistical-measurement-budget"],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_STATISTICAL_MEASUREMENT_BUDGET,
+                description="The maximum number of repeated measurements statistical measurement takes per model.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "statistical_measurement_ci_threshold",
+                flags=["--statistical-measurement-ci-threshold"],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_STATISTICAL_MEASUREMENT_CI_THRESHOLD,
+                description="A candidate is measured again until the half width of the confidence interval "
+                "on its objective is below this fraction of the objective.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "statistical_measurement_confidence_level",
+                flags=["--statistical-measurement-confidence-level"],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_STATISTICAL_MEASUREMENT_CONFIDENCE_LEVEL,
+                description="The confidence level of the confidence intervals of repeated measurements.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "dcgm_disable",
@@ -519,6 +622,11 @@ def _add_profile_models_configs(self):
                         "min": ConfigPrimitive(int),
                     }
                 ),
+                "request_goodput": ConfigObject(
+                    schema={
+                        "min": ConfigPrimitive(int),
+                    }
+                ),
                 "perf_latency_avg": ConfigObject(
                     schema={
                         "max": ConfigPrimitive(int),
@@ -539,6 +647,21 @@ def _add_profile_models_configs(self):
                         "max": ConfigPrimitive(int),
                     }
                 ),
+                "perf_latency_p50": ConfigObject(
+                    schema={
+                        "max": ConfigPrimitive(int),
+                    }
+                ),
+                "perf_latency_p999": ConfigObject(
+                    schema={
+                        "max": ConfigPrimitive(int),
+                    }
+                ),
+                "perf_latency_max": ConfigObject(
+                    schema={
+                        "max": ConfigPrimitive(int),
+                    }
+                ),
                 "perf_latency": ConfigObject(
                     schema={
                         "max": ConfigPrimitive(int),
@@ -911,6 +1034,25 @@ def _add_run_search_configs(self):
                 description="Min request rate value that run config search should start with.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "run_config_search_max_request_trace_scale",
+                flags=["--run-config-search-max-request-trace-scale"],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_RUN_CONFIG_MAX_REQUEST_TRACE_SCALE,
+                description="Max load multiplier of the request trace that run config search should not go beyond that.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "run_config_search_min_request_trace_scale",
+                flags=["--run-config-search-min-request-trace-scale"],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_RUN_CONFIG_MIN_REQUEST_TRACE_SCALE,
+                description="Min load multiplier of the request trace that run config search should start with. "
+                "Fractions (e.g. 0.5) replay the trace at a reduced load.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "run_config_search_max_instance_count",
@@ -956,6 +1098,20 @@ def _add_run_search_configs(self):
                 description="Maximum number of steps take during the binary concurrency search.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "parameter_search_mode",
+                flags=["--parameter-search-mode"],
+                choices=["sweep", "knee"],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_PARAMETER_SEARCH_MODE,
+                description="How the concurrency (or request rate) of a model config is searched. "
+                "'sweep' walks powers of two until throughput saturates, then binary searches "
+                "any constraint boundary. 'knee' stops at the first power of two that does not "
+                "improve, then refines towards the lowest value that reaches the best "
+                "throughput within the constraints.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "min_percentage_of_search_space",
@@ -1001,6 +1157,59 @@ def _add_run_search_configs(self):
                 description="Number of trials without improvement before triggering early exit when using Optuna",
             )
         )
+        self._add_config(
+            ConfigField(
+                "optuna_fidelity_levels",
+                flags=["--optuna-fidelity-levels"],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_OPTUNA_FIDELITY_LEVELS,
+                description="Number of measurement fidelity levels used by Optuna's successive halving. "
+                "Trials are first measured with a shortened PA measurement and only the best are "
+                "promoted to longer ones. A value of 1 measures every trial at full fidelity.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "optuna_fidelity_reduction_factor",
+                flags=["--optuna-fidelity-reduction-factor"],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_OPTUNA_FIDELITY_REDUCTION_FACTOR,
+                description="Factor by which the measurement is shortened at each lower fidelity level, "
+                "and by which the number of trials is reduced at each promotion",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "optuna_multi_objective",
+                flags=["--optuna-multi-objective"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_OPTUNA_MULTI_OBJECTIVE,
+                description="Search for the Pareto frontier of the objectives, rather than for the best "
+                "single weighted score, so the operating point can be picked afterwards "
+                "for any weighting or constraint without re-profiling.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "optuna_warm_start_study",
+                flags=["--optuna-warm-start-study"],
+                field_type=ConfigPrimitive(str),
+                description="Name of a checkpointed Optuna study (the comma separated model names it profiled) "
+                "whose trials are used to warm start the Optuna search. "
+                "Parameters are matched to the models being profiled by position.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "warm_start_checkpoint",
+                flags=["--warm-start-checkpoint"],
+                field_type=ConfigPrimitive(str),
+                description="Checkpoint file (or checkpoint directory) of a previous run. Quick search starts at, "
+                "and Optuna search first measures, the best configurations of the most recently profiled "
+                "model in it, rather than starting from scratch.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "use_concurrency_formula",
@@ -1026,6 +1235,31 @@ def _add_run_search_configs(self):
                 " the user to quickly search over any set of parameters.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "quick_search_surrogate",
+                flags=["--quick-search-surrogate"],
+                choices=["none", "quadratic"],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_QUICK_SEARCH_SURROGATE,
+                description="The surrogate model quick search uses to pick its next step. "
+                "'none' steps along a weighted sum of the neighbors' comparisons to home. "
+                "'quadratic' fits a quadratic regression over the measured neighborhood and "
+                "steps to the coordinate with the best predicted score.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "quick_search_coordinate_descent_enable",
+                flags=["--quick-search-coordinate-descent-enable"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_QUICK_SEARCH_COORDINATE_DESCENT_ENABLE,
+                description="When profiling models concurrently, quick search steps in one model's "
+                "dimensions at a time, holding the other models at their best configuration, "
+                "and then refines the best configuration found in all dimensions jointly.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "run_config_search_disable",
@@ -1046,6 +1280,28 @@ def _add_run_search_configs(self):
                 description="Enable the profiling of all supplied models concurrently.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "brute_search_minimize_restarts",
+                flags=["--brute-search-minimize-restarts"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_BRUTE_SEARCH_MINIMIZE_RESTARTS,
+                description="Orders a concurrent brute search so each combination of model config variants "
+                "is loaded once, sweeping every perf analyzer config before moving to the next combination.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "brute_search_dominance_pruning_enable",
+                flags=["--brute-search-dominance-pruning-enable"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_BRUTE_SEARCH_DOMINANCE_PRUNING_ENABLE,
+                description="Skips brute search model configs that increase a model config parameter beyond a value "
+                "whose increase already lowered the throughput at every measured load.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "request_rate_search_enable",
@@ -1056,6 +1312,46 @@ def _add_run_search_configs(self):
                 description="Enables the searching of request rate (instead of concurrency).",
             )
         )
+        self._add_config(
+            ConfigField(
+                "request_trace",
+                flags=["--request-trace"],
+                field_type=ConfigPrimitive(str),
+                description="A log of timestamped requests (.csv or .jsonl). Its arrivals are replayed through perf analyzer "
+                "request intervals, and the multiplier of its load is searched (instead of concurrency).",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "request_trace_timestamp_field",
+                flags=["--request-trace-timestamp-field"],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_REQUEST_TRACE_TIMESTAMP_FIELD,
+                description="The column (CSV) or key (JSONL) of each request's timestamp in the request trace.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "request_trace_timestamp_unit",
+                flags=["--request-trace-timestamp-unit"],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_REQUEST_TRACE_TIMESTAMP_UNIT,
+                choices=["s", "ms", "us"],
+                description="The unit of numeric timestamps in the request trace.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "request_rate_prediction_enable",
+                flags=["--request-rate-prediction-enable"],
+                field_type=ConfigPrimitive(bool),
+                parser_args={"action": "store_true"},
+                default_value=DEFAULT_REQUEST_RATE_PREDICTION_ENABLE,
+                description="Uses a queueing model of the measured service time to start request rate "
+                "sweeps near the predicted knee and skip rates predicted to saturate the model "
+                "or violate the latency budget.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "concurrency_sweep_disable",
@@ -1250,6 +1546,44 @@ def _add_perf_analyzer_configs(self):
                 "launched with auto adjusted parameters in an attempt to profile a model. ",
             )
         )
+        self._add_config(
+            ConfigField(
+                "perf_analyzer_artifact_directory",
+                flags=["--perf-analyzer-artifact-directory"],
+                field_type=ConfigPrimitive(str, validator=parent_path_validator),
+                description="Directory in which each perf_analyzer/genai-perf run gets its "
+                "own temporary artifact directory. Defaults to the system temp directory.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "perf_analyzer_artifact_retention",
+                flags=["--perf-analyzer-artifact-retention"],
+                choices=["none", "failed", "all"],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_PERF_ANALYZER_ARTIFACT_RETENTION,
+                description="Which per-run perf_analyzer/genai-perf artifact directories are kept "
+                "after the run for debugging: 'none', only those of 'failed' runs, or 'all'.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "goodput_time_to_first_token_slo",
+                flags=["--goodput-time-to-first-token-slo"],
+                field_type=ConfigPrimitive(float),
+                description="Maximum time to first token (ms) of an LLM request "
+                "for it to count towards request_goodput.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "goodput_inter_token_latency_slo",
+                flags=["--goodput-inter-token-latency-slo"],
+                field_type=ConfigPrimitive(float),
+                description="Maximum inter token latency (ms) of an LLM request "
+                "for it to count towards request_goodput.",
+            )
+        )
 
     def _add_export_configs(self):
         """
@@ -1512,12 +1846,31 @@ def _preprocess_and_verify_arguments(self):
         elif not os.path.exists(self.export_path):
             os.makedirs(self.export_path)
 
+        if self.run_config_search_min_request_trace_scale <= 0:
+            raise TritonModelAnalyzerException(
+                "run_config_search_min_request_trace_scale must be greater than 0."
+            )
+
         if self.num_top_model_configs > 0 and not self.constraints:
             raise TritonModelAnalyzerException(
                 "If setting num_top_model_configs > 0, comparison across models is requested. "
                 "This requires that global constraints be specified in the config to be used as default."
             )
 
+        if self.statistical_measurement_enable:
+            if not 0 < self.statistical_measurement_confidence_level < 1:
+                raise TritonModelAnalyzerException(
+                    "statistical_measurement_confidence_level must be between 0 and 1."
+                )
+            if self.statistical_measurement_ci_threshold <= 0:
+                raise TritonModelAnalyzerException(
+                    "statistical_measurement_ci_threshold must be greater than 0."
+                )
+            if self.statistical_measurement_candidates < 1:
+                raise TritonModelAnalyzerException(
+                    "statistical_measurement_candidates must be at least 1."
+                )
+
     def _autofill_values(self):
         """
         Fill in the implied or default
@@ -1761,6 +2114,12 @@ def _are_models_using_request_rate(self) -> bool:
         else:
             return model_using_request_rate
 
+    def is_request_trace_specified(self) -> bool:
+        """
+        Returns true if the config specified a request trace
+        """
+        return bool(self.request_trace)
+
     def is_request_rate_specified(self, model_parameters: dict) -> bool:
         """
         Returns true if either the model or the config specified request rate
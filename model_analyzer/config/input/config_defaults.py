@@ -20,6 +20,7 @@
 DEFAULT_MONITORING_INTERVAL = 1.0
 DEFAULT_DURATION_SECONDS = 3
 DEFAULT_COLLECT_CPU_METRICS = False
+DEFAULT_COLLECT_LATENCY_HISTOGRAM = False
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_GPUS = "all"
 DEFAULT_ALWAYS_REPORT_GPU_METRICS = False
@@ -34,21 +35,41 @@
 DEFAULT_RUN_CONFIG_MIN_CONCURRENCY = 1
 DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE = 8192
 DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE = 16
+DEFAULT_RUN_CONFIG_MAX_REQUEST_TRACE_SCALE = 64.0
+DEFAULT_RUN_CONFIG_MIN_REQUEST_TRACE_SCALE = 1.0
 DEFAULT_RUN_CONFIG_MAX_INSTANCE_COUNT = 5
 DEFAULT_RUN_CONFIG_MIN_INSTANCE_COUNT = 1
 DEFAULT_RUN_CONFIG_MIN_MODEL_BATCH_SIZE = 1
 DEFAULT_RUN_CONFIG_MAX_MODEL_BATCH_SIZE = 128
 DEFAULT_RUN_CONFIG_MAX_BINARY_SEARCH_STEPS = 5
+DEFAULT_PARAMETER_SEARCH_MODE = "sweep"
 DEFAULT_RUN_CONFIG_SEARCH_DISABLE = False
 DEFAULT_RUN_CONFIG_SEARCH_MODE = "brute"
 DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE = False
+DEFAULT_BRUTE_SEARCH_MINIMIZE_RESTARTS = False
+DEFAULT_BRUTE_SEARCH_DOMINANCE_PRUNING_ENABLE = False
+DEFAULT_GPU_MEMORY_PREDICTION_ENABLE = False
+DEFAULT_FAILURE_PRUNING_ENABLE = False
+DEFAULT_STATISTICAL_MEASUREMENT_ENABLE = False
+DEFAULT_STATISTICAL_MEASUREMENT_CANDIDATES = 3
+DEFAULT_STATISTICAL_MEASUREMENT_BUDGET = 10
+DEFAULT_STATISTICAL_MEASUREMENT_CI_THRESHOLD = 0.05
+DEFAULT_STATISTICAL_MEASUREMENT_CONFIDENCE_LEVEL = 0.95
+DEFAULT_QUICK_SEARCH_SURROGATE = "none"
+DEFAULT_QUICK_SEARCH_COORDINATE_DESCENT_ENABLE = False
 DEFAULT_OPTUNA_MIN_PERCENTAGE_OF_SEARCH_SPACE = 5
 DEFAULT_OPTUNA_MAX_PERCENTAGE_OF_SEARCH_SPACE = 10
 DEFAULT_OPTUNA_MIN_TRIALS = 20
 DEFAULT_OPTUNA_MAX_TRIALS = 200
 DEFAULT_OPTUNA_EARLY_EXIT_THRESHOLD = 10
+DEFAULT_OPTUNA_FIDELITY_LEVELS = 1
+DEFAULT_OPTUNA_FIDELITY_REDUCTION_FACTOR = 3
+DEFAULT_OPTUNA_MULTI_OBJECTIVE = False
 DEFAULT_USE_CONCURRENCY_FORMULA = False
 DEFAULT_REQUEST_RATE_SEARCH_ENABLE = False
+DEFAULT_REQUEST_RATE_PREDICTION_ENABLE = False
+DEFAULT_REQUEST_TRACE_TIMESTAMP_FIELD = "timestamp"
+DEFAULT_REQUEST_TRACE_TIMESTAMP_UNIT = "s"
 DEFAULT_CONCURRENCY_SWEEP_DISABLE = False
 DEFAULT_DCGM_DISABLE = False
 DEFAULT_TRITON_LAUNCH_MODE = "local"
@@ -63,6 +84,7 @@
 DEFAULT_PERF_ANALYZER_PATH = "perf_analyzer"
 DEFAULT_PERF_OUTPUT_FLAG = False
 DEFAULT_PERF_MAX_AUTO_ADJUSTS = 10
+DEFAULT_PERF_ANALYZER_ARTIFACT_RETENTION = "none"
 DEFAULT_MEASUREMENT_MODE = "count_windows"
 DEFAULT_MODEL_TYPE = "generic"
 
@@ -126,3 +126,30 @@ def objective_list_output_mapper(objectives):
         value.set_value(10)
         output_dict[objective] = value
     return output_dict
+
+
+#########
+# Paths #
+#########
+
+
+def absolute_path_if_exists(path):
+    """
+    Makes a path that exists relative to the current
+    working directory absolute. Any other value (absolute
+    paths, keywords or names) is returned unchanged
+
+    Parameters
+    ----------
+    path: str
+        A config value that may be a relative path
+
+    Returns
+    -------
+    str
+    """
+
+    if isinstance(path, str) and not os.path.isabs(path) and os.path.exists(path):
+        return os.path.abspath(path)
+
+    return path
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
@@ -57,6 +57,10 @@ def __init__(
         self._perf_config = perf_config
         self._composing_config_variants: List[ModelConfigVariant] = []
 
+        # Cached representation, tagged with the version it was built from
+        self._representation: Optional[str] = None
+        self._representation_version: Optional[Tuple[int, int]] = None
+
     def model_name(self) -> str:
         """
         Get the original model name for this run config.
@@ -140,18 +144,30 @@ def composing_configs(self) -> List[ModelConfig]:
         else:
             return []
 
+    def version(self) -> Tuple[int, int]:
+        """
+        Returns a stamp that changes whenever the representation
+        of this ModelRunConfig can change
+        """
+        return (len(self._composing_config_variants), self._perf_config.version())
+
     def representation(self) -> str:
         """
         Returns a representation string for the ModelRunConfig that can be used
         as a key to uniquely identify it
         """
-        repr = self.model_variant_name()
-        repr += " " + self.perf_config().representation()
+        version = self.version()
+        if self._representation is None or self._representation_version != version:
+            repr = self.model_variant_name()
+            repr += " " + self.perf_config().representation()
 
-        if self._composing_config_variants:
-            repr += " " + (",").join(self.get_composing_config_names())  # type: ignore
+            if self._composing_config_variants:
+                repr += " " + (",").join(self.get_composing_config_names())  # type: ignore
 
-        return repr
+            self._representation = repr
+            self._representation_version = version
+
+        return self._representation
 
     def _check_for_client_vs_model_batch_size(self) -> bool:
         """
@@ -210,6 +226,28 @@ def _check_for_preferred_vs_model_batch_size(self) -> bool:
 
         return legal
 
+    def _check_for_priority_levels(self) -> bool:
+        """
+        Returns false if the default priority level is outside of
+        the priority levels of the dynamic batcher. Else true
+        """
+        for model_config in self._create_model_config_dicts():
+            dynamic_batching = model_config.get("dynamic_batching", {})
+            priority_levels = int(dynamic_batching.get("priority_levels", 0))
+            if not priority_levels:
+                continue
+
+            default_priority_level = int(
+                dynamic_batching.get("default_priority_level", 0)
+            )
+            if not 1 <= default_priority_level <= priority_levels:
+                logger.debug(
+                    f"Illegal model run config because {model_config['name']}'s default priority level {default_priority_level} is not within its {priority_levels} priority levels"
+                )
+                return False
+
+        return True
+
     def _create_model_config_dicts(self) -> List[Dict]:
         """
         Create a list of model config dictionaries for
@@ -237,6 +275,7 @@ def is_legal_combination(self):
         legal = (
             self._check_for_client_vs_model_batch_size()
             and self._check_for_preferred_vs_model_batch_size()
+            and self._check_for_priority_levels()
         )
 
         return legal
@@ -276,6 +315,17 @@ def add_composing_model_config_variants(
         for composing_model_config_variant in composing_model_config_variants:
             self._composing_config_variants.append(composing_model_config_variant)
 
+    def to_dict(self) -> Dict:
+        """
+        Returns the checkpointed state of the ModelRunConfig,
+        which excludes the cached representation
+        """
+        mrc_dict = dict(self.__dict__)
+        del mrc_dict["_representation"]
+        del mrc_dict["_representation_version"]
+
+        return mrc_dict
+
     @classmethod
     def from_dict(cls, model_run_config_dict):
         model_run_config = ModelRunConfig(None, None, None)
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.perf_analyzer.genai_perf_config import GenaiPerfConfig
@@ -43,6 +43,13 @@ def __init__(self, triton_env, genai_perf_flags=None):
         self._genai_perf_config.update_config(genai_perf_flags)
         self._model_run_configs: List[ModelRunConfig] = []
 
+        # Fraction of the full PA measurement window to measure with
+        self._fidelity = 1.0
+
+        # Cached representation, tagged with the version it was built from
+        self._representation: Optional[str] = None
+        self._representation_version: Optional[Tuple] = None
+
     def add_model_run_config(self, model_run_config):
         """
         Add a ModelRunConfig to this RunConfig
@@ -59,8 +66,18 @@ def representation(self):
         """
         Returns a representation string for the RunConfig that can be used
         as a key to uniquely identify it
+
+        The string is cached until one of the member ModelRunConfigs changes,
+        so repeated lookups (and the hashing of the key) are not recomputed
         """
-        return "".join([mrc.representation() for mrc in self.model_run_configs()])
+        version = tuple(mrc.version() for mrc in self._model_run_configs)
+        if self._representation is None or self._representation_version != version:
+            self._representation = "".join(
+                [mrc.representation() for mrc in self.model_run_configs()]
+            )
+            self._representation_version = version
+
+        return self._representation
 
     def is_legal_combination(self):
         """
@@ -112,6 +129,31 @@ def triton_environment(self):
     def genai_perf_config(self):
         return self._genai_perf_config
 
+    def set_fidelity(self, fidelity: float) -> None:
+        """
+        Shortens the PA measurement of every model in this RunConfig
+        to a fraction of its full measurement window
+
+        Parameters
+        ----------
+        fidelity: float
+            Fraction (0, 1] of the full measurement window
+        """
+        for model_run_config in self._model_run_configs:
+            model_run_config.perf_config().scale_measurement(fidelity)
+
+        self._fidelity = fidelity
+
+    def fidelity(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Fraction of the full PA measurement window
+            this RunConfig is measured with
+        """
+        return self._fidelity
+
     def models_name(self):
         """Returns a single comma-joined name of the original model names"""
         return ",".join([mrc.model_name() for mrc in self.model_run_configs()])
@@ -157,6 +199,17 @@ def combined_model_variants_name(self):
         else:
             return self.model_variants_name()
 
+    def to_dict(self) -> Dict:
+        """
+        Returns the checkpointed state of the RunConfig,
+        which excludes the cached representation
+        """
+        run_config_dict = dict(self.__dict__)
+        del run_config_dict["_representation"]
+        del run_config_dict["_representation_version"]
+
+        return run_config_dict
+
     @classmethod
     def from_dict(cls, run_config_dict):
         run_config = RunConfig({})
@@ -164,5 +217,6 @@ def from_dict(cls, run_config_dict):
         run_config._triton_env = run_config_dict["_triton_env"]
         for mrc_dict in run_config_dict["_model_run_configs"]:
             run_config._model_run_configs.append(ModelRunConfig.from_dict(mrc_dict))
+        run_config._fidelity = run_config_dict.get("_fidelity", 1.0)
 
         return run_config
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Config constants
 CONFIG_PARSER_SUCCESS = 1
@@ -30,11 +30,37 @@
 # config to result in the default config (empty dict)
 DEFAULT_CONFIG_PARAMS: Dict[str, Any] = {}
 
+# Batching parameters that quick and optuna search can search,
+# mapped to their path in the model config
+BATCHING_SEARCH_PARAMETER_PATHS: Dict[str, List[str]] = {
+    "max_queue_delay_microseconds": [
+        "dynamic_batching",
+        "max_queue_delay_microseconds",
+    ],
+    "preferred_batch_size": ["dynamic_batching", "preferred_batch_size"],
+    "priority_levels": ["dynamic_batching", "priority_levels"],
+    "max_queue_size": ["dynamic_batching", "default_queue_policy", "max_queue_size"],
+    "max_candidate_sequences": [
+        "sequence_batching",
+        "oldest",
+        "max_candidate_sequences",
+    ],
+    "response_cache": ["response_cache", "enable"],
+}
+
 # Run Search
 THROUGHPUT_MINIMUM_GAIN = 0.05
 THROUGHPUT_MINIMUM_CONSECUTIVE_PARAMETER_TRIES = 4
 THROUGHPUT_MINIMUM_CONSECUTIVE_BATCH_SIZE_TRIES = 4
 
+# Knee search stops refining once the parameter is bracketed
+# to within this fraction of the best parameter found
+KNEE_SEARCH_PARAMETER_TOLERANCE = 0.25
+
+# Request rates beyond this multiple of the queueing model's predicted
+# saturation rate are not measured
+QUEUEING_MODEL_SATURATION_MARGIN = 2.0
+
 # Quick search algorithm constants
 RADIUS = 3
 MIN_INITIALIZED = 3
@@ -62,15 +88,24 @@
 # PA Error Log Filename
 PA_ERROR_LOG_FILENAME = "perf_analyzer_error.log"
 
+# Prefix of the per-run directories PA and genai-perf write their outputs to
+PA_ARTIFACT_DIR_PREFIX = "model_analyzer_pa_"
+
 # Constraints
 GLOBAL_CONSTRAINTS_KEY = "__default__"
 
 # Measurement constants
 INVALID_MEASUREMENT_THRESHOLD = 2
 
+# Classes of failure used to prune run configs larger than one that failed
+FAILURE_OUT_OF_MEMORY = "out of memory"
+FAILURE_LOAD_TIMEOUT = "load timeout"
+FAILURE_PERF_ANALYZER_TIMEOUT = "perf_analyzer timeout"
+FAILURE_PERF_ANALYZER_CPU_LIMIT = "perf_analyzer CPU limit"
+
 # Model analyzer package name
 PACKAGE_NAME = "triton-model-analyzer"
 
 # GENAI-PERF
 GENAI_PERF_CSV = "profile_export_genai_perf.csv"
-GENAI_PERF_COLLATERAL = ["llm_inputs.json", "profile_export.json"]
+GENAI_PERF_PROFILE_EXPORT = "profile_export.json"
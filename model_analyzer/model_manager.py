@@ -17,6 +17,7 @@
 import logging
 from typing import Dict, List, Optional
 
+from model_analyzer.config.generate.measurement_repeater import MeasurementRepeater
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
 )
@@ -34,6 +35,7 @@
 from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.result.warm_start import WarmStart
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 from model_analyzer.triton.client.client import TritonClient
 from model_analyzer.triton.model.model_config import ModelConfig
@@ -134,6 +136,12 @@ def run_models(self, models: List[ConfigModelProfileSpec]) -> None:
         triton_server_flags = self._get_triton_server_flags(models)
         self._server.update_config(params=triton_server_flags)
 
+        warm_start = (
+            WarmStart(self._config.warm_start_checkpoint, models)
+            if self._config.warm_start_checkpoint
+            else None
+        )
+
         rcg = RunConfigGeneratorFactory.create_run_config_generator(
             command_config=self._config,
             state_manager=self._state_manager,
@@ -144,20 +152,39 @@ def run_models(self, models: List[ConfigModelProfileSpec]) -> None:
             search_parameters=self._search_parameters,
             composing_search_parameters=self._composing_search_parameters,
             model_variant_name_manager=self._model_variant_name_manager,
+            warm_start=warm_start,
         )
 
+        predicted_restart_count = 0
+        last_model_variants = None
+
         for run_config in rcg.get_configs():
             if self._state_manager.exiting():
                 break
 
-            if run_config.is_legal_combination():
+            if not run_config.is_legal_combination():
+                logger.info("Skipping illegal run configuration")
+                measurement = None
+            elif self._metrics_manager.is_predicted_to_exceed_gpu_memory(run_config):
+                logger.info(
+                    "Skipping run configuration predicted to run out of GPU memory"
+                )
+                measurement = None
+            elif self._metrics_manager.is_pruned_by_failure(run_config):
+                logger.info(
+                    "Skipping run configuration larger than one that already failed"
+                )
+                measurement = None
+            else:
+                # A restart is expected every time the set of loaded variants changes
+                if run_config.model_variants_name() != last_model_variants:
+                    predicted_restart_count += 1
+                    last_model_variants = run_config.model_variants_name()
+
                 measurement = self._metrics_manager.execute_run_config(run_config)
 
                 self._check_for_valid_measurement(measurement)
                 self._stop_ma_if_no_valid_measurement_threshold_reached()
-            else:
-                logger.info("Skipping illegal run configuration")
-                measurement = None
 
             if measurement:
                 objectives = [model.objectives() for model in models]
@@ -172,8 +199,20 @@ def run_models(self, models: List[ConfigModelProfileSpec]) -> None:
             rcg.set_last_results([measurement])
             self._state_manager.save_checkpoint()
 
+        if self._config.statistical_measurement_enable:
+            self._repeat_top_measurements(models)
+
         self._metrics_manager.finalize()
 
+        if self._config.brute_search_minimize_restarts:
+            logger.info(
+                f"Server was restarted {self._metrics_manager.server_restart_count()} "
+                f"times ({predicted_restart_count} predicted from the run config order)"
+            )
+
+        if warm_start:
+            warm_start.log_measurements_saved(self._get_measurement_count(models))
+
         # Reset the server args to global config
         self._server.update_config(params=server_config_copy.server_args())
 
@@ -185,6 +224,41 @@ def run_models(self, models: List[ConfigModelProfileSpec]) -> None:
             "ModelManager.model_variant_name_manager", model_variant_name_manager_dict
         )
 
+    def _repeat_top_measurements(self, models: List[ConfigModelProfileSpec]) -> None:
+        """
+        Measures the top candidates again, until the confidence
+        interval on each of their objectives is below the threshold
+        """
+        measurement_repeater = MeasurementRepeater(
+            config=self._config,
+            result_manager=self._result_manager,
+            models_name=",".join([model.model_name() for model in models]),
+        )
+
+        for run_config in measurement_repeater.get_configs():
+            if self._state_manager.exiting():
+                break
+
+            measurement = self._metrics_manager.repeat_run_config(run_config)
+
+            measurement_repeater.set_last_results([measurement])
+            self._state_manager.save_checkpoint()
+
+    def _get_measurement_count(self, models: List[ConfigModelProfileSpec]) -> int:
+        models_name = ",".join([model.model_name() for model in models])
+        model_measurements = (
+            self._result_manager.get_results().get_model_measurements_dict(
+                models_name, suppress_warning=True
+            )
+        )
+
+        return sum(
+            [
+                len(run_config_measurements)
+                for _, run_config_measurements in model_measurements.values()
+            ]
+        )
+
     def _get_triton_server_flags(self, models):
         triton_server_flags = models[0].triton_server_flags()
 
@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import deepcopy
+
+from model_analyzer.config.input.config_utils import absolute_path_if_exists
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
 
@@ -41,6 +44,10 @@ class GenaiPerfConfig:
 
     boolean_args = ["streaming"]
 
+    # Args whose values may be paths relative to the directory model analyzer
+    # was launched from, which differs from the directory genai-perf is run in
+    path_args = ["input-dataset", "tokenizer"]
+
     def __init__(self):
         """
         Construct a GenaiPerfConfig
@@ -84,6 +91,22 @@ def from_dict(cls, genai_perf_config_dict):
                 setattr(genai_perf_config, key, genai_perf_config_dict[key])
         return genai_perf_config
 
+    def with_absolute_paths(self) -> "GenaiPerfConfig":
+        """
+        Returns
+        -------
+        GenaiPerfConfig
+            a copy of this config where every path arg that
+            names an existing relative path is made absolute
+        """
+        genai_perf_config = deepcopy(self)
+
+        for key in self.path_args:
+            if self._args[key]:
+                genai_perf_config[key] = absolute_path_if_exists(self._args[key])
+
+        return genai_perf_config
+
     def representation(self):
         """
         Returns
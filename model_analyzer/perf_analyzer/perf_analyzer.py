@@ -3,10 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import csv
-import glob
 import logging
 import os
 import re
+import shutil
 import signal
 import tempfile
 from csv import DictReader
@@ -15,18 +15,27 @@
 
 import psutil
 
-from model_analyzer.config.input.config_defaults import DEFAULT_MODEL_TYPE
+from model_analyzer.config.input.config_defaults import (
+    DEFAULT_MODEL_TYPE,
+    DEFAULT_PERF_ANALYZER_ARTIFACT_RETENTION,
+)
 from model_analyzer.constants import (
-    GENAI_PERF_COLLATERAL,
+    FAILURE_OUT_OF_MEMORY,
+    FAILURE_PERF_ANALYZER_CPU_LIMIT,
+    FAILURE_PERF_ANALYZER_TIMEOUT,
     GENAI_PERF_CSV,
+    GENAI_PERF_PROFILE_EXPORT,
     INTERVAL_SLEEP_TIME,
     LOGGER_NAME,
     MEASUREMENT_REQUEST_COUNT_STEP,
     MEASUREMENT_WINDOW_STEP,
+    PA_ARTIFACT_DIR_PREFIX,
     PERF_ANALYZER_MEASUREMENT_WINDOW,
     PERF_ANALYZER_MINIMUM_REQUEST_COUNT,
 )
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+from model_analyzer.perf_analyzer.profile_export_reader import ProfileExportReader
+from model_analyzer.record.latency_histogram import LatencyHistogram
 from model_analyzer.record.record import Record
 from model_analyzer.record.types.gpu_free_memory import GPUFreeMemory
 from model_analyzer.record.types.gpu_power_usage import GPUPowerUsage
@@ -45,9 +54,12 @@
 from model_analyzer.record.types.perf_client_response_wait import PerfClientResponseWait
 from model_analyzer.record.types.perf_client_send_recv import PerfClientSendRecv
 from model_analyzer.record.types.perf_latency_avg import PerfLatencyAvg
+from model_analyzer.record.types.perf_latency_max import PerfLatencyMax
+from model_analyzer.record.types.perf_latency_p50 import PerfLatencyP50
 from model_analyzer.record.types.perf_latency_p90 import PerfLatencyP90
 from model_analyzer.record.types.perf_latency_p95 import PerfLatencyP95
 from model_analyzer.record.types.perf_latency_p99 import PerfLatencyP99
+from model_analyzer.record.types.perf_latency_p999 import PerfLatencyP999
 from model_analyzer.record.types.perf_server_compute_infer import PerfServerComputeInfer
 from model_analyzer.record.types.perf_server_compute_input import PerfServerComputeInput
 from model_analyzer.record.types.perf_server_compute_output import (
@@ -55,6 +67,7 @@
 )
 from model_analyzer.record.types.perf_server_queue import PerfServerQueue
 from model_analyzer.record.types.perf_throughput import PerfThroughput
+from model_analyzer.record.types.request_goodput import RequestGoodput
 from model_analyzer.record.types.time_to_first_token_avg import TimeToFirstTokenAvg
 from model_analyzer.record.types.time_to_first_token_max import TimeToFirstTokenMax
 from model_analyzer.record.types.time_to_first_token_min import TimeToFirstTokenMin
@@ -82,6 +95,7 @@ class PerfAnalyzer:
     METRIC_TAG, CSV_STRING, RECORD_CLASS, REDUCTION_FACTOR = 0, 1, 2, 3
     perf_metric_table = [
         ["perf_latency_avg", "Avg latency", PerfLatencyAvg, "1000"],
+        ["perf_latency_p50", "p50 latency", PerfLatencyP50, "1000"],
         ["perf_latency_p90", "p90 latency", PerfLatencyP90, "1000"],
         ["perf_latency_p95", "p95 latency", PerfLatencyP95, "1000"],
         ["perf_latency_p99", "p99 latency", PerfLatencyP99, "1000"],
@@ -110,6 +124,14 @@ class PerfAnalyzer:
         ],
     ]
 
+    # Metrics computed from the latency histogram built out of PA's profile export
+    # The percentile replaces the CSV string of the other tables
+    PERCENTILE = 1
+    latency_histogram_metric_table = [
+        ["perf_latency_p999", 99.9, PerfLatencyP999, "1000"],
+        ["perf_latency_max", 100, PerfLatencyMax, "1000"],
+    ]
+
     gpu_metric_table = [
         ["gpu_utilization", "Avg GPU Utilization", GPUUtilization, "0.01"],
         ["gpu_power_usage", "Avg GPU Power Usage", GPUPowerUsage, "1"],
@@ -239,6 +261,7 @@ def get_perf_metrics():
         perf_metrics = [
             perf_metric[PerfAnalyzer.RECORD_CLASS]
             for perf_metric in PerfAnalyzer.perf_metric_table
+            + PerfAnalyzer.latency_histogram_metric_table
         ]
         return perf_metrics
 
@@ -256,6 +279,7 @@ def get_llm_metrics():
             llm_metric[PerfAnalyzer.RECORD_CLASS]
             for llm_metric in PerfAnalyzer.llm_metric_table
         ]
+        llm_metrics.append(RequestGoodput)
         return llm_metrics
 
     def __init__(
@@ -266,6 +290,10 @@ def __init__(
         timeout,
         max_cpu_util,
         model_type=DEFAULT_MODEL_TYPE,
+        goodput_time_to_first_token_slo=None,
+        goodput_inter_token_latency_slo=None,
+        artifact_directory=None,
+        artifact_retention=DEFAULT_PERF_ANALYZER_ARTIFACT_RETENTION,
     ):
         """
         Parameters
@@ -282,6 +310,15 @@ def __init__(
             will wait until the execution is complete.
         max_cpu_util : float
             Maximum CPU utilization allowed for perf_analyzer
+        goodput_time_to_first_token_slo : float
+            Maximum time to first token (ms) of a request counted towards goodput
+        goodput_inter_token_latency_slo : float
+            Maximum inter token latency (ms) of a request counted towards goodput
+        artifact_directory : str
+            Directory in which every run creates its own artifact directory
+            (defaults to the system temp directory)
+        artifact_retention : str
+            Which artifact directories to keep after a run: 'none', 'failed' or 'all'
         """
 
         self.bin_path = path
@@ -289,11 +326,18 @@ def __init__(
         self._max_retries = max_retries
         self._timeout = timeout
         self._output = ""
+        self._failure_class = None
         self._perf_records = {}
         self._llm_records = {}
+        self._latency_histograms = {}
         self._gpu_records = []
         self._max_cpu_util = max_cpu_util
         self._model_type = model_type
+        self._goodput_time_to_first_token_slo = goodput_time_to_first_token_slo
+        self._goodput_inter_token_latency_slo = goodput_inter_token_latency_slo
+        self._artifact_directory = artifact_directory
+        self._artifact_retention = artifact_retention
+        self._artifact_dir = None
 
     def run(self, metrics, env=None):
         """
@@ -320,29 +364,71 @@ def run(self, metrics, env=None):
             If subprocess throws CalledProcessError
         """
 
-        if metrics:
-            # Synchronously start and finish run
-            for _ in range(self._max_retries):
-                status = self._execute_pa(env)
+        if not metrics:
+            return self.PA_SUCCESS
 
-                if status == self.PA_FAIL:
-                    return status
-                elif status == self.PA_SUCCESS:
-                    self._parse_outputs(metrics)
-                    break
-                elif status == self.PA_RETRY:
-                    continue
-                else:
-                    raise TritonModelAnalyzerException(f"Unexpected PA return {status}")
+        # Every run writes its outputs into its own directory, so that
+        # concurrent runs on the same host cannot clobber each other
+        if self._artifact_directory:
+            os.makedirs(self._artifact_directory, exist_ok=True)
+        self._artifact_dir = os.path.abspath(
+            tempfile.mkdtemp(
+                prefix=PA_ARTIFACT_DIR_PREFIX, dir=self._artifact_directory
+            )
+        )
+
+        self._failure_class = None
+        status = self.PA_FAIL
+        try:
+            status = self._run_with_retries(metrics, env)
+        finally:
+            self._cleanup_artifact_dir(status)
 
+        return status
+
+    def get_artifact_dir(self):
+        """
+        Returns
+        -------
+        str
+            The directory the last run wrote its outputs to.
+            It only exists after the run if it was retained
+        """
+
+        return self._artifact_dir
+
+    def _run_with_retries(self, metrics, env):
+        # Synchronously start and finish run
+        for _ in range(self._max_retries):
+            status = self._execute_pa(env)
+
+            if status == self.PA_FAIL:
+                return status
+            elif status == self.PA_SUCCESS:
+                self._parse_outputs(metrics)
+                return self.PA_SUCCESS
+            elif status == self.PA_RETRY:
+                continue
             else:
-                logger.info(
-                    f"Ran perf_analyzer {self._max_retries} times, "
-                    "but no valid requests recorded"
-                )
-                return self.PA_FAIL
+                raise TritonModelAnalyzerException(f"Unexpected PA return {status}")
 
-        return self.PA_SUCCESS
+        logger.info(
+            f"Ran perf_analyzer {self._max_retries} times, "
+            "but no valid requests recorded"
+        )
+        return self.PA_FAIL
+
+    def _cleanup_artifact_dir(self, status):
+        if self._artifact_retention == "all" or (
+            self._artifact_retention == "failed" and status != self.PA_SUCCESS
+        ):
+            logger.info(f"perf_analyzer artifacts retained in {self._artifact_dir}")
+            return
+
+        shutil.rmtree(self._artifact_dir, ignore_errors=True)
+
+    def _artifact_path(self, filename):
+        return os.path.join(self._artifact_dir, filename)
 
     def get_perf_records(self):
         """
@@ -370,6 +456,17 @@ def get_llm_records(self):
             "Attempted to get perf_analyzer results without calling run first."
         )
 
+    def get_latency_histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        Returns
+        -------
+        Dict of model name to the LatencyHistogram from the last
+        perf_analyzer run. Only models profiled with a profile export
+        file are present
+        """
+
+        return self._latency_histograms
+
     def get_gpu_records(self):
         """
         Returns
@@ -391,6 +488,22 @@ def output(self):
             logger.info("perf_analyzer did not produce any output.")
         return self._output
 
+    def get_failure_class(self):
+        """
+        Returns
+        -------
+        str or None
+            The class of failure of the last perf_analyzer
+            run, or None if it is not known
+        """
+
+        if self._failure_class:
+            return self._failure_class
+        elif self._output and "out of memory" in self._output.lower():
+            return FAILURE_OUT_OF_MEMORY
+
+        return None
+
     def get_cmd(self):
         """
         Returns a string of the command to run
@@ -438,14 +551,17 @@ def _get_single_model_cmd(self, index):
         return cmd
 
     def _get_pa_cli_command(self, index, exclude_model_name=False):
+        # PA runs inside the artifact directory, so relative input paths
+        # must be resolved against the directory model analyzer was run from
         return (
             self._config.model_run_configs()[index]
             .perf_config()
+            .with_absolute_paths()
             .to_cli_string(exclude_model_name)
         )
 
     def _get_genai_perf_cli_command(self, index):
-        return self._config.genai_perf_config().to_cli_string()
+        return self._config.genai_perf_config().with_absolute_paths().to_cli_string()
 
     def _create_env(self, env):
         perf_analyzer_env = os.environ.copy()
@@ -471,6 +587,7 @@ def _create_process(self, cmd, perf_analyzer_env):
                 stderr=STDOUT,
                 encoding="utf-8",
                 env=perf_analyzer_env,
+                cwd=self._artifact_dir,
             )
         except FileNotFoundError as e:
             raise TritonModelAnalyzerException(f"perf_analyzer binary not found : {e}")
@@ -491,7 +608,7 @@ def _verify_output_files_exist(self):
         for perf_config in [
             mrc.perf_config() for mrc in self._config.model_run_configs()
         ]:
-            latency_file = perf_config["latency-report-file"]
+            latency_file = self._artifact_path(perf_config["latency-report-file"])
 
             file_found = False
             for attempt in range(max_attempts):
@@ -561,6 +678,7 @@ def _poll_perf_analyzer(self, process):
                     f"perf_analyzer used significant amount of CPU resources ({cpu_util}%), killing perf_analyzer"
                 )
                 self._output = self._get_process_output()
+                self._failure_class = FAILURE_PERF_ANALYZER_CPU_LIMIT
                 process.kill()
 
                 return self.PA_FAIL
@@ -568,6 +686,7 @@ def _poll_perf_analyzer(self, process):
             current_timeout -= INTERVAL_SLEEP_TIME
         else:
             logger.info("perf_analyzer took very long to exit, killing perf_analyzer")
+            self._failure_class = FAILURE_PERF_ANALYZER_TIMEOUT
             process.kill()
 
             return self.PA_FAIL
@@ -694,7 +813,7 @@ def _parse_generic_outputs(self, metrics):
         for perf_config in [
             mrc.perf_config() for mrc in self._config.model_run_configs()
         ]:
-            latency_file = perf_config["latency-report-file"]
+            latency_file = self._artifact_path(perf_config["latency-report-file"])
             logger.debug(f"Reading PA results from {latency_file}")
 
             with open(latency_file, mode="r") as f:
@@ -706,12 +825,34 @@ def _parse_generic_outputs(self, metrics):
                     ] = self._extract_perf_records_from_row(metrics, row)
                     self._gpu_records = self._extract_gpu_records_from_row(metrics, row)
 
-        for perf_config in [
-            mrc.perf_config() for mrc in self._config.model_run_configs()
-        ]:
-            # Remove the latency file and all associated composing model latency files
-            for f in glob.glob(f"*{perf_config['latency-report-file']}"):
-                os.remove(f)
+            if perf_config["profile-export-file"]:
+                self._parse_profile_export(metrics, perf_config)
+
+    def _parse_profile_export(self, metrics, perf_config):
+        """
+        Stream the per-request profile export into a latency histogram
+        and extract the histogram based records from it
+        """
+
+        profile_export_file = self._artifact_path(perf_config["profile-export-file"])
+        if not os.path.isfile(profile_export_file):
+            logger.warning(
+                f"perf_analyzer did not create the profile export {profile_export_file}, "
+                "the latency distribution will not be captured"
+            )
+            return
+
+        logger.debug(f"Reading PA profile export from {profile_export_file}")
+        latency_histogram = LatencyHistogram()
+        latency_histogram.record_all(
+            ProfileExportReader(profile_export_file).request_latencies_us()
+        )
+
+        model_name = perf_config["model-name"]
+        self._latency_histograms[model_name] = latency_histogram
+        self._perf_records.setdefault(model_name, []).extend(
+            self._extract_perf_records_from_histogram(metrics, latency_histogram)
+        )
 
     def _parse_llm_outputs(self, metrics):
         """
@@ -720,8 +861,9 @@ def _parse_llm_outputs(self, metrics):
 
         perf_config = self._config.model_run_configs()[0].perf_config()
 
-        logger.debug(f"Reading GENAI-PERF results from {GENAI_PERF_CSV}")
-        with open(GENAI_PERF_CSV, mode="r") as f:
+        genai_perf_csv = self._artifact_path(GENAI_PERF_CSV)
+        logger.debug(f"Reading GENAI-PERF results from {genai_perf_csv}")
+        with open(genai_perf_csv, mode="r") as f:
             csv_reader = list(csv.DictReader(f, delimiter=","))
 
             # See test_perf_analyzer::test_pa_llm_csv_output() for CSV output example
@@ -729,9 +871,70 @@ def _parse_llm_outputs(self, metrics):
                 metrics, csv_reader
             )
 
-            os.remove(GENAI_PERF_CSV)
-            for filename in GENAI_PERF_COLLATERAL:
-                os.remove(filename)
+            if RequestGoodput in metrics:
+                self._parse_goodput(perf_config["model-name"])
+
+    def _parse_goodput(self, model_name):
+        """
+        Stream genai-perf's per-request profile export and count
+        the requests per second that met the TTFT and ITL SLOs
+        """
+
+        profile_export_file = self._artifact_path(GENAI_PERF_PROFILE_EXPORT)
+        if not os.path.isfile(profile_export_file):
+            logger.warning(
+                f"genai-perf did not create the profile export {profile_export_file}, "
+                "goodput will not be measured"
+            )
+            return
+
+        logger.debug(f"Reading GENAI-PERF profile export from {profile_export_file}")
+        goodput = self._compute_goodput(
+            ProfileExportReader(profile_export_file).completed_requests()
+        )
+
+        if goodput is not None:
+            self._llm_records[model_name].append(RequestGoodput(goodput))
+
+    def _compute_goodput(self, completed_requests) -> Optional[float]:
+        # SLOs are in ms, timestamps are in ns
+        ttft_slo_ns = (
+            self._goodput_time_to_first_token_slo * 1e6
+            if self._goodput_time_to_first_token_slo is not None
+            else None
+        )
+        itl_slo_ns = (
+            self._goodput_inter_token_latency_slo * 1e6
+            if self._goodput_inter_token_latency_slo is not None
+            else None
+        )
+
+        good_request_count = 0
+        first_timestamp, last_timestamp = None, None
+        for timestamp, response_timestamps in completed_requests:
+            if first_timestamp is None or timestamp < first_timestamp:
+                first_timestamp = timestamp
+            if last_timestamp is None or response_timestamps[-1] > last_timestamp:
+                last_timestamp = response_timestamps[-1]
+
+            time_to_first_token = response_timestamps[0] - timestamp
+            if ttft_slo_ns is not None and time_to_first_token > ttft_slo_ns:
+                continue
+
+            # Every streamed response is treated as one token
+            if itl_slo_ns is not None and len(response_timestamps) > 1:
+                inter_token_latency = (
+                    response_timestamps[-1] - response_timestamps[0]
+                ) / (len(response_timestamps) - 1)
+                if inter_token_latency > itl_slo_ns:
+                    continue
+
+            good_request_count += 1
+
+        if first_timestamp is None or last_timestamp <= first_timestamp:  # type: ignore
+            return None
+
+        return good_request_count / ((last_timestamp - first_timestamp) / 1e9)  # type: ignore
 
     def _extract_perf_records_from_row(
         self, requested_metrics: List[Record], row_metrics: Dict[str, str]
@@ -753,6 +956,31 @@ def _extract_perf_records_from_row(
 
         return perf_records
 
+    def _extract_perf_records_from_histogram(
+        self, requested_metrics: List[Record], latency_histogram: LatencyHistogram
+    ) -> List[Record]:
+        perf_records: List[Record] = []
+        if not latency_histogram.total_count():
+            return perf_records
+
+        for histogram_metric in PerfAnalyzer.latency_histogram_metric_table:
+            if any(
+                histogram_metric[PerfAnalyzer.METRIC_TAG] == requested_metric.tag
+                for requested_metric in requested_metrics
+            ):
+                value = latency_histogram.percentile(
+                    float(histogram_metric[PerfAnalyzer.PERCENTILE])  # type: ignore
+                )
+                reduction_factor = float(
+                    str(histogram_metric[PerfAnalyzer.REDUCTION_FACTOR])
+                )
+
+                perf_records.append(
+                    histogram_metric[PerfAnalyzer.RECORD_CLASS](value / reduction_factor)  # type: ignore
+                )
+
+        return perf_records
+
     def _extract_gpu_records_from_row(
         self, requested_metrics: List[Record], row_metrics: Dict[str, str]
     ) -> List[Record]:
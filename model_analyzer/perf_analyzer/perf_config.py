@@ -2,10 +2,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2020-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List
+from copy import deepcopy
+from typing import Dict, List, Optional
 
 from model_analyzer.config.input.config_defaults import DEFAULT_MEASUREMENT_MODE
-from model_analyzer.constants import SECONDS_TO_MILLISECONDS_MULTIPLIER
+from model_analyzer.config.input.config_utils import absolute_path_if_exists
+from model_analyzer.constants import (
+    PERF_ANALYZER_MEASUREMENT_WINDOW,
+    PERF_ANALYZER_MINIMUM_REQUEST_COUNT,
+    SECONDS_TO_MILLISECONDS_MULTIPLIER,
+)
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
 
@@ -61,6 +67,7 @@ class PerfAnalyzerConfig:
         "metrics-url",
         "metrics-interval",
         "bls-composing-models",
+        "profile-export-file",
     ]
 
     input_to_options = [
@@ -77,6 +84,21 @@ class PerfAnalyzerConfig:
 
     additive_args = ["input-data", "shape"]
 
+    # Args whose values may be paths relative to the directory model analyzer
+    # was launched from, which differs from the directory PA is run in
+    path_args = [
+        "input-data",
+        "request-intervals",
+        "triton-server-directory",
+        "model-repository",
+        "ssl-grpc-root-certifications-file",
+        "ssl-grpc-private-key-file",
+        "ssl-grpc-certificate-chain-file",
+        "ssl-https-ca-certificates-file",
+        "ssl-https-client-certificate-file",
+        "ssl-https-private-key-file",
+    ]
+
     boolean_args = [
         "streaming",
         "async",
@@ -134,6 +156,11 @@ def __init__(self):
             for k in self.additive_args
         }
 
+        # The version is bumped on every update so that representations cached
+        # here (and in the run configs that contain this config) can be invalidated
+        self._version = 0
+        self._representation: Optional[str] = None
+
     @classmethod
     def allowed_keys(cls):
         """
@@ -227,6 +254,13 @@ def update_config_from_profile_config(self, model_name, profile_config):
                 }
             )
 
+        # genai-perf writes its own profile export for LLM models
+        if (
+            profile_config.collect_latency_histogram
+            and profile_config.model_type != "LLM"
+        ):
+            params.update({"profile-export-file": model_name + "-profile-export.json"})
+
         if profile_config.bls_composing_models:
             bls_composing_model_names = ",".join(
                 [
@@ -252,6 +286,27 @@ def from_dict(cls, perf_config_dict):
                 setattr(perf_config, key, perf_config_dict[key])
         return perf_config
 
+    def to_dict(self) -> Dict:
+        """
+        Returns the checkpointed state of the PA config,
+        which excludes the cached representation
+        """
+        perf_config_dict = dict(self.__dict__)
+        del perf_config_dict["_version"]
+        del perf_config_dict["_representation"]
+
+        return perf_config_dict
+
+    def version(self) -> int:
+        """
+        Returns
+        -------
+        int
+            a counter that is incremented every time
+            a value in this config is changed
+        """
+        return self._version
+
     def representation(self):
         """
         Returns
@@ -262,11 +317,64 @@ def representation(self):
             runs, but should be ignored when determining
             if a previous (checkpointed) run can be used
         """
-        cli_string = self.to_cli_string()
-        cli_string = PerfAnalyzerConfig.remove_url_from_cli_string(cli_string)
-        cli_string = PerfAnalyzerConfig.remove_mrc_from_cli_string(cli_string)
+        if self._representation is None:
+            cli_string = self.to_cli_string()
+            cli_string = PerfAnalyzerConfig.remove_url_from_cli_string(cli_string)
+            cli_string = PerfAnalyzerConfig.remove_mrc_from_cli_string(cli_string)
+            cli_string = PerfAnalyzerConfig.remove_profile_export_file_from_cli_string(
+                cli_string
+            )
+            self._representation = cli_string
+
+        return self._representation
+
+    def scale_measurement(self, fidelity: float) -> None:
+        """
+        Scales the measurement window (time_windows mode) or the
+        measurement request count (count_windows mode) by fidelity
+
+        Parameters
+        ----------
+        fidelity: float
+            Fraction (0, 1] of the current measurement to keep
+        """
+        if fidelity >= 1:
+            return
 
-        return cli_string
+        if self._args["measurement-mode"] == "time_windows":
+            measurement_interval = (
+                self._args["measurement-interval"] or PERF_ANALYZER_MEASUREMENT_WINDOW
+            )
+            self["measurement-interval"] = max(
+                1, int(int(measurement_interval) * fidelity)
+            )
+        else:
+            measurement_request_count = (
+                self._args["measurement-request-count"]
+                or PERF_ANALYZER_MINIMUM_REQUEST_COUNT
+            )
+            self["measurement-request-count"] = max(
+                1, int(int(measurement_request_count) * fidelity)
+            )
+
+    def with_absolute_paths(self) -> "PerfAnalyzerConfig":
+        """
+        Returns
+        -------
+        PerfAnalyzerConfig
+            a copy of this config where every path arg that
+            names an existing relative path is made absolute
+        """
+        perf_config = deepcopy(self)
+
+        for key in self.path_args:
+            value = self._args[key]
+            if type(value) is list:
+                perf_config[key] = [absolute_path_if_exists(v) for v in value]
+            elif value:
+                perf_config[key] = absolute_path_if_exists(value)
+
+        return perf_config
 
     def extract_model_specific_parameters(self):
         """
@@ -335,6 +443,30 @@ def remove_mrc_from_cli_string(cls, cli_string):
 
         return " ".join(perf_str_tokens)
 
+    @classmethod
+    def remove_profile_export_file_from_cli_string(cls, cli_string):
+        """
+        utility function strips the profile export file
+        (only written to collect latency histograms) from
+        a cli string representation
+
+        Parameters
+        ----------
+        cli_string : str
+            The cli string representation
+        """
+
+        perf_str_tokens = cli_string.split(" ")
+
+        profile_export_file_index = [
+            i for i, s in enumerate(perf_str_tokens) if "--profile-export-file" in s
+        ]
+
+        if profile_export_file_index:
+            perf_str_tokens.pop(profile_export_file_index[0])
+
+        return " ".join(perf_str_tokens)
+
     def to_cli_string(self, exclude_model_name: bool = False) -> str:
         """
         Utility function to convert a config into a
@@ -476,6 +608,9 @@ def __setitem__(self, key, value):
                 "is not supported by the model analyzer."
             )
 
+        self._version += 1
+        self._representation = None
+
     def __contains__(self, key):
         """
         Returns
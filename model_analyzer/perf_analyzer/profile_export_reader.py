@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from typing import Dict, Iterator, List, Tuple
+
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+
+
+class ProfileExportReader:
+    """
+    Streams the per-request entries out of a perf_analyzer profile export
+    (--profile-export-file) without loading the whole file into memory
+
+    The export has the form:
+        {"experiments": [{"experiment": {...}, "requests": [{...}, ...], ...}], ...}
+    and every object inside a "requests" array is decoded on its own
+    """
+
+    CHUNK_SIZE = 1 << 16
+    REQUESTS_KEY = '"requests"'
+
+    def __init__(self, filename: str):
+        """
+        Parameters
+        ----------
+        filename: str
+            Path to the profile export written by perf_analyzer
+        """
+        self._filename = filename
+        self._decoder = json.JSONDecoder()
+
+    def requests(self) -> Iterator[Dict]:
+        """
+        Yields each request entry of every experiment in the export
+        """
+        with open(self._filename, mode="r") as f:
+            self._file = f
+            self._buffer = ""
+            self._position = 0
+
+            while self._seek_past(self.REQUESTS_KEY):
+                if not self._seek_past("["):
+                    raise TritonModelAnalyzerException(
+                        f"Malformed requests array in {self._filename}"
+                    )
+
+                while True:
+                    next_char = self._next_significant_char()
+                    if next_char == "]":
+                        self._position += 1
+                        break
+                    elif next_char == ",":
+                        self._position += 1
+                    elif next_char is None:
+                        raise TritonModelAnalyzerException(
+                            f"Unexpected end of file in {self._filename}"
+                        )
+                    else:
+                        yield self._decode_next_object()
+
+    def completed_requests(self) -> Iterator[Tuple[int, List[int]]]:
+        """
+        Yields the send timestamp and the response timestamps (in ns)
+        of each request that received at least one response
+        """
+        for request in self.requests():
+            response_timestamps = request.get("response_timestamps")
+            if not response_timestamps or "timestamp" not in request:
+                continue
+
+            yield request["timestamp"], response_timestamps
+
+    def request_latencies_us(self) -> Iterator[int]:
+        """
+        Yields the latency (time from sending a request to its last response)
+        of each completed request, in microseconds
+        """
+        for timestamp, response_timestamps in self.completed_requests():
+            yield (response_timestamps[-1] - timestamp) // 1000
+
+    def _read_chunk(self) -> bool:
+        chunk = self._file.read(self.CHUNK_SIZE)
+        if not chunk:
+            return False
+
+        # Drop everything that has already been consumed
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _seek_past(self, token: str) -> bool:
+        while True:
+            index = self._buffer.find(token, self._position)
+            if index != -1:
+                self._position = index + len(token)
+                return True
+
+            # Keep enough of the tail to match a token split across chunks
+            self._position = max(self._position, len(self._buffer) - len(token))
+            if not self._read_chunk():
+                return False
+
+    def _next_significant_char(self):
+        while True:
+            while self._position < len(self._buffer):
+                if not self._buffer[self._position].isspace():
+                    return self._buffer[self._position]
+                self._position += 1
+
+            if not self._read_chunk():
+                return None
+
+    def _decode_next_object(self) -> Dict:
+        while True:
+            try:
+                request, end = self._decoder.raw_decode(self._buffer, self._position)
+                self._position = end
+                return request
+            except json.JSONDecodeError:
+                if not self._read_chunk():
+                    raise TritonModelAnalyzerException(
+                        f"Malformed request entry in {self._filename}"
+                    )
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import csv
+import json
+import logging
+import os
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+
+logger = logging.getLogger(LOGGER_NAME)
+
+MICROSECONDS_PER_UNIT = {"s": 1e6, "ms": 1e3, "us": 1}
+
+
+class RequestTrace:
+    """
+    Converts a log of timestamped requests (CSV or JSONL) into perf
+    analyzer request intervals files, replaying the trace's arrivals
+    with their load multiplied by a scale factor
+
+    The trace is streamed, so it is never held in memory
+    """
+
+    def __init__(self, config: ConfigCommandProfile) -> None:
+        """
+        Parameters
+        ----------
+        config: ConfigCommandProfile
+            Profile configuration information, with the request trace set
+        """
+        self._trace_path = config.request_trace
+        self._timestamp_field = config.request_trace_timestamp_field
+        self._microseconds_per_unit = MICROSECONDS_PER_UNIT[
+            config.request_trace_timestamp_unit
+        ]
+        self._intervals_directory = os.path.join(
+            config.export_path, "request_intervals"
+        )
+
+        if not os.path.isfile(self._trace_path):
+            raise TritonModelAnalyzerException(
+                f"Request trace {self._trace_path} does not exist"
+            )
+
+    def get_intervals_file(self, scale: float) -> str:
+        """
+        Returns the path of the request intervals file
+        of the scale factor, creating it if needed
+        """
+        return self.create_intervals_files([scale])[scale]
+
+    def create_intervals_files(self, scales: List[float]) -> Dict[float, str]:
+        """
+        Creates the request intervals files of the scale factors (in a
+        single pass over the trace), unless they are already up to date
+
+        Returns the path of each scale factor's intervals file
+        """
+        paths = {scale: self._get_intervals_path(scale) for scale in scales}
+        stale_scales = [
+            scale for scale, path in paths.items() if not self._is_up_to_date(path)
+        ]
+
+        if stale_scales:
+            self._write_intervals_files({scale: paths[scale] for scale in stale_scales})
+
+        return paths
+
+    def _write_intervals_files(self, paths: Dict[float, str]) -> None:
+        os.makedirs(self._intervals_directory, exist_ok=True)
+
+        logger.info(
+            f"Creating request intervals at {', '.join(f'{s:g}' for s in paths)}x "
+            f"the load of {self._trace_path}"
+        )
+
+        temp_paths = {scale: path + ".tmp" for scale, path in paths.items()}
+        try:
+            request_count = self._write_intervals(temp_paths)
+            if request_count < 2:
+                raise TritonModelAnalyzerException(
+                    f"Request trace {self._trace_path} needs at least two requests"
+                )
+        except Exception:
+            for temp_path in temp_paths.values():
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            raise
+
+        for scale, path in paths.items():
+            os.replace(temp_paths[scale], path)
+
+    def _write_intervals(self, paths: Dict[float, str]) -> int:
+        """
+        Writes the intervals of every scale factor in a single pass
+        over the trace, and returns the number of requests in it
+
+        Each interval is the difference of the rounded arrival times,
+        so that rounding errors do not accumulate over the trace
+        """
+        request_count = 0
+        with ExitStack() as stack:
+            files = {
+                scale: stack.enter_context(open(path, "w"))
+                for scale, path in paths.items()
+            }
+            first_timestamp = None
+            last_timestamp = None
+            last_arrivals = {scale: 0 for scale in paths}
+
+            for timestamp in self._read_timestamps():
+                request_count += 1
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                    last_timestamp = timestamp
+                    continue
+
+                # Requests logged out of order arrive at the same time
+                timestamp = max(timestamp, last_timestamp)
+                last_timestamp = timestamp
+
+                elapsed = (timestamp - first_timestamp) * self._microseconds_per_unit
+                for scale, file in files.items():
+                    arrival = round(elapsed / scale)
+                    file.write(f"{arrival - last_arrivals[scale]}\n")
+                    last_arrivals[scale] = arrival
+
+        return request_count
+
+    def _read_timestamps(self) -> Iterator[float]:
+        for line_number, record in enumerate(self._read_records(), start=1):
+            if self._timestamp_field not in record:
+                raise TritonModelAnalyzerException(
+                    f"Request {line_number} of {self._trace_path} has no "
+                    f"{self._timestamp_field} field"
+                )
+
+            yield self._parse_timestamp(record[self._timestamp_field], line_number)
+
+    def _read_records(self) -> Iterator[Dict[str, Any]]:
+        extension = os.path.splitext(self._trace_path)[1].lower()
+
+        with open(self._trace_path, "r", newline="") as f:
+            if extension == ".csv":
+                yield from csv.DictReader(f)
+            elif extension in [".jsonl", ".ndjson", ".json"]:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        raise TritonModelAnalyzerException(
+                            f"Line {line_number} of {self._trace_path} is not valid JSON"
+                        )
+            else:
+                raise TritonModelAnalyzerException(
+                    f"Request trace {self._trace_path} must be a .csv or .jsonl file"
+                )
+
+    def _parse_timestamp(self, value: Any, line_number: int) -> float:
+        """
+        Returns the timestamp in the trace's units. ISO 8601 timestamps
+        are converted to the trace's units from seconds
+        """
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            time = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            raise TritonModelAnalyzerException(
+                f"Request {line_number} of {self._trace_path} has an invalid "
+                f"timestamp: {value}"
+            )
+
+        return time.timestamp() * 1e6 / self._microseconds_per_unit
+
+    def _get_intervals_path(self, scale: float) -> str:
+        trace_name = os.path.splitext(os.path.basename(self._trace_path))[0]
+        return os.path.join(self._intervals_directory, f"{trace_name}_{scale:g}x.txt")
+
+    def _is_up_to_date(self, path: str) -> bool:
+        return os.path.isfile(path) and os.path.getmtime(path) >= os.path.getmtime(
+            self._trace_path
+        )
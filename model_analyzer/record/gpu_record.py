@@ -52,7 +52,7 @@ def device_uuid(self):
     @classmethod
     def from_dict(cls, record_dict):
         record = cls(0)
-        for key in ["_value", "_timestamp", "_device"]:
+        for key in ["_value", "_timestamp", "_device", "_device_uuid"]:
             if key in record_dict:
                 setattr(record, key, record_dict[key])
         return record
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from array import array
+from math import ceil
+from typing import Dict, Iterable, Optional
+
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+
+
+class LatencyHistogram:
+    """
+    A fixed-size, log-linear (HDR style) histogram of request latencies
+
+    Latencies are stored in microseconds. Values below 2 * SUB_BUCKET_COUNT
+    are recorded exactly, larger values fall into buckets whose width doubles
+    every power of two, which bounds the relative error of any reported
+    percentile to 1 / SUB_BUCKET_COUNT
+    """
+
+    SUB_BUCKET_BITS = 6
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+    # Values above ~2^46 us (over two years) are clamped into the last bucket
+    MAX_SHIFT = 40
+    BUCKET_COUNT = (MAX_SHIFT + 2) * SUB_BUCKET_COUNT
+
+    def __init__(self):
+        self._counts = array("I", [0]) * self.BUCKET_COUNT
+        self._total_count = 0
+        self._sum = 0
+        self._min: Optional[int] = None
+        self._max: Optional[int] = None
+
+    def record(self, latency_us: int) -> None:
+        """
+        Adds a single latency (in microseconds) to the histogram
+        """
+        latency_us = max(0, int(latency_us))
+
+        self._counts[self._bucket_index(latency_us)] += 1
+        self._total_count += 1
+        self._sum += latency_us
+
+        if self._min is None or latency_us < self._min:
+            self._min = latency_us
+        if self._max is None or latency_us > self._max:
+            self._max = latency_us
+
+    def record_all(self, latencies_us: Iterable[int]) -> None:
+        """
+        Adds every latency (in microseconds) from an iterable to the histogram
+        """
+        for latency_us in latencies_us:
+            self.record(latency_us)
+
+    def total_count(self) -> int:
+        """
+        Returns the number of latencies recorded
+        """
+        return self._total_count
+
+    def min(self) -> Optional[int]:
+        """
+        Returns the exact minimum latency recorded, in microseconds
+        """
+        return self._min
+
+    def max(self) -> Optional[int]:
+        """
+        Returns the exact maximum latency recorded, in microseconds
+        """
+        return self._max
+
+    def mean(self) -> Optional[float]:
+        """
+        Returns the exact mean latency recorded, in microseconds
+        """
+        if not self._total_count:
+            return None
+
+        return self._sum / self._total_count
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Parameters
+        ----------
+        percentile: float
+            Any value in the range [0, 100]
+
+        Returns
+        -------
+        float
+            The latency (in microseconds) at the given percentile,
+            or None if no latencies have been recorded
+        """
+        if percentile < 0 or percentile > 100:
+            raise TritonModelAnalyzerException(
+                f"Percentile must be between 0 and 100, not {percentile}"
+            )
+
+        if not self._total_count:
+            return None
+
+        if percentile == 100:
+            return float(self._max)  # type: ignore
+
+        target_rank = max(1, ceil(self._total_count * percentile / 100))
+
+        cumulative_count = 0
+        for index, count in enumerate(self._counts):
+            cumulative_count += count
+            if cumulative_count >= target_rank:
+                value = self._bucket_midpoint(index)
+                return float(min(max(value, self._min), self._max))  # type: ignore
+
+        return float(self._max)  # type: ignore
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Adds all of the latencies from another histogram to this one
+        """
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+
+        self._total_count += other._total_count
+        self._sum += other._sum
+
+        for value in [other._min, other._max]:
+            if value is not None:
+                if self._min is None or value < self._min:
+                    self._min = value
+                if self._max is None or value > self._max:
+                    self._max = value
+
+    def to_dict(self) -> Dict:
+        # Only the non-empty buckets are written to the checkpoint
+        return {
+            "counts": {
+                str(index): count for index, count in enumerate(self._counts) if count
+            },
+            "total_count": self._total_count,
+            "sum": self._sum,
+            "min": self._min,
+            "max": self._max,
+        }
+
+    @classmethod
+    def from_dict(cls, histogram_dict: Dict) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+
+        for index, count in histogram_dict["counts"].items():
+            histogram._counts[int(index)] = count
+
+        histogram._total_count = histogram_dict["total_count"]
+        histogram._sum = histogram_dict["sum"]
+        histogram._min = histogram_dict["min"]
+        histogram._max = histogram_dict["max"]
+
+        return histogram
+
+    def _bucket_index(self, value: int) -> int:
+        shift = max(0, value.bit_length() - (self.SUB_BUCKET_BITS + 1))
+        shift = min(shift, self.MAX_SHIFT)
+
+        index = shift * self.SUB_BUCKET_COUNT + (value >> shift)
+        return min(index, self.BUCKET_COUNT - 1)
+
+    def _bucket_midpoint(self, index: int) -> float:
+        shift = max(0, index // self.SUB_BUCKET_COUNT - 1)
+        lowest_value = (index - shift * self.SUB_BUCKET_COUNT) << shift
+
+        return lowest_value + ((1 << shift) - 1) / 2
@@ -16,16 +16,24 @@
     BaseModelConfigGenerator,
 )
 from model_analyzer.config.run.run_config import RunConfig
-from model_analyzer.constants import LOGGER_NAME, PA_ERROR_LOG_FILENAME
+from model_analyzer.constants import (
+    FAILURE_LOAD_TIMEOUT,
+    FAILURE_OUT_OF_MEMORY,
+    LOGGER_NAME,
+    PA_ERROR_LOG_FILENAME,
+)
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.monitor.cpu_monitor import CPUMonitor
 from model_analyzer.monitor.dcgm.dcgm_monitor import DCGMMonitor
 from model_analyzer.monitor.remote_monitor import RemoteMonitor
 from model_analyzer.output.file_writer import FileWriter
 from model_analyzer.perf_analyzer.perf_analyzer import PerfAnalyzer
+from model_analyzer.result.failure_cache import FailureCache
+from model_analyzer.result.gpu_memory_predictor import GPUMemoryPredictor
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
 
+from .latency_histogram import LatencyHistogram
 from .record import Record, RecordType
 from .record_aggregator import RecordAggregator
 
@@ -41,9 +49,12 @@ class MetricsManager:
     metrics = [
         "perf_throughput",
         "perf_latency_avg",
+        "perf_latency_p50",
         "perf_latency_p90",
         "perf_latency_p95",
         "perf_latency_p99",
+        "perf_latency_p999",
+        "perf_latency_max",
         "perf_latency",
         "perf_client_response_wait",
         "perf_client_send_recv",
@@ -76,6 +87,7 @@ class MetricsManager:
         "inter_token_latency_p50",
         "inter_token_latency_p25",
         "output_token_throughput",
+        "request_goodput",
     ]
 
     def __init__(self, config, client, server, gpus, result_manager, state_manager):
@@ -115,6 +127,10 @@ def __init__(self, config, client, server, gpus, result_manager, state_manager):
         self._result_manager = result_manager
         self._state_manager = state_manager
         self._loaded_models = None
+        self._server_restart_count = 0
+        self._gpu_memory_predictor = GPUMemoryPredictor(gpu_count=len(gpus))
+        self._failure_cache = FailureCache(gpu_count=len(gpus))
+        self._load_failure_class: Optional[str] = None
 
         self._cpu_warning_printed = False
         self._encountered_perf_analyzer_error = False
@@ -131,6 +147,60 @@ def __init__(self, config, client, server, gpus, result_manager, state_manager):
     def start_new_model(self):
         """Indicate that profiling of a new model is starting"""
         self._first_config_variant = {}
+        self._server_restart_count = 0
+        self._gpu_memory_predictor = GPUMemoryPredictor(
+            gpu_count=len(self._gpus), baseline=self._get_server_only_gpu_memory()
+        )
+        self._failure_cache = FailureCache(gpu_count=len(self._gpus))
+
+    def server_restart_count(self) -> int:
+        """
+        Returns the number of times the server was restarted to
+        load new model variants since the current model started
+        """
+        return self._server_restart_count
+
+    def is_predicted_to_exceed_gpu_memory(self, run_config: RunConfig) -> bool:
+        """
+        Returns true if the GPU memory predicted (per GPU) from earlier
+        measurements is larger than the memory of the smallest GPU being profiled
+        """
+        if not self._config.gpu_memory_prediction_enable or run_config.cpu_only():
+            return False
+
+        total_memory = self._get_gpu_total_memory()
+        if not total_memory:
+            return False
+
+        predicted_memory = self._gpu_memory_predictor.predict(run_config)
+        if predicted_memory is None or predicted_memory <= total_memory:
+            return False
+
+        logger.info(
+            f"Predicted GPU memory usage of {predicted_memory:.0f} MB "
+            f"exceeds the {total_memory:.0f} MB available"
+        )
+        return True
+
+    def is_pruned_by_failure(self, run_config: RunConfig) -> bool:
+        """
+        Returns true if the RunConfig is at least as large as one that
+        already failed, and adds it to the pruned run configs if so
+        """
+        if not self._config.failure_pruning_enable:
+            return False
+
+        failure = self._failure_cache.find_failure(run_config)
+        if failure is None:
+            return False
+
+        failure_class, failed_representation = failure
+        logger.info(
+            f"Run config is at least as large as {failed_representation}, "
+            f"which failed with: {failure_class}"
+        )
+        self._result_manager.add_pruned_run_config(run_config, failure_class)
+        return True
 
     def encountered_perf_analyzer_error(self) -> bool:
         return self._encountered_perf_analyzer_error
@@ -216,24 +286,41 @@ def execute_run_config(
         measurement = self._get_measurement_if_config_duplicate(run_config)
         if measurement:
             logger.info("Existing measurement found for run config. Skipping profile")
+            self._add_gpu_memory_measurement(run_config, measurement)
             return measurement
 
-        current_model_variants = run_config.model_variants_name()
-        if current_model_variants != self._loaded_models:
-            self._server.stop()
-            self._server.start(env=run_config.triton_environment())
-
-            if not self._load_model_variants(run_config):
-                self._server.stop()
-                self._loaded_models = None
-                return None
-
-            self._loaded_models = current_model_variants
+        if not self._load_run_config_model_variants(run_config):
+            return None
 
         measurement = self.profile_models(run_config)
+        if measurement:
+            self._add_gpu_memory_measurement(run_config, measurement)
 
         return measurement
 
+    def repeat_run_config(
+        self, run_config: RunConfig
+    ) -> Optional[RunConfigMeasurement]:
+        """
+        Profiles an already measured RunConfig again, and adds the new
+        measurement as a repetition of the existing one. Returns the
+        existing measurement (holding every repetition), or None if
+        the new measurement failed
+        """
+
+        self._create_model_variants(run_config)
+
+        if not self._load_run_config_model_variants(run_config):
+            return None
+
+        repetition = self._measure_models(run_config)
+        if not repetition:
+            return None
+
+        return self._result_manager.add_run_config_measurement_repetition(
+            run_config, repetition
+        )
+
     def profile_models(self, run_config: RunConfig) -> Optional[RunConfigMeasurement]:
         """
         Runs monitors while running perf_analyzer with a specific set of
@@ -250,6 +337,15 @@ def profile_models(self, run_config: RunConfig) -> Optional[RunConfigMeasurement
             The gpu specific and non gpu metrics
         """
 
+        run_config_measurement = self._measure_models(run_config)
+        if run_config_measurement:
+            self._result_manager.add_run_config_measurement(
+                run_config, run_config_measurement
+            )
+
+        return run_config_measurement
+
+    def _measure_models(self, run_config: RunConfig) -> Optional[RunConfigMeasurement]:
         perf_output_writer = (
             None
             if not self._config.perf_output
@@ -263,9 +359,11 @@ def profile_models(self, run_config: RunConfig) -> Optional[RunConfigMeasurement
 
         self._start_monitors(capture_gpu_metrics=capture_gpu_metrics)
 
-        perf_analyzer_metrics, model_gpu_metrics = self._run_perf_analyzer(
-            run_config, perf_output_writer
-        )
+        (
+            perf_analyzer_metrics,
+            model_gpu_metrics,
+            latency_histograms,
+        ) = self._run_perf_analyzer(run_config, perf_output_writer)
 
         if not perf_analyzer_metrics:
             self._stop_monitors(capture_gpu_metrics=capture_gpu_metrics)
@@ -284,6 +382,7 @@ def profile_models(self, run_config: RunConfig) -> Optional[RunConfigMeasurement
             run_config_measurement = RunConfigMeasurement(
                 run_config.model_variants_name(), model_gpu_metrics
             )
+            run_config_measurement.set_fidelity(run_config.fidelity())
 
             # Combine all per-model measurements into the RunConfigMeasurement
             #
@@ -303,17 +402,46 @@ def profile_models(self, run_config: RunConfig) -> Optional[RunConfigMeasurement
                     perf_config["model-name"],
                     model_specific_pa_params,
                     model_non_gpu_metrics,
+                    latency_histograms.get(model_name),
                 )
 
-            self._result_manager.add_run_config_measurement(
-                run_config, run_config_measurement
-            )
-
         return run_config_measurement
 
     def finalize(self):
         self._server.stop()
 
+    def _add_gpu_memory_measurement(
+        self, run_config: RunConfig, measurement: RunConfigMeasurement
+    ) -> None:
+        self._gpu_memory_predictor.add_measurement(run_config, measurement)
+
+    def _get_gpu_total_memory(self) -> float:
+        """
+        Returns the memory (MB) of the smallest GPU being profiled
+        """
+        gpu_info = self._state_manager.get_state_variable("MetricsManager.gpus")
+        total_memories = [
+            gpu_info[gpu.device_uuid()]["total_memory"]
+            for gpu in self._gpus
+            if gpu_info and gpu.device_uuid() in gpu_info
+        ]
+
+        # Total memory is stored in bytes, GPU metrics are in MB
+        return min(total_memories) / 1e6 if total_memories else 0.0
+
+    def _get_server_only_gpu_memory(self) -> float:
+        """
+        Returns the memory (MB) used on each GPU by the server with no models loaded
+        """
+        used_memories = [
+            metric.value()
+            for metrics in self._result_manager.get_server_only_data().values()
+            for metric in metrics
+            if metric.tag == "gpu_used_memory"
+        ]
+
+        return sum(used_memories) / len(used_memories) if used_memories else 0.0
+
     def _create_model_variants(self, run_config: RunConfig) -> None:
         """
         Creates and fills all model variant directories
@@ -426,10 +554,33 @@ def _create_remote_mode_model_variant(
             # Ignore if the dir already exists
             pass
 
+    def _load_run_config_model_variants(self, run_config: RunConfig) -> bool:
+        """
+        Restarts the server and loads the RunConfig's model variants,
+        unless they are already loaded. Returns False if they failed to load
+        """
+        current_model_variants = run_config.model_variants_name()
+        if current_model_variants == self._loaded_models:
+            return True
+
+        self._server.stop()
+        self._server.start(env=run_config.triton_environment())
+        self._server_restart_count += 1
+
+        if not self._load_model_variants(run_config):
+            self._add_failure(run_config, self._load_failure_class)
+            self._server.stop()
+            self._loaded_models = None
+            return False
+
+        self._loaded_models = current_model_variants
+        return True
+
     def _load_model_variants(self, run_config: RunConfig) -> bool:
         """
         Loads all model variants in the client
         """
+        self._load_failure_class = None
         for mrc in run_config.model_run_configs():
             # Load all composing model variants first, and then the parent model
             for composing_config_variant in mrc.composing_config_variants():
@@ -475,6 +626,7 @@ def _do_load_model_variant(self, variant_config: ModelConfigVariant) -> bool:
             )
             == -1
         ):
+            self._load_failure_class = self._get_load_failure_class(default=None)
             return False
 
         if (
@@ -484,9 +636,22 @@ def _do_load_model_variant(self, variant_config: ModelConfigVariant) -> bool:
             )
             == -1
         ):
+            self._load_failure_class = self._get_load_failure_class(
+                default=FAILURE_LOAD_TIMEOUT
+            )
             return False
         return True
 
+    def _get_load_failure_class(self, default: Optional[str]) -> Optional[str]:
+        if "out of memory" in str(self._client.last_error()).lower():
+            return FAILURE_OUT_OF_MEMORY
+
+        return default
+
+    def _add_failure(self, run_config: RunConfig, failure_class: Optional[str]) -> None:
+        if self._config.failure_pruning_enable and failure_class:
+            self._failure_cache.add_failure(run_config, failure_class)
+
     def _get_measurement_if_config_duplicate(self, run_config):
         """
         Checks whether this run config has measurements
@@ -506,7 +671,12 @@ def _get_measurement_if_config_duplicate(self, run_config):
             models_name, model_variants_name
         )
 
-        return measurements.get(key, None)
+        # A measurement can only stand in for one of at least the same fidelity
+        measurement = measurements.get(key, None)
+        if measurement and measurement.fidelity() < run_config.fidelity():
+            return None
+
+        return measurement
 
     def _start_monitors(self, capture_gpu_metrics=True):
         """
@@ -567,9 +737,14 @@ def _destroy_monitors(self, capture_gpu_metrics=True):
 
     def _run_perf_analyzer(
         self, run_config: RunConfig, perf_output_writer: Optional[FileWriter]
-    ) -> Tuple[Optional[Dict], Optional[Dict[int, List[Record]]]]:
+    ) -> Tuple[
+        Optional[Dict],
+        Optional[Dict[int, List[Record]]],
+        Dict[str, LatencyHistogram],
+    ]:
         """
         Runs perf_analyzer and returns the aggregated metrics
+        along with the latency histogram of each model (if captured)
 
         Parameters
         ----------
@@ -600,6 +775,10 @@ def _run_perf_analyzer(
             timeout=self._config.perf_analyzer_timeout,
             max_cpu_util=self._config.perf_analyzer_cpu_util,
             model_type=self._config.model_type,
+            goodput_time_to_first_token_slo=self._config.goodput_time_to_first_token_slo,
+            goodput_inter_token_latency_slo=self._config.goodput_inter_token_latency_slo,
+            artifact_directory=self._config.perf_analyzer_artifact_directory,
+            artifact_retention=self._config.perf_analyzer_artifact_retention,
         )
 
         metrics_to_gather = self._perf_metrics + self._llm_metrics + self._gpu_metrics
@@ -608,8 +787,9 @@ def _run_perf_analyzer(
         self._write_perf_analyzer_output(perf_output_writer, perf_analyzer)
 
         if status == 1:
+            self._add_failure(run_config, perf_analyzer.get_failure_class())
             self._handle_unsuccessful_perf_analyzer_run(perf_analyzer)
-            return (None, None)
+            return (None, None, {})
 
         perf_records = perf_analyzer.get_perf_records()
 
@@ -623,7 +803,11 @@ def _run_perf_analyzer(
         aggregated_perf_records = self._aggregate_perf_records(perf_records)
         aggregated_gpu_records = self._aggregate_gpu_records(gpu_records)
 
-        return aggregated_perf_records, aggregated_gpu_records
+        return (
+            aggregated_perf_records,
+            aggregated_gpu_records,
+            perf_analyzer.get_latency_histograms(),
+        )
 
     def _write_perf_analyzer_output(
         self, perf_output_writer: Optional[FileWriter], perf_analyzer: PerfAnalyzer
@@ -772,7 +956,7 @@ def _print_run_config_info(self, run_config):
             perf_config = model_run_config.perf_config()
             if perf_config["request-intervals"]:
                 logger.info(
-                    f"Profiling {model_run_config.model_variant_name()}: client batch size={perf_config['batch-size']}"
+                    f"Profiling {model_run_config.model_variant_name()}: client batch size={perf_config['batch-size']}, request-intervals={os.path.basename(perf_config['request-intervals'])}"
                 )
             elif perf_config["request-rate-range"]:
                 if perf_config["batch-size"] != 1:
@@ -393,6 +393,10 @@ def _build_summary_report(self, report_key, num_configs, statistics):
             "shown in the plots."
         )
 
+        pruned_str = self._create_pruned_run_configs_string(report_key)
+        if pruned_str:
+            summary.add_paragraph(pruned_str)
+
         throughput_plot_config = self._config.plots[0]
         throughput_plot = os.path.join(
             self._config.export_path,
@@ -527,6 +531,25 @@ def _find_best_configs(self, report_key):
 
         return best_run_config, best_run_config_measurement, sorted_measurements
 
+    def _create_pruned_run_configs_string(self, report_key: str) -> str:
+        pruned_run_configs = self._result_manager.get_pruned_run_configs(report_key)
+        if not pruned_run_configs:
+            return ""
+
+        pruned_counts: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        for model_variants_name, _, failure_class in pruned_run_configs:
+            pruned_counts[(model_variants_name, failure_class)] += 1
+
+        pruned_strs = [
+            f"{model_variants_name} x{count} ({failure_class})"
+            for (model_variants_name, failure_class), count in pruned_counts.items()
+        ]
+
+        return (
+            f"{len(pruned_run_configs)} measurement(s) were skipped because a "
+            f"smaller configuration failed: {', '.join(pruned_strs)}."
+        )
+
     def _create_constraint_string(self, report_key: str) -> str:
         constraint_strs = self._build_constraint_strings()
 
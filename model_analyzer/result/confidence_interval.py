@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+from statistics import NormalDist, stdev
+from typing import Sequence
+
+
+def student_t_quantile(probability: float, degrees_of_freedom: int) -> float:
+    """
+    Returns the quantile of Student's t distribution at the probability
+
+    The quantile is exact for one and two degrees of freedom, and otherwise
+    uses the expansion of Abramowitz & Stegun (26.7.5) around the normal
+    quantile, which is accurate to within 1% from three degrees of freedom
+    (for probabilities up to 0.995)
+    """
+    if degrees_of_freedom == 1:
+        return math.tan(math.pi * (probability - 0.5))
+    if degrees_of_freedom == 2:
+        return (2 * probability - 1) / math.sqrt(2 * probability * (1 - probability))
+
+    z = NormalDist().inv_cdf(probability)
+    v = degrees_of_freedom
+
+    return (
+        z
+        + (z**3 + z) / (4 * v)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * v**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * v**3)
+        + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z)
+        / (92160 * v**4)
+    )
+
+
+def confidence_interval_half_width(
+    samples: Sequence[float], confidence_level: float
+) -> float:
+    """
+    Returns the half width of the (two sided, Student's t) confidence
+    interval on the mean of the samples, or inf if there are fewer
+    than two samples
+
+    Parameters
+    ----------
+    samples: list of floats
+        Independent samples of the same quantity
+    confidence_level: float
+        The probability (0, 1) that the interval contains the true mean
+    """
+    if len(samples) < 2:
+        return math.inf
+
+    t = student_t_quantile((1 + confidence_level) / 2, len(samples) - 1)
+
+    return t * stdev(samples) / math.sqrt(len(samples))
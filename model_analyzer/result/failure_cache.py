@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.constants import (
+    FAILURE_LOAD_TIMEOUT,
+    FAILURE_OUT_OF_MEMORY,
+    FAILURE_PERF_ANALYZER_CPU_LIMIT,
+    FAILURE_PERF_ANALYZER_TIMEOUT,
+)
+
+# Sizes that, when all are at least as large as in a failed
+# run config, make a run config fail the same way
+FAILURE_DOMINATING_SIZES = {
+    FAILURE_OUT_OF_MEMORY: ["instances", "max_batch_size", "batch_size"],
+    FAILURE_LOAD_TIMEOUT: ["instances", "max_batch_size"],
+    FAILURE_PERF_ANALYZER_TIMEOUT: ["batch_size", "load"],
+    FAILURE_PERF_ANALYZER_CPU_LIMIT: ["batch_size", "load"],
+}
+
+# Failures caused by the load perf_analyzer generates, which only
+# carry over to run configs of the same model variants
+PERF_ANALYZER_FAILURES = [
+    FAILURE_PERF_ANALYZER_TIMEOUT,
+    FAILURE_PERF_ANALYZER_CPU_LIMIT,
+]
+
+
+class FailureCache:
+    """
+    Records the RunConfigs that failed, along with the class of
+    their failure, and finds the RunConfigs that are at least as
+    large as one that failed, and so are expected to fail the same way
+    """
+
+    def __init__(self, gpu_count: int) -> None:
+        """
+        Parameters
+        ----------
+        gpu_count: int
+            Number of GPUs the models are profiled on
+        """
+        self._gpu_count = gpu_count
+        self._failures: List[Tuple[str, str, Dict[str, Dict[str, Any]]]] = []
+
+    def add_failure(self, run_config: RunConfig, failure_class: str) -> None:
+        """
+        Adds a RunConfig that failed with the class of failure
+        """
+        sizes = self._get_sizes(run_config)
+        if sizes is None or failure_class not in FAILURE_DOMINATING_SIZES:
+            return
+
+        self._failures.append((failure_class, run_config.representation(), sizes))
+
+    def find_failure(self, run_config: RunConfig) -> Optional[Tuple[str, str]]:
+        """
+        Returns the class of failure and the representation of a
+        failed RunConfig that the RunConfig is at least as large as,
+        or None if there is no such RunConfig
+        """
+        sizes = self._get_sizes(run_config)
+        if sizes is None:
+            return None
+
+        for failure_class, representation, failed_sizes in self._failures:
+            if self._is_at_least_as_large(sizes, failed_sizes, failure_class):
+                return failure_class, representation
+
+        return None
+
+    def _is_at_least_as_large(
+        self,
+        sizes: Dict[str, Dict[str, Any]],
+        failed_sizes: Dict[str, Dict[str, Any]],
+        failure_class: str,
+    ) -> bool:
+        if sizes.keys() != failed_sizes.keys():
+            return False
+
+        for model_name, model_sizes in sizes.items():
+            failed_model_sizes = failed_sizes[model_name]
+
+            if failure_class in PERF_ANALYZER_FAILURES:
+                if model_sizes["variant"] != failed_model_sizes["variant"]:
+                    return False
+            elif model_sizes["fixed_fields"] != failed_model_sizes["fixed_fields"]:
+                return False
+
+            for size in FAILURE_DOMINATING_SIZES[failure_class]:
+                if model_sizes[size] is None or failed_model_sizes[size] is None:
+                    return False
+                if model_sizes[size] < failed_model_sizes[size]:
+                    return False
+
+        return True
+
+    def _get_sizes(self, run_config: RunConfig) -> Optional[Dict[str, Dict[str, Any]]]:
+        if run_config.is_ensemble_model() or run_config.is_bls_model():
+            return None
+
+        sizes = {}
+        for model_run_config in run_config.model_run_configs():
+            model_config = model_run_config.model_config()
+            if model_config is None:
+                return None
+
+            perf_config = model_run_config.perf_config()
+            load = perf_config["concurrency-range"]
+            if load is None:
+                load = perf_config["request-rate-range"]
+
+            sizes[model_run_config.model_name()] = {
+                "variant": model_run_config.model_variant_name(),
+                "fixed_fields": self._get_fixed_fields(model_config.get_config()),
+                "instances": model_config.instance_group_count(self._gpu_count),
+                "max_batch_size": model_config.max_batch_size(),
+                "batch_size": self._get_number(perf_config["batch-size"]),
+                "load": self._get_number(load),
+            }
+
+        return sizes
+
+    def _get_fixed_fields(self, model_config: Dict) -> str:
+        """
+        Returns the fields of the model config other than the
+        ones the failure sizes are compared on
+        """
+        model_config.pop("name", None)
+        model_config.pop("max_batch_size", None)
+        for instance_group in model_config.get("instance_group", []):
+            instance_group.pop("count", None)
+
+        return json.dumps(model_config, sort_keys=True)
+
+    def _get_number(self, value: Any) -> Optional[float]:
+        """
+        Returns the value as a number, or None if it is
+        not a single number (e.g. a range)
+        """
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
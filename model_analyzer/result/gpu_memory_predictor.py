@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+
+# Relative residual below which a config is treated as lying
+# inside the span of the measured configs
+SPAN_TOLERANCE = 1e-6
+
+
+class GPUMemoryPredictor:
+    """
+    Predicts the GPU memory (MB) a RunConfig will use on each GPU from
+    the memory used by the RunConfigs already measured
+
+    Every model adds (a * instances + b * instances * max_batch_size) on top
+    of the server-only baseline, with a and b fit per model by least squares.
+    Predictions are only made for configs that lie in the span of the
+    measured ones, so the predictor never guesses at a term it has not seen vary
+    """
+
+    def __init__(self, gpu_count: int, baseline: float = 0.0) -> None:
+        """
+        Parameters
+        ----------
+        gpu_count: int
+            Number of GPUs the models are profiled on
+        baseline: float
+            GPU memory (MB) used on each GPU by the server with no models loaded
+        """
+        self._gpu_count = gpu_count
+        self._baseline = baseline
+
+        self._feature_names: List[Tuple[str, str]] = []
+        self._features: List[Dict[Tuple[str, str], float]] = []
+        self._used_memory: List[float] = []
+
+    def add_measurement(
+        self, run_config: RunConfig, measurement: RunConfigMeasurement
+    ) -> None:
+        """
+        Adds the GPU memory (MB) used while measuring the RunConfig. The
+        measured memory is summed across GPUs, so it is averaged per GPU
+        """
+        used_memory = measurement.get_gpu_metric_value("gpu_used_memory")
+        gpus_used = measurement.gpus_used()
+        if not used_memory or not gpus_used:
+            return
+
+        features = self._get_features(run_config)
+        if features is None:
+            return
+
+        for name in features:
+            if name not in self._feature_names:
+                self._feature_names.append(name)
+
+        self._features.append(features)
+        self._used_memory.append(used_memory / len(gpus_used) - self._baseline)
+
+    def predict(self, run_config: RunConfig) -> Optional[float]:
+        """
+        Returns the predicted GPU memory (MB) of the RunConfig on each GPU, or None
+        if the measurements so far cannot predict it
+        """
+        features = self._get_features(run_config)
+        if features is None or not self._features:
+            return None
+
+        if any(name not in self._feature_names for name in features):
+            return None
+
+        matrix = np.array(
+            [
+                [measured.get(name, 0.0) for name in self._feature_names]
+                for measured in self._features
+            ]
+        )
+        vector = np.array([features.get(name, 0.0) for name in self._feature_names])
+
+        if not self._is_in_span(matrix, vector):
+            return None
+
+        used_memory = np.array(self._used_memory)
+        coefficients, *_ = np.linalg.lstsq(matrix, used_memory, rcond=None)
+
+        return float(self._baseline + vector @ coefficients)
+
+    def _is_in_span(self, matrix: np.ndarray, vector: np.ndarray) -> bool:
+        _, singular_values, row_basis = np.linalg.svd(matrix, full_matrices=False)
+        rank = int(np.sum(singular_values > SPAN_TOLERANCE * singular_values[0]))
+        projection = row_basis[:rank].T @ (row_basis[:rank] @ vector)
+
+        return bool(
+            np.linalg.norm(vector - projection)
+            <= SPAN_TOLERANCE * np.linalg.norm(vector)
+        )
+
+    def _get_features(
+        self, run_config: RunConfig
+    ) -> Optional[Dict[Tuple[str, str], float]]:
+        features = {}
+        for model_run_config in run_config.model_run_configs():
+            model_config = model_run_config.model_config()
+            if model_config is None:
+                return None
+
+            model_name = model_run_config.model_name()
+            instances = model_config.instance_group_count(self._gpu_count)
+            max_batch_size = max(model_config.max_batch_size(), 1)
+
+            features[(model_name, "instances")] = float(instances)
+            features[(model_name, "batched_instances")] = float(
+                instances * max_batch_size
+            )
+
+        return features
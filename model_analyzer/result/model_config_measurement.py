@@ -20,6 +20,7 @@
 from statistics import mean
 
 from model_analyzer.constants import COMPARISON_SCORE_THRESHOLD, LOGGER_NAME
+from model_analyzer.record.latency_histogram import LatencyHistogram
 from model_analyzer.record.record import RecordType
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -32,7 +33,13 @@ class ModelConfigMeasurement:
     RunConfig run
     """
 
-    def __init__(self, model_config_name, model_specific_pa_params, non_gpu_data):
+    def __init__(
+        self,
+        model_config_name,
+        model_specific_pa_params,
+        non_gpu_data,
+        latency_histogram=None,
+    ):
         """
         model_config_name : string
             The model config name that was used in the RunConfig
@@ -42,11 +49,14 @@ def __init__(self, model_config_name, model_specific_pa_params, non_gpu_data):
         non_gpu_data : list of Records
             Metrics that do not have a GPU UUID associated with them,
             from either CPU or PA
+        latency_histogram : LatencyHistogram
+            The full latency distribution of the measurement, if captured
         """
 
         self._model_config_name = model_config_name
         self._model_specific_pa_params = model_specific_pa_params
         self._non_gpu_data = non_gpu_data
+        self._latency_histogram = latency_histogram
 
         self._non_gpu_data_from_tag = self._get_non_gpu_data_from_tag()
 
@@ -78,6 +88,11 @@ def from_dict(cls, model_config_measurement_dict):
             cls._get_non_gpu_data_from_tag(model_config_measurement)
         )
 
+        if model_config_measurement_dict.get("_latency_histogram"):
+            model_config_measurement._latency_histogram = LatencyHistogram.from_dict(
+                model_config_measurement_dict["_latency_histogram"]
+            )
+
         return model_config_measurement
 
     def set_metric_weighting(self, metric_objectives):
@@ -130,6 +145,72 @@ def non_gpu_data(self):
 
         return self._non_gpu_data
 
+    def latency_histogram(self):
+        """
+        Return the LatencyHistogram of this measurement,
+        or None if the latency distribution was not captured
+        """
+
+        return self._latency_histogram
+
+    def get_latency_percentile(self, percentile):
+        """
+        Parameters
+        ----------
+        percentile : float
+            Any percentile in the range [0, 100]
+
+        Returns
+        -------
+        float
+            The latency (in ms) at the given percentile, or None
+            if the latency distribution was not captured
+        """
+
+        if not self._latency_histogram or not self._latency_histogram.total_count():
+            return None
+
+        return self._latency_histogram.percentile(percentile) / 1000
+
+    def get_metric_weights(self):
+        """
+        Return the (normalized) weight of each
+        objective metric, keyed by its tag
+        """
+
+        return self._metric_weights
+
+    def get_metric_values(self):
+        """
+        Return the value of every non-GPU
+        metric, keyed by its tag
+        """
+
+        return {metric.tag: metric.value() for metric in self._non_gpu_data}
+
+    def set_metric_values(self, metric_values):
+        """
+        Replaces the values of the non-GPU metrics
+
+        Parameters
+        ----------
+        metric_values : dict
+            keys are the tags of the metrics to replace,
+            and values are their new values
+        """
+
+        self._non_gpu_data = [
+            (
+                type(metric)(
+                    value=metric_values[metric.tag], timestamp=metric.timestamp()
+                )
+                if metric.tag in metric_values
+                else metric
+            )
+            for metric in self._non_gpu_data
+        ]
+        self._non_gpu_data_from_tag = self._get_non_gpu_data_from_tag()
+
     def get_metric(self, tag):
         """
         Parameters
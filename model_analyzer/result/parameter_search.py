@@ -4,19 +4,25 @@
 
 import logging
 from math import log2
-from typing import Generator, List, Optional
+from typing import Dict, Generator, List, Optional
 
+from model_analyzer.config.generate.generator_utils import GeneratorUtils as utils
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 from model_analyzer.constants import (
+    KNEE_SEARCH_PARAMETER_TOLERANCE,
     LOGGER_NAME,
     THROUGHPUT_MINIMUM_CONSECUTIVE_PARAMETER_TRIES,
     THROUGHPUT_MINIMUM_GAIN,
 )
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+from model_analyzer.result.request_rate_predictor import RequestRatePredictor
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Fraction of the interval a golden-section step moves away from the best parameter
+GOLDEN_SECTION_RATIO = 0.382
+
 
 class ParameterSearch:
     """
@@ -25,8 +31,14 @@ class ParameterSearch:
       - Will sweep from by powers of two from min to max parameter
       - If the user specifies a constraint, the algorithm will perform a binary search
         around the boundary if the constraint is violated
+      - In knee mode, the sweep stops at the first power of two that does not
+        improve on the best measurement, and the parameter is then refined towards
+        the lowest value that reaches the best objective within the constraints
       - Will not sweep at all if custom stimulus is provided by the user (via the
-        "request-intervals" perf analyzer flag)
+        "request-intervals" perf analyzer flag). A request trace is swept by the
+        multiplier (scale) of its load
+      - If a request rate predictor is provided, the binary search skips
+        request rates predicted to violate the latency budget
 
     Invariant: It is necessary for the user to add new measurements as they are taken
     """
@@ -37,6 +49,8 @@ def __init__(
         model_parameters: dict = {},
         perf_analyzer_flags: dict = {},
         skip_parameter_sweep: bool = False,
+        request_rate_predictor: Optional[RequestRatePredictor] = None,
+        batch_size: int = 1,
     ) -> None:
         """
         Parameters
@@ -45,35 +59,56 @@ def __init__(
             Profile configuration information
         skip_parameter_sweep: bool
             If true, skips the parameter sweep and only does the binary search
+        request_rate_predictor: RequestRatePredictor
+            Predicts the request rates that violate the latency budget
+        batch_size: int
+            The client batch size of the measurements, used by the predictor
         """
         self._skip_parameter_sweep = skip_parameter_sweep
         self._parameter_is_request_rate = config.is_request_rate_specified(
             model_parameters
         )
+        self._parameter_is_request_trace_scale = (
+            not self._parameter_is_request_rate and config.is_request_trace_specified()
+        )
         self._inference_load_is_custom = "request-intervals" in perf_analyzer_flags
+        self._request_rate_predictor = (
+            request_rate_predictor if self._parameter_is_request_rate else None
+        )
+        self._batch_size = batch_size
 
-        if self._parameter_is_request_rate:
-            self._min_parameter_index = int(
-                log2(config.run_config_search_min_request_rate)
-            )
-            self._max_parameter_index = int(
-                log2(config.run_config_search_max_request_rate)
-            )
-
-        else:
-            self._min_parameter_index = int(
-                log2(config.run_config_search_min_concurrency)
-            )
-            self._max_parameter_index = int(
-                log2(config.run_config_search_max_concurrency)
-            )
+        self._sweep_parameters = self._create_sweep_parameters(config)
 
         self._max_binary_search_steps = config.run_config_search_max_binary_search_steps
+        self._is_knee_search = config.parameter_search_mode == "knee"
 
         self._run_config_measurements: List[Optional[RunConfigMeasurement]] = []
-        self._parameters: List[int] = []
-        self._last_failing_parameter = 0
-        self._last_passing_parameter = 0
+        self._parameters: List[float] = []
+        self._last_failing_parameter: float = 0
+        self._last_passing_parameter: float = 0
+
+    def _create_sweep_parameters(self, config: ConfigCommandProfile) -> List[float]:
+        """
+        Concurrency and request rate are swept over the powers of two in
+        their range. A request trace scale is doubled from its minimum,
+        which (like the perf analyzer config generator) allows fractions
+        """
+        if self._parameter_is_request_trace_scale:
+            return utils.generate_doubled_list(
+                config.run_config_search_min_request_trace_scale,
+                config.run_config_search_max_request_trace_scale,
+            )
+        elif self._parameter_is_request_rate:
+            min_parameter = config.run_config_search_min_request_rate
+            max_parameter = config.run_config_search_max_request_rate
+        else:
+            min_parameter = config.run_config_search_min_concurrency
+            max_parameter = config.run_config_search_max_concurrency
+
+        return [
+            2**i
+            for i in range(int(log2(min_parameter)), int(log2(max_parameter)) + 1)
+        ]
 
     def add_run_config_measurement(
         self, run_config_measurement: Optional[RunConfigMeasurement]
@@ -84,23 +119,30 @@ def add_run_config_measurement(
         """
         self._run_config_measurements.append(run_config_measurement)
 
-    def search_parameters(self) -> Generator[int, None, None]:
+        if self._request_rate_predictor and run_config_measurement:
+            self._request_rate_predictor.update(
+                run_config_measurement, self._batch_size
+            )
+
+    def search_parameters(self) -> Generator[float, None, None]:
         """
         First performs a parameter sweep, and then, if necessary, perform
         a binary parameter search around the point where the constraint
         violated
         """
-        if not self._inference_load_is_custom:
+        if self._inference_load_is_custom:
+            return
+
+        if self._is_knee_search:
+            yield from self._perform_knee_search()
+        else:
             yield from self._perform_parameter_sweep()
 
             if self._was_constraint_violated():
                 yield from self._perform_binary_parameter_search()
 
-    def _perform_parameter_sweep(self) -> Generator[int, None, None]:
-        for parameter in (
-            2**i
-            for i in range(self._min_parameter_index, self._max_parameter_index + 1)
-        ):
+    def _perform_parameter_sweep(self) -> Generator[float, None, None]:
+        for parameter in self._sweep_parameters:
             if self._should_continue_parameter_sweep():
                 self._parameters.append(parameter)
                 yield parameter
@@ -108,16 +150,22 @@ def _perform_parameter_sweep(self) -> Generator[int, None, None]:
                 # We can't actually skip the sweep because the results need to be added
                 # but, we can suppress the logging messages
                 if not self._skip_parameter_sweep:
-                    if self._parameter_is_request_rate:
-                        logger.info(
-                            "Terminating request rate sweep - throughput is decreasing"
-                        )
-                    else:
-                        logger.info(
-                            "Terminating concurrency sweep - throughput is decreasing"
-                        )
+                    self._log_sweep_termination()
                     return
 
+    def _log_sweep_termination(self) -> None:
+        if self._skip_parameter_sweep:
+            return
+
+        if self._parameter_is_request_trace_scale:
+            logger.info(
+                "Terminating request trace scale sweep - throughput is decreasing"
+            )
+        elif self._parameter_is_request_rate:
+            logger.info("Terminating request rate sweep - throughput is decreasing")
+        else:
+            logger.info("Terminating concurrency sweep - throughput is decreasing")
+
     def _should_continue_parameter_sweep(self) -> bool:
         self._check_measurement_count()
 
@@ -213,27 +261,267 @@ def _at_constraint_failure_boundary(self, index: int) -> bool:
 
         return at_failure_boundary
 
-    def _perform_binary_parameter_search(self) -> Generator[int, None, None]:
+    def _perform_binary_parameter_search(self) -> Generator[float, None, None]:
         # This is needed because we are going to restart the search from the
         # parameter that failed - so we expect this to be at the end of the list
         self._parameters.append(self._last_failing_parameter)
 
+        predicted_to_fail = False
         for i in range(0, self._max_binary_search_steps):
-            parameter = self._determine_next_binary_parameter()
+            if predicted_to_fail:
+                parameter = self._get_midpoint(
+                    self._last_passing_parameter, self._last_failing_parameter
+                )
+            else:
+                parameter = self._determine_next_binary_parameter()
+
+            if parameter == self._parameters[-1]:
+                continue
 
-            if parameter != self._parameters[-1]:
+            # A step predicted to fail is taken without measuring it
+            predicted_to_fail = self._is_parameter_predicted_to_fail(parameter)
+            if predicted_to_fail:
+                self._last_failing_parameter = parameter
+            else:
                 self._parameters.append(parameter)
                 yield parameter
 
-    def _determine_next_binary_parameter(self) -> int:
+    def _determine_next_binary_parameter(self) -> float:
         if not self._run_config_measurements[-1]:
             return 0
 
         if self._run_config_measurements[-1].is_passing_constraints():
             self._last_passing_parameter = self._parameters[-1]
-            parameter = int((self._last_failing_parameter + self._parameters[-1]) / 2)
+            parameter = self._get_midpoint(
+                self._last_failing_parameter, self._parameters[-1]
+            )
         else:
             self._last_failing_parameter = self._parameters[-1]
-            parameter = int((self._last_passing_parameter + self._parameters[-1]) / 2)
+            parameter = self._get_midpoint(
+                self._last_passing_parameter, self._parameters[-1]
+            )
 
         return parameter
+
+    def _get_midpoint(self, parameter: float, other_parameter: float) -> float:
+        # A request trace can be replayed at any scale, the
+        # other parameters are whole numbers
+        if self._parameter_is_request_trace_scale:
+            return (parameter + other_parameter) / 2
+
+        return int((parameter + other_parameter) / 2)
+
+    def _round_parameter(self, parameter: float) -> float:
+        if self._parameter_is_request_trace_scale:
+            return parameter
+
+        return round(parameter)
+
+    def _get_parameter_step(self) -> float:
+        """
+        Returns the smallest difference between two parameters
+        """
+        return 0 if self._parameter_is_request_trace_scale else 1
+
+    def _is_parameter_predicted_to_fail(self, parameter: float) -> bool:
+        if not self._request_rate_predictor:
+            return False
+
+        max_request_rate = self._request_rate_predictor.max_request_rate()
+        return max_request_rate is not None and parameter > max_request_rate
+
+    def _perform_knee_search(self) -> Generator[float, None, None]:
+        yield from self._perform_knee_bracketing()
+
+        best_parameter = self._get_knee_parameter()
+        if best_parameter:
+            yield from self._perform_knee_refinement(best_parameter)
+        elif len(self._run_config_measurements) > 2 and self._was_constraint_violated():
+            yield from self._perform_binary_parameter_search()
+
+    def _perform_knee_bracketing(self) -> Generator[float, None, None]:
+        for parameter in self._sweep_parameters:
+            self._check_measurement_count()
+
+            if self._has_knee_been_bracketed():
+                self._log_sweep_termination()
+                return
+
+            self._parameters.append(parameter)
+            yield parameter
+
+    def _has_knee_been_bracketed(self) -> bool:
+        """
+        The knee is bracketed once the last measurement fails to improve on
+        the best passing measurement before it. Until something passes, the
+        sweep's saturation rule is used
+        """
+        if not self._run_config_measurements:
+            return False
+
+        passing_rcms = [
+            rcm
+            for rcm in self._run_config_measurements[:-1]
+            if rcm and rcm.is_passing_constraints()
+        ]
+        if passing_rcms:
+            return not self._is_better(
+                self._run_config_measurements[-1], max(passing_rcms)
+            )
+        elif self._are_minimum_tries_reached():
+            return self._has_objective_gain_saturated()
+        else:
+            return False
+
+    def _get_knee_parameter(self) -> Optional[float]:
+        """
+        Returns the lowest measured parameter whose passing measurement
+        is within the minimum gain of the best passing measurement
+        """
+        measurements = self._get_passing_measurements_by_parameter()
+        if not measurements:
+            return None
+
+        best_rcm = max(measurements.values())
+        return min(
+            parameter
+            for parameter, rcm in measurements.items()
+            if not self._is_better(best_rcm, rcm)
+        )
+
+    def _perform_knee_refinement(
+        self, best_parameter: float
+    ) -> Generator[float, None, None]:
+        measured_parameters = sorted(set(self._parameters))
+        lower_parameter = max(
+            [p for p in measured_parameters if p < best_parameter],
+            default=best_parameter,
+        )
+        upper_parameter = min(
+            [p for p in measured_parameters if p > best_parameter],
+            default=best_parameter,
+        )
+        best_rcm = self._get_passing_measurements_by_parameter()[best_parameter]
+
+        for step in range(self._max_binary_search_steps):
+            if (
+                upper_parameter - lower_parameter
+                <= KNEE_SEARCH_PARAMETER_TOLERANCE * best_parameter
+            ):
+                return
+
+            parameter = self._determine_next_knee_parameter(
+                lower_parameter, best_parameter, upper_parameter, use_estimate=step == 0
+            )
+            if parameter is None:
+                return
+
+            self._parameters.append(parameter)
+            yield parameter
+            self._check_measurement_count()
+
+            rcm = self._run_config_measurements[-1]
+            if parameter < best_parameter:
+                if self._is_passing(rcm) and not self._is_better(best_rcm, rcm):
+                    upper_parameter, best_parameter = best_parameter, parameter
+                    best_rcm = rcm  # type: ignore
+                else:
+                    lower_parameter = parameter
+            else:
+                if self._is_better(rcm, best_rcm):
+                    lower_parameter, best_parameter = best_parameter, parameter
+                    best_rcm = rcm  # type: ignore
+                else:
+                    upper_parameter = parameter
+
+    def _determine_next_knee_parameter(
+        self,
+        lower_parameter: float,
+        best_parameter: float,
+        upper_parameter: float,
+        use_estimate: bool,
+    ) -> Optional[float]:
+        """
+        The first probe is placed at the estimated knee; after that a
+        golden-section step is taken into the larger of the two intervals
+        around the best parameter
+        """
+        if use_estimate:
+            parameter = self._estimate_knee_parameter(best_parameter)
+            if parameter and lower_parameter < parameter < upper_parameter:
+                if parameter != best_parameter:
+                    return parameter
+
+        intervals = [
+            (lower_parameter, best_parameter),
+            (best_parameter, upper_parameter),
+        ]
+        if best_parameter - lower_parameter < upper_parameter - best_parameter:
+            intervals.reverse()
+
+        step = self._get_parameter_step()
+        for low, high in intervals:
+            if high == low or high - low < 2 * step:
+                continue
+
+            if low == best_parameter:
+                parameter = self._round_parameter(
+                    low + GOLDEN_SECTION_RATIO * (high - low)
+                )
+            else:
+                parameter = self._round_parameter(
+                    high - GOLDEN_SECTION_RATIO * (high - low)
+                )
+
+            return min(max(parameter, low + step), high - step)
+
+        return None
+
+    def _estimate_knee_parameter(self, best_parameter: float) -> Optional[float]:
+        """
+        Throughput grows roughly linearly with the parameter until the
+        knee, so the knee sits where the steepest measured slope reaches
+        the best throughput
+        """
+        measurements = self._get_passing_measurements_by_parameter()
+        max_slope = max(
+            rcm.get_non_gpu_metric_value("perf_throughput") / parameter
+            for parameter, rcm in measurements.items()
+        )
+        if not max_slope:
+            return None
+
+        best_throughput = measurements[best_parameter].get_non_gpu_metric_value(
+            "perf_throughput"
+        )
+        return self._round_parameter(best_throughput / max_slope)
+
+    def _get_passing_measurements_by_parameter(
+        self,
+    ) -> Dict[float, RunConfigMeasurement]:
+        return {
+            parameter: rcm
+            for parameter, rcm in zip(self._parameters, self._run_config_measurements)
+            if rcm and rcm.is_passing_constraints()
+        }
+
+    def _is_passing(self, rcm: Optional[RunConfigMeasurement]) -> bool:
+        return rcm is not None and rcm.is_passing_constraints()
+
+    def _is_better(
+        self,
+        rcm: Optional[RunConfigMeasurement],
+        other_rcm: Optional[RunConfigMeasurement],
+    ) -> bool:
+        """
+        Returns true if rcm beats other_rcm: passing the constraints takes
+        priority, otherwise it must gain at least the minimum throughput gain
+        """
+        if not rcm:
+            return False
+        if not other_rcm:
+            return True
+        if rcm.is_passing_constraints() != other_rcm.is_passing_constraints():
+            return rcm.is_passing_constraints()
+
+        return other_rcm.compare_measurements(rcm) > THROUGHPUT_MINIMUM_GAIN
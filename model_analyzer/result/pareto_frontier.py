@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Sequence
+
+
+def dominates(first: Sequence[float], second: Sequence[float]) -> bool:
+    """
+    Returns true if the first point is at least as good as the second
+    in every objective, and strictly better in at least one
+    (all objectives are maximized)
+    """
+    strictly_better = False
+    for first_value, second_value in zip(first, second):
+        if first_value < second_value:
+            return False
+        elif first_value > second_value:
+            strictly_better = True
+
+    return strictly_better
+
+
+def fast_non_dominated_sort(points: Sequence[Sequence[float]]) -> List[List[int]]:
+    """
+    Sorts points into successive non-dominated fronts, using the
+    O(M * N^2) fast non-dominated sort from NSGA-II (Deb et al.)
+
+    Parameters
+    ----------
+    points: list of objective vectors
+        Every objective is maximized. Objectives where a lower value is
+        better must be negated by the caller
+
+    Returns
+    -------
+    list of lists of int
+        The indices of the points in each front. The first front is the
+        Pareto frontier, each later front is only dominated by earlier ones
+    """
+    dominated_points: List[List[int]] = [[] for _ in points]
+    domination_counts = [0] * len(points)
+
+    for p in range(len(points)):
+        for q in range(p + 1, len(points)):
+            if dominates(points[p], points[q]):
+                dominated_points[p].append(q)
+                domination_counts[q] += 1
+            elif dominates(points[q], points[p]):
+                dominated_points[q].append(p)
+                domination_counts[p] += 1
+
+    fronts = []
+    front = [p for p in range(len(points)) if domination_counts[p] == 0]
+    while front:
+        fronts.append(front)
+
+        next_front = []
+        for p in front:
+            for q in dominated_points[p]:
+                domination_counts[q] -= 1
+                if domination_counts[q] == 0:
+                    next_front.append(q)
+
+        front = sorted(next_front)
+
+    return fronts
+
+
+def pareto_frontier(points: Sequence[Sequence[float]]) -> List[int]:
+    """
+    Returns the indices of the points that no other point dominates
+    """
+    fronts = fast_non_dominated_sort(points)
+
+    return fronts[0] if fronts else []
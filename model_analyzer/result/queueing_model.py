@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from math import inf, log
+
+
+def erlang_c(servers: int, offered_load: float) -> float:
+    """
+    Returns the probability that an arriving request has to wait
+    in an M/M/c queue
+
+    Parameters
+    ----------
+    servers: int
+        Number of servers (model instances)
+    offered_load: float
+        Arrival rate divided by the service rate of a single server
+    """
+    if offered_load >= servers:
+        return 1.0
+
+    # Erlang B computed with the stable recurrence, then converted to Erlang C
+    erlang_b = 1.0
+    for k in range(1, servers + 1):
+        erlang_b = offered_load * erlang_b / (k + offered_load * erlang_b)
+
+    utilization = offered_load / servers
+    return erlang_b / (1 - utilization * (1 - erlang_b))
+
+
+class QueueingModel:
+    """
+    Predicts the latency of a model config under a request rate by
+    treating its instances as the servers of an M/M/c queue
+    """
+
+    def __init__(self, service_time: float, servers: int) -> None:
+        """
+        Parameters
+        ----------
+        service_time: float
+            Time (ms) a single instance spends on one request
+        servers: int
+            Number of model instances serving requests
+        """
+        self._service_time = service_time
+        self._servers = max(servers, 1)
+
+    def saturation_rate(self) -> float:
+        """
+        Returns the request rate (requests/sec) at which the queue becomes unstable
+        """
+        return self._servers * 1000 / self._service_time
+
+    def predict_latency(
+        self, request_rate: float, percentile: float = 99, deterministic: bool = False
+    ) -> float:
+        """
+        Returns the predicted latency percentile (ms) at the request rate
+
+        If deterministic is true, the waiting time is halved, which is the
+        usual M/D/c approximation. Because service times of a model are
+        close to constant this gives a lower bound on the latency
+        """
+        if request_rate >= self.saturation_rate():
+            return inf
+
+        service_rate = 1000 / self._service_time
+        probability_of_waiting = erlang_c(self._servers, request_rate / service_rate)
+        tail_probability = 1 - percentile / 100
+
+        if probability_of_waiting <= tail_probability:
+            waiting_time = 0.0
+        else:
+            waiting_time = (
+                1000
+                * log(probability_of_waiting / tail_probability)
+                / (self._servers * service_rate - request_rate)
+            )
+
+        if deterministic:
+            waiting_time /= 2
+
+        return self._service_time + waiting_time
+
+    def max_request_rate(
+        self, latency_budget: float, percentile: float = 99, deterministic: bool = False
+    ) -> float:
+        """
+        Returns the highest request rate whose predicted latency
+        percentile stays within the budget (ms)
+        """
+        if self.predict_latency(0, percentile, deterministic) > latency_budget:
+            return 0.0
+
+        # Latency increases monotonically with the rate, so bisect
+        # the stable range [0, saturation_rate)
+        low, high = 0.0, self.saturation_rate()
+        for _ in range(50):
+            mid = (low + high) / 2
+            if self.predict_latency(mid, percentile, deterministic) <= latency_budget:
+                low = mid
+            else:
+                high = mid
+
+        return low
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Optional
+
+from model_analyzer.config.input.objects.config_model_profile_spec import (
+    ConfigModelProfileSpec,
+)
+from model_analyzer.constants import QUEUEING_MODEL_SATURATION_MARGIN
+from model_analyzer.result.queueing_model import QueueingModel
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.triton.model.model_config import ModelConfig
+
+
+class RequestRatePredictor:
+    """
+    Predicts the highest request rate a model config can sustain from
+    its last measurement, using a queueing model of its instances
+
+    perf_server_compute_infer is the time the server spends computing a
+    batch. If the model config batches requests on the server, each
+    instance can compute several requests in that time, so two models
+    are kept:
+      - A lower bound where every request is computed on its own, used to
+        decide how far the request rate can safely jump ahead
+      - An upper bound where every instance always computes full batches,
+        used to decide which request rates are predicted to fail
+
+    Neither model predicts a capacity below the measured throughput
+    """
+
+    def __init__(
+        self,
+        instance_count: int = 1,
+        max_batch_size: int = 1,
+        latency_budget: Optional[float] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        instance_count: int
+            Number of model instances serving the requests
+        max_batch_size: int
+            Largest batch the server computes, which is 1 unless the
+            model config batches requests on the server
+        latency_budget: float
+            The p99 latency constraint (ms) of the model, if any
+        """
+        self._instance_count = instance_count
+        self._max_batch_size = max(max_batch_size, 1)
+        self._latency_budget = latency_budget
+
+        self._lower_model: Optional[QueueingModel] = None
+        self._upper_model: Optional[QueueingModel] = None
+
+    @classmethod
+    def create(
+        cls,
+        model_config: ModelConfig,
+        gpu_count: int,
+        model: ConfigModelProfileSpec,
+    ) -> "RequestRatePredictor":
+        """
+        Creates the predictor for a model config of the profiled model
+        """
+        config = model_config.get_config()
+        if "dynamic_batching" in config or "sequence_batching" in config:
+            max_batch_size = model_config.max_batch_size()
+        else:
+            max_batch_size = 1
+
+        latency_budget = None
+        constraints = model.constraints()
+        if constraints and constraints.has_metric("perf_latency_p99"):
+            latency_budget = constraints["perf_latency_p99"].get("max")
+
+        return cls(
+            instance_count=model_config.instance_group_count(gpu_count),
+            max_batch_size=max_batch_size,
+            latency_budget=latency_budget,
+        )
+
+    def has_latency_budget(self) -> bool:
+        """
+        Returns true if the model has a p99 latency constraint
+        """
+        return bool(self._latency_budget)
+
+    def update(self, measurement: RunConfigMeasurement, batch_size: int) -> bool:
+        """
+        Updates the queueing models from a measurement taken with
+        the client batch size. Returns false if the measurement
+        lacks the server compute time, in which case nothing is predicted
+        """
+        service_time = measurement.get_non_gpu_metric_value("perf_server_compute_infer")
+        if not service_time:
+            self._lower_model = None
+            self._upper_model = None
+            return False
+
+        throughput = measurement.get_non_gpu_metric_value("perf_throughput")
+        measured_request_rate = throughput / batch_size if throughput else 0
+        requests_per_batch = max(self._max_batch_size // batch_size, 1)
+
+        self._lower_model = self._create_queueing_model(
+            service_time, self._instance_count, measured_request_rate
+        )
+        self._upper_model = self._create_queueing_model(
+            service_time,
+            self._instance_count * requests_per_batch,
+            measured_request_rate,
+        )
+
+        return True
+
+    def max_request_rate(self) -> Optional[float]:
+        """
+        Returns the request rate beyond which the model config is
+        predicted to saturate or violate the latency budget, or None
+        if there is nothing to predict from
+        """
+        return self._predict_request_rate(self._upper_model)
+
+    def knee_request_rate(self) -> Optional[float]:
+        """
+        Returns the request rate the model config is guaranteed to reach
+        before saturating or violating the latency budget, or None
+        if there is nothing to predict from
+        """
+        return self._predict_request_rate(self._lower_model)
+
+    def _create_queueing_model(
+        self, service_time: float, servers: int, measured_request_rate: float
+    ) -> QueueingModel:
+        if measured_request_rate:
+            service_time = min(service_time, servers * 1000 / measured_request_rate)
+
+        return QueueingModel(service_time=service_time, servers=servers)
+
+    def _predict_request_rate(
+        self, queueing_model: Optional[QueueingModel]
+    ) -> Optional[float]:
+        if not queueing_model:
+            return None
+
+        if self._latency_budget:
+            return queueing_model.max_request_rate(
+                self._latency_budget, deterministic=True
+            )
+        else:
+            return queueing_model.saturation_rate() * QUEUEING_MODEL_SATURATION_MARGIN
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from collections import defaultdict
-from typing import DefaultDict, Union
+from typing import DefaultDict, Dict, List, Optional, Union
 
 from model_analyzer.config.generate.base_model_config_generator import (
     BaseModelConfigGenerator,
@@ -29,6 +29,7 @@
 from model_analyzer.result.result_statistics import ResultStatistics
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 
+from .pareto_frontier import pareto_frontier
 from .results import Results
 from .run_config_measurement import RunConfigMeasurement
 from .run_config_result import RunConfigResult
@@ -120,6 +121,34 @@ def add_server_data(self, data):
 
         self._state_manager.set_state_variable("ResultManager.server_only_data", data)
 
+    def add_pruned_run_config(self, run_config: RunConfig, failure_class: str) -> None:
+        """
+        Adds a run config that was not profiled because
+        a smaller run config failed with the class of failure
+        """
+
+        pruned_run_configs = self._get_pruned_run_configs()
+        pruned_run_configs.setdefault(run_config.models_name(), []).append(
+            [
+                run_config.model_variants_name(),
+                run_config.representation(),
+                failure_class,
+            ]
+        )
+
+        self._state_manager.set_state_variable(
+            "ResultManager.pruned_run_configs", pruned_run_configs
+        )
+
+    def get_pruned_run_configs(self, models_name: str) -> List[List[str]]:
+        """
+        Returns : list
+            The [model variants name, representation, failure class]
+            of every run config of the models that was pruned
+        """
+
+        return self._get_pruned_run_configs().get(models_name, [])
+
     def add_run_config_measurement(
         self, run_config: RunConfig, run_config_measurement: RunConfigMeasurement
     ) -> None:
@@ -129,6 +158,12 @@ def add_run_config_measurement(
         """
         model_name = run_config.models_name()
 
+        # Reduced fidelity measurements are checkpointed (so they are not
+        # repeated), but only full fidelity measurements are ranked and reported
+        if not run_config_measurement.is_full_fidelity():
+            self._add_rcm_to_results(run_config, run_config_measurement)
+            return
+
         run_config_result = RunConfigResult(
             model_name=model_name,
             run_config=run_config,
@@ -150,6 +185,38 @@ def add_run_config_measurement(
         self._per_model_sorted_results[model_name].add_result(run_config_result)
         self._across_model_sorted_results.add_result(run_config_result)
 
+    def add_run_config_measurement_repetition(
+        self, run_config: RunConfig, run_config_measurement: RunConfigMeasurement
+    ) -> Optional[RunConfigMeasurement]:
+        """
+        Adds a new measurement of an already measured RunConfig as a
+        repetition of its measurement, and re-ranks the results with
+        the mean of every repetition
+
+        Returns
+        -------
+        RunConfigMeasurement
+            The measurement holding every repetition, or None if
+            the RunConfig was not measured before
+        """
+        results = self._state_manager.get_state_variable("ResultManager.results")
+
+        measurement = results.get_model_variants_measurements_dict(
+            run_config.models_name(), run_config.model_variants_name()
+        ).get(run_config.representation())
+        if measurement is None:
+            return None
+
+        measurement.add_repetition(run_config_measurement)
+        self._add_rcm_to_results(run_config, measurement)
+
+        # The heaps hold copies of the measurements, ordered by their old values
+        self._per_model_sorted_results = defaultdict(SortedResults)
+        self._across_model_sorted_results = SortedResults()
+        self._add_results_to_heaps(suppress_warnings=True)
+
+        return measurement
+
     def get_model_configs_run_config_measurements(self, model_variants_name):
         """
         Unsorted list of RunConfigMeasurements for a config
@@ -228,6 +295,34 @@ def top_n_results(
 
         return top_results
 
+    def get_pareto_frontier(self, model_name: str) -> List[RunConfigMeasurement]:
+        """
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+
+        Returns
+        -------
+        list of RunConfigMeasurements
+            The measurements of the model that no other measurement beats
+            (or matches) in every objective, whether or not they pass the
+            constraints. The best measurement for any weighting of these
+            objectives is always one of them
+        """
+        measurements = [
+            measurement
+            for run_config_result in self.get_model_sorted_results(model_name).results()
+            for measurement in run_config_result.passing_measurements()
+            + run_config_result.failing_measurements()
+        ]
+
+        frontier = pareto_frontier(
+            [measurement.get_objective_values() for measurement in measurements]
+        )
+
+        return [measurements[index] for index in frontier]
+
     def get_result_statistics(self):
         """
         This function computes statistics
@@ -266,6 +361,15 @@ def _init_state(self):
 
         self._state_manager.set_state_variable("ResultManager.results", Results())
         self._state_manager.set_state_variable("ResultManager.server_only_data", {})
+        self._state_manager.set_state_variable("ResultManager.pruned_run_configs", {})
+
+    def _get_pruned_run_configs(self) -> Dict[str, List[List[str]]]:
+        pruned_run_configs = self._state_manager.get_state_variable(
+            "ResultManager.pruned_run_configs"
+        )
+
+        # Checkpoints written before pruning existed do not have the variable
+        return pruned_run_configs if pruned_run_configs else {}
 
     def _complete_setup(self):
         # The Report subcommand can init, but nothing needs to be done
@@ -325,6 +429,7 @@ def _setup_for_concurrent_profile(self):
             self._concurrent_profile_model_name: RunConfigResultComparator(
                 metric_objectives_list=model_objectives_list,
                 model_weights=model_weighting_list,
+                confidence_level=self._config.statistical_measurement_confidence_level,
             )
         }
 
@@ -337,6 +442,7 @@ def _setup_for_sequential_profile(self):
             model.model_name(): RunConfigResultComparator(
                 metric_objectives_list=[model.objectives()],
                 model_weights=[model.weighting()],
+                confidence_level=self._config.statistical_measurement_confidence_level,
             )
             for model in self._config.profile_models
         }
@@ -381,6 +487,14 @@ def _add_results_to_heaps(self, suppress_warnings=False):
                 continue
 
             for run_config, run_config_measurements in model_measurements.values():
+                run_config_measurements = {
+                    key: run_config_measurement
+                    for key, run_config_measurement in run_config_measurements.items()
+                    if run_config_measurement.is_full_fidelity()
+                }
+                if not run_config_measurements:
+                    continue
+
                 run_config_result = RunConfigResult(
                     model_name=model_name,
                     run_config=run_config,
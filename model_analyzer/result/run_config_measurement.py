@@ -3,17 +3,27 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import math
 from copy import deepcopy
 from functools import total_ordering
-from typing import Any, Dict, List, Optional
+from statistics import mean
+from typing import Any, Dict, List, Optional, Tuple
 
 from model_analyzer.constants import COMPARISON_SCORE_THRESHOLD, LOGGER_NAME
-from model_analyzer.record.record import Record, RecordType
+from model_analyzer.record.gpu_record import IncreasingGPURecord
+from model_analyzer.record.latency_histogram import LatencyHistogram
+from model_analyzer.record.record import IncreasingRecord, Record, RecordType
+from model_analyzer.result.confidence_interval import confidence_interval_half_width
 from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.result.model_config_measurement import ModelConfigMeasurement
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# (tags, values, timestamps, device UUIDs) of the GPU metrics collected on a single GPU
+PackedGPUData = Tuple[
+    Tuple[str, ...], Tuple[Any, ...], Tuple[int, ...], Tuple[Optional[str], ...]
+]
+
 
 @total_ordering
 class RunConfigMeasurement:
@@ -35,21 +45,48 @@ def __init__(
         """
         self._model_variants_name = model_variants_name
 
-        self._gpu_data = gpu_data
+        self._gpu_data: Optional[Dict[int, List[Record]]] = gpu_data
+
+        # GPU data restored from a checkpoint is kept per GPU UUID as compact
+        # (tags, values, timestamps, device UUIDs) tuples until the Records
+        # are first needed
+        self._packed_gpu_data: Optional[Dict[int, PackedGPUData]] = None
+
         # Note: "_avg_gpu_data" is a historical name. This actually contains
         # aggregated GPU metrics: memory metrics are SUMMED, while utilization
         # and power metrics are AVERAGED across GPUs.
-        self._avg_gpu_data = self._average_list(list(self._gpu_data.values()))
-        self._avg_gpu_data_from_tag = self._get_avg_gpu_data_from_tag()
+        #
+        # Both aggregates are computed on first access and cached
+        self._avg_gpu_data: Optional[List[Record]] = None
+        self._avg_gpu_data_from_tag: Optional[Dict[str, Record]] = None
 
         self._model_config_measurements: List[ModelConfigMeasurement] = []
         self._model_config_weights: List[float] = []
         self._constraint_manager: Optional[ConstraintManager] = None
 
+        # Fraction of the full PA measurement window this was measured with
+        self._fidelity = 1.0
+
+        # The non-GPU metric values (per model config, keyed by tag) of every
+        # repetition of this measurement. Empty until it is first repeated
+        self._samples: List[List[Dict[str, float]]] = []
+
     def to_dict(self):
-        rcm_dict = deepcopy(self.__dict__)
-        del rcm_dict["_model_config_weights"]
-        del rcm_dict["_constraint_manager"]
+        rcm_dict = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key
+            not in [
+                "_gpu_data",
+                "_packed_gpu_data",
+                "_avg_gpu_data",
+                "_avg_gpu_data_from_tag",
+                "_model_config_weights",
+                "_constraint_manager",
+            ]
+        }
+        rcm_dict = deepcopy(rcm_dict)
+        rcm_dict["_gpu_data"] = self._serialize_gpu_data()
 
         return rcm_dict
 
@@ -61,18 +98,11 @@ def from_dict(cls, run_config_measurement_dict: Dict) -> "RunConfigMeasurement":
             "_model_variants_name"
         ]
 
-        run_config_measurement._gpu_data = cls._deserialize_gpu_data(
+        run_config_measurement._gpu_data = None
+        run_config_measurement._packed_gpu_data = cls._pack_gpu_data(
             run_config_measurement, run_config_measurement_dict["_gpu_data"]
         )
 
-        run_config_measurement._avg_gpu_data = cls._average_list(
-            run_config_measurement, list(run_config_measurement._gpu_data.values())
-        )
-
-        run_config_measurement._avg_gpu_data_from_tag = cls._get_avg_gpu_data_from_tag(
-            run_config_measurement
-        )
-
         run_config_measurement._model_config_measurements = (
             cls._deserialize_model_config_measurements(
                 run_config_measurement,
@@ -80,6 +110,15 @@ def from_dict(cls, run_config_measurement_dict: Dict) -> "RunConfigMeasurement":
             )
         )
 
+        # Checkpoints written before fidelity was tracked only hold full measurements
+        run_config_measurement._fidelity = run_config_measurement_dict.get(
+            "_fidelity", 1.0
+        )
+
+        run_config_measurement._samples = run_config_measurement_dict.get(
+            "_samples", []
+        )
+
         return run_config_measurement
 
     def set_model_config_weighting(self, model_config_weights: List[int]) -> None:
@@ -113,6 +152,7 @@ def add_model_config_measurement(
         model_config_name: str,
         model_specific_pa_params: Dict[str, int],
         non_gpu_data: List[Record],
+        latency_histogram: Optional[LatencyHistogram] = None,
     ) -> None:
         """
         Adds a measurement from a single model config in this PA's run
@@ -125,10 +165,15 @@ def add_model_config_measurement(
         non_gpu_data : list of Records
             Metrics that do not have a GPU UUID associated with them,
             from either CPU or PA
+        latency_histogram : LatencyHistogram
+            The full latency distribution, if it was captured
         """
         self._model_config_measurements.append(
             ModelConfigMeasurement(
-                model_config_name, model_specific_pa_params, non_gpu_data
+                model_config_name,
+                model_specific_pa_params,
+                non_gpu_data,
+                latency_histogram,
             )
         )
 
@@ -147,6 +192,164 @@ def set_metric_weightings(self, metric_objectives: List[Dict[str, int]]) -> None
         for index, measurement in enumerate(self._model_config_measurements):
             measurement.set_metric_weighting(metric_objectives[index])
 
+    def set_fidelity(self, fidelity: float) -> None:
+        """
+        Parameters
+        ----------
+        fidelity: float
+            Fraction (0, 1] of the full PA measurement window
+            this measurement was collected with
+        """
+        self._fidelity = fidelity
+
+    def fidelity(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Fraction of the full PA measurement window
+            this measurement was collected with
+        """
+        return self._fidelity
+
+    def is_full_fidelity(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if this measurement used the full PA
+            measurement window, and can therefore be reported
+        """
+        return self._fidelity >= 1.0
+
+    def add_repetition(self, repetition: "RunConfigMeasurement") -> None:
+        """
+        Adds another measurement of the same RunConfig as a repetition of
+        this one. The non-GPU metrics become the mean of every repetition,
+        while the GPU metrics and latency distributions of the first
+        measurement are kept
+
+        Parameters
+        ----------
+        repetition: RunConfigMeasurement
+            The new measurement of this measurement's RunConfig
+        """
+        if not self._samples:
+            self._samples = [self._get_non_gpu_metric_values()]
+
+        self._samples.append(repetition._get_non_gpu_metric_values())
+
+        for index, model_config_measurement in enumerate(
+            self._model_config_measurements
+        ):
+            model_config_measurement.set_metric_values(
+                {
+                    tag: mean([sample[index][tag] for sample in self._samples])
+                    for tag in model_config_measurement.get_metric_values()
+                    if all(tag in sample[index] for sample in self._samples)
+                }
+            )
+
+    def repetition_count(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of times this measurement's RunConfig was measured
+        """
+        return max(len(self._samples), 1)
+
+    def get_samples(self) -> List[List[Dict[str, float]]]:
+        """
+        Returns
+        -------
+        list:
+            of per repetition list:
+                of per model dicts of non-GPU metric values, keyed by tag
+        """
+        return self._samples if self._samples else [self._get_non_gpu_metric_values()]
+
+    def get_objective_samples(self) -> List[float]:
+        """
+        Returns
+        -------
+        list of floats
+            The weighted objective of every repetition, where each objective
+            metric is relative to its mean, so that the samples have a mean
+            of 1 and their spread is a fraction of the objective
+        """
+        samples = self.get_samples()
+        model_config_weights = self._get_normalized_model_config_weights()
+
+        objective_samples = [0.0] * len(samples)
+        for index, model_config_measurement in enumerate(
+            self._model_config_measurements
+        ):
+            for tag, weight in model_config_measurement.get_metric_weights().items():
+                values = [sample[index].get(tag) for sample in samples]
+                if None in values or not mean(values):
+                    continue
+
+                metric_mean = mean(values)
+                for sample_index, value in enumerate(values):
+                    objective_samples[sample_index] += (
+                        model_config_weights[index] * weight * value / metric_mean
+                    )
+
+        return objective_samples
+
+    def get_objective_confidence_interval(self, confidence_level: float) -> float:
+        """
+        Parameters
+        ----------
+        confidence_level: float
+            The probability (0, 1) that the interval contains the true mean
+
+        Returns
+        -------
+        float
+            The half width of the confidence interval on the mean of the
+            weighted objective, as a fraction of the mean, or inf if this
+            measurement was not repeated
+        """
+        return confidence_interval_half_width(
+            self.get_objective_samples(), confidence_level
+        )
+
+    def is_statistically_tied(
+        self, other: "RunConfigMeasurement", confidence_level: float
+    ) -> bool:
+        """
+        Checks whether the difference between the weighted objectives of two
+        measurements is within their combined confidence intervals, so that
+        neither is better beyond the noise of its repetitions
+
+        A measurement that was not repeated has no interval, so two
+        measurements that were never repeated are never tied
+
+        Parameters
+        ----------
+        other: RunConfigMeasurement
+        confidence_level: float
+            The probability (0, 1) that each interval contains the true mean
+        """
+        half_widths = [
+            (
+                measurement.get_objective_confidence_interval(confidence_level)
+                if measurement.repetition_count() > 1
+                else 0.0
+            )
+            for measurement in [self, other]
+        ]
+        if not any(half_widths):
+            return False
+
+        weighted_rcm_score = self._calculate_weighted_rcm_score(
+            self._calculate_weighted_mcm_score(other)
+        )
+
+        return abs(weighted_rcm_score) <= math.hypot(*half_widths)
+
     def model_variants_name(self) -> Optional[str]:
         """
         Returns: str
@@ -174,8 +377,10 @@ def data(self) -> Dict[str, List[Record]]:
             for both GPU and non-GPU
         """
 
+        avg_gpu_data = self._get_avg_gpu_data()
+
         return {
-            mcm.model_name(): self._avg_gpu_data + mcm.non_gpu_data()
+            mcm.model_name(): avg_gpu_data + mcm.non_gpu_data()
             for mcm in self._model_config_measurements
         }
 
@@ -187,6 +392,9 @@ def gpu_data(self) -> Dict[int, List[Record]]:
             GPU specific measurements
         """
 
+        if self._gpu_data is None:
+            self._gpu_data = self._unpack_gpu_data()
+
         return self._gpu_data
 
     def non_gpu_data(self) -> List[List[Record]]:
@@ -220,8 +428,10 @@ def get_gpu_metric(self, tag: str) -> Optional[Record]:
             of aggregated GPU metric Records corresponding to this tag,
             or None if tag not found
         """
-        if tag in self._avg_gpu_data_from_tag:
-            return self._avg_gpu_data_from_tag[tag]
+        avg_gpu_data_from_tag = self._get_avg_gpu_data_from_tag()
+
+        if tag in avg_gpu_data_from_tag:
+            return avg_gpu_data_from_tag[tag]
         else:
             logger.warning(
                 f"No GPU metric corresponding to tag '{tag}' "
@@ -251,6 +461,24 @@ def get_non_gpu_metric(self, tag: str) -> List[Record]:
             for model_config_measurement in self._model_config_measurements
         ]
 
+    def get_latency_percentile(self, percentile: float) -> List[Optional[float]]:
+        """
+        Parameters
+        ----------
+        percentile : float
+            Any percentile in the range [0, 100]
+
+        Returns
+        -------
+        list:
+            of per model latencies (in ms) at the given percentile,
+            or None if the model's latency distribution was not captured
+        """
+        return [
+            model_config_measurement.get_latency_percentile(percentile)
+            for model_config_measurement in self._model_config_measurements
+        ]
+
     def get_weighted_non_gpu_metric(self, tag: str) -> List[Record]:
         """
         Parameters
@@ -360,7 +588,10 @@ def gpus_used(self) -> List[int]:
             list of device IDs used in this measurement
         """
 
-        return list(self._gpu_data.keys())
+        if self._gpu_data is None and self._packed_gpu_data is not None:
+            return list(self._packed_gpu_data.keys())
+
+        return list(self.gpu_data().keys())
 
     def model_specific_pa_params(self) -> List[Dict[str, int]]:
         """
@@ -377,6 +608,32 @@ def model_specific_pa_params(self) -> List[Dict[str, int]]:
             for model_config_measurement in self._model_config_measurements
         ]
 
+    def get_objective_values(self) -> List[float]:
+        """
+        Returns
+        -------
+        list of floats
+            The objective values of every ModelConfig measurement, negated
+            when a lower value is better, so that every objective is
+            maximized. GPU objectives are the aggregate across all GPUs,
+            and missing metrics are reported as -inf
+        """
+        objective_values = []
+        for model_config_measurement in self._model_config_measurements:
+            for tag in model_config_measurement.get_metric_weights():
+                metric = model_config_measurement.get_metric(tag)
+                if metric is None:
+                    metric = self.get_gpu_metric(tag)
+
+                if metric is None:
+                    objective_values.append(float("-inf"))
+                elif isinstance(metric, (IncreasingRecord, IncreasingGPURecord)):
+                    objective_values.append(metric.value())
+                else:
+                    objective_values.append(-metric.value())
+
+        return objective_values
+
     def is_better_than(self, other: "RunConfigMeasurement") -> bool:
         """
         Checks whether a measurement is better than another
@@ -543,6 +800,23 @@ def _compare_measurements(self, other: "RunConfigMeasurement") -> int:
             return -1
         return 0
 
+    def _get_non_gpu_metric_values(self) -> List[Dict[str, float]]:
+        return [
+            model_config_measurement.get_metric_values()
+            for model_config_measurement in self._model_config_measurements
+        ]
+
+    def _get_normalized_model_config_weights(self) -> List[float]:
+        # Measurements restored from a checkpoint have no weights until they are set
+        if len(self._model_config_weights) != len(self._model_config_measurements):
+            return [1 / len(self._model_config_measurements)] * len(
+                self._model_config_measurements
+            )
+
+        total_weight = sum(self._model_config_weights)
+
+        return [weight / total_weight for weight in self._model_config_weights]
+
     def _calculate_weighted_mcm_score(
         self, other: "RunConfigMeasurement"
     ) -> List[float]:
@@ -636,22 +910,93 @@ def _average_list(self, row_list):
                     agg[i] = summed_record / N
             return agg
 
-    def _deserialize_gpu_data(
-        self, serialized_gpu_data: Dict
-    ) -> Dict[int, List[Record]]:
-        gpu_data = {}
+    def _pack_gpu_data(self, serialized_gpu_data: Dict) -> Dict[int, PackedGPUData]:
+        packed_gpu_data = {}
         for gpu_uuid, gpu_data_list in serialized_gpu_data.items():
+            tags = tuple(tag for [tag, _] in gpu_data_list)
+            values = tuple(
+                record_dict.get("_value", 0) for [_, record_dict] in gpu_data_list
+            )
+            timestamps = tuple(
+                record_dict.get("_timestamp", 0) for [_, record_dict] in gpu_data_list
+            )
+            device_uuids = tuple(
+                record_dict.get("_device_uuid") for [_, record_dict] in gpu_data_list
+            )
+            packed_gpu_data[gpu_uuid] = (tags, values, timestamps, device_uuids)
+
+        return packed_gpu_data
+
+    def _unpack_gpu_data(self) -> Dict[int, List[Record]]:
+        gpu_data: Dict[int, List[Record]] = {}
+        if self._packed_gpu_data is None:
+            return gpu_data
+
+        for gpu_uuid, (
+            tags,
+            values,
+            timestamps,
+            device_uuids,
+        ) in self._packed_gpu_data.items():
             metric_list = []
-            for [tag, record_dict] in gpu_data_list:
+            for tag, value, timestamp, device_uuid in zip(
+                tags, values, timestamps, device_uuids
+            ):
                 record_type = RecordType.get(tag)
-                record = record_type.from_dict(record_dict)
+                record = record_type.from_dict(
+                    {
+                        "_value": value,
+                        "_timestamp": timestamp,
+                        "_device_uuid": device_uuid,
+                    }
+                )
                 metric_list.append(record)
             gpu_data[gpu_uuid] = metric_list
 
+        # The Records are the source of truth from now on
+        self._packed_gpu_data = None
+
         return gpu_data
 
+    def _serialize_gpu_data(self) -> Dict:
+        if self._gpu_data is None and self._packed_gpu_data is not None:
+            return {
+                gpu_uuid: [
+                    [
+                        tag,
+                        {
+                            "_value": value,
+                            "_timestamp": timestamp,
+                            "_device_uuid": device_uuid,
+                        },
+                    ]
+                    for tag, value, timestamp, device_uuid in zip(
+                        tags, values, timestamps, device_uuids
+                    )
+                ]
+                for gpu_uuid, (
+                    tags,
+                    values,
+                    timestamps,
+                    device_uuids,
+                ) in self._packed_gpu_data.items()
+            }
+
+        return deepcopy(self.gpu_data())
+
+    def _get_avg_gpu_data(self) -> List[Record]:
+        if self._avg_gpu_data is None:
+            self._avg_gpu_data = self._average_list(list(self.gpu_data().values()))
+
+        return self._avg_gpu_data
+
     def _get_avg_gpu_data_from_tag(self) -> Dict[str, Record]:
-        return {metric.tag: metric for metric in self._avg_gpu_data}
+        if self._avg_gpu_data_from_tag is None:
+            self._avg_gpu_data_from_tag = {
+                metric.tag: metric for metric in self._get_avg_gpu_data()
+            }
+
+        return self._avg_gpu_data_from_tag
 
     def _deserialize_model_config_measurements(
         self, serialized_model_config_measurements: List[Dict]
@@ -198,6 +198,27 @@ def top_n_measurements(self, n):
             for passing_measurement in reversed(self._passing_measurements[-n:])
         ]
 
+    def is_statistically_tied(self, other):
+        """
+        Checks whether neither this RunConfigResult nor the other
+        is better beyond the confidence intervals of their
+        repeated measurements
+        """
+
+        return self._comparator.is_statistically_tied(self, other)
+
+    def lower_confidence_bound(self, reference):
+        """
+        Returns
+        -------
+        float
+            The lower bound of the confidence interval on the objective
+            of this RunConfigResult's best measurement, relative to
+            the objective of the reference RunConfigResult
+        """
+
+        return self._comparator.get_lower_confidence_bound(self, reference)
+
     def __lt__(self, other):
         """
         Checks whether this RunConfigResult is better
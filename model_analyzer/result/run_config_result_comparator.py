@@ -16,6 +16,10 @@
 
 from typing import Dict, List
 
+from model_analyzer.config.input.config_defaults import (
+    DEFAULT_STATISTICAL_MEASUREMENT_CONFIDENCE_LEVEL,
+)
+
 
 class RunConfigResultComparator:
     """
@@ -23,7 +27,10 @@ class RunConfigResultComparator:
     """
 
     def __init__(
-        self, metric_objectives_list: List[Dict[str, int]], model_weights: List[int]
+        self,
+        metric_objectives_list: List[Dict[str, int]],
+        model_weights: List[int],
+        confidence_level: float = DEFAULT_STATISTICAL_MEASUREMENT_CONFIDENCE_LEVEL,
     ):
         """
         Parameters
@@ -32,8 +39,13 @@ def __init__(
             metric_objectives : dict of RecordTypes
                 keys are the metric types, and values are The relative importance
                 of the keys with respect to other. If the values are 0,
+        confidence_level: float
+            The confidence level of the intervals used to decide
+            whether repeated measurements are statistically tied
         """
 
+        self._confidence_level = confidence_level
+
         # Normalize metric weights
         self._metric_weights = []
         self._model_weights = []
@@ -79,6 +91,58 @@ def is_better_than(self, run_config_result1, run_config_result2):
 
         return agg_run_config_measurement1.is_better_than(agg_run_config_measurement2)
 
+    def is_statistically_tied(self, run_config_result1, run_config_result2):
+        """
+        Checks whether the aggregated measurements of two RunConfigResults
+        are within the confidence intervals of their repetitions
+
+        Parameters
+        ----------
+        run_config_result1 : RunConfigResult
+            first result to be compared
+        run_config_result2 : RunConfigResult
+            second result to be compared
+
+        Returns
+        -------
+        bool
+           True: if neither result is better beyond the noise of its measurements
+        """
+
+        agg_run_config_measurement1 = self._aggregate_run_config_measurements(
+            run_config_result1, aggregation_func=max
+        )
+        agg_run_config_measurement2 = self._aggregate_run_config_measurements(
+            run_config_result2, aggregation_func=max
+        )
+
+        return agg_run_config_measurement1.is_statistically_tied(
+            agg_run_config_measurement2, self._confidence_level
+        )
+
+    def get_lower_confidence_bound(self, run_config_result, reference_result):
+        """
+        Returns the lower bound of the confidence interval on the objective of
+        the RunConfigResult's aggregated measurement, relative to the objective
+        of the reference result's (so that 0 is the reference's mean). A
+        measurement that was not repeated is bounded by its mean
+        """
+
+        measurement = self._aggregate_run_config_measurements(
+            run_config_result, aggregation_func=max
+        )
+        reference_measurement = self._aggregate_run_config_measurements(
+            reference_result, aggregation_func=max
+        )
+
+        half_width = (
+            measurement.get_objective_confidence_interval(self._confidence_level)
+            if measurement.repetition_count() > 1
+            else 0.0
+        )
+
+        return -measurement.compare_measurements(reference_measurement) - half_width
+
     def _aggregate_run_config_measurements(self, run_config_result, aggregation_func):
         """
         Returns
@@ -42,7 +42,7 @@ def results(self) -> List[RunConfigResult]:
         All the results
         """
 
-        self._run_config_results.sort()
+        self._sort()
         return self._run_config_results
 
     def add_result(self, run_config_result: RunConfigResult) -> None:
@@ -94,6 +94,32 @@ def top_n_results(self, n: int) -> List[RunConfigResult]:
         else:
             return self._get_top_n_results(passing_results, n)
 
+    def _sort(self) -> None:
+        """
+        Ranks the results by the mean of their measurements. Each run of
+        adjacent results that are statistically tied (within the confidence
+        intervals of their repeated measurements) is then ranked by the lower
+        bound of their intervals, so that the result whose objective is
+        most certainly good comes first
+        """
+        self._run_config_results.sort()
+
+        results = self._run_config_results
+        start = 0
+        for end in range(1, len(results) + 1):
+            if end < len(results) and results[end - 1].is_statistically_tied(
+                results[end]
+            ):
+                continue
+
+            if end - start > 1:
+                results[start:end] = sorted(
+                    results[start:end],
+                    key=lambda result: result.lower_confidence_bound(results[start]),
+                    reverse=True,
+                )
+            start = end
+
     def _find_existing_run_config_result(
         self, run_config_result: RunConfigResult
     ) -> Optional[RunConfigResult]:
@@ -123,7 +149,7 @@ def _add_new_run_config_result(self, run_config_result: RunConfigResult) -> None
         self._run_config_results.append(new_run_config_result)
 
     def _create_passing_and_failing_lists(self):
-        self._run_config_results.sort()
+        self._sort()
 
         passing = []
         failing = []
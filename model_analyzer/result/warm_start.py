@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import glob
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from model_analyzer.config.generate.generator_utils import GeneratorUtils
+from model_analyzer.config.input.objects.config_model_profile_spec import (
+    ConfigModelProfileSpec,
+)
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+from model_analyzer.result.results import Results
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class WarmStart:
+    """
+    Loads the results of a previously profiled, similar model from a
+    checkpoint, so that the search of the models being profiled can
+    start from that model's best configurations
+    """
+
+    def __init__(
+        self, checkpoint_path: str, models: List[ConfigModelProfileSpec]
+    ) -> None:
+        """
+        Parameters
+        ----------
+        checkpoint_path: str
+            A checkpoint file, or a checkpoint directory (in which
+            case its latest checkpoint is used)
+        models: List of ConfigModelProfileSpec
+            The models being profiled
+        """
+        self._models = models
+
+        results = self._load_results(checkpoint_path)
+        self._source_models_name = self._find_source_models_name(results)
+
+        self._run_configs_and_measurements = []
+        if self._source_models_name:
+            for run_config, measurements in results.get_model_measurements_dict(
+                self._source_models_name
+            ).values():
+                for measurement in measurements.values():
+                    self._run_configs_and_measurements.append((run_config, measurement))
+
+            logger.info(
+                f"Warm starting the search from the results of {self._source_models_name}"
+            )
+        else:
+            logger.info(
+                f"No results of a similar model found in {checkpoint_path}, "
+                "starting the search without a warm start"
+            )
+
+    def source_models_name(self) -> Optional[str]:
+        """
+        Returns the name of the model(s) whose results warm start the
+        search, or None if the checkpoint holds no similar model
+        """
+        return self._source_models_name
+
+    def measurement_count(self) -> int:
+        """
+        Returns the number of measurements the search of the
+        source model(s) took (without a warm start)
+        """
+        return len(self._run_configs_and_measurements)
+
+    def get_best_configs(self, count: int) -> List[List[Dict[str, Any]]]:
+        """
+        Returns the parameters of the best (up to count) configurations
+        of the source model(s), best first, ranked with the objectives
+        of the models being profiled
+
+        Each configuration is a list with one dict per model (in profiling
+        order), whose keys are search parameter names (max_batch_size,
+        instance_group, batch_sizes, concurrency, request_rate and the
+        batching search parameters)
+        """
+        objectives = [model.objectives() for model in self._models]
+        weightings = [model.weighting() for model in self._models]
+
+        best_per_variant: Dict[str, RunConfigMeasurement] = {}
+        run_configs: Dict[str, RunConfig] = {}
+        for run_config, measurement in self._run_configs_and_measurements:
+            if not measurement.is_full_fidelity():
+                continue
+
+            measurement.set_metric_weightings(objectives)
+            measurement.set_model_config_weighting(weightings)
+
+            variant = run_config.model_variants_name()
+            if variant not in best_per_variant or measurement.is_better_than(
+                best_per_variant[variant]
+            ):
+                best_per_variant[variant] = measurement
+                run_configs[variant] = run_config
+
+        ranked_variants = sorted(
+            best_per_variant, key=lambda variant: best_per_variant[variant]
+        )
+
+        return [
+            self._get_config_parameters(run_configs[variant], best_per_variant[variant])
+            for variant in reversed(ranked_variants[-count:])
+        ]
+
+    def log_measurements_saved(self, measurement_count: int) -> None:
+        """
+        Logs how many measurements the warm started search took,
+        compared to the search of the source model(s)
+        """
+        if not self._source_models_name:
+            return
+
+        cold_start_count = self.measurement_count()
+        saved_count = cold_start_count - measurement_count
+
+        logger.info(
+            f"Warm started search took {measurement_count} measurements, "
+            f"compared to {cold_start_count} for {self._source_models_name} "
+            f"({saved_count} saved)"
+        )
+
+    def _get_config_parameters(
+        self, run_config: RunConfig, measurement: RunConfigMeasurement
+    ) -> List[Dict[str, Any]]:
+        config_parameters = []
+        for model_run_config, pa_params in zip(
+            run_config.model_run_configs(), measurement.model_specific_pa_params()
+        ):
+            model_config = model_run_config.model_config()
+            model_config_dict = model_config.get_config() if model_config else {}
+
+            parameters = GeneratorUtils.get_batching_parameters(model_config_dict)
+            if model_config_dict.get("max_batch_size"):
+                parameters["max_batch_size"] = model_config_dict["max_batch_size"]
+
+            instance_groups = model_config_dict.get("instance_group")
+            if instance_groups:
+                parameters["instance_group"] = instance_groups[0].get("count")
+
+            parameters["batch_sizes"] = self._get_number(pa_params.get("batch-size"))
+            parameters["concurrency"] = self._get_number(
+                pa_params.get("concurrency-range")
+            )
+            parameters["request_rate"] = self._get_number(
+                pa_params.get("request-rate-range")
+            )
+
+            config_parameters.append(
+                {name: value for name, value in parameters.items() if value is not None}
+            )
+
+        return config_parameters
+
+    def _get_number(self, value: Any) -> Optional[int]:
+        """
+        Returns the value as an int, or None if it is
+        not a single number (e.g. a range)
+        """
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _find_source_models_name(self, results: Results) -> Optional[str]:
+        """
+        Returns the most recently profiled model(s) in the results
+        that profiled as many models concurrently as are being profiled
+        now, other than the models being profiled themselves
+        """
+        models_name = ",".join([model.model_name() for model in self._models])
+
+        candidates = [
+            candidate
+            for candidate in results.get_list_of_models()
+            if candidate != models_name
+            and len(candidate.split(",")) == len(self._models)
+        ]
+
+        return candidates[-1] if candidates else None
+
+    def _load_results(self, checkpoint_path: str) -> Results:
+        if os.path.isdir(checkpoint_path):
+            checkpoint_files = glob.glob(os.path.join(checkpoint_path, "*.ckpt"))
+            if not checkpoint_files:
+                raise TritonModelAnalyzerException(
+                    f"No checkpoint file found in {checkpoint_path}"
+                )
+
+            checkpoint_path = max(
+                checkpoint_files,
+                key=lambda f: int(os.path.split(f)[1].split(".")[0]),
+            )
+
+        try:
+            with open(checkpoint_path, "r") as f:
+                state_dict = json.load(f)
+        except (OSError, ValueError) as e:
+            raise TritonModelAnalyzerException(
+                f"Unable to load warm start checkpoint {checkpoint_path}: {e}"
+            )
+
+        return Results.from_dict(state_dict["ResultManager.results"])
@@ -56,6 +56,11 @@ def from_dict(cls, state_dict):
                 metric_list.append(record)
             state._state_dict["ResultManager.server_only_data"][gpu_uuid] = metric_list
 
+        # Run configs pruned because a smaller one failed
+        state._state_dict["ResultManager.pruned_run_configs"] = state_dict.get(
+            "ResultManager.pruned_run_configs", {}
+        )
+
         # GPU data
         state._state_dict["MetricsManager.gpus"] = state_dict["MetricsManager.gpus"]
 
@@ -64,6 +69,11 @@ def from_dict(cls, state_dict):
             "OptunaRunConfigGenerator.seed", 0
         )
 
+        # Optuna trial log
+        state._state_dict["OptunaRunConfigGenerator.trials"] = state_dict.get(
+            "OptunaRunConfigGenerator.trials", {}
+        )
+
         return state
 
     def get(self, name):
@@ -30,6 +30,8 @@ class TritonClient:
     TritonClientFactory
     """
 
+    _last_error = ""
+
     def wait_for_server_ready(
         self,
         num_retries,
@@ -110,6 +112,7 @@ def load_model(self, model_name, variant_name="", config_str=None):
             return None
         except Exception as e:
             logger.info(f"Model {variant_name} load failed: {e}")
+            self._last_error = str(e)
             if "polling is enabled" in e.message():
                 raise TritonModelAnalyzerException(
                     "The remote Tritonserver needs to be launched in EXPLICIT mode"
@@ -186,8 +189,20 @@ def wait_for_model_ready(self, model_name, num_retries, sleep_time=1):
                 retries -= 1
 
         logger.info(f"Model readiness failed for model {model_name}. Error {error}")
+        self._last_error = str(error)
         return -1
 
+    def last_error(self):
+        """
+        Returns
+        -------
+        str
+            The error of the last failed load or
+            readiness request to the server
+        """
+
+        return self._last_error
+
     def get_model_config(self, model_name, num_retries):
         """
         Model name to get the config for.
@@ -388,6 +388,38 @@ def construct_run_config_measurement(
     return rc_measurement
 
 
+def construct_repeated_run_config_measurement(
+    model_config_name, throughputs, model_specific_pa_params=None
+):
+    """
+    Constructs a single model RunConfigMeasurement whose throughput
+    objective was measured once per throughput (the first measurement
+    is repeated with the rest)
+    """
+    run_config_measurement = None
+    for throughput in throughputs:
+        repetition = construct_run_config_measurement(
+            model_name=model_config_name.partition("_config_")[0],
+            model_config_names=[model_config_name],
+            model_specific_pa_params=[
+                model_specific_pa_params or {"batch_size": 1, "concurrency": 1}
+            ],
+            gpu_metric_values={},
+            non_gpu_metric_values=[
+                {"perf_throughput": throughput, "perf_latency_p99": 20}
+            ],
+            metric_objectives=[{"perf_throughput": 1}],
+            model_config_weights=[1],
+        )
+
+        if run_config_measurement is None:
+            run_config_measurement = repetition
+        else:
+            run_config_measurement.add_repetition(repetition)
+
+    return run_config_measurement
+
+
 def construct_run_config_result(
     avg_gpu_metric_values,
     avg_non_gpu_metric_values_list,
@@ -35,12 +35,20 @@ def get_test_options():
         #   (bool, MA step, long_option)
         OptionStruct("bool", "profile", "--override-output-model-repository"),
         OptionStruct("bool", "profile", "--collect-cpu-metrics"),
+        OptionStruct("bool", "profile", "--collect-latency-histogram"),
+        OptionStruct("bool", "profile", "--optuna-multi-objective"),
         OptionStruct("bool", "profile", "--perf-output"),
         OptionStruct("bool", "profile", "--run-config-search-disable"),
         OptionStruct(
             "bool", "profile", "--run-config-profile-models-concurrently-enable"
         ),
         OptionStruct("bool", "profile", "--request-rate-search-enable"),
+        OptionStruct("bool", "profile", "--request-rate-prediction-enable"),
+        OptionStruct("bool", "profile", "--brute-search-minimize-restarts"),
+        OptionStruct("bool", "profile", "--brute-search-dominance-pruning-enable"),
+        OptionStruct("bool", "profile", "--gpu-memory-prediction-enable"),
+        OptionStruct("bool", "profile", "--failure-pruning-enable"),
+        OptionStruct("bool", "profile", "--statistical-measurement-enable"),
         OptionStruct("bool", "profile", "--reload-model-disable"),
         OptionStruct("bool", "profile", "--early-exit-enable"),
         OptionStruct("bool", "profile", "--skip-summary-reports"),
@@ -78,6 +86,22 @@ def get_test_options():
             "100",
             "8192",
         ),
+        OptionStruct(
+            "float",
+            "profile",
+            "--run-config-search-min-request-trace-scale",
+            None,
+            "0.5",
+            "1.0",
+        ),
+        OptionStruct(
+            "float",
+            "profile",
+            "--run-config-search-max-request-trace-scale",
+            None,
+            "16.0",
+            "64.0",
+        ),
         OptionStruct(
             "int",
             "profile",
@@ -116,9 +140,80 @@ def get_test_options():
         ),
         OptionStruct("int", "profile", "--optuna-min-trials", None, "10", "20"),
         OptionStruct("int", "profile", "--optuna-max-trials", None, "5", "200"),
+        OptionStruct(
+            "int", "profile", "--statistical-measurement-candidates", None, "5", "3"
+        ),
+        OptionStruct(
+            "int", "profile", "--statistical-measurement-budget", None, "20", "10"
+        ),
+        OptionStruct(
+            "float",
+            "profile",
+            "--statistical-measurement-ci-threshold",
+            None,
+            "0.1",
+            "0.05",
+        ),
+        OptionStruct(
+            "float",
+            "profile",
+            "--statistical-measurement-confidence-level",
+            None,
+            "0.99",
+            "0.95",
+        ),
         OptionStruct(
             "int", "profile", "--optuna-early-exit-threshold", None, "5", "10"
         ),
+        OptionStruct("int", "profile", "--optuna-fidelity-levels", None, "3", "1"),
+        OptionStruct(
+            "int", "profile", "--optuna-fidelity-reduction-factor", None, "2", "3"
+        ),
+        OptionStruct(
+            "string",
+            "profile",
+            "--optuna-warm-start-study",
+            None,
+            "model_A",
+            None,
+            None,
+        ),
+        OptionStruct(
+            "string",
+            "profile",
+            "--warm-start-checkpoint",
+            None,
+            "./checkpoints/0.ckpt",
+            None,
+            None,
+        ),
+        OptionStruct(
+            "string",
+            "profile",
+            "--request-trace",
+            None,
+            "./requests.csv",
+            None,
+            None,
+        ),
+        OptionStruct(
+            "string",
+            "profile",
+            "--request-trace-timestamp-field",
+            None,
+            "arrival_time",
+            "timestamp",
+            None,
+        ),
+        OptionStruct(
+            "string",
+            "profile",
+            "--request-trace-timestamp-unit",
+            None,
+            ["s", "ms", "us"],
+            "s",
+            "SHOULD_FAIL",
+        ),
         OptionStruct("float", "profile", "--monitoring-interval", "-i", "10.0", "1.0"),
         OptionStruct(
             "float",
@@ -128,6 +223,12 @@ def get_test_options():
             "10.0",
             str(psutil.cpu_count() * 80.0),
         ),
+        OptionStruct(
+            "float", "profile", "--goodput-time-to-first-token-slo", None, "200.0", None
+        ),
+        OptionStruct(
+            "float", "profile", "--goodput-inter-token-latency-slo", None, "20.0", None
+        ),
         OptionStruct("int", "profile", "--num-configs-per-model", None, "10", "3"),
         OptionStruct("int", "profile", "--num-top-model-configs", None, "10", "0"),
         OptionStruct("int", "profile", "--latency-budget", None, "200", None),
@@ -178,6 +279,15 @@ def get_test_options():
             None,
         ),
         OptionStruct("string", "profile", "--perf-output-path", None, ".", None, None),
+        OptionStruct(
+            "string",
+            "profile",
+            "--perf-analyzer-artifact-directory",
+            None,
+            "./test_dir",
+            None,
+            None,
+        ),
         OptionStruct(
             "string",
             "profile",
@@ -315,6 +425,34 @@ def get_test_options():
             "brute",
             "SHOULD_FAIL",
         ),
+        OptionStruct("bool", "profile", "--quick-search-coordinate-descent-enable"),
+        OptionStruct(
+            "string",
+            "profile",
+            "--quick-search-surrogate",
+            None,
+            ["quadratic", "none"],
+            "none",
+            "SHOULD_FAIL",
+        ),
+        OptionStruct(
+            "string",
+            "profile",
+            "--parameter-search-mode",
+            None,
+            ["knee", "sweep"],
+            "sweep",
+            "SHOULD_FAIL",
+        ),
+        OptionStruct(
+            "string",
+            "profile",
+            "--perf-analyzer-artifact-retention",
+            None,
+            ["failed", "all"],
+            "none",
+            "SHOULD_FAIL",
+        ),
         OptionStruct(
             "string",
             "profile",
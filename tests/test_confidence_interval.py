@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import unittest
+from unittest.mock import patch
+
+from model_analyzer.result.confidence_interval import (
+    confidence_interval_half_width,
+    student_t_quantile,
+)
+
+from .common import test_result_collector as trc
+
+
+class TestConfidenceInterval(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_student_t_quantile(self):
+        """
+        Test the quantiles against the t table
+        """
+        t_table = [
+            (0.975, 1, 12.706),
+            (0.975, 2, 4.303),
+            (0.975, 3, 3.182),
+            (0.975, 5, 2.571),
+            (0.975, 30, 2.042),
+            (0.95, 4, 2.132),
+            (0.995, 10, 3.169),
+        ]
+        for probability, degrees_of_freedom, quantile in t_table:
+            self.assertAlmostEqual(
+                student_t_quantile(probability, degrees_of_freedom),
+                quantile,
+                delta=quantile * 0.01,
+            )
+
+    def test_confidence_interval_half_width(self):
+        """
+        Test the half width is scaled by the standard error,
+        and is infinite with fewer than two samples
+        """
+        self.assertEqual(confidence_interval_half_width([], 0.95), math.inf)
+        self.assertEqual(confidence_interval_half_width([10], 0.95), math.inf)
+        self.assertEqual(confidence_interval_half_width([10, 10, 10], 0.95), 0)
+
+        # Sample variance of 16 / 5, over 6 samples
+        self.assertAlmostEqual(
+            confidence_interval_half_width([8, 10, 12, 8, 10, 12], 0.95),
+            student_t_quantile(0.975, 5) * math.sqrt(16 / 5 / 6),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1982,7 +1982,8 @@ def test_copy(self):
 
     def test_multi_model_search_mode(self):
         """
-        Test that multi-model is only run in quick/optuna
+        Test that multi-model is only run in quick/optuna, or in brute
+        when server restarts are minimized
         """
         args = [
             "model-analyzer",
@@ -2007,6 +2008,11 @@ def test_multi_model_search_mode(self):
         with self.assertRaises(TritonModelAnalyzerException):
             self._evaluate_config(new_args, yaml_content, subcommand="profile")
 
+        # Brute minimizing server restarts should pass
+        new_args.append("--brute-search-minimize-restarts")
+
+        self._evaluate_config(new_args, yaml_content, subcommand="profile")
+
         # Quick should pass
         new_args = list(args)
         new_args.append("--run-config-search-mode")
@@ -2369,6 +2375,70 @@ def test_mixing_request_rate_and_concurrency(self):
         with self.assertRaises(TritonModelAnalyzerException):
             self._evaluate_config(args, yaml_content, subcommand="profile")
 
+    def test_request_trace_conflicts(self):
+        """
+        Test that a request trace cannot be combined with concurrency
+        or request rate options, or with a search mode other than brute,
+        and that its scale must be greater than 0
+        """
+        base_args = [
+            "model-analyzer",
+            "profile",
+            "--model-repository",
+            "cli-repository",
+            "--profile-models",
+            "modelA",
+            "--request-trace",
+            "requests.csv",
+        ]
+        yaml_content = ""
+
+        config = self._evaluate_config(base_args, yaml_content)
+        self.assertTrue(config.is_request_trace_specified())
+
+        self._test_request_rate_config_conflicts(base_args, yaml_content)
+        self._test_arg_conflict(base_args, yaml_content, ["--concurrency", "1,2"])
+        self._test_arg_conflict(
+            base_args, yaml_content, ["--run-config-search-max-concurrency", "4"]
+        )
+        self._test_arg_conflict(
+            base_args, yaml_content, ["--run-config-search-mode", "quick"]
+        )
+        self._test_arg_conflict(
+            base_args,
+            yaml_content,
+            ["--run-config-search-min-request-trace-scale", "-0.5"],
+        )
+
+    def test_statistical_measurement_settings(self):
+        """
+        Test that the statistical measurement settings are checked
+        when statistical measurement is enabled
+        """
+        base_args = [
+            "model-analyzer",
+            "profile",
+            "--model-repository",
+            "cli-repository",
+            "--profile-models",
+            "modelA",
+            "--statistical-measurement-enable",
+        ]
+        yaml_content = ""
+
+        config = self._evaluate_config(base_args, yaml_content)
+        self.assertTrue(config.statistical_measurement_enable)
+
+        self._test_arg_conflict(
+            base_args, yaml_content, ["--statistical-measurement-confidence-level", "1"]
+        )
+        self._test_arg_conflict(
+            base_args, yaml_content, ["--statistical-measurement-ci-threshold", "-0.05"]
+        )
+        self._test_arg_conflict(
+            base_args, yaml_content, ["--statistical-measurement-candidates", "-1"]
+        )
+
     def test_model_type_llm(self):
         """
         Test that model type of LLM chooses the correct inference outputs
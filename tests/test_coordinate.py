@@ -16,6 +16,8 @@
 
 from copy import deepcopy
 
+import numpy as np
+
 from model_analyzer.config.generate.coordinate import Coordinate
 
 from .common import test_result_collector as trc
@@ -92,6 +94,27 @@ def test_multiplication(self):
         self.assertEqual(c1[0], 14)
         self.assertEqual(c1[1], 12)
 
+    def test_float_assignment(self):
+        c1 = Coordinate([1, 2])
+        c1[1] = 0.5
+
+        self.assertEqual(c1[1], 0.5)
+        self.assertEqual(c1, Coordinate([1, 0.5]))
+
+    def test_array_conversion(self):
+        c1 = Coordinate([2, 4])
+
+        array = np.asarray(c1)
+        np.testing.assert_array_equal(array, [2, 4])
+
+        # Confirm c1 unchanged by array update
+        array[0] = 5
+        self.assertEqual(c1, Coordinate([2, 4]))
+
+        c2 = Coordinate(np.array([3, 1]))
+        self.assertEqual(c2, Coordinate([3, 1]))
+        self.assertEqual(type(c2[0]), int)
+
     def test_round(self):
         c1 = Coordinate([0.1, 4.6, 3.9])
         c1.round()
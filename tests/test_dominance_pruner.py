@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.config.generate.dominance_pruner import DominancePruner
+
+from .common import test_result_collector as trc
+from .common.test_utils import construct_run_config_measurement
+
+
+class TestDominancePruner(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_larger_value_is_dominated(self):
+        """
+        Test that once a larger instance count lowers the throughput at
+        every load, even larger instance counts are dominated
+        """
+        pruner = DominancePruner("my-model")
+        pruner.add_results(self._make_config(1, 8), self._make_measurements([10, 20]))
+        pruner.add_results(self._make_config(2, 8), self._make_measurements([8, 15]))
+
+        self.assertEqual(
+            pruner.find_dominating_parameter(self._make_config(3, 8)),
+            "instance_group.0.count",
+        )
+        self.assertIsNone(pruner.find_dominating_parameter(self._make_config(2, 8)))
+
+        # Only configs with every other parameter unchanged are dominated
+        self.assertIsNone(pruner.find_dominating_parameter(self._make_config(3, 16)))
+
+    def test_higher_throughput_at_any_load(self):
+        """
+        Test that a larger value is not dominating if it
+        increased the throughput at any of the loads
+        """
+        pruner = DominancePruner("my-model")
+        pruner.add_results(self._make_config(1, 8), self._make_measurements([10, 20]))
+        pruner.add_results(self._make_config(2, 8), self._make_measurements([8, 25]))
+
+        self.assertIsNone(pruner.find_dominating_parameter(self._make_config(3, 8)))
+
+    def test_results_in_any_order(self):
+        """
+        Test that a bound is found when the larger value
+        is measured before the smaller one
+        """
+        pruner = DominancePruner("my-model")
+        pruner.add_results(self._make_config(1, 16), self._make_measurements([5, 6]))
+        pruner.add_results(self._make_config(1, 8), self._make_measurements([10, 20]))
+
+        self.assertEqual(
+            pruner.find_dominating_parameter(self._make_config(1, 32)),
+            "max_batch_size",
+        )
+
+    def test_failed_measurements(self):
+        """
+        Test that configs without measurements are not compared
+        """
+        pruner = DominancePruner("my-model")
+        pruner.add_results(self._make_config(1, 8), self._make_measurements([10]))
+        pruner.add_results(self._make_config(2, 8), [None])
+
+        self.assertIsNone(pruner.find_dominating_parameter(self._make_config(3, 8)))
+
+    def _make_config(self, instance_count, max_batch_size):
+        return {
+            "name": f"my-model_config_{instance_count}_{max_batch_size}",
+            "max_batch_size": max_batch_size,
+            "instance_group": [{"count": instance_count, "kind": "KIND_GPU"}],
+            "dynamic_batching": {"max_queue_delay_microseconds": "100"},
+        }
+
+    def _make_measurements(self, throughputs):
+        return [
+            construct_run_config_measurement(
+                model_name="my-model",
+                model_config_names=["my-model_config_0"],
+                model_specific_pa_params=[
+                    {"batch-size": 1, "concurrency-range": concurrency}
+                ],
+                gpu_metric_values=MagicMock(),
+                non_gpu_metric_values=[{"perf_throughput": throughput}],
+            )
+            for concurrency, throughput in enumerate(throughputs, start=1)
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.constants import (
+    FAILURE_LOAD_TIMEOUT,
+    FAILURE_OUT_OF_MEMORY,
+    FAILURE_PERF_ANALYZER_TIMEOUT,
+)
+from model_analyzer.result.failure_cache import FailureCache
+
+from .common import test_result_collector as trc
+
+
+class TestFailureCache(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_out_of_memory(self):
+        """
+        Test that an out of memory failure prunes every config with at
+        least as many instances, max batch size and client batch size
+        """
+        failure_cache = FailureCache(gpu_count=1)
+        failure_cache.add_failure(
+            self._make_run_config({"model_A": (2, 8, 1, 4)}), FAILURE_OUT_OF_MEMORY
+        )
+
+        self.assertEqual(
+            failure_cache.find_failure(
+                self._make_run_config({"model_A": (4, 8, 2, 1)})
+            ),
+            (FAILURE_OUT_OF_MEMORY, "model_A_2_8_1_4"),
+        )
+        self.assertIsNone(
+            failure_cache.find_failure(
+                self._make_run_config({"model_A": (1, 16, 1, 4)})
+            )
+        )
+        self.assertIsNone(
+            failure_cache.find_failure(self._make_run_config({"model_B": (4, 8, 1, 4)}))
+        )
+
+    def test_load_timeout_ignores_client_sizes(self):
+        """
+        Test that a load timeout prunes larger model configs
+        regardless of the client batch size and concurrency
+        """
+        failure_cache = FailureCache(gpu_count=1)
+        failure_cache.add_failure(
+            self._make_run_config({"model_A": (2, 8, 4, 16)}), FAILURE_LOAD_TIMEOUT
+        )
+
+        self.assertIsNotNone(
+            failure_cache.find_failure(self._make_run_config({"model_A": (2, 8, 1, 1)}))
+        )
+        self.assertIsNone(
+            failure_cache.find_failure(
+                self._make_run_config({"model_A": (2, 4, 4, 16)})
+            )
+        )
+
+    def test_perf_analyzer_failure_only_prunes_same_variant(self):
+        """
+        Test that a perf_analyzer timeout prunes higher loads of
+        the same variant, but not of a larger variant
+        """
+        failure_cache = FailureCache(gpu_count=1)
+        failure_cache.add_failure(
+            self._make_run_config({"model_A": (1, 8, 1, 64)}),
+            FAILURE_PERF_ANALYZER_TIMEOUT,
+        )
+
+        self.assertIsNotNone(
+            failure_cache.find_failure(
+                self._make_run_config({"model_A": (1, 8, 1, 128)})
+            )
+        )
+        self.assertIsNone(
+            failure_cache.find_failure(
+                self._make_run_config({"model_A": (1, 8, 1, 32)})
+            )
+        )
+        self.assertIsNone(
+            failure_cache.find_failure(
+                self._make_run_config({"model_A": (2, 8, 1, 128)})
+            )
+        )
+
+    def test_other_model_config_fields_must_match(self):
+        """
+        Test that configs differing in fields other than the
+        compared sizes are not pruned
+        """
+        failure_cache = FailureCache(gpu_count=1)
+        failure_cache.add_failure(
+            self._make_run_config({"model_A": (1, 8, 1, 1)}), FAILURE_OUT_OF_MEMORY
+        )
+
+        self.assertIsNone(
+            failure_cache.find_failure(
+                self._make_run_config({"model_A": (2, 8, 1, 1)}, dynamic_batching=True)
+            )
+        )
+
+    def test_multi_model(self):
+        """
+        Test that a multi-model config is only pruned when
+        every model is at least as large as in the failed config
+        """
+        failure_cache = FailureCache(gpu_count=1)
+        failure_cache.add_failure(
+            self._make_run_config({"model_A": (2, 1, 1, 1), "model_B": (2, 1, 1, 1)}),
+            FAILURE_OUT_OF_MEMORY,
+        )
+
+        self.assertIsNotNone(
+            failure_cache.find_failure(
+                self._make_run_config(
+                    {"model_A": (3, 1, 1, 1), "model_B": (2, 1, 1, 1)}
+                )
+            )
+        )
+        self.assertIsNone(
+            failure_cache.find_failure(
+                self._make_run_config(
+                    {"model_A": (3, 1, 1, 1), "model_B": (1, 1, 1, 1)}
+                )
+            )
+        )
+        self.assertIsNone(
+            failure_cache.find_failure(self._make_run_config({"model_A": (3, 1, 1, 1)}))
+        )
+
+    def _make_run_config(self, models, dynamic_batching=False):
+        model_run_configs = []
+        for model_name, (
+            instances,
+            max_batch_size,
+            batch_size,
+            concurrency,
+        ) in models.items():
+            model_run_config = MagicMock()
+            model_run_config.model_name.return_value = model_name
+            model_run_config.model_variant_name.return_value = (
+                f"{model_name}_config_{instances}_{max_batch_size}"
+            )
+            model_run_config.perf_config.return_value = {
+                "batch-size": batch_size,
+                "concurrency-range": concurrency,
+                "request-rate-range": None,
+            }
+
+            model_config = model_run_config.model_config.return_value
+            model_config.instance_group_count.return_value = instances
+            model_config.max_batch_size.return_value = max_batch_size
+            model_config.get_config.side_effect = partial(
+                self._make_model_config_dict,
+                model_name,
+                max_batch_size,
+                instances,
+                dynamic_batching,
+            )
+            model_run_configs.append(model_run_config)
+
+        run_config = MagicMock()
+        run_config.model_run_configs.return_value = model_run_configs
+        run_config.is_ensemble_model.return_value = False
+        run_config.is_bls_model.return_value = False
+        run_config.representation.return_value = "_".join(
+            f"{model_name}_{'_'.join(str(size) for size in sizes)}"
+            for model_name, sizes in models.items()
+        )
+
+        return run_config
+
+    def _make_model_config_dict(
+        self, model_name, max_batch_size, instances, dynamic_batching
+    ):
+        model_config = {
+            "name": model_name,
+            "max_batch_size": max_batch_size,
+            "instance_group": [{"count": instances, "kind": "KIND_GPU"}],
+        }
+        if dynamic_batching:
+            model_config["dynamic_batching"] = {}
+
+        return model_config
+
+
+if __name__ == "__main__":
+    unittest.main()
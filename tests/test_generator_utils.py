@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from itertools import islice
+from unittest.mock import patch
+
+from model_analyzer.config.generate.generator_utils import GeneratorUtils
+
+from .common import test_result_collector as trc
+
+
+class TestGeneratorUtils(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_generate_combinations(self):
+        """
+        Test that nested dicts and lists are expanded into
+        every combination of their sweep choices
+        """
+        model_config_params = {
+            "instance_group": [[{"kind": ["KIND_GPU"], "count": [1, 2]}]],
+            "dynamic_batching": [{"max_queue_delay_microseconds": [100, 200]}],
+        }
+
+        expected_combinations = [
+            {
+                "instance_group": [{"kind": "KIND_GPU", "count": count}],
+                "dynamic_batching": {"max_queue_delay_microseconds": delay},
+            }
+            for count in [1, 2]
+            for delay in [100, 200]
+        ]
+
+        self.assertEqual(
+            GeneratorUtils.generate_combinations(model_config_params),
+            expected_combinations,
+        )
+        self.assertEqual(
+            list(GeneratorUtils.iterate_combinations(model_config_params)),
+            expected_combinations,
+        )
+        self.assertEqual(GeneratorUtils.count_combinations(model_config_params), 4)
+
+    def test_iterate_combinations_is_lazy(self):
+        """
+        Test that the first combinations of a huge search space
+        are produced without generating the whole space
+        """
+        model_config_params = {
+            f"parameter_{i}": [value for value in range(10)] for i in range(12)
+        }
+
+        self.assertEqual(
+            GeneratorUtils.count_combinations(model_config_params), 10**12
+        )
+
+        first_combinations = list(
+            islice(GeneratorUtils.iterate_combinations(model_config_params), 2)
+        )
+        self.assertEqual(
+            first_combinations[1],
+            {**{f"parameter_{i}": 0 for i in range(11)}, "parameter_11": 1},
+        )
+
+    def test_batching_parameters(self):
+        """
+        Test that searched batching parameters are read from, removed
+        from and applied to nested model config parameters
+        """
+        model_config_parameters = {
+            "dynamic_batching": [
+                {
+                    "max_queue_delay_microseconds": [100, 200],
+                    "default_queue_policy": [{"max_queue_size": [8, 16]}],
+                }
+            ],
+        }
+        path = ["dynamic_batching", "default_queue_policy", "max_queue_size"]
+
+        self.assertEqual(
+            GeneratorUtils.get_model_config_parameter(model_config_parameters, path),
+            [8, 16],
+        )
+        self.assertIsNone(
+            GeneratorUtils.get_model_config_parameter(
+                model_config_parameters, ["response_cache", "enable"]
+            )
+        )
+
+        GeneratorUtils.remove_model_config_parameter(model_config_parameters, path)
+        self.assertIsNone(
+            GeneratorUtils.get_model_config_parameter(model_config_parameters, path)
+        )
+
+        param_combo = {"dynamic_batching": {"max_queue_delay_microseconds": 100}}
+        GeneratorUtils.apply_batching_parameters(
+            param_combo,
+            {"preferred_batch_size": 4, "priority_levels": 2, "response_cache": True},
+        )
+        self.assertEqual(
+            param_combo,
+            {
+                "dynamic_batching": {
+                    "max_queue_delay_microseconds": 100,
+                    "preferred_batch_size": [4],
+                    "priority_levels": 2,
+                    "default_priority_level": 2,
+                },
+                "response_cache": {"enable": True},
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.result.gpu_memory_predictor import GPUMemoryPredictor
+
+from .common import test_result_collector as trc
+from .common.test_utils import construct_run_config_measurement
+
+
+class TestGPUMemoryPredictor(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_predict_instances_and_batch_size(self):
+        """
+        Test that memory is predicted from the measured per-instance
+        and per-batch costs once both have been seen to vary
+        """
+        predictor = GPUMemoryPredictor(gpu_count=1, baseline=500)
+
+        # 100 MB per instance plus 10 MB per batch slot
+        for instances, max_batch_size in [(1, 1), (2, 1), (1, 8)]:
+            predictor.add_measurement(
+                self._make_run_config({"model_A": (instances, max_batch_size)}),
+                self._make_measurement(self._memory(instances, max_batch_size)),
+            )
+
+        self.assertAlmostEqual(
+            predictor.predict(self._make_run_config({"model_A": (4, 16)})),
+            self._memory(4, 16),
+        )
+
+    def test_no_prediction_outside_measured_span(self):
+        """
+        Test that batch sizes are not extrapolated when only
+        the instance count has been measured
+        """
+        predictor = GPUMemoryPredictor(gpu_count=1, baseline=500)
+
+        for instances in [1, 2]:
+            predictor.add_measurement(
+                self._make_run_config({"model_A": (instances, 4)}),
+                self._make_measurement(self._memory(instances, 4)),
+            )
+
+        self.assertAlmostEqual(
+            predictor.predict(self._make_run_config({"model_A": (3, 4)})),
+            self._memory(3, 4),
+        )
+        self.assertIsNone(predictor.predict(self._make_run_config({"model_A": (3, 8)})))
+        self.assertIsNone(predictor.predict(self._make_run_config({"model_B": (1, 4)})))
+
+    def test_multi_model(self):
+        """
+        Test that the costs of each model are fit separately
+        from run configs that load several models
+        """
+        predictor = GPUMemoryPredictor(gpu_count=1)
+
+        for instances_a, instances_b in [(1, 1), (2, 1), (1, 2)]:
+            predictor.add_measurement(
+                self._make_run_config(
+                    {"model_A": (instances_a, 1), "model_B": (instances_b, 1)}
+                ),
+                self._make_measurement(100 * instances_a + 300 * instances_b),
+            )
+
+        self.assertAlmostEqual(
+            predictor.predict(
+                self._make_run_config({"model_A": (3, 1), "model_B": (2, 1)})
+            ),
+            900,
+        )
+
+    def test_multiple_gpus(self):
+        """
+        Test that memory summed across GPUs is predicted per GPU,
+        to match the per GPU baseline and capacity
+        """
+        predictor = GPUMemoryPredictor(gpu_count=2, baseline=500)
+
+        # The instances are split evenly across both GPUs
+        for instances in [2, 4]:
+            predictor.add_measurement(
+                self._make_run_config({"model_A": (instances, 1)}),
+                self._make_measurement(self._memory(instances // 2, 1), gpu_count=2),
+            )
+
+        self.assertAlmostEqual(
+            predictor.predict(self._make_run_config({"model_A": (6, 1)})),
+            self._memory(3, 1),
+        )
+
+    def test_no_gpu_memory_measured(self):
+        """
+        Test that measurements without GPU memory are ignored
+        """
+        predictor = GPUMemoryPredictor(gpu_count=1)
+        predictor.add_measurement(
+            self._make_run_config({"model_A": (1, 1)}), self._make_measurement(0)
+        )
+
+        self.assertIsNone(predictor.predict(self._make_run_config({"model_A": (1, 1)})))
+
+    def _make_measurement(self, used_memory, gpu_count=1):
+        """
+        Returns a measurement where each GPU used the given memory (MB)
+        """
+        return construct_run_config_measurement(
+            model_name="model_A",
+            model_config_names=["model_A_config_0"],
+            model_specific_pa_params=[{"batch_size": 1, "concurrency": 1}],
+            gpu_metric_values={
+                str(gpu): {"gpu_used_memory": used_memory} for gpu in range(gpu_count)
+            },
+            non_gpu_metric_values=[{"perf_throughput": 100}],
+        )
+
+    def _memory(self, instances, max_batch_size):
+        return 500 + 100 * instances + 10 * instances * max_batch_size
+
+    def _make_run_config(self, models):
+        model_run_configs = []
+        for model_name, (instances, max_batch_size) in models.items():
+            model_run_config = MagicMock()
+            model_run_config.model_name.return_value = model_name
+            model_config = model_run_config.model_config.return_value
+            model_config.instance_group_count.return_value = instances
+            model_config.max_batch_size.return_value = max_batch_size
+            model_run_configs.append(model_run_config)
+
+        run_config = MagicMock()
+        run_config.model_run_configs.return_value = model_run_configs
+
+        return run_config
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import unittest
+from unittest.mock import mock_open, patch
+
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+from model_analyzer.perf_analyzer.profile_export_reader import ProfileExportReader
+from model_analyzer.record.latency_histogram import LatencyHistogram
+
+from .common import test_result_collector as trc
+
+
+class TestLatencyHistogram(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(histogram.total_count(), 0)
+        self.assertIsNone(histogram.percentile(99))
+        self.assertIsNone(histogram.mean())
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        histogram.record_all(range(1, 101))
+
+        self.assertEqual(histogram.percentile(50), 50)
+        self.assertEqual(histogram.percentile(99), 99)
+        self.assertEqual(histogram.percentile(100), 100)
+        self.assertEqual(histogram.min(), 1)
+        self.assertEqual(histogram.mean(), 50.5)
+
+    def test_percentile_accuracy(self):
+        random.seed(10)
+        latencies = [int(random.lognormvariate(9, 1)) for _ in range(10000)]
+
+        histogram = LatencyHistogram()
+        histogram.record_all(latencies)
+
+        latencies.sort()
+        for percentile in [50, 90, 99, 99.9]:
+            expected = latencies[int(len(latencies) * percentile / 100) - 1]
+            self.assertAlmostEqual(
+                histogram.percentile(percentile),
+                expected,
+                delta=expected / LatencyHistogram.SUB_BUCKET_COUNT,
+            )
+
+        self.assertEqual(histogram.percentile(100), latencies[-1])
+
+    def test_invalid_percentile(self):
+        with self.assertRaises(TritonModelAnalyzerException):
+            LatencyHistogram().percentile(101)
+
+    def test_merge(self):
+        histogram_a = LatencyHistogram()
+        histogram_a.record_all([10, 20, 30])
+        histogram_b = LatencyHistogram()
+        histogram_b.record_all([5, 5000])
+
+        histogram_a.merge(histogram_b)
+
+        self.assertEqual(histogram_a.total_count(), 5)
+        self.assertEqual(histogram_a.min(), 5)
+        self.assertEqual(histogram_a.max(), 5000)
+        self.assertEqual(histogram_a.percentile(60), 20)
+
+    def test_to_from_dict(self):
+        histogram = LatencyHistogram()
+        histogram.record_all([100, 2000, 300000, 300000])
+
+        histogram_dict = histogram.to_dict()
+        self.assertEqual(len(histogram_dict["counts"]), 3)
+
+        restored_histogram = LatencyHistogram.from_dict(histogram_dict)
+        for percentile in [0, 25, 50, 75, 100]:
+            self.assertEqual(
+                restored_histogram.percentile(percentile),
+                histogram.percentile(percentile),
+            )
+
+    def test_profile_export_reader(self):
+        """
+        Tests that requests split across read chunks are decoded
+        """
+        requests = [
+            f'{{"timestamp": {i * 1000}, "response_timestamps": [{i * 1000 + 5000}, {i * 1000 + i * 1000}]}}'
+            for i in range(1, 51)
+        ]
+        profile_export = (
+            '{"experiments": [{"experiment": {"mode": "concurrency", "value": 1}, '
+            f'"requests": [ {", ".join(requests)} ]}}, '
+            '{"experiment": {"mode": "concurrency", "value": 2}, '
+            '"requests": [{"timestamp": 0, "response_timestamps": []}]}]}'
+        )
+
+        reader = ProfileExportReader("profile_export.json")
+        reader.CHUNK_SIZE = 7
+
+        with patch(
+            "model_analyzer.perf_analyzer.profile_export_reader.open",
+            mock_open(read_data=profile_export),
+        ):
+            latencies = list(reader.request_latencies_us())
+
+        self.assertEqual(latencies, list(range(1, 51)))
+
+    def test_profile_export_reader_malformed(self):
+        with patch(
+            "model_analyzer.perf_analyzer.profile_export_reader.open",
+            mock_open(read_data='{"experiments": [{"requests": [{"timestamp": 1'),
+        ):
+            with self.assertRaises(TritonModelAnalyzerException):
+                list(ProfileExportReader("profile_export.json").requests())
+
+
+if __name__ == "__main__":
+    unittest.main()
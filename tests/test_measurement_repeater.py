@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from copy import deepcopy
+from unittest.mock import patch
+
+from model_analyzer.config.generate.measurement_repeater import MeasurementRepeater
+
+from .common import test_result_collector as trc
+from .common.test_utils import load_single_model_result_manager
+
+
+class TestMeasurementRepeater(trc.TestResultCollector):
+    def setUp(self):
+        self._result_manager, self._config = load_single_model_result_manager()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_repeats_top_candidates(self):
+        """
+        Test that each top candidate is measured again, and that
+        candidates within the threshold are not measured again
+        """
+        self._config.statistical_measurement_candidates = 2
+        measurement_repeater = MeasurementRepeater(
+            self._config, self._result_manager, "add_sub"
+        )
+
+        repeated_candidates = []
+        for run_config in measurement_repeater.get_configs():
+            repeated_candidates.append(self._get_candidate(run_config))
+
+            # An identical repetition leaves no uncertainty
+            measurement_repeater.set_last_results(
+                [self._add_repetition(run_config, throughput_scale=1)]
+            )
+
+        self.assertEqual(repeated_candidates, self._get_top_candidates(2))
+
+        measurement = self._result_manager.top_n_results("add_sub", n=1)[
+            0
+        ].passing_measurements()[0]
+        self.assertEqual(measurement.repetition_count(), 2)
+        self.assertEqual(measurement.get_objective_confidence_interval(0.95), 0)
+
+    def test_candidates_are_reranked(self):
+        """
+        Test that the candidates are re-ranked with the mean
+        of their repetitions after every repetition
+        """
+        self._config.statistical_measurement_candidates = 1
+        self._config.statistical_measurement_budget = 2
+        measurement_repeater = MeasurementRepeater(
+            self._config, self._result_manager, "add_sub"
+        )
+
+        best_candidate = self._get_top_candidates(1)[0]
+        repeated_candidates = []
+        for run_config in measurement_repeater.get_configs():
+            repeated_candidates.append(self._get_candidate(run_config))
+            measurement_repeater.set_last_results(
+                [self._add_repetition(run_config, throughput_scale=0.1)]
+            )
+
+            if len(repeated_candidates) == 1:
+                next_best_candidate = self._get_top_candidates(1)[0]
+
+        self.assertNotEqual(best_candidate, next_best_candidate)
+        self.assertEqual(repeated_candidates, [best_candidate, next_best_candidate])
+
+    def test_budget_and_failures(self):
+        """
+        Test that no more than the budget of repetitions are taken,
+        and that candidates whose repetition failed are skipped
+        """
+        self._config.statistical_measurement_candidates = 2
+        self._config.statistical_measurement_budget = 1
+        self.assertEqual(
+            len(
+                list(
+                    MeasurementRepeater(
+                        self._config, self._result_manager, "add_sub"
+                    ).get_configs()
+                )
+            ),
+            1,
+        )
+
+        self._config.statistical_measurement_budget = 10
+        measurement_repeater = MeasurementRepeater(
+            self._config, self._result_manager, "add_sub"
+        )
+
+        repeated_candidates = []
+        for run_config in measurement_repeater.get_configs():
+            repeated_candidates.append(self._get_candidate(run_config))
+            measurement_repeater.set_last_results([None])
+
+        self.assertEqual(repeated_candidates, self._get_top_candidates(2))
+
+    def _get_top_candidates(self, n):
+        """
+        Returns the variant and perf analyzer parameters of
+        the best measurement of each of the top n results
+        """
+        return [
+            (
+                result.run_config().model_variants_name(),
+                self._get_set_parameters(
+                    result.passing_measurements()[0].model_specific_pa_params()
+                ),
+            )
+            for result in self._result_manager.top_n_results("add_sub", n=n)
+        ]
+
+    def _get_candidate(self, run_config):
+        return (
+            run_config.model_variants_name(),
+            self._get_set_parameters(
+                [
+                    model_run_config.perf_config().extract_model_specific_parameters()
+                    for model_run_config in run_config.model_run_configs()
+                ]
+            ),
+        )
+
+    def _get_set_parameters(self, pa_params):
+        # Older checkpoints do not hold the parameters that are not set
+        return [
+            {key: value for key, value in params.items() if value is not None}
+            for params in pa_params
+        ]
+
+    def _add_repetition(self, run_config, throughput_scale):
+        measurement = (
+            self._result_manager.get_results()
+            .get_model_variants_measurements_dict(
+                "add_sub", run_config.model_variants_name()
+            )
+            .get(run_config.representation())
+        )
+        self.assertIsNotNone(measurement)
+
+        repetition = deepcopy(measurement)
+        for model_config_measurement in repetition._model_config_measurements:
+            model_config_measurement.set_metric_values(
+                {
+                    "perf_throughput": model_config_measurement.get_metric_value(
+                        "perf_throughput"
+                    )
+                    * throughput_scale
+                }
+            )
+
+        return self._result_manager.add_run_config_measurement_repetition(
+            run_config, repetition
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
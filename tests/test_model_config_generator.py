@@ -1140,6 +1140,46 @@ def test_early_exit_on_automatic(self):
                 yaml_str, expected_configs, early_exit_enable=True
             )
 
+    def test_dominance_pruning_automatic(self):
+        """
+        Test that once a larger instance count lowers the throughput of
+        every max batch size, larger instance counts are skipped
+        """
+        yaml_str = """
+            profile_models:
+                - my-model
+            run_config_search_max_instance_count: 3
+            run_config_search_max_model_batch_size: 8
+            brute_search_dominance_pruning_enable: true
+            """
+
+        expected_configs = [
+            {
+                "max_batch_size": max_batch_size,
+                "instance_group": [{"count": count, "kind": "KIND_GPU"}],
+                "dynamic_batching": {},
+            }
+            for count in [1, 2]
+            for max_batch_size in [1, 2, 4, 8]
+        ]
+
+        with patch.object(
+            TestModelConfigGenerator, "_get_next_fake_throughput"
+        ) as mock_method:
+            mock_method.side_effect = [
+                2,
+                4,
+                8,
+                16,  # 1 instance
+                1,
+                2,
+                4,
+                8,  # 2 instances. Lower at every max batch size
+            ]
+            self._run_and_test_model_config_generator(
+                yaml_str, expected_configs, early_exit_enable=True
+            )
+
     def test_early_exit_off_manual(self):
         """
         Test that manual mode will not early exit despite throughput plateauing despite because early_exit_enable=False
@@ -1315,7 +1355,7 @@ def _get_next_fake_results(self):
         measurement = construct_run_config_measurement(
             model_name=MagicMock(),
             model_config_names=["test_model_config_name"],
-            model_specific_pa_params=MagicMock(),
+            model_specific_pa_params=[{"batch-size": 1, "concurrency-range": 1}],
             gpu_metric_values=MagicMock(),
             non_gpu_metric_values=[{"perf_throughput": throughput}],
         )
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 from typing import List
 from unittest.mock import MagicMock, patch
 
@@ -140,7 +141,7 @@ def test_create_neighborhood(self):
         expected_coordinates = [Coordinate(x) for x in expected_neighborhood]
 
         self.assertEqual(
-            self._sort_coordinates(n._neighborhood),
+            self._sort_coordinates(n._get_neighborhood_coordinates()),
             self._sort_coordinates(expected_coordinates),
         )
 
@@ -171,6 +172,92 @@ def test_large_neighborhood(self):
 
         self.assertEqual(2328, len(n._neighborhood))
 
+    def test_active_dimensions(self):
+        """
+        Test that the neighborhood only steps in the active
+        dimensions, holding every other dimension at home
+        """
+        dims = SearchDimensions()
+        dims.add_dimensions(
+            0,
+            [
+                SearchDimension("a1", SearchDimension.DIMENSION_TYPE_LINEAR),
+                SearchDimension("b1", SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            ],
+        )
+        dims.add_dimensions(
+            1,
+            [
+                SearchDimension("a2", SearchDimension.DIMENSION_TYPE_LINEAR),
+                SearchDimension("b2", SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            ],
+        )
+        nc = NeighborhoodConfig(
+            dims, radius=1, min_initialized=3, active_dimensions=[2, 3]
+        )
+        n = Neighborhood(
+            nc,
+            home_coordinate=Coordinate([1, 1, 1, 1]),
+            coordinate_data=CoordinateData(),
+        )
+
+        expected_neighborhood = [
+            [1, 1, 0, 1],
+            [1, 1, 1, 0],
+            [1, 1, 1, 1],
+            [1, 1, 1, 2],
+            [1, 1, 2, 1],
+        ]
+        expected_coordinates = [Coordinate(x) for x in expected_neighborhood]
+
+        self.assertEqual(
+            self._sort_coordinates(n._get_neighborhood_coordinates()),
+            self._sort_coordinates(expected_coordinates),
+        )
+        self.assertEqual(
+            self._sort_coordinates(n._get_all_adjacent_neighbors()),
+            self._sort_coordinates(
+                [c for c in expected_coordinates if c != Coordinate([1, 1, 1, 1])]
+            ),
+        )
+
+    def test_offset_table_is_shared(self):
+        """
+        Test that the table of step vectors is only computed once per
+        number of dimensions and radius, and can't be modified
+        """
+        dims = SearchDimensions()
+        dims.add_dimensions(
+            0,
+            [
+                SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+                SearchDimension("bar", SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            ],
+        )
+        nc = NeighborhoodConfig(dims, radius=2, min_initialized=3)
+
+        with patch.object(
+            Neighborhood,
+            "_offset_tables",
+            {},
+        ), patch.object(
+            Neighborhood,
+            "_get_potential_steps",
+            wraps=Neighborhood._get_potential_steps,
+        ) as mock_get_potential_steps:
+            n1 = Neighborhood(nc, Coordinate([0, 0]), CoordinateData())
+            n2 = Neighborhood(nc, Coordinate([3, 3]), CoordinateData())
+            Neighborhood._get_offset_table(2, 3)
+
+            self.assertEqual(mock_get_potential_steps.call_count, 2)
+            self.assertEqual(len(n1._neighborhood), 6)
+            self.assertEqual(len(n2._neighborhood), 13)
+
+            offsets = Neighborhood._get_offset_table(2, 2)
+            self.assertEqual(offsets.shape, (13, 2))
+            with self.assertRaises(ValueError):
+                offsets[0, 0] = 1
+
     def test_num_initialized(self):
         dims = SearchDimensions()
         dims.add_dimensions(
@@ -829,6 +916,128 @@ def test_all_same_throughputs(self):
         new_coord = n.determine_new_home()
         self.assertEqual(new_coord, Coordinate([1, 1, 1]))
 
+    def test_surrogate_determine_new_home(self):
+        """
+        Test that the quadratic surrogate steps to the unmeasured coordinate
+        it predicts to be best, and never outside of the bounding box of the
+        measured coordinates
+        """
+        dims = SearchDimensions()
+        dims.add_dimensions(
+            0,
+            [
+                SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+                SearchDimension("bar", SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            ],
+        )
+
+        nc = NeighborhoodConfig(
+            dims, radius=2, min_initialized=3, surrogate="quadratic"
+        )
+        cd = CoordinateData()
+        n = Neighborhood(nc, home_coordinate=Coordinate([1, 1]), coordinate_data=cd)
+
+        rcm0 = self._construct_rcm(throughput=1, latency=5)
+        rcm1 = self._construct_rcm(throughput=3, latency=5)
+        rcm2 = self._construct_rcm(throughput=3, latency=5)
+
+        cd.set_measurement(Coordinate([1, 1]), rcm0)  # home coordinate
+        cd.set_measurement(Coordinate([2, 1]), rcm1)
+        cd.set_measurement(Coordinate([1, 2]), rcm2)
+
+        # Both dimensions increase the measurement, so [2,2] is predicted
+        # to be better than either measured neighbor. [3,3] is outside of
+        # the measured bounding box, so it isn't considered
+        new_coord = n.determine_new_home()
+        self.assertEqual(new_coord, Coordinate([2, 2]))
+
+    def test_surrogate_stays_home(self):
+        """
+        Test that the quadratic surrogate stays at home when
+        no coordinate is expected to beat it
+        """
+        dims = SearchDimensions()
+        dims.add_dimensions(
+            0,
+            [
+                SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+                SearchDimension("bar", SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            ],
+        )
+
+        nc = NeighborhoodConfig(
+            dims, radius=2, min_initialized=3, surrogate="quadratic"
+        )
+        cd = CoordinateData()
+        n = Neighborhood(nc, home_coordinate=Coordinate([1, 1]), coordinate_data=cd)
+
+        rcm0 = self._construct_rcm(throughput=10, latency=5)
+        rcm1 = self._construct_rcm(throughput=5, latency=5)
+        rcm2 = self._construct_rcm(throughput=5, latency=5)
+        rcm3 = self._construct_rcm(throughput=5, latency=5)
+        rcm4 = self._construct_rcm(throughput=5, latency=5)
+
+        cd.set_measurement(Coordinate([1, 1]), rcm0)  # home coordinate
+        cd.set_measurement(Coordinate([0, 1]), rcm1)
+        cd.set_measurement(Coordinate([2, 1]), rcm2)
+        cd.set_measurement(Coordinate([1, 0]), rcm3)
+        cd.set_measurement(Coordinate([1, 2]), rcm4)
+
+        new_coord = n.determine_new_home()
+        self.assertEqual(new_coord, Coordinate([1, 1]))
+
+    def test_fit_quadratic_surrogate(self):
+        """
+        Test that the surrogate fit recovers the coefficients of a
+        quadratic, up to the shrinkage from the ridge penalty
+        """
+        dims = SearchDimensions()
+        dims.add_dimensions(
+            0,
+            [
+                SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+                SearchDimension("bar", SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            ],
+        )
+        nc = NeighborhoodConfig(dims, radius=2, min_initialized=3)
+        n = Neighborhood(nc, Coordinate([0, 0]), CoordinateData())
+
+        # score = 1 + 2x - y + 0.5y^2
+        vectors = [Coordinate([x, y]) for x in range(-2, 3) for y in range(-2, 3)]
+        scores = [1 + 2 * v[0] - v[1] + 0.5 * v[1] * v[1] for v in vectors]
+
+        coefficients = n._fit_quadratic_surrogate(vectors, scores)
+
+        # [c, b_foo, b_bar, a_foo, a_bar]
+        self.assertEqual(len(coefficients), 5)
+        for actual, expected in zip(coefficients, [1, 2, -1, 0, 0.5]):
+            self.assertAlmostEqual(actual, expected, delta=0.05)
+
+    def test_fit_quadratic_surrogate_degenerate(self):
+        """
+        Test that the surrogate fit stays finite when the measured
+        vectors do not span the features, and predicts a flat model
+        """
+        dims = SearchDimensions()
+        dims.add_dimensions(
+            0,
+            [
+                SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+                SearchDimension("bar", SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            ],
+        )
+        nc = NeighborhoodConfig(dims, radius=2, min_initialized=3)
+        n = Neighborhood(nc, Coordinate([0, 0]), CoordinateData())
+
+        coefficients = n._fit_quadratic_surrogate(
+            [Coordinate([0, 0]), Coordinate([0, 0])], [0.0, 0.0]
+        )
+
+        self.assertTrue(all(math.isfinite(c) for c in coefficients))
+        self.assertAlmostEqual(
+            n._predict_quadratic_surrogate(coefficients, Coordinate([1, 1])), 0
+        )
+
     def test_translate_step_vector(self):
         """
         Test the functionality of translate_step_vector()
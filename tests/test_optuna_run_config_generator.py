@@ -17,6 +17,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import optuna
+
 from model_analyzer.config.generate.model_profile_spec import ModelProfileSpec
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
@@ -61,25 +63,7 @@ def setUp(self):
             ]
 
         config = self._create_config(additional_args=["--use-concurrency-formula"])
-        mock_model_config = MockModelConfig("max_batch_size: 8")
-        mock_model_config.start()
-        model = ModelProfileSpec(
-            config.profile_models[0], config, MagicMock(), MagicMock()
-        )
-        search_parameters = SearchParameters(model=model, config=config)
-        mock_model_config.stop()
-
-        self._rcg = OptunaRunConfigGenerator(
-            config=config,
-            state_manager=MagicMock(),
-            gpu_count=1,
-            models=self._mock_models,
-            composing_models=[],
-            model_variant_name_manager=ModelVariantNameManager(),
-            search_parameters={"add_sub": search_parameters},
-            composing_search_parameters={},
-            user_seed=100,
-        )
+        self._rcg = self._create_rcg(config)
 
     def test_max_number_of_configs_to_search_percentage(self):
         """
@@ -498,6 +482,252 @@ def test_create_run_multi_model_config(self):
         self.assertEqual(vgg_perf_config["batch-size"], DEFAULT_BATCH_SIZES)
         self.assertEqual(vgg_perf_config["concurrency-range"], 16)
 
+    def test_successive_halving(self):
+        """
+        Test that trials are measured at increasing fidelities and
+        only the best of each level are promoted
+        """
+        config = self._create_config(
+            additional_args=[
+                "--optuna-max-trials",
+                "9",
+                "--optuna-fidelity-levels",
+                "3",
+            ]
+        )
+        self._rcg._config = config
+
+        # The score of a trial is its instance count + max batch size
+        scores = {}
+
+        def score_run_config(run_config):
+            model_config = run_config.model_run_configs()[0].model_config()
+            return (
+                model_config.instance_group_count(system_gpu_count=1)
+                + model_config.max_batch_size()
+            )
+
+        run_configs = []
+        with patch.object(
+            self._rcg,
+            "_calculate_score",
+            side_effect=lambda: scores[run_configs[-1].representation()],
+        ):
+            for run_config in self._rcg.get_configs():
+                run_configs.append(run_config)
+                scores[run_config.representation()] = score_run_config(run_config)
+                self._rcg.set_last_results([MagicMock()])
+
+        fidelities = [run_config.fidelity() for run_config in run_configs]
+        self.assertEqual(fidelities, [1] + [1 / 9] * 9 + [1 / 3] * 3 + [1])
+
+        # Measurements are shortened to match the fidelity
+        self.assertEqual(
+            run_configs[1]
+            .model_run_configs()[0]
+            .perf_config()["measurement-request-count"],
+            5,
+        )
+
+        # The top third of each level is promoted
+        first_level_scores = sorted(
+            [score_run_config(rc) for rc in run_configs[1:10]], reverse=True
+        )
+        second_level_scores = [score_run_config(rc) for rc in run_configs[10:13]]
+        self.assertEqual(
+            sorted(second_level_scores, reverse=True), first_level_scores[:3]
+        )
+        self.assertEqual(score_run_config(run_configs[13]), max(second_level_scores))
+
+        # Every trial is told to Optuna exactly once
+        self.assertEqual(len(self._rcg._study.trials), 9)
+        self.assertTrue(
+            all(trial.value is not None for trial in self._rcg._study.trials)
+        )
+
+    def test_resume_from_trial_log(self):
+        """
+        Test that trials told to Optuna are logged into the checkpoint,
+        and that a resumed study is rebuilt from them
+        """
+        config = self._create_config(additional_args=["--optuna-max-trials", "3"])
+        state = {}
+        rcg = self._create_rcg(config, self._create_state_manager(state))
+        self._run_rcg(rcg)
+
+        self.assertEqual(len(state["OptunaRunConfigGenerator.trials"]["add_sub"]), 3)
+
+        config = self._create_config(additional_args=["--optuna-max-trials", "5"])
+        resumed_rcg = self._create_rcg(
+            config, self._create_state_manager(state, fresh_run=False)
+        )
+        self.assertEqual(len(resumed_rcg._study.trials), 3)
+
+        # Only the remaining two trials (plus the default config) are generated
+        run_configs = self._run_rcg(resumed_rcg)
+        self.assertEqual(len(run_configs), 3)
+        self.assertEqual(len(state["OptunaRunConfigGenerator.trials"]["add_sub"]), 5)
+
+    def test_warm_start(self):
+        """
+        Test that a study can be warm started from the trials of another
+        model, keeping only the values inside the current search space
+        """
+        state = {
+            "OptunaRunConfigGenerator.trials": {
+                "other_model": [
+                    {
+                        "params": {
+                            "other_model::max_batch_size": 2,
+                            "other_model::instance_group": 3,
+                        },
+                        "value": 0.5,
+                        "fidelity": 1.0,
+                        "config_name": "other_model_config_1",
+                    },
+                    {
+                        "params": {"other_model::max_batch_size": 100},
+                        "value": 0.2,
+                        "fidelity": 1.0,
+                        "config_name": "other_model_config_2",
+                    },
+                ]
+            }
+        }
+        config = self._create_config(
+            additional_args=["--optuna-warm-start-study", "other_model"]
+        )
+        rcg = self._create_rcg(config, self._create_state_manager(state))
+
+        self.assertEqual(len(rcg._study.trials), 1)
+        self.assertEqual(
+            rcg._study.trials[0].params,
+            {"add_sub::max_batch_size": 2, "add_sub::instance_group": 3},
+        )
+
+        # Warm start trials do not count towards this study's budget
+        self.assertEqual(rcg._resumed_trial_count, 0)
+
+    def test_warm_start_checkpoint(self):
+        """
+        Test that the best configurations of a previously profiled model
+        are the first trials, keeping only the values inside the search space
+        """
+        warm_start = MagicMock()
+        warm_start.source_models_name.return_value = "other_model"
+        warm_start.get_best_configs.return_value = [
+            [
+                {
+                    "max_batch_size": 4,
+                    "instance_group": 2,
+                    "max_queue_delay_microseconds": 200,
+                    "concurrency": 16,
+                }
+            ],
+            [{"max_batch_size": 4096, "max_queue_delay_microseconds": 150}],
+        ]
+
+        config = self._create_config()
+        rcg = self._create_rcg(config, warm_start=warm_start)
+
+        # The second config has no value inside the search space
+        self.assertEqual(len(rcg._study.trials), 1)
+
+        trial_objectives = rcg._create_trial_objectives(rcg._study.ask())
+        self.assertEqual(trial_objectives["add_sub"]["max_batch_size"], 4)
+        self.assertEqual(trial_objectives["add_sub"]["instance_group"], 2)
+        self.assertEqual(
+            trial_objectives["add_sub"]["max_queue_delay_microseconds"], 200
+        )
+        self.assertEqual(trial_objectives["add_sub"]["concurrency"], 16)
+
+    def test_multi_objective(self):
+        """
+        Test that in multi-objective mode each objective is told to
+        Optuna, and trials without a measurement are marked as failed
+        """
+        with patch(
+            "model_analyzer.triton.model.model_config.ModelConfig.create_model_config_dict",
+            return_value=self._test_config_dict,
+        ):
+            models = [
+                ModelProfileSpec(
+                    ConfigModelProfileSpec(
+                        model_name="add_sub",
+                        objectives={"perf_throughput": 1, "perf_latency_p99": 1},
+                    ),
+                    MagicMock(),
+                    MagicMock(),
+                    MagicMock(),
+                )
+            ]
+
+        config = self._create_config(
+            additional_args=["--optuna-max-trials", "4", "--optuna-multi-objective"]
+        )
+        state = {}
+        rcg = self._create_rcg(config, self._create_state_manager(state), models)
+        self.assertEqual(len(rcg._study.directions), 2)
+
+        objective_values = [None, [100, -10], [200, -20], [50, -20]]
+        with patch.object(rcg, "_get_objective_values", side_effect=objective_values):
+            self._run_rcg(rcg)
+
+        self.assertEqual(
+            [trial.state for trial in rcg._study.trials],
+            [optuna.trial.TrialState.FAIL] + [optuna.trial.TrialState.COMPLETE] * 3,
+        )
+        self.assertEqual(
+            [trial.number for trial in rcg._study.best_trials],
+            [1, 2],
+        )
+        self.assertEqual(
+            [
+                logged_trial["values"]
+                for logged_trial in state["OptunaRunConfigGenerator.trials"]["add_sub"]
+            ],
+            objective_values,
+        )
+
+    def _run_rcg(self, rcg):
+        run_configs = []
+        with patch.object(rcg, "_calculate_score", return_value=0.1):
+            for run_config in rcg.get_configs():
+                run_configs.append(run_config)
+                rcg.set_last_results([MagicMock()])
+
+        return run_configs
+
+    def _create_state_manager(self, state, fresh_run=True):
+        state_manager = MagicMock()
+        state_manager.starting_fresh_run.return_value = fresh_run
+        state_manager.get_state_variable.side_effect = state.get
+        state_manager.set_state_variable.side_effect = state.__setitem__
+
+        return state_manager
+
+    def _create_rcg(self, config, state_manager=None, models=None, warm_start=None):
+        mock_model_config = MockModelConfig("max_batch_size: 8")
+        mock_model_config.start()
+        model = ModelProfileSpec(
+            config.profile_models[0], config, MagicMock(), MagicMock()
+        )
+        search_parameters = SearchParameters(model=model, config=config)
+        mock_model_config.stop()
+
+        return OptunaRunConfigGenerator(
+            config=config,
+            state_manager=state_manager if state_manager else MagicMock(),
+            gpu_count=1,
+            models=models if models else self._mock_models,
+            composing_models=[],
+            model_variant_name_manager=ModelVariantNameManager(),
+            search_parameters={"add_sub": search_parameters},
+            composing_search_parameters={},
+            user_seed=100,
+            warm_start=warm_start,
+        )
+
     def _create_config(self, additional_args=[]):
         args = [
             "model-analyzer",
@@ -24,13 +24,16 @@
 from model_analyzer.config.input.config_defaults import (
     DEFAULT_RUN_CONFIG_MAX_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE,
+    DEFAULT_RUN_CONFIG_MAX_REQUEST_TRACE_SCALE,
     DEFAULT_RUN_CONFIG_MIN_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE,
+    DEFAULT_RUN_CONFIG_MIN_REQUEST_TRACE_SCALE,
 )
 from model_analyzer.constants import THROUGHPUT_MINIMUM_CONSECUTIVE_PARAMETER_TRIES
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.result.parameter_search import ParameterSearch
+from model_analyzer.result.request_rate_predictor import RequestRatePredictor
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
 from .common import test_result_collector as trc
@@ -110,6 +113,76 @@ def test_request_rate_sweep(self):
 
         self.assertEqual(self._request_rates, self._expected_request_rates)
 
+    def test_request_trace_scale_sweep(self):
+        """
+        Test sweeping the request trace scale from min to max, when no
+        constraints are present and throughput is linearly increasing
+        """
+        config = self._create_single_model_no_constraints(
+            extra_args=["--request-trace", "requests.csv"]
+        )
+        constraint_manager = ConstraintManager(config)
+        request_trace_search = ParameterSearch(config)
+
+        scales = []
+        for scale in request_trace_search.search_parameters():
+            scales.append(scale)
+
+            request_trace_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * scale,
+                    latency=10,
+                    concurrency=1,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        expected_scales = [
+            2**s
+            for s in range(
+                int(log2(DEFAULT_RUN_CONFIG_MIN_REQUEST_TRACE_SCALE)),
+                int(log2(DEFAULT_RUN_CONFIG_MAX_REQUEST_TRACE_SCALE)) + 1,
+            )
+        ]
+        self.assertEqual(scales, expected_scales)
+
+    def test_request_trace_scale_binary_search(self):
+        """
+        Test that request trace scales below 1 are swept, and that the
+        binary search bisects the scales without truncating them, with
+        a 100ms latency constraint that is violated above 1.5x
+        """
+        config = self._create_single_model_with_constraints(
+            "100",
+            extra_args=[
+                "--request-trace",
+                "requests.csv",
+                "--run-config-search-min-request-trace-scale",
+                "0.5",
+                "--run-config-search-max-request-trace-scale",
+                "4",
+            ],
+        )
+        constraint_manager = ConstraintManager(config)
+        request_trace_search = ParameterSearch(config)
+
+        scales = []
+        for scale in request_trace_search.search_parameters():
+            scales.append(scale)
+
+            request_trace_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * scale,
+                    latency=100 * scale / 1.5,
+                    concurrency=1,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(
+            scales, [0.5, 1.0, 2.0, 4.0, 1.5, 1.75, 1.625, 1.5625, 1.53125]
+        )
+
     def test_saturating_sweep(self):
         """
         Test sweeping concurrency from min to max, when no constraints are present
@@ -254,6 +327,44 @@ def test_sweep_with_constraints_hitting_limit(self):
 
         self.assertEqual(self._concurrencies, self._expected_concurrencies)
 
+    def test_binary_search_with_request_rate_prediction(self):
+        """
+        Test that the binary search skips request rates predicted to
+        violate the latency budget, with a 100ms latency constraint
+        and latency growing linearly with the request rate
+        """
+        config = self._create_single_model_with_constraints(
+            "100", extra_args=["--request-rate-search-enable"]
+        )
+        constraint_manager = ConstraintManager(config)
+        request_rate_predictor = MagicMock(spec=RequestRatePredictor)
+        request_rate_predictor.max_request_rate.return_value = 850
+        request_rate_search = ParameterSearch(
+            config,
+            model_parameters={"request_rate": "True"},
+            request_rate_predictor=request_rate_predictor,
+        )
+
+        # 896 is predicted to fail, so it is never measured
+        self._expected_request_rates.extend([768, 832, 800, 816])
+
+        for request_rate in request_rate_search.search_parameters():
+            self._request_rates.append(request_rate)
+
+            request_rate_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * request_rate,
+                    latency=request_rate / 8,
+                    request_rate=request_rate,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(self._request_rates, self._expected_request_rates)
+        self.assertEqual(
+            request_rate_predictor.update.call_count, len(self._request_rates)
+        )
+
     def test_not_adding_measurements(self):
         """
         Test that an exception is raised if measurements are not added
@@ -276,15 +387,75 @@ def test_not_adding_measurements(self):
                         )
                     )
 
-    def _create_single_model_no_constraints(self):
-        args = ["model-analyzer", "profile", "--profile-models", "test_model"]
+    def test_knee_search(self):
+        """
+        Test that knee search stops the sweep once throughput saturates
+        and then refines towards the lowest concurrency reaching the plateau
+        """
+        config = self._create_single_model_no_constraints(parameter_search_mode="knee")
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(config)
+
+        for concurrency in concurrency_search.search_parameters():
+            self._concurrencies.append(concurrency)
+
+            concurrency_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * min(concurrency, 48),
+                    latency=10,
+                    concurrency=concurrency,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(self._concurrencies, [1, 2, 4, 8, 16, 32, 64, 128, 48, 42, 54])
+
+    def test_knee_search_with_constraints(self):
+        """
+        Test that knee search stops the sweep at the first constraint violation
+        and then refines towards the constraint boundary
+        """
+        config = self._create_single_model_with_constraints(
+            "155", parameter_search_mode="knee"
+        )
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(config)
+
+        for concurrency in concurrency_search.search_parameters():
+            self._concurrencies.append(concurrency)
+
+            concurrency_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * concurrency,
+                    latency=10 * concurrency,
+                    concurrency=concurrency,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(self._concurrencies, [1, 2, 4, 8, 16, 11, 13, 14])
+
+    def _create_single_model_no_constraints(
+        self, parameter_search_mode="sweep", extra_args=[]
+    ):
+        args = [
+            "model-analyzer",
+            "profile",
+            "--profile-models",
+            "test_model",
+            "--parameter-search-mode",
+            parameter_search_mode,
+        ] + extra_args
         yaml_str = ""
         config = evaluate_mock_config(args, yaml_str)
 
         return config
 
     def _create_single_model_with_constraints(
-        self, latency_budget: str
+        self,
+        latency_budget: str,
+        parameter_search_mode: str = "sweep",
+        extra_args: list = [],
     ) -> Union[ConfigCommandProfile, ConfigCommandReport]:
         args = [
             "model-analyzer",
@@ -293,7 +464,9 @@ def _create_single_model_with_constraints(
             "test_model",
             "--latency-budget",
             latency_budget,
-        ]
+            "--parameter-search-mode",
+            parameter_search_mode,
+        ] + extra_args
         yaml_str = ""
         config = evaluate_mock_config(args, yaml_str)
 
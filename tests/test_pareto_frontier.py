@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import unittest
+from unittest.mock import patch
+
+from model_analyzer.result.pareto_frontier import (
+    dominates,
+    fast_non_dominated_sort,
+    pareto_frontier,
+)
+
+from .common import test_result_collector as trc
+
+
+class TestParetoFrontier(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_dominates(self):
+        self.assertTrue(dominates([2, 2], [1, 2]))
+        self.assertFalse(dominates([1, 2], [2, 2]))
+        self.assertFalse(dominates([2, 1], [1, 2]))
+
+        # A point does not dominate an equal point
+        self.assertFalse(dominates([1, 2], [1, 2]))
+
+    def test_empty(self):
+        self.assertEqual(fast_non_dominated_sort([]), [])
+        self.assertEqual(pareto_frontier([]), [])
+
+    def test_fronts(self):
+        # Throughput (maximize) and negated latency (minimize)
+        points = [
+            [100, -10],
+            [200, -20],
+            [150, -20],
+            [50, -5],
+            [100, -30],
+            [200, -20],
+        ]
+
+        fronts = fast_non_dominated_sort(points)
+
+        self.assertEqual(fronts, [[0, 1, 3, 5], [2], [4]])
+        self.assertEqual(pareto_frontier(points), [0, 1, 3, 5])
+
+    def test_against_brute_force(self):
+        random.seed(5)
+        points = [[random.randint(0, 10) for _ in range(3)] for _ in range(100)]
+
+        remaining = set(range(len(points)))
+        expected_fronts = []
+        while remaining:
+            front = sorted(
+                p
+                for p in remaining
+                if not any(dominates(points[q], points[p]) for q in remaining)
+            )
+            expected_fronts.append(front)
+            remaining -= set(front)
+
+        self.assertEqual(fast_non_dominated_sort(points), expected_fronts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 # SPDX-FileCopyrightText: Copyright (c) 2020-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -34,9 +36,12 @@
 from model_analyzer.record.types.perf_client_response_wait import PerfClientResponseWait
 from model_analyzer.record.types.perf_client_send_recv import PerfClientSendRecv
 from model_analyzer.record.types.perf_latency_avg import PerfLatencyAvg
+from model_analyzer.record.types.perf_latency_max import PerfLatencyMax
+from model_analyzer.record.types.perf_latency_p50 import PerfLatencyP50
 from model_analyzer.record.types.perf_latency_p90 import PerfLatencyP90
 from model_analyzer.record.types.perf_latency_p95 import PerfLatencyP95
 from model_analyzer.record.types.perf_latency_p99 import PerfLatencyP99
+from model_analyzer.record.types.perf_latency_p999 import PerfLatencyP999
 from model_analyzer.record.types.perf_server_compute_infer import PerfServerComputeInfer
 from model_analyzer.record.types.perf_server_compute_input import PerfServerComputeInput
 from model_analyzer.record.types.perf_server_compute_output import (
@@ -44,6 +49,7 @@
 )
 from model_analyzer.record.types.perf_server_queue import PerfServerQueue
 from model_analyzer.record.types.perf_throughput import PerfThroughput
+from model_analyzer.record.types.request_goodput import RequestGoodput
 from model_analyzer.record.types.time_to_first_token_avg import TimeToFirstTokenAvg
 from model_analyzer.record.types.time_to_first_token_max import TimeToFirstTokenMax
 from model_analyzer.record.types.time_to_first_token_min import TimeToFirstTokenMin
@@ -301,6 +307,7 @@ def test_pa_csv_output(self):
         self.assertEqual(records[TEST_MODEL_NAME][0].value(), 5)
 
         # Test latency parsing
+        self._test_metrics_from_csv(perf_analyzer, pa_csv_mock, [PerfLatencyP50], [4.6])
         self._test_metrics_from_csv(perf_analyzer, pa_csv_mock, [PerfLatencyP90], [4.7])
         self._test_metrics_from_csv(perf_analyzer, pa_csv_mock, [PerfLatencyP95], [4.8])
         self._test_metrics_from_csv(perf_analyzer, pa_csv_mock, [PerfLatencyP99], [4.9])
@@ -487,6 +494,124 @@ def test_pa_csv_output(self):
             self.assertTrue(perf_analyzer.run(perf_metrics))
         self.server.stop()
 
+    def test_pa_profile_export_output(self):
+        """
+        Tests that the latency histogram is built from PA's profile export
+        """
+        self.config["profile-export-file"] = TEST_MODEL_NAME + "-profile-export.json"
+
+        perf_analyzer = PerfAnalyzer(
+            path=PERF_BIN_PATH,
+            config=self.run_config,
+            max_retries=10,
+            timeout=100,
+            max_cpu_util=50,
+        )
+
+        pa_csv_mock = (
+            """Concurrency,Inferences/Second,p50 latency,p99 latency,Avg latency\n"""
+        )
+        pa_csv_mock += """1,46.8,4600,4900,5000"""
+
+        # Request latencies of 1..100 ms (timestamps are in ns)
+        requests = [
+            f'{{"timestamp": {i * 10**9}, "response_timestamps": [{i * 10**9 + i * 10**6}]}}'
+            for i in range(1, 101)
+        ]
+        profile_export_mock = (
+            '{"experiments": [{"experiment": {"mode": "concurrency", "value": 1}, '
+            f'"requests": [{", ".join(requests)}], "window_boundaries": [0]}}], '
+            '"version": "1"}'
+        )
+
+        perf_metrics = [PerfLatencyP99, PerfLatencyP999, PerfLatencyMax]
+
+        with patch(
+            "model_analyzer.perf_analyzer.perf_analyzer.open",
+            mock_open(read_data=pa_csv_mock),
+        ), patch(
+            "model_analyzer.perf_analyzer.profile_export_reader.open",
+            mock_open(read_data=profile_export_mock),
+        ), patch(
+            "model_analyzer.perf_analyzer.perf_analyzer.os.remove"
+        ), patch(
+            "model_analyzer.perf_analyzer.perf_analyzer.os.path.isfile",
+            return_value=True,
+        ), patch.object(
+            PerfAnalyzer, "_verify_output_files_exist", return_value=True
+        ):
+            perf_analyzer.run(perf_metrics)
+
+        records = perf_analyzer.get_perf_records()[TEST_MODEL_NAME]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0].value(), 4.9)
+        self.assertAlmostEqual(records[1].value(), 100, delta=100 / 64)
+        self.assertEqual(records[2].value(), 100)
+
+        latency_histogram = perf_analyzer.get_latency_histograms()[TEST_MODEL_NAME]
+        self.assertEqual(latency_histogram.total_count(), 100)
+        self.assertAlmostEqual(
+            latency_histogram.percentile(50), 50000, delta=50000 / 64
+        )
+
+    def test_pa_llm_goodput(self):
+        """
+        Tests that goodput is computed from genai-perf's profile export
+        """
+        perf_analyzer = PerfAnalyzer(
+            path=PERF_BIN_PATH,
+            config=self.run_config,
+            max_retries=10,
+            timeout=100,
+            max_cpu_util=50,
+            model_type="LLM",
+            goodput_time_to_first_token_slo=200,
+            goodput_inter_token_latency_slo=50,
+        )
+
+        pa_llm_csv_mock = """Metric,avg,min,max,p99,p95,p90,p75,p50,p25\n"""
+        pa_llm_csv_mock += """Output Token Throughput (per sec),36.37,None,None,None,None,None,None,None,None\n"""
+
+        # (send, [responses]) in ms: only the 1st, 4th and 5th requests meet both SLOs
+        ms = 10**6
+        requests = [
+            (0, [100, 110, 120]),
+            (200, [500, 510]),
+            (400, [450, 550, 650]),
+            (600, [650]),
+            (900, [1000]),
+        ]
+        profile_export_mock = (
+            '{"experiments": [{"requests": ['
+            + ", ".join(
+                f'{{"timestamp": {send * ms}, "response_timestamps": {[r * ms for r in responses]}}}'
+                for send, responses in requests
+            )
+            + "]}]}"
+        )
+
+        with patch(
+            "model_analyzer.perf_analyzer.perf_analyzer.open",
+            mock_open(read_data=pa_llm_csv_mock),
+        ), patch(
+            "model_analyzer.perf_analyzer.profile_export_reader.open",
+            mock_open(read_data=profile_export_mock),
+        ), patch(
+            "model_analyzer.perf_analyzer.perf_analyzer.os.remove"
+        ), patch(
+            "model_analyzer.perf_analyzer.perf_analyzer.os.path.isfile",
+            return_value=True,
+        ), patch.object(
+            PerfAnalyzer, "_verify_output_files_exist", return_value=True
+        ):
+            perf_analyzer.run([OutputTokenThroughput, RequestGoodput])
+
+        records = perf_analyzer.get_llm_records()[TEST_MODEL_NAME]
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0].value(), 36.37)
+        self.assertIsInstance(records[1], RequestGoodput)
+        self.assertAlmostEqual(records[1].value(), 3)
+
     def test_pa_llm_csv_output(self):
         """
         Tests the ability to read PA's LLM CSV output
@@ -807,6 +932,79 @@ def test_get_cmd_single_model(self):
         ]
         self.assertEqual(pa._get_cmd(), expected_cmd)
 
+    def test_get_cmd_absolute_paths(self):
+        """
+        Test that relative input paths are made absolute, since PA
+        is run inside its artifact directory
+        """
+        # NamedTemporaryFile is mocked out by MockPerfAnalyzerMethods
+        with tempfile.TemporaryDirectory() as input_data_dir:
+            input_data_file = os.path.join(input_data_dir, "input_data.json")
+            open(input_data_file, "w").close()
+
+            relative_path = os.path.relpath(input_data_file)
+            self.config["input-data"] = ["zero", relative_path]
+
+            pa = PerfAnalyzer(
+                path=PERF_BIN_PATH,
+                config=self.run_config,
+                max_retries=10,
+                timeout=100,
+                max_cpu_util=50,
+            )
+
+            cmd = pa._get_cmd()
+
+        self.assertIn("--input-data", cmd)
+        self.assertIn("zero", cmd)
+        self.assertIn(input_data_file, cmd)
+        self.assertEqual(self.config["input-data"], ["zero", relative_path])
+
+    def test_artifact_dir(self):
+        """
+        Test that each run gets its own artifact directory,
+        which is removed or kept based on the retention policy
+        """
+        pa_csv_mock = """Concurrency,Inferences/Second,p99 latency\n1,46.8,4900"""
+
+        with tempfile.TemporaryDirectory() as artifact_directory:
+            artifact_dirs = []
+            for retention in ["none", "all"]:
+                pa = PerfAnalyzer(
+                    path=PERF_BIN_PATH,
+                    config=self.run_config,
+                    max_retries=10,
+                    timeout=100,
+                    max_cpu_util=50,
+                    artifact_directory=artifact_directory,
+                    artifact_retention=retention,
+                )
+
+                with patch(
+                    "model_analyzer.perf_analyzer.perf_analyzer.open",
+                    mock_open(read_data=pa_csv_mock),
+                ) as mocked_open, patch.object(
+                    PerfAnalyzer, "_verify_output_files_exist", return_value=True
+                ):
+                    pa.run([PerfLatencyP99])
+
+                artifact_dir = pa.get_artifact_dir()
+                artifact_dirs.append(artifact_dir)
+
+                self.assertEqual(os.path.dirname(artifact_dir), artifact_directory)
+                self.assertEqual(
+                    self.perf_mock.mock_popen_constructor.call_args.kwargs["cwd"],
+                    artifact_dir,
+                )
+                mocked_open.assert_called_with(
+                    os.path.join(artifact_dir, TEST_MODEL_NAME + "-results.csv"),
+                    mode="r",
+                )
+
+            self.assertNotEqual(artifact_dirs[0], artifact_dirs[1])
+            self.assertFalse(os.path.exists(artifact_dirs[0]))
+            self.assertTrue(os.path.isdir(artifact_dirs[1]))
+
     def test_get_cmd_multi_model(self):
         """
         Test the functionality of _get_cmd() for multi model
@@ -1017,6 +1215,20 @@ def test_valid_load_args_list(self):
         self.assertIn("request-rate-range", load_args)
         self.assertEqual(len(load_args), 3)
 
+    def test_representation_ignores_profile_export_file(self):
+        """
+        Test that collecting latency histograms does not
+        change the representation of a PA config
+        """
+        config = PerfAnalyzerConfig()
+        config["model-name"] = "test_model"
+        config["concurrency-range"] = 4
+        representation = config.representation()
+
+        config["profile-export-file"] = "test_model-profile-export.json"
+        self.assertIn("--profile-export-file", config.to_cli_string())
+        self.assertEqual(config.representation(), representation)
+
     def test_request_intervals_preserved_in_config(self):
         """
         Test that request-intervals is preserved when set in config
@@ -26,6 +26,8 @@
     DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE,
     DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE,
 )
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.result.request_rate_predictor import RequestRatePredictor
 from tests.common.test_utils import (
     construct_perf_analyzer_config,
     construct_run_config_measurement,
@@ -475,6 +477,48 @@ def test_min_request_rate(self):
             yaml_str, expected_configs, pa_cli_args
         )
 
+    def test_request_trace(self):
+        """
+        Test Request Trace:
+            - Shmoo the request trace scale from min to max
+
+        Every config replays the intervals file of its scale
+        """
+
+        yaml_str = """
+            profile_models:
+                - my-model
+            """
+
+        scales = [1, 2, 4, 8]
+        mock_request_trace = MagicMock()
+        mock_request_trace.create_intervals_files.return_value = {
+            scale: f"requests_{scale}x.txt" for scale in scales
+        }
+        patch(
+            "model_analyzer.config.generate.perf_analyzer_config_generator.RequestTrace",
+            return_value=mock_request_trace,
+        ).start()
+
+        expected_configs = [
+            construct_perf_analyzer_config(
+                concurrency=None,
+                perf_analyzer_flags={"request-intervals": f"requests_{scale}x.txt"},
+            )
+            for scale in scales
+        ]
+
+        pa_cli_args = [
+            "--request-trace",
+            "requests.csv",
+            "--run-config-search-max-request-trace-scale",
+            "8",
+        ]
+        self._run_and_test_perf_analyzer_config_generator(
+            yaml_str, expected_configs, pa_cli_args
+        )
+        mock_request_trace.create_intervals_files.assert_called_once_with(scales)
+
     def test_perf_analyzer_flags(self):
         """
         Test Perf Analyzer Flags:
@@ -660,6 +704,116 @@ def test_throughput_gain_based_on_max(self):
         expected_result = False
         self._test_throughput_gain_valid_helper(throughput_values, expected_result)
 
+    def test_request_rate_prediction(self):
+        """
+        Test that the queueing model jumps the request rate sweep towards
+        the predicted saturation rate and stops beyond the saturation margin
+
+        Service time is 10ms on one instance, so the model saturates at 100 req/s
+        """
+        request_rates = self._run_request_rate_prediction()
+
+        self.assertEqual(request_rates, [16, 64, 128])
+
+    def test_request_rate_prediction_with_latency_budget(self):
+        """
+        Test that the queueing model skips request rates predicted
+        to violate the latency budget
+        """
+        request_rates = self._run_request_rate_prediction(latency_budget=50)
+
+        self.assertEqual(request_rates, [16, 32])
+
+    def test_request_rate_prediction_with_server_side_batching(self):
+        """
+        Test that the request rate is predicted for a model config that
+        batches requests on the server, where each request is charged
+        the compute time of its whole batch
+
+        Batches of up to 8 requests take 10ms, so the model saturates at
+        800 req/s rather than the 100 req/s the compute time suggests
+        """
+        request_rates = self._run_request_rate_prediction(
+            latency_budget=50, max_batch_size=8, saturation_rate=800
+        )
+
+        self.assertEqual(request_rates, [16, 32, 64, 128, 256, 512])
+
+    def test_request_rate_prediction_without_compute_time(self):
+        """
+        Test that the request rate sweep is not cut short when
+        the server compute time was not measured
+        """
+        with self.assertLogs(LOGGER_NAME, level="INFO") as logs:
+            request_rates = self._run_request_rate_prediction(
+                latency_budget=50, compute_time=None
+            )
+
+        # The sweep runs until throughput plateaus
+        self.assertEqual(request_rates, [16, 32, 64, 128, 256, 512, 1024])
+        self.assertEqual(
+            len([log for log in logs.output if "Not predicting" in log]), 1
+        )
+
+    def _run_request_rate_prediction(
+        self,
+        latency_budget=None,
+        max_batch_size=1,
+        saturation_rate=100,
+        compute_time=10,
+    ):
+        yaml_str = """
+            profile_models:
+                - my-model
+            """
+        args = [
+            "model-analyzer",
+            "profile",
+            "--model-repository",
+            "cli_repository",
+            "-f",
+            "path-to-config-file",
+            "--request-rate-search-enable",
+            "--request-rate-prediction-enable",
+        ]
+        config = evaluate_mock_config(args, yaml_str, subcommand="profile")
+
+        pacg = PerfAnalyzerConfigGenerator(
+            config,
+            config.profile_models[0].model_name(),
+            config.profile_models[0].perf_analyzer_flags(),
+            config.profile_models[0].parameters(),
+            early_exit_enable=True,
+            request_rate_predictor=RequestRatePredictor(
+                instance_count=1,
+                max_batch_size=max_batch_size,
+                latency_budget=latency_budget,
+            ),
+        )
+
+        request_rates = []
+        for perf_config in pacg.get_configs():
+            request_rate = perf_config._args["request-rate-range"]
+            request_rates.append(request_rate)
+            non_gpu_metric_values = {
+                "perf_throughput": min(request_rate, saturation_rate)
+            }
+            if compute_time:
+                non_gpu_metric_values["perf_server_compute_infer"] = compute_time
+            pacg.set_last_results(
+                [
+                    construct_run_config_measurement(
+                        model_name=MagicMock(),
+                        model_config_names=["test_model_config_name"],
+                        model_specific_pa_params=MagicMock(),
+                        gpu_metric_values=MagicMock(),
+                        non_gpu_metric_values=[non_gpu_metric_values],
+                    )
+                ]
+            )
+
+        return request_rates
+
     def _test_throughput_gain_valid_helper(self, throughput_values, expected_result):
         throughputs = [
             construct_run_config_measurement(
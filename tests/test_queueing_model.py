@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from math import inf
+from unittest.mock import patch
+
+from model_analyzer.result.queueing_model import QueueingModel, erlang_c
+
+from .common import test_result_collector as trc
+
+
+class TestQueueingModel(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_erlang_c(self):
+        # With one server the probability of waiting is the utilization
+        self.assertAlmostEqual(erlang_c(1, 0.5), 0.5)
+
+        # Textbook value: 2 servers at an offered load of 1 Erlang
+        self.assertAlmostEqual(erlang_c(2, 1), 1 / 3)
+
+        self.assertEqual(erlang_c(2, 2), 1.0)
+
+    def test_saturation(self):
+        queueing_model = QueueingModel(service_time=10, servers=2)
+
+        self.assertEqual(queueing_model.saturation_rate(), 200)
+        self.assertEqual(queueing_model.predict_latency(200), inf)
+
+    def test_predict_latency(self):
+        queueing_model = QueueingModel(service_time=10, servers=1)
+
+        # Lightly loaded requests almost never wait
+        self.assertEqual(queueing_model.predict_latency(0.5), 10)
+
+        # Latency grows with the request rate, and the deterministic
+        # approximation never predicts more than M/M/c
+        latencies = [queueing_model.predict_latency(rate) for rate in [20, 50, 90]]
+        self.assertEqual(latencies, sorted(latencies))
+        self.assertLess(
+            queueing_model.predict_latency(90, deterministic=True), latencies[-1]
+        )
+
+    def test_max_request_rate(self):
+        queueing_model = QueueingModel(service_time=10, servers=1)
+
+        max_request_rate = queueing_model.max_request_rate(latency_budget=50)
+
+        self.assertAlmostEqual(queueing_model.predict_latency(max_request_rate), 50)
+        self.assertEqual(queueing_model.max_request_rate(latency_budget=5), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,7 +23,11 @@
 )
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.triton.model.model_config import ModelConfig
-from tests.common.test_utils import evaluate_mock_config
+from tests.common.test_utils import (
+    construct_constraint_manager,
+    construct_run_config_measurement,
+    evaluate_mock_config,
+)
 
 from .common import test_result_collector as trc
 
@@ -198,6 +202,30 @@ def test_get_starting_coordinate(self):
         )
         self.assertEqual(qrcg._get_starting_coordinate(), Coordinate([2, 1, 3]))
 
+    def test_warm_start_starting_coordinate(self):
+        """
+        Test that a warm start moves the starting coordinate to the
+        best configuration of a previously profiled model
+        """
+        warm_start = MagicMock()
+        warm_start.get_best_configs.return_value = [
+            [{"max_batch_size": 16, "instance_group": 3, "batch_sizes": 1}]
+        ]
+
+        sc = SearchConfig(dimensions=self._dims, radius=5, min_initialized=2)
+        qrcg = QuickRunConfigGenerator(
+            sc,
+            self._create_config(),
+            MagicMock(),
+            self._mock_models,
+            {},
+            ModelVariantNameManager(),
+            warm_start=warm_start,
+        )
+
+        # Concurrency is not set by the warm start config, and stays at its minimum
+        self.assertEqual(qrcg._get_starting_coordinate(), Coordinate([4, 2, 0]))
+
     def test_get_next_run_config(self):
         """
         Test that get_next_run_config() creates a proper RunConfig
@@ -440,6 +468,91 @@ def test_get_next_run_config_multi_model(self):
         self.assertEqual(pc2["batch-size"], 1)
         self.assertEqual(pc2["model-version"], 3)
 
+    def test_coordinate_descent(self):
+        """
+        Test that with coordinate descent enabled, quick search only steps
+        in one model's dimensions at a time, holding the other model at its
+        best values, and ends with a joint search of every dimension
+        """
+        dims = SearchDimensions()
+        for key in [0, 1]:
+            dims.add_dimensions(
+                key,
+                [
+                    SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+                    SearchDimension("bar", SearchDimension.DIMENSION_TYPE_LINEAR),
+                ],
+            )
+
+        sc = SearchConfig(dimensions=dims, radius=2, min_initialized=2)
+        qrcg = QuickRunConfigGenerator(
+            sc,
+            self._create_config(["--quick-search-coordinate-descent-enable"]),
+            MagicMock(),
+            self._mock_models,
+            {},
+            ModelVariantNameManager(),
+        )
+        self.assertEqual(qrcg._blocks, [[0, 1], [2, 3], None])
+
+        patch.object(qrcg, "_get_next_run_config", return_value=MagicMock()).start()
+        patch.object(
+            qrcg, "_create_default_run_config", return_value=MagicMock()
+        ).start()
+
+        constraint_manager = construct_constraint_manager(
+            """
+            profile_models:
+              - modelA
+              - modelB
+            """
+        )
+
+        blocks_measured = []
+        for _ in qrcg.get_configs():
+            coordinate = qrcg._coordinate_to_measure
+            blocks_measured.append((qrcg._block_index, list(coordinate)))
+            qrcg.set_last_results(
+                [self._construct_multi_model_rcm(coordinate, constraint_manager)]
+            )
+
+        self.assertEqual(qrcg._block_index, 2)
+
+        # Model B's dimensions stay at their minimum while searching model A
+        model_a_coordinates = [c for block, c in blocks_measured if block == 0]
+        self.assertTrue(all(c[2:] == [0, 0] for c in model_a_coordinates))
+
+        # Model A's dimensions stay at their best while searching model B
+        model_b_coordinates = [c for block, c in blocks_measured if block == 1]
+        self.assertTrue(model_b_coordinates)
+        self.assertTrue(all(c[:2] == [1, 1] for c in model_b_coordinates))
+
+        # The joint search refines the best coordinate of the model searches
+        joint_coordinates = [c for block, c in blocks_measured if block == 2]
+        self.assertTrue(joint_coordinates)
+        self.assertEqual(qrcg._best_coordinate, Coordinate([1, 1, 1, 3]))
+
+    def _construct_multi_model_rcm(self, coordinate, constraint_manager):
+        """
+        Each model's throughput peaks at a different coordinate of its dimensions
+        """
+        throughput_a = 1000 / (1 + (coordinate[0] - 2) ** 2 + (coordinate[1] - 2) ** 2)
+        throughput_b = 1000 / (1 + (coordinate[2] - 1) ** 2 + (coordinate[3] - 3) ** 2)
+
+        return construct_run_config_measurement(
+            model_name="modelA,modelB",
+            model_config_names=["modelA_config_0", "modelB_config_0"],
+            model_specific_pa_params=[MagicMock(), MagicMock()],
+            gpu_metric_values={},
+            non_gpu_metric_values=[
+                {"perf_throughput": throughput_a, "perf_latency_p99": 10},
+                {"perf_throughput": throughput_b, "perf_latency_p99": 10},
+            ],
+            constraint_manager=constraint_manager,
+            metric_objectives=[{"perf_throughput": 1}, {"perf_throughput": 1}],
+            model_config_weights=[1, 1],
+        )
+
     def test_default_config_generation(self):
         """
         Test that the default config is generated correctly
@@ -46,9 +46,12 @@ def setUp(self):
             record_types[k]
             for k in [
                 "perf_latency_avg",
+                "perf_latency_p50",
                 "perf_latency_p90",
                 "perf_latency_p95",
                 "perf_latency_p99",
+                "perf_latency_p999",
+                "perf_latency_max",
                 "inter_token_latency_min",
                 "inter_token_latency_max",
                 "inter_token_latency_avg",
@@ -84,6 +87,7 @@ def setUp(self):
             for k in [
                 "perf_throughput",
                 "output_token_throughput",
+                "request_goodput",
                 "gpu_free_memory",
                 "gpu_utilization",
                 "cpu_available_ram",
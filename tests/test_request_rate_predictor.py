@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.constants import QUEUEING_MODEL_SATURATION_MARGIN
+from model_analyzer.result.model_constraints import ModelConstraints
+from model_analyzer.result.request_rate_predictor import RequestRatePredictor
+from model_analyzer.triton.model.model_config import ModelConfig
+
+from .common import test_result_collector as trc
+from .common.test_utils import construct_run_config_measurement
+
+
+class TestRequestRatePredictor(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_unbatched(self):
+        """
+        Without server side batching both bounds are the
+        saturation rate of the instances
+        """
+        predictor = RequestRatePredictor(instance_count=2)
+
+        self.assertIsNone(predictor.max_request_rate())
+        self.assertTrue(predictor.update(self._construct_rcm(10, 50), batch_size=1))
+
+        self.assertEqual(predictor.max_request_rate(), 400)
+        self.assertEqual(predictor.knee_request_rate(), 400)
+
+    def test_server_side_batching(self):
+        """
+        With server side batching each instance computes up to
+        max_batch_size // batch_size requests per batch
+        """
+        predictor = RequestRatePredictor(instance_count=1, max_batch_size=8)
+        predictor.update(self._construct_rcm(10, 50), batch_size=2)
+
+        self.assertEqual(
+            predictor.max_request_rate(), 400 * QUEUEING_MODEL_SATURATION_MARGIN
+        )
+        self.assertEqual(
+            predictor.knee_request_rate(), 100 * QUEUEING_MODEL_SATURATION_MARGIN
+        )
+
+    def test_measured_throughput_floor(self):
+        """
+        The bounds never fall below the measured request rate
+        """
+        predictor = RequestRatePredictor(instance_count=1)
+        predictor.update(self._construct_rcm(10, 400), batch_size=2)
+
+        self.assertEqual(
+            predictor.knee_request_rate(), 200 * QUEUEING_MODEL_SATURATION_MARGIN
+        )
+
+    def test_latency_budget(self):
+        predictor = RequestRatePredictor(instance_count=1, latency_budget=5)
+        predictor.update(self._construct_rcm(10, 50), batch_size=1)
+
+        self.assertEqual(predictor.max_request_rate(), 0)
+
+    def test_missing_compute_time(self):
+        predictor = RequestRatePredictor(instance_count=1)
+        predictor.update(self._construct_rcm(10, 50), batch_size=1)
+
+        self.assertFalse(predictor.update(self._construct_rcm(0, 50), batch_size=1))
+        self.assertIsNone(predictor.max_request_rate())
+        self.assertIsNone(predictor.knee_request_rate())
+
+    def test_create(self):
+        model_config = ModelConfig.create_from_dictionary(
+            {
+                "name": "my-model",
+                "max_batch_size": 8,
+                "dynamic_batching": {},
+                "instance_group": [{"count": 2, "kind": "KIND_CPU"}],
+            }
+        )
+        model = MagicMock()
+        model.constraints.return_value = ModelConstraints(
+            {"perf_latency_p99": {"max": 50}}
+        )
+
+        predictor = RequestRatePredictor.create(model_config, gpu_count=1, model=model)
+
+        self.assertEqual(predictor._instance_count, 2)
+        self.assertEqual(predictor._max_batch_size, 8)
+        self.assertTrue(predictor.has_latency_budget())
+
+    def _construct_rcm(self, compute_time, throughput):
+        non_gpu_metric_values = {"perf_throughput": throughput}
+        if compute_time:
+            non_gpu_metric_values["perf_server_compute_infer"] = compute_time
+
+        return construct_run_config_measurement(
+            model_name=MagicMock(),
+            model_config_names=["test_model_config_name"],
+            model_specific_pa_params=MagicMock(),
+            gpu_metric_values=MagicMock(),
+            non_gpu_metric_values=[non_gpu_metric_values],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
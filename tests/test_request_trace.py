@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+from model_analyzer.perf_analyzer.request_trace import RequestTrace
+
+from .common import test_result_collector as trc
+
+
+class TestRequestTrace(trc.TestResultCollector):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+        patch.stopall()
+
+    def test_csv_trace(self):
+        """
+        Test that the intervals of a CSV trace are scaled by each scale factor,
+        and that out of order requests arrive with the previous request
+        """
+        trace_path = self._write_trace(
+            "requests.csv",
+            "id,timestamp\n1,10.0\n2,10.5\n3,10.4\n4,11.0\n5,13.0\n",
+        )
+        request_trace = RequestTrace(self._create_config(trace_path))
+
+        paths = request_trace.create_intervals_files([1, 4])
+
+        self.assertEqual(self._read_intervals(paths[1]), [500000, 0, 500000, 2000000])
+        self.assertEqual(self._read_intervals(paths[4]), [125000, 0, 125000, 500000])
+
+    def test_fractional_scale(self):
+        """
+        Test that a scale below 1 stretches the intervals, and
+        that its intervals file is named after the scale
+        """
+        trace_path = self._write_trace("requests.csv", "timestamp\n1\n2\n2.5\n")
+        request_trace = RequestTrace(self._create_config(trace_path))
+
+        paths = request_trace.create_intervals_files([0.5, 1.0])
+
+        self.assertEqual(self._read_intervals(paths[0.5]), [2000000, 1000000])
+        self.assertEqual(self._read_intervals(paths[1.0]), [1000000, 500000])
+        self.assertEqual(os.path.basename(paths[0.5]), "requests_0.5x.txt")
+        self.assertEqual(os.path.basename(paths[1.0]), "requests_1x.txt")
+
+    def test_jsonl_trace(self):
+        """
+        Test that ISO 8601 timestamps and numeric timestamps in other
+        units are read from a JSONL trace
+        """
+        trace_path = self._write_trace(
+            "requests.jsonl",
+            '{"time": "2026-01-01T00:00:00Z"}\n'
+            '{"time": "2026-01-01T00:00:00.250Z"}\n'
+            "\n"
+            '{"time": "2026-01-01T00:00:01Z"}\n',
+        )
+        request_trace = RequestTrace(
+            self._create_config(trace_path, timestamp_field="time")
+        )
+        self.assertEqual(
+            self._read_intervals(request_trace.get_intervals_file(2)),
+            [125000, 375000],
+        )
+
+        trace_path = self._write_trace(
+            "requests_ms.jsonl", '{"timestamp": 0}\n{"timestamp": 3}\n'
+        )
+        request_trace = RequestTrace(
+            self._create_config(trace_path, timestamp_unit="ms")
+        )
+        self.assertEqual(
+            self._read_intervals(request_trace.get_intervals_file(2)), [1500]
+        )
+
+    def test_intervals_files_are_reused(self):
+        """
+        Test that up to date intervals files are not recreated
+        """
+        trace_path = self._write_trace("requests.csv", "timestamp\n1\n2\n")
+        request_trace = RequestTrace(self._create_config(trace_path))
+
+        request_trace.create_intervals_files([1, 2])
+
+        with patch.object(request_trace, "_write_intervals_files") as mock_write:
+            paths = request_trace.create_intervals_files([1, 2, 4])
+            mock_write.assert_called_once_with({4: paths[4]})
+
+    def test_invalid_traces(self):
+        """
+        Test that invalid traces raise an exception
+        """
+        with self.assertRaises(TritonModelAnalyzerException):
+            RequestTrace(self._create_config("missing.csv"))
+
+        invalid_traces = [
+            ("requests.txt", "1\n2\n"),
+            ("one_request.csv", "timestamp\n1\n"),
+            ("no_timestamp.csv", "time\n1\n2\n"),
+            ("bad_timestamp.csv", "timestamp\n1\nyesterday\n"),
+            ("bad_json.jsonl", '{"timestamp": 1}\n{"timestamp": \n'),
+        ]
+        for name, contents in invalid_traces:
+            request_trace = RequestTrace(
+                self._create_config(self._write_trace(name, contents))
+            )
+            with self.assertRaises(TritonModelAnalyzerException):
+                request_trace.get_intervals_file(1)
+
+        # No partially written intervals files are left behind
+        self.assertEqual(
+            os.listdir(os.path.join(self._temp_dir.name, "request_intervals")), []
+        )
+
+    def _write_trace(self, name, contents):
+        path = os.path.join(self._temp_dir.name, name)
+        with open(path, "w") as f:
+            f.write(contents)
+
+        return path
+
+    def _read_intervals(self, path):
+        with open(path, "r") as f:
+            return [int(line) for line in f]
+
+    def _create_config(
+        self, trace_path, timestamp_field="timestamp", timestamp_unit="s"
+    ):
+        config = MagicMock()
+        config.request_trace = trace_path
+        config.request_trace_timestamp_field = timestamp_field
+        config.request_trace_timestamp_unit = timestamp_unit
+        config.export_path = self._temp_dir.name
+
+        return config
+
+
+if __name__ == "__main__":
+    unittest.main()
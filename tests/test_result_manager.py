@@ -20,12 +20,14 @@
 from model_analyzer.config.input.config_command_report import ConfigCommandReport
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.result.constraint_manager import ConstraintManager
+from model_analyzer.result.pareto_frontier import dominates
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.result.sorted_results import SortedResults
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 
 from .common import test_result_collector as trc
 from .common.test_utils import (
+    construct_run_config_measurement,
     load_multi_model_result_manager,
     load_single_model_result_manager,
 )
@@ -176,6 +178,51 @@ def test_get_across_model_sorted_results(self):
         self.assertTrue(isinstance(sorted_results, SortedResults))
         self.assertEqual(6, len(sorted_results.results()))
 
+    def test_reduced_fidelity_results_not_ranked(self):
+        """
+        Test that measurements taken at a reduced fidelity are
+        stored but are not added to the sorted results
+        """
+        result_manager, _ = load_single_model_result_manager()
+
+        fake_run_config = MagicMock()
+        fake_run_config.models_name.return_value = "add_sub"
+        fake_run_config.representation.return_value = "fake_representation"
+
+        fake_measurement = MagicMock()
+        fake_measurement.is_full_fidelity.return_value = False
+        fake_measurement.model_variants_name.return_value = "fake_variant"
+
+        result_manager.add_run_config_measurement(fake_run_config, fake_measurement)
+
+        sorted_results = result_manager.get_across_model_sorted_results()
+        self.assertEqual(5, len(sorted_results.results()))
+
+    def test_get_pareto_frontier(self):
+        """
+        Test that the Pareto frontier contains exactly the
+        measurements no other measurement dominates
+        """
+        result_manager, _ = load_single_model_result_manager()
+
+        measurements = [
+            measurement
+            for result in result_manager.get_model_sorted_results("add_sub").results()
+            for measurement in result.passing_measurements()
+            + result.failing_measurements()
+        ]
+        frontier = result_manager.get_pareto_frontier("add_sub")
+
+        self.assertTrue(frontier)
+        for measurement in measurements:
+            is_dominated = any(
+                dominates(
+                    other.get_objective_values(), measurement.get_objective_values()
+                )
+                for other in measurements
+            )
+            self.assertEqual(measurement in frontier, not is_dominated)
+
     def _add_a_fake_result(self, result_manager):
         fake_model = MagicMock()
         fake_model.model_name.return_value = "FakeModel"
@@ -189,7 +236,18 @@ def _add_a_fake_result(self, result_manager):
         fake_run_config = MagicMock()
         fake_run_config.models_name.return_value = "FakeModel"
 
-        result_manager.add_run_config_measurement(fake_run_config, MagicMock())
+        result_manager.add_run_config_measurement(
+            fake_run_config,
+            construct_run_config_measurement(
+                model_name="add_sub",
+                model_config_names=["add_sub_config_fake"],
+                model_specific_pa_params=[{"batch-size": 1, "concurrency-range": 1}],
+                gpu_metric_values={},
+                non_gpu_metric_values=[
+                    {"perf_throughput": 1000, "perf_latency_p99": 10}
+                ],
+            ),
+        )
 
     def tearDown(self):
         patch.stopall()
@@ -2,6 +2,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -12,6 +13,7 @@
 from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
 
 from .common import test_result_collector as trc
+from .common.test_utils import default_encode
 
 
 class TestRunConfig(trc.TestResultCollector):
@@ -82,6 +84,63 @@ def test_representation_mrc_removal(self):
         expected_representation = "model1_config_0 -m TestModel1 -b 1"
         self.assertEqual(mrc.representation(), expected_representation)
 
+    def test_representation_cache_invalidation(self):
+        """
+        Test that the cached representation is rebuilt when the
+        PA config or composing models change, and not otherwise
+        """
+        pc = PerfAnalyzerConfig()
+        pc.update_config({"model-name": "TestModel1"})
+        mrc = ModelRunConfig(
+            "model1", ModelConfigVariant(MagicMock(), "model1_config_0"), pc
+        )
+        rc = RunConfig({})
+        rc.add_model_run_config(mrc)
+
+        first_representation = rc.representation()
+        self.assertIs(rc.representation(), first_representation)
+
+        pc.update_config({"concurrency-range": 4})
+        self.assertEqual(
+            rc.representation(),
+            "model1_config_0 -m TestModel1 -b 1 --concurrency-range=4",
+        )
+
+        mrc.add_composing_model_config_variants(
+            [ModelConfigVariant(MagicMock(), "composing_config_0")]
+        )
+        self.assertEqual(
+            rc.representation(),
+            "model1_config_0 -m TestModel1 -b 1 --concurrency-range=4 composing_config_0",
+        )
+
+    def test_to_dict_excludes_cache(self):
+        """
+        Test that the cached representation is not written to the checkpoint
+        and that a config round-tripped through from_dict has the same representation
+        """
+        pc = PerfAnalyzerConfig()
+        pc.update_config({"model-name": "TestModel1", "concurrency-range": 2})
+        mrc = ModelRunConfig(
+            "model1",
+            ModelConfigVariant(
+                ModelConfig.create_from_dictionary({"name": "model1"}),
+                "model1_config_0",
+            ),
+            pc,
+        )
+        rc = RunConfig({})
+        rc.add_model_run_config(mrc)
+        representation = rc.representation()
+
+        self.assertNotIn("_representation", rc.to_dict())
+        self.assertNotIn("_representation", mrc.to_dict())
+        self.assertNotIn("_representation", pc.to_dict())
+        self.assertNotIn("_version", pc.to_dict())
+
+        rc_dict = json.loads(json.dumps(rc, default=default_encode))
+        self.assertEqual(RunConfig.from_dict(rc_dict).representation(), representation)
+
     def test_cpu_only(self):
         """
         Test that cpu_only() is only true if all ModelConfigs are cpu_only()
@@ -159,6 +218,36 @@ def test_mrc_with_legal_combinations(self):
         mrc = ModelRunConfig("modelB", mcv, pc)
         self.assertTrue(mrc.is_legal_combination())
 
+    def test_mrc_with_illegal_priority_levels(self):
+        """
+        Test ModelRunConfig with illegal priority levels
+        """
+        mc = ModelConfig({})
+        pc = PerfAnalyzerConfig()
+        mcv = ModelConfigVariant(mc, "test_model_config_default")
+
+        # Default priority level outside of the priority levels
+        mc.set_config(
+            {
+                "name": "test_model",
+                "max_batch_size": 8,
+                "dynamic_batching": {"priority_levels": 2},
+            }
+        )
+        self.assertFalse(ModelRunConfig("modelA", mcv, pc).is_legal_combination())
+
+        mc.set_config(
+            {
+                "name": "test_model",
+                "max_batch_size": 8,
+                "dynamic_batching": {
+                    "priority_levels": 2,
+                    "default_priority_level": 2,
+                },
+            }
+        )
+        self.assertTrue(ModelRunConfig("modelB", mcv, pc).is_legal_combination())
+
     def test_composing_mrc_with_illegal_combinations(self):
         """
         Test ModelRunConfig with illegal combinations in composing config
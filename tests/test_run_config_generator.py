@@ -28,6 +28,9 @@
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
 )
+from model_analyzer.config.generate.perf_analyzer_config_generator import (
+    PerfAnalyzerConfigGenerator,
+)
 from model_analyzer.config.input.config_defaults import (
     DEFAULT_RUN_CONFIG_MAX_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MAX_INSTANCE_COUNT,
@@ -125,6 +128,40 @@ def test_two_models(self):
                 mock_method.call_count, expected_num_calls_to_set_last_results
             )
 
+    def test_two_models_minimize_restarts(self):
+        """
+        Test Two Models with restarts minimized:
+
+        The same 68 configs as test_two_models are generated, but every
+        PA config is swept before the model variants change, so there is
+        one server restart for the default step plus one per combination
+        of the 4 variants of each model (1 + 4 * 4 = 17), instead of
+        one per combination of the root model's 8 ModelRunConfigs with
+        the leaf model's 4 variants (1 + 8 * 4 = 33)
+        """
+
+        yaml_str = """
+            run_config_search_max_model_batch_size: 2
+            run_config_search_max_instance_count: 2
+            run_config_search_max_concurrency: 2
+            profile_models:
+                - my-model
+                - my-modelB
+
+            """
+
+        run_configs = self._run_and_test_run_config_generator(yaml_str, 68)
+        minimized_run_configs = self._run_and_test_run_config_generator(
+            yaml_str, 68, extra_args=["--brute-search-minimize-restarts"]
+        )
+
+        self.assertEqual(
+            set(run_config.representation() for run_config in run_configs),
+            set(run_config.representation() for run_config in minimized_run_configs),
+        )
+        self.assertEqual(self._count_variant_changes(run_configs), 33)
+        self.assertEqual(self._count_variant_changes(minimized_run_configs), 17)
+
     def test_two_uneven_models(self):
         """
         Test Two Uneven Models:
@@ -686,7 +723,47 @@ def test_variant_naming(self):
                 rc.model_run_configs()[1].model_variant_name(),
             )
 
-    def _run_and_test_run_config_generator(self, yaml_str, expected_config_count):
+    def test_request_rate_prediction_server_side_batching(self):
+        """
+        Test that the request rate is predicted with the max batch size
+        of model configs that batch on the server
+        """
+        yaml_str = """
+            run_config_search_max_model_batch_size: 2
+            run_config_search_max_instance_count: 1
+            run_config_search_min_request_rate: 1
+            run_config_search_max_request_rate: 2
+            profile_models:
+                - my-model
+            """
+
+        with patch.object(
+            PerfAnalyzerConfigGenerator,
+            "__init__",
+            side_effect=PerfAnalyzerConfigGenerator.__init__,
+            autospec=True,
+        ) as mock_method:
+            self._run_and_test_run_config_generator(
+                yaml_str,
+                expected_config_count=6,
+                extra_args=[
+                    "--request-rate-search-enable",
+                    "--request-rate-prediction-enable",
+                ],
+            )
+
+        # The default config, then the two dynamic batching configs
+        self.assertEqual(
+            [
+                call.kwargs["request_rate_predictor"]._max_batch_size
+                for call in mock_method.call_args_list
+            ],
+            [1, 1, 2],
+        )
+
+    def _run_and_test_run_config_generator(
+        self, yaml_str, expected_config_count, extra_args=None
+    ):
         args = [
             "model-analyzer",
             "profile",
@@ -696,6 +773,9 @@ def _run_and_test_run_config_generator(self, yaml_str, expected_config_count):
             "path-to-config-file",
         ]
 
+        if extra_args:
+            args += extra_args
+
         protobuf = """
             max_batch_size: 8
             instance_group [
@@ -737,6 +817,16 @@ def _run_and_test_run_config_generator(self, yaml_str, expected_config_count):
 
         return run_configs
 
+    def _count_variant_changes(self, run_configs):
+        variant_changes = 0
+        last_model_variants = None
+        for run_config in run_configs:
+            if run_config.model_variants_name() != last_model_variants:
+                variant_changes += 1
+                last_model_variants = run_config.model_variants_name()
+
+        return variant_changes
+
     def setUp(self):
         # Mock path validation
         self.mock_os = MockOSMethods(
@@ -3,12 +3,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import math
 import unittest
 from unittest.mock import MagicMock, patch
 
+from model_analyzer.record.types.gpu_used_memory import GPUUsedMemory
+from model_analyzer.record.types.gpu_utilization import GPUUtilization
+from model_analyzer.result.confidence_interval import confidence_interval_half_width
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 from tests.common.test_utils import (
     construct_constraint_manager,
+    construct_repeated_run_config_measurement,
     construct_run_config_measurement,
     convert_avg_gpu_metrics_to_data,
     convert_gpu_metrics_to_data,
@@ -420,6 +425,176 @@ def test_from_dict(self):
         )
         self.assertEqual(rcm0_from_dict._model_config_weights, [])
 
+    def test_from_dict_gpu_data_is_lazy(self):
+        """
+        Test that GPU records and aggregates are only built on first access
+        and that a packed measurement is saved back out unchanged
+        """
+        rcm0_dict = json.loads(json.dumps(self.rcm0, default=default_encode))
+        self.assertNotIn("_avg_gpu_data", rcm0_dict)
+
+        rcm0_from_dict = RunConfigMeasurement.from_dict(rcm0_dict)
+
+        self.assertIsNone(rcm0_from_dict._gpu_data)
+        self.assertIsNone(rcm0_from_dict._avg_gpu_data)
+        self.assertEqual(rcm0_from_dict.gpus_used(), ["0", "1"])
+        self.assertEqual(
+            json.loads(json.dumps(rcm0_from_dict, default=default_encode)), rcm0_dict
+        )
+
+        avg_gpu_data = convert_avg_gpu_metrics_to_data(self.avg_gpu_metric_values)
+        self.assertEqual(
+            rcm0_from_dict.get_gpu_metric("gpu_used_memory"),
+            avg_gpu_data["gpu_used_memory"],
+        )
+        self.assertIsNotNone(rcm0_from_dict._gpu_data)
+        self.assertIsNotNone(rcm0_from_dict._avg_gpu_data)
+
+    def test_from_dict_keeps_gpu_device_uuid(self):
+        """
+        Test that the device UUID of the GPU records survives
+        loading and saving a checkpoint, and unpacking the records
+        """
+        rcm = RunConfigMeasurement(
+            "modelA_config_0",
+            {
+                "GPU-0": [
+                    GPUUsedMemory(value=6000, device_uuid="GPU-0"),
+                    GPUUtilization(value=60, device_uuid="GPU-0"),
+                ]
+            },
+        )
+        rcm_dict = json.loads(json.dumps(rcm, default=default_encode))
+
+        rcm_from_dict = RunConfigMeasurement.from_dict(rcm_dict)
+        self.assertEqual(
+            json.loads(json.dumps(rcm_from_dict, default=default_encode)), rcm_dict
+        )
+
+        self.assertEqual(
+            [record.device_uuid() for record in rcm_from_dict.gpu_data()["GPU-0"]],
+            ["GPU-0", "GPU-0"],
+        )
+        self.assertEqual(
+            json.loads(json.dumps(rcm_from_dict, default=default_encode)), rcm_dict
+        )
+
+    def test_fidelity(self):
+        """
+        Test that the fidelity is checkpointed, and that measurements
+        from older checkpoints are treated as full fidelity
+        """
+        self.assertTrue(self.rcm0.is_full_fidelity())
+
+        self.rcm0.set_fidelity(1 / 3)
+        rcm0_dict = json.loads(json.dumps(self.rcm0, default=default_encode))
+        rcm0_from_dict = RunConfigMeasurement.from_dict(rcm0_dict)
+
+        self.assertEqual(rcm0_from_dict.fidelity(), 1 / 3)
+        self.assertFalse(rcm0_from_dict.is_full_fidelity())
+
+        del rcm0_dict["_fidelity"]
+        self.assertTrue(RunConfigMeasurement.from_dict(rcm0_dict).is_full_fidelity())
+
+    def test_get_objective_values(self):
+        """
+        Test that objective values are oriented so that larger is better
+        """
+        # modelA's objective is throughput, modelB's is p99 latency
+        self.assertEqual(self.rcm0.get_objective_values(), [1000, -40])
+
+        self.rcm0.set_metric_weightings(
+            [{"perf_throughput": 1, "perf_client_send_recv": 1}, {"cpu_used_ram": 1}]
+        )
+        self.assertEqual(self.rcm0.get_objective_values(), [1000, float("-inf"), -1500])
+
+        # GPU objectives are aggregated across GPUs (memory is summed)
+        self.rcm0.set_metric_weightings(
+            [{"perf_throughput": 1, "gpu_used_memory": 1}, {"gpu_utilization": 1}]
+        )
+        self.assertEqual(self.rcm0.get_objective_values(), [1000, -16000, 40])
+
+    def test_add_repetition(self):
+        """
+        Test that repetitions average the non-GPU metrics, and that
+        their samples are checkpointed
+        """
+        self.assertEqual(self.rcm0.repetition_count(), 1)
+
+        repetition_non_gpu_metric_values = [
+            {"perf_throughput": 1200, "perf_latency_p99": 30, "cpu_used_ram": 1000},
+            {"perf_throughput": 2000, "perf_latency_p99": 60, "cpu_used_ram": 1500},
+        ]
+        self.rcm0.add_repetition(
+            construct_run_config_measurement(
+                self.model_name,
+                self.model_config_name,
+                self.model_specific_pa_params,
+                self.gpu_metric_values,
+                repetition_non_gpu_metric_values,
+            )
+        )
+
+        self.assertEqual(self.rcm0.repetition_count(), 2)
+        self.assertEqual(
+            self.rcm0.get_samples(),
+            [self.rcm0_non_gpu_metric_values, repetition_non_gpu_metric_values],
+        )
+        self.assertEqual(self.rcm0.get_non_gpu_metric_value("perf_latency_p99"), 37.5)
+        self.assertEqual(self.rcm0.get_objective_values(), [1100, -50])
+
+        rcm0_dict = json.loads(json.dumps(self.rcm0, default=default_encode))
+        rcm0_from_dict = RunConfigMeasurement.from_dict(rcm0_dict)
+        self.assertEqual(rcm0_from_dict.get_samples(), self.rcm0.get_samples())
+        self.assertEqual(rcm0_from_dict.non_gpu_data(), self.rcm0.non_gpu_data())
+
+        del rcm0_dict["_samples"]
+        self.assertEqual(
+            RunConfigMeasurement.from_dict(rcm0_dict).repetition_count(), 1
+        )
+
+    def test_objective_confidence_interval(self):
+        """
+        Test that the confidence interval is on the weighted objective,
+        relative to its mean, and is infinite without repetitions
+        """
+        self.assertEqual(self.rcm0.get_objective_confidence_interval(0.95), math.inf)
+
+        rcm = construct_repeated_run_config_measurement(
+            "modelA_config_0", [100, 110, 90]
+        )
+
+        self.assertEqual(rcm.get_non_gpu_metric_value("perf_throughput"), 100)
+        self.assertEqual(
+            [round(sample, 6) for sample in rcm.get_objective_samples()],
+            [1.0, 1.1, 0.9],
+        )
+        self.assertAlmostEqual(
+            rcm.get_objective_confidence_interval(0.95),
+            confidence_interval_half_width([1.0, 1.1, 0.9], 0.95),
+        )
+
+    def test_is_statistically_tied(self):
+        """
+        Test that measurements are tied when their difference is within
+        their confidence intervals, and never when neither was repeated
+        """
+        noisy_rcm = construct_repeated_run_config_measurement(
+            "modelA_config_0", [100, 110, 90]
+        )
+        single_rcm = construct_repeated_run_config_measurement("modelA_config_0", [95])
+        slow_rcm = construct_repeated_run_config_measurement("modelA_config_0", [50])
+
+        self.assertTrue(noisy_rcm.is_statistically_tied(single_rcm, 0.95))
+        self.assertTrue(single_rcm.is_statistically_tied(noisy_rcm, 0.95))
+        self.assertFalse(noisy_rcm.is_statistically_tied(slow_rcm, 0.95))
+        self.assertFalse(single_rcm.is_statistically_tied(slow_rcm, 0.95))
+        self.assertFalse(
+            single_rcm.is_statistically_tied(
+                construct_repeated_run_config_measurement("modelA_config_0", [95]), 0.95
+            )
+        )
+
     def _construct_rcm0(self):
         self.model_name = "modelA,modelB"
         self.model_config_name = ["modelA_config_0", "modelB_config_1"]
@@ -84,5 +84,11 @@ def test_get_neighborhood_config(self):
         self.assertEqual("foo", nc.get_dimension(0).get_name())
         self.assertEqual("bar", nc.get_dimension(1).get_name())
 
+        self.assertEqual([0, 1], nc.get_active_dimensions())
+        self.assertEqual(
+            [1],
+            sc.get_neighborhood_config(active_dimensions=[1]).get_active_dimensions(),
+        )
+
         self.assertEqual(7, nc.get_dimension(0).get_value_at_idx(6))
         self.assertEqual(64, nc.get_dimension(1).get_value_at_idx(6))
@@ -37,6 +37,19 @@ def test_exponential(self):
         self.assertEqual(4, sd.get_value_at_idx(2))
         self.assertEqual(8, sd.get_value_at_idx(3))
 
+    def test_list(self):
+        sd = SearchDimension(
+            "foo", SearchDimension.DIMENSION_TYPE_LIST, values=[4, 8, 16]
+        )
+
+        self.assertEqual(0, sd.get_min_idx())
+        self.assertEqual(2, sd.get_max_idx())
+        self.assertEqual(4, sd.get_value_at_idx(0))
+        self.assertEqual(16, sd.get_value_at_idx(2))
+
+        with self.assertRaises(IndexError):
+            sd.get_value_at_idx(3)
+
     def test_out_of_bounds(self):
         sd = SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR, 2, 10)
 
@@ -51,3 +64,21 @@ def test_no_max(self):
 
         # Confirm no assert
         sd.get_value_at_idx(100000000)
+
+    def test_idx_for_value(self):
+        linear = SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR, 0, 10)
+        self.assertEqual(2, linear.get_idx_for_value(3))
+        self.assertEqual(10, linear.get_idx_for_value(64))
+
+        exponential = SearchDimension(
+            "foo", SearchDimension.DIMENSION_TYPE_EXPONENTIAL, 1, 6
+        )
+        self.assertEqual(3, exponential.get_idx_for_value(8))
+        self.assertEqual(1, exponential.get_idx_for_value(1))
+        self.assertIsNone(exponential.get_idx_for_value(0))
+
+        values = SearchDimension(
+            "foo", SearchDimension.DIMENSION_TYPE_LIST, values=[4, 8, 16]
+        )
+        self.assertEqual(1, values.get_idx_for_value(8))
+        self.assertIsNone(values.get_idx_for_value(5))
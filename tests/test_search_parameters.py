@@ -461,6 +461,67 @@ def test_search_parameter_request_rate(self):
         self.assertEqual(ParameterCategory.INT_LIST, request_rate.category)
         self.assertEqual([1, 8, 64, 256], request_rate.enumerated_list)
 
+    def test_search_parameter_batching(self):
+        """
+        Test that the dynamic batching, sequence batching and response
+        cache parameters are created as list parameters
+        """
+
+        args = [
+            "model-analyzer",
+            "profile",
+            "--model-repository",
+            "cli-repository",
+            "-f",
+            "path-to-config-file",
+            "--run-config-search-mode",
+            "optuna",
+        ]
+
+        yaml_content = """
+        run_config_search_mode: optuna
+        profile_models:
+            add_sub:
+                model_config_parameters:
+                    dynamic_batching:
+                        preferred_batch_size: [[4], [8, 16]]
+                        priority_levels: [1, 2]
+                        default_queue_policy:
+                            max_queue_size: [8, 16]
+                    sequence_batching:
+                        oldest:
+                            max_candidate_sequences: [4, 8]
+                    response_cache:
+                        enable: [true, false]
+
+        """
+        config = TestConfig()._evaluate_config(args, yaml_content)
+        analyzer = Analyzer(config, MagicMock(), MagicMock(), MagicMock())
+        mock_model_config = MockModelConfig()
+        mock_model_config.start()
+        analyzer._populate_search_parameters(MagicMock(), MagicMock())
+        mock_model_config.stop()
+
+        expected_parameters = {
+            "preferred_batch_size": (ParameterCategory.INT_LIST, [4, 8, 16]),
+            "priority_levels": (ParameterCategory.INT_LIST, [1, 2]),
+            "max_queue_size": (ParameterCategory.INT_LIST, [8, 16]),
+            "max_candidate_sequences": (ParameterCategory.INT_LIST, [4, 8]),
+            "response_cache": (ParameterCategory.BOOL_LIST, [True, False]),
+        }
+
+        for name, (category, enumerated_list) in expected_parameters.items():
+            parameter = analyzer._search_parameters["add_sub"].get_parameter(name)
+            self.assertEqual(ParameterUsage.MODEL, parameter.usage)
+            self.assertEqual(category, parameter.category)
+            self.assertEqual(enumerated_list, parameter.enumerated_list)
+
+        self.assertIsNone(
+            analyzer._search_parameters["add_sub"].get_parameter(
+                "max_queue_delay_microseconds"
+            )
+        )
+
     def test_number_of_configs_range(self):
         """
         Test number of configs for a range (INTEGER/EXPONENTIAL)
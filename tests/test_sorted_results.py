@@ -20,12 +20,14 @@
 
 import yaml
 
+from model_analyzer.result.run_config_result import RunConfigResult
 from model_analyzer.result.run_config_result_comparator import RunConfigResultComparator
 from model_analyzer.result.sorted_results import SortedResults
 
 from .common import test_result_collector as trc
 from .common.test_utils import (
     construct_constraint_manager,
+    construct_repeated_run_config_measurement,
     construct_run_config,
     construct_run_config_result,
 )
@@ -301,6 +303,55 @@ def test_top_n_results(self):
         self.assertEqual(all_results[8].model_name(), "1")
         self.assertEqual(all_results[9].model_name(), "0")
 
+    def test_statistical_ties(self):
+        """
+        Test that results are ranked by the mean of their repetitions, and
+        that statistically tied results are ranked by their confidence intervals
+        """
+        comparator = RunConfigResultComparator(
+            metric_objectives_list=[{"perf_throughput": 1}], model_weights=[1]
+        )
+
+        # noisy has the best mean, but is within the interval of steady
+        for model_config_name, throughputs in [
+            ("slow_config_0", [50]),
+            ("noisy_config_0", [100, 120, 80]),
+            ("steady_config_0", [97, 98, 96]),
+        ]:
+            run_config_result = RunConfigResult(
+                model_name="test_model",
+                run_config=construct_run_config(
+                    "test_model", model_config_name, model_config_name
+                ),
+                comparator=comparator,
+                constraint_manager=MagicMock(),
+            )
+            run_config_result.add_run_config_measurement(
+                construct_repeated_run_config_measurement(
+                    model_config_name, throughputs
+                )
+            )
+            self.sorted_results.add_result(run_config_result)
+
+        self.assertEqual(
+            [
+                result.run_config().model_variants_name()
+                for result in self.sorted_results.top_n_results(n=3)
+            ],
+            ["steady_config_0", "noisy_config_0", "slow_config_0"],
+        )
+
+        self.assertTrue(
+            self.sorted_results.results()[0].is_statistically_tied(
+                self.sorted_results.results()[1]
+            )
+        )
+        self.assertFalse(
+            self.sorted_results.results()[1].is_statistically_tied(
+                self.sorted_results.results()[2]
+            )
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
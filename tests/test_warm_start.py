@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import patch
+
+from model_analyzer.config.input.objects.config_model_profile_spec import (
+    ConfigModelProfileSpec,
+)
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
+from model_analyzer.result.warm_start import WarmStart
+
+from .common import test_result_collector as trc
+from .common.test_utils import ROOT_DIR
+
+
+class TestWarmStart(trc.TestResultCollector):
+    def tearDown(self):
+        patch.stopall()
+
+    def test_source_model(self):
+        """
+        Test that the results of another model in the checkpoint
+        are used, but not those of the model being profiled
+        """
+        warm_start = WarmStart(
+            f"{ROOT_DIR}/single-model-ckpt", [self._make_model("fine_tuned_add_sub")]
+        )
+        self.assertEqual(warm_start.source_models_name(), "add_sub")
+        self.assertEqual(warm_start.measurement_count(), 16)
+
+        warm_start = WarmStart(
+            f"{ROOT_DIR}/single-model-ckpt/0.ckpt", [self._make_model("add_sub")]
+        )
+        self.assertIsNone(warm_start.source_models_name())
+        self.assertEqual(warm_start.get_best_configs(3), [])
+
+    def test_best_configs(self):
+        """
+        Test that the best configs of the source model are ranked
+        using the objectives of the model being profiled
+        """
+        warm_start = WarmStart(
+            f"{ROOT_DIR}/single-model-ckpt",
+            [self._make_model("fine_tuned_add_sub", {"perf_throughput": 1})],
+        )
+
+        best_configs = warm_start.get_best_configs(3)
+        self.assertEqual(len(best_configs), 3)
+        self.assertEqual(
+            best_configs[0],
+            [{"max_batch_size": 8, "batch_sizes": 2, "concurrency": 2}],
+        )
+        self.assertEqual(
+            best_configs[1],
+            [
+                {
+                    "max_batch_size": 2,
+                    "instance_group": 1,
+                    "batch_sizes": 2,
+                    "concurrency": 2,
+                }
+            ],
+        )
+
+        warm_start = WarmStart(
+            f"{ROOT_DIR}/single-model-ckpt",
+            [self._make_model("fine_tuned_add_sub", {"perf_latency_p99": 1})],
+        )
+        self.assertEqual(
+            warm_start.get_best_configs(2)[1],
+            [
+                {
+                    "max_batch_size": 1,
+                    "instance_group": 1,
+                    "batch_sizes": 1,
+                    "concurrency": 1,
+                }
+            ],
+        )
+
+    def test_missing_checkpoint(self):
+        with self.assertRaises(TritonModelAnalyzerException):
+            WarmStart(f"{ROOT_DIR}/no-such-ckpt/0.ckpt", [self._make_model("a")])
+
+    def _make_model(self, model_name, objectives={"perf_throughput": 1}):
+        return ConfigModelProfileSpec(
+            model_name=model_name, objectives=objectives, weighting=1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()